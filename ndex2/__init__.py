@@ -7,7 +7,9 @@ import logging
 import logging.handlers
 import json
 import base64
+from collections.abc import Iterable
 import numpy as np
+import pandas as pd
 from ndex2cx.nice_cx_builder import NiceCXBuilder
 from ndex2.nice_cx_network import NetworkXFactory
 from ndex2.exceptions import NDExNotFoundError
@@ -481,6 +483,22 @@ def create_nice_cx_from_pandas(df, source_field=None, target_field=None,
         Removed print statements showing progress and network name is
         now being set
 
+    .. versionchanged:: 3.12.0
+        The :py:class:`pandas.DataFrame` is read a column at a time
+        instead of a row at a time, which is much faster on large
+        data frames. The resulting network is unchanged
+
+        **df** can also be an iterable of :py:class:`pandas.DataFrame`
+        chunks, such as the one returned by :py:func:`pandas.read_csv`
+        with ``chunksize`` set, so a large file does not have to be
+        loaded into one :py:class:`pandas.DataFrame`. Nodes are matched
+        by name across chunks and keep the attribute values of the
+        first row they appear in. Edge ids come from the index of each
+        chunk, so chunks should not share index labels. Node names and
+        represents in chunks are read with the type of their own column,
+        not cast to the common type of all columns in the row, so a node
+        gets the same name in every chunk
+
     If only the **df** argument is provided the :py:class:`pandas.DataFrame` is treated
     as 'SIF' format, where the first two columns specify the source and target node ids
     of the edge and all other columns are ignored. The edge interaction is
@@ -520,8 +538,8 @@ def create_nice_cx_from_pandas(df, source_field=None, target_field=None,
         to handle multi-edges.
 
 
-    :param df: Pandas dataframe to process
-    :type df: :py:class:`pandas.DataFrame`
+    :param df: Pandas dataframe, or iterable of dataframes, to process
+    :type df: :py:class:`pandas.DataFrame` or iterable
     :param source_field: header name specifying the name of the source node.
     :type source_field: str
     :param target_field: header name specifying the name of the target node.
@@ -542,160 +560,298 @@ def create_nice_cx_from_pandas(df, source_field=None, target_field=None,
     :return: NiceCXNetwork
     :rtype: :py:func:`~ndex2.nice_cx_network.NiceCXNetwork`
     """
+    cx_builder = NiceCXBuilder()
+    cx_builder.set_name('created from pandas by '
+                        'ndex2.create_nice_cx_from_pandas()')
+
+    chunked = isinstance(df, Iterable) and \
+        not isinstance(df, (pd.DataFrame, str, bytes))
+    chunks = df if chunked else [df]
+
+    for chunk in chunks:
+        _add_pandas_chunk(cx_builder, chunk, source_field, target_field,
+                          source_node_attr, target_node_attr, edge_attr,
+                          edge_interaction, source_represents,
+                          target_represents, chunked)
+
+    return cx_builder.get_nice_cx()  # my_nicecx
+
+
+def _add_pandas_chunk(cx_builder, df, source_field, target_field,
+                      source_node_attr, target_node_attr, edge_attr,
+                      edge_interaction, source_represents,
+                      target_represents, chunked=False):
+    """
+    Adds the nodes, edges and attributes of the rows of **df** to
+    **cx_builder**. Nodes already added by an earlier chunk are matched
+    by name and keep the id, represents and attribute values they
+    were first given
+
+    If **chunked** is ``True``, node names and represents are read with
+    the type of their own column, since the common type of the row can
+    differ from chunk to chunk and with it the name of a node. Other
+    arguments are the same as for :py:func:`create_nice_cx_from_pandas`
+    """
     # ====================================================
     # IF NODE FIELD NAME (SOURCE AND TARGET) IS PROVIDED
     # THEN USE THOSE FIELDS OTHERWISE USE INDEX 0 & 1
     # ====================================================
-    source_predicate = ''
-    target_predicate = ''
+    row_dtype = df.iloc[:0].to_numpy().dtype
+    name_dtype = None if chunked else row_dtype
+    if source_field and target_field:
+        source_names = _get_pandas_column_values(df, source_field, name_dtype,
+                                                 as_str=True)
+        target_names = _get_pandas_column_values(df, target_field, name_dtype,
+                                                 as_str=True)
+        if source_represents is not None:
+            source_reps = _get_pandas_column_values(df, source_represents,
+                                                    name_dtype, as_str=True)
+        else:
+            source_reps = source_names
+        if target_represents is not None:
+            target_reps = _get_pandas_column_values(df, target_represents,
+                                                    name_dtype, as_str=True)
+        else:
+            target_reps = target_names
 
-    cx_builder = NiceCXBuilder()
-    cx_builder.set_name('created from pandas by '
-                        'ndex2.create_nice_cx_from_pandas()')
+        if edge_interaction:
+            if edge_interaction in df.columns:
+                interactions = [val if val else edge_interaction for val in
+                                _get_pandas_column_values(df, edge_interaction,
+                                                          row_dtype)]
+            else:
+                interactions = [edge_interaction] * len(df)
+        else:
+            interactions = ['interacts-with'] * len(df)
+    else:
+        source_names = _get_pandas_column_values(df, 0, name_dtype,
+                                                 as_str=True)
+        target_names = _get_pandas_column_values(df, 1, name_dtype,
+                                                 as_str=True)
+        source_reps = source_names
+        target_reps = target_names
+        if len(df.columns) > 2:
+            interactions = _get_pandas_column_values(df, 2, row_dtype)
+        else:
+            interactions = ['interacts-with'] * len(df)
+
+    source_ids, target_ids = _add_pandas_nodes(cx_builder,
+                                               source_names, source_reps,
+                                               target_names, target_reps)
+    edge_ids = list(df.index)
+    # an edge id seen before means a row updates an existing edge
+    update_edges = _add_pandas_edges(cx_builder, edge_ids, source_ids,
+                                     target_ids, interactions)
 
     if source_field and target_field:
-        for index, row in df.iterrows():
+        _add_pandas_node_attributes(cx_builder, df, row_dtype,
+                                    source_ids, source_node_attr,
+                                    target_ids, target_node_attr)
+        _add_pandas_edge_attributes(cx_builder, df, row_dtype, edge_ids,
+                                    edge_attr,
+                                    'citation' in source_node_attr or
+                                    'citation' in target_node_attr,
+                                    update_edges)
 
-            # =============
-            # ADD NODES
-            # =============
 
-            if source_represents is not None:
-                source_node_id = cx_builder.add_node(name=source_predicate + str(row[source_field]),
-                                                     represents=source_predicate +
-                                                                   str(row[source_represents]))
-            else:
-                source_node_id = cx_builder.add_node(name=source_predicate + str(row[source_field]),
-                                                     represents=source_predicate +
-                                                                   str(row[source_field]))
-
-            if target_represents is not None:
-                target_node_id = cx_builder.add_node(name=target_predicate + str(row[target_field]),
-                                                     represents=target_predicate +
-                                                                   str(row[target_represents]))
-            else:
-                target_node_id = cx_builder.add_node(name=target_predicate + str(row[target_field]),
-                                                     represents=target_predicate +
-                                                                   str(row[target_field]))
-
-            # =============
-            # ADD EDGES
-            # =============
-            if edge_interaction:
-                if row.get(edge_interaction):
-                    use_this_interaction = row[edge_interaction]
-                else:
-                    use_this_interaction = edge_interaction
-            else:
-                use_this_interaction = 'interacts-with'
-
-            cx_builder.add_edge(id=index, source=source_node_id,
-                                target=target_node_id,
-                                interaction=use_this_interaction)
-
-            # ==============================
-            # ADD SOURCE NODE ATTRIBUTES
-            # ==============================
-            for sp in source_node_attr:
-
-                #TODO - need to be smarter about how data type is inferred
-                #row[sp], attr_type = _infer_data_type(row[sp])
-
-                attr_type = None
-
-                #attr_type = None
-                #if type(row[sp]) is float and math.isnan(row[sp]):
-                #    row[sp] = ''
-                #    attr_type = 'float'
-                #elif type(row[sp]) is float and math.isinf(row[sp]):
-                #    row[sp] = 'Inf'
-                #    attr_type = 'float'
-                #elif type(row[sp]) is float:
-                #    attr_type = 'float'
-                #elif isinstance(row[sp], int):
-                #    attr_type = 'integer'
-                if sp == 'citation' and not isinstance(row[sp], list):
-                    row[sp] = [row[sp]]
-                    attr_type = 'list_of_string'
-                cx_builder.add_node_attribute(source_node_id, sp, str(row[sp]), type=attr_type)
-
-            # ==============================
-            # ADD TARGET NODE ATTRIBUTES
-            # ==============================
-            for tp in target_node_attr:
-                #TODO - need to be smarter about how data type is inferred
-                #row[tp], attr_type = _infer_data_type(row[tp])
-
-                attr_type = None
-
-                #attr_type = None
-                #if type(row[tp]) is float and math.isnan(row[tp]):
-                #    row[tp] = ''
-                #    attr_type = 'float'
-                #elif type(row[tp]) is float and math.isinf(row[tp]):
-                #    row[tp] = 'Inf'
-                #    attr_type = 'float'
-                #elif type(row[tp]) is float:
-                #    attr_type = 'float'
-                #elif isinstance(row[tp], int):
-                #    attr_type = 'integer'
-
-                if tp == 'citation' and not isinstance(row[tp], list):
-                    row[tp] = [row[tp]]
-                    attr_type = 'list_of_string'
-                cx_builder.add_node_attribute(target_node_id, tp, str(row[tp]), type=attr_type)
-
-            # ==============================
-            # ADD EDGE ATTRIBUTES
-            # ==============================
-            for ep in edge_attr:
-                #TODO - need to be smarter about how data type is inferred
-                #row[ep], attr_type = _infer_data_type(row[ep])
-
-                attr_type = None
-
-                #attr_type = None
-                #if type(row[ep]) is float and math.isnan(row[ep]):
-                #    row[ep] = ''
-                #    attr_type = 'float'
-                #elif type(row[ep]) is float and math.isinf(row[ep]):
-                #    row[ep] = 'INFINITY'
-                #    attr_type = 'float'
-
-                if ep == 'citation' and not isinstance(row[ep], list):
-                    row[ep] = [row[ep]]
-                    attr_type = 'list_of_string'
-
-                cx_builder.add_edge_attribute(property_of=index,
-                                              name=ep, values=row[ep],
-                                              type=attr_type)
+def _get_pandas_column_values(df, column, row_dtype, as_str=False):
+    """
+    Gets the values of **column** in **df** as they would appear in the
+    rows returned by :py:meth:`pandas.DataFrame.iterrows`, which casts
+    all values of a row to the common **row_dtype**. If **row_dtype** is
+    ``None`` values keep the type of the column
 
+    :param df: data frame
+    :type df: :py:class:`pandas.DataFrame`
+    :param column: column name or, if :py:class:`int`, position if
+                   **df** has no column by that name
+    :param row_dtype: common data type of all columns in **df**, or
+                      ``None``
+    :type row_dtype: :py:class:`numpy.dtype`
+    :param as_str: If ``True`` values are converted by :py:class:`str`
+    :type as_str: bool
+    :return: values
+    :rtype: list
+    """
+    if isinstance(column, int) and column not in df.columns:
+        series = df.iloc[:, column]
     else:
-        for index, row in df.iterrows():
-            # =============
-            # ADD NODES
-            # =============
-            source_node_id = cx_builder.add_node(name=str(row[0]),
-                                                 represents=str(row[0]))
-
-            target_node_id = cx_builder.add_node(name=str(row[1]),
-                                                 represents=str(row[1]))
-
-            # =============
-            # ADD EDGES
-            # =============
-            if len(row) > 2:
-                cx_builder.add_edge(id=index,
-                                    source=source_node_id,
-                                    target=target_node_id,
-                                    interaction=row[2])
-            else:
-                cx_builder.add_edge(id=index,
-                                    source=source_node_id,
-                                    target=target_node_id,
-                                    interaction='interacts-with')
+        series = df[column]
+    values = series.to_numpy(dtype=row_dtype)
+    if values.dtype == object and not isinstance(series.dtype, np.dtype):
+        # missing values of nullable columns are NaN in iterrows() rows
+        values[pd.isna(values)] = np.nan
+    if as_str:
+        return list(map(str, values))
+    return list(values)
+
+
+def _add_pandas_nodes(cx_builder, source_names, source_reps,
+                      target_names, target_reps):
+    """
+    Adds nodes to **cx_builder** for the source and target names of each
+    row, unless **cx_builder** already has a node by that name. New node
+    ids are assigned in order of first appearance, going through the
+    source then the target of each row, and the represents of a node
+    comes from its first appearance
+
+    :return: (source node ids, target node ids) for each row
+    :rtype: tuple
+    """
+    names = np.empty(2 * len(source_names), dtype=object)
+    names[0::2] = source_names
+    names[1::2] = target_names
+    reps = np.empty(len(names), dtype=object)
+    reps[0::2] = source_reps
+    reps[1::2] = target_reps
+
+    codes = pd.factorize(names)[0]
+    first_positions = np.unique(codes, return_index=True)[1]
+    node_ids = cx_builder.add_nodes(names[first_positions].tolist(),
+                                    reps[first_positions].tolist())
+    ids = np.asarray(node_ids, dtype=np.int64)[codes].tolist()
+    return ids[0::2], ids[1::2]
+
+
+def _add_pandas_edges(cx_builder, edge_ids, source_ids, target_ids,
+                      interactions):
+    """
+    Adds one edge per row to **cx_builder**, a later row replaces an
+    earlier row with the same edge id
 
-    return cx_builder.get_nice_cx()  # my_nicecx
+    :return: ``True`` if an edge replaced an edge with the same id
+    :rtype: bool
+    """
+    return len(cx_builder.add_edges(edge_ids, source_ids, target_ids,
+                                    interactions)) > 0
+
+
+def _add_pandas_node_attributes(cx_builder, df, row_dtype,
+                                source_ids, source_node_attr,
+                                target_ids, target_node_attr):
+    """
+    Adds node attributes from the columns **source_node_attr** and
+    **target_node_attr** to **cx_builder**. Only the first row a node
+    appears in, as source or target, can set a given attribute, so
+    only those rows are looked at, and attributes a node already has
+    are left as is. Values are stored as strings, except ``citation``
+    which is wrapped in a list first
+    """
+    attribute_map = cx_builder.node_attribute_map
+    first_values = {}
+    for side, node_ids, attr_names in ((0, source_ids, source_node_attr),
+                                       (1, target_ids, target_node_attr)):
+        if not attr_names:
+            continue
+        unique_ids, first_rows = np.unique(node_ids, return_index=True)
+        unique_ids = unique_ids.tolist()
+        first_rows = first_rows.tolist()
+        for position, name in enumerate(attr_names):
+            values = _get_pandas_column_values(df, name, row_dtype)
+            for node_id, row in zip(unique_ids, first_rows):
+                if name in attribute_map.get(node_id, ()):
+                    continue
+                order = (row, side, position)
+                key = (node_id, name)
+                if key not in first_values or order < first_values[key][0]:
+                    first_values[key] = (order, values[row])
+
+    citation_in_source = 'citation' in source_node_attr
+    for (node_id, name), (order, value) in sorted(first_values.items(),
+                                                  key=lambda x: x[1][0]):
+        attr_type = constants.STRING_DATATYPE
+        if name == 'citation' and not isinstance(value, list):
+            value = [value]
+            # the source attribute wraps citation in a list for the rest
+            # of the row, so a target attribute sees a list and is typed
+            # as a string
+            if order[1] == 0 or not citation_in_source:
+                attr_type = constants.LIST_OF_STRING
+        cx_builder.node_attribute_inventory.append({'po': node_id, 'n': name,
+                                                    'v': str(value),
+                                                    'd': attr_type})
+        attribute_map.setdefault(node_id, {})[name] = True
+
+
+def _add_pandas_edge_attributes(cx_builder, df, row_dtype, edge_ids,
+                                edge_attr, citation_wrapped,
+                                update_edges=False):
+    """
+    Adds edge attributes from the columns **edge_attr** to
+    **cx_builder**. The CX datatype is set once per column if the
+    column is numeric or boolean, otherwise it is inferred for each
+    value by :py:meth:`NiceCXBuilder._infer_data_type`
+
+    If **update_edges** is ``True``, some of **edge_ids** repeat or were
+    added before, and an edge keeps the first value it got for an
+    attribute
+    """
+    columns = []
+    for name in edge_attr:
+        values = _get_pandas_column_values(df, name, row_dtype)
+        if name == 'citation':
+            attr_type = None if citation_wrapped else constants.LIST_OF_STRING
+            converted = [(v, None) if isinstance(v, list) else ([v], attr_type)
+                         for v in values]
+        else:
+            converted = _get_pandas_edge_attribute_values(cx_builder,
+                                                          values,
+                                                          df[name].dtype,
+                                                          row_dtype)
+        columns.append((name, converted))
+
+    seen = None
+    if update_edges:
+        seen = {(attr['po'], attr['n'])
+                for attr in cx_builder.edge_attribute_inventory}
+    elif len(set(edge_attr)) != len(edge_attr):
+        seen = set()
+
+    inventory = cx_builder.edge_attribute_inventory
+    for row, edge_id in enumerate(edge_ids):
+        for name, converted in columns:
+            value, attr_type = converted[row]
+            if seen is not None and (edge_id, name) in seen:
+                continue
+            if attr_type is None:
+                value, attr_type = cx_builder._infer_data_type(value)
+            if value is None:
+                # skipped values, such as NaN, leave the attribute
+                # free for a later row with the same edge id
+                continue
+            if seen is not None:
+                seen.add((edge_id, name))
+            inventory.append({'po': edge_id, 'n': name, 'v': value,
+                              'd': attr_type})
+
+
+def _get_pandas_edge_attribute_values(cx_builder, values, column_dtype,
+                                      row_dtype):
+    """
+    Gets (value, CX datatype) for each value of an edge attribute
+    column. Datatype is ``None`` if it has to be inferred per value
+
+    :raises TypeError: If a value is ``None``
+    """
+    if any(v is None for v in values):
+        raise TypeError('Attribute value is None')
+    if row_dtype != object:
+        return [(v, None) for v in values]
+
+    if pd.api.types.is_bool_dtype(column_dtype):
+        return [(v, constants.BOOLEAN_DATATYPE) for v in values]
+    if pd.api.types.is_integer_dtype(column_dtype) and \
+            isinstance(column_dtype, np.dtype):
+        return [(v, constants.INTEGER_DATATYPE) for v in values]
+    if pd.api.types.is_float_dtype(column_dtype) and \
+            isinstance(column_dtype, np.dtype):
+        array = np.asarray(values, dtype=float)
+        converted = [(v, constants.DOUBLE_DATATYPE) for v in values]
+        for row in np.flatnonzero(~np.isfinite(array)).tolist():
+            converted[row] = cx_builder._infer_data_type(values[row])
+            converted[row] = (converted[row][0], constants.DOUBLE_DATATYPE)
+        return converted
+    return [(v, None) for v in values]
 
 
 def create_nice_cx_from_server(server, username=None, password=None, uuid=None,
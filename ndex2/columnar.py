@@ -0,0 +1,747 @@
+# -*- coding: utf-8 -*-
+
+"""
+Stores the nodes and edges of a CX2 network as typed columns,
+one :py:mod:`numpy` array per attribute, instead of a dict per element.
+
+.. versionadded:: 3.12.0
+"""
+
+import copy
+from collections.abc import Mapping
+
+import numpy as np
+
+from ndex2 import constants
+from ndex2.cx2 import CX2Network, _convert_values
+from ndex2.exceptions import NDExAlreadyExists, NDExError, NDExNotFoundError, \
+    NDExInvalidParameterError
+
+_NUMPY_DTYPES = {constants.INTEGER_DATATYPE: np.int64,
+                 constants.LONG_DATATYPE: np.int64,
+                 constants.DOUBLE_DATATYPE: np.float64,
+                 constants.BOOLEAN_DATATYPE: np.bool_}
+
+
+class _Column(object):
+    """
+    Values of one attribute of all nodes or edges, with a mask of which elements
+    have a value. Strings are stored as codes into a list of distinct strings,
+    lists as Python objects. Arrays have spare room at the end for elements added later.
+    """
+
+    def __init__(self, datatype, capacity=0):
+        """
+        :param datatype: CX2 data type of the values
+        :type datatype: str
+        :param capacity: Number of elements to make room for
+        :type capacity: int
+        """
+        self.datatype = datatype
+        if datatype == constants.STRING_DATATYPE:
+            dtype = np.int32
+            self.categories = []
+            self._codes = {}
+        else:
+            dtype = _NUMPY_DTYPES.get(datatype, object)
+            self.categories = None
+        self.values = np.zeros(capacity, dtype=dtype)
+        self.present = np.zeros(capacity, dtype=bool)
+
+    def resize(self, capacity):
+        """
+        Changes the number of elements there is room for.
+
+        :param capacity: Number of elements
+        :type capacity: int
+        """
+        values = np.zeros(capacity, dtype=self.values.dtype)
+        present = np.zeros(capacity, dtype=bool)
+        size = min(capacity, len(self.values))
+        values[:size] = self.values[:size]
+        present[:size] = self.present[:size]
+        self.values = values
+        self.present = present
+
+    def _get_code(self, value):
+        """
+        Gets code of string **value**, adding it to the distinct strings if new.
+        """
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.categories)
+            self._codes[value] = code
+            self.categories.append(value)
+        return code
+
+    def set(self, row, value):
+        """
+        Sets the value of element at **row**, ``None`` removes the value.
+
+        :param row: Position of the element
+        :type row: int
+        :param value: Value already converted to the data type of the column
+        """
+        if value is None:
+            self.present[row] = False
+            return
+        if self.categories is not None:
+            value = self._get_code(value)
+        try:
+            self.values[row] = value
+        except (OverflowError, TypeError, ValueError):
+            # a value numpy cannot hold, such as a very large integer
+            self.values = self.values.astype(object)
+            self.values[row] = value
+        self.present[row] = True
+
+    def set_all(self, rows, values):
+        """
+        Sets the values of elements at **rows**, leaving other elements without a value.
+
+        :param rows: Positions of the elements
+        :type rows: list
+        :param values: Values already converted to the data type of the column
+        :type values: list
+        """
+        self.present[:] = False
+        if self.categories is not None:
+            values = [self._get_code(value) for value in values]
+        elif self.values.dtype != object:
+            try:
+                values = np.array(values, dtype=self.values.dtype)
+            except (OverflowError, TypeError, ValueError):
+                self.values = self.values.astype(object)
+        if self.values.dtype == object:
+            array = np.empty(len(values), dtype=object)
+            array[:] = values
+            values = array
+        self.values[rows] = values
+        self.present[rows] = True
+
+    def get(self, row):
+        """
+        Gets the value of the element at **row** as a Python object.
+
+        :param row: Position of the element
+        :type row: int
+        :return: The value, or ``None`` if the element has no value
+        """
+        if not self.present[row]:
+            return None
+        value = self.values[row]
+        if self.categories is not None:
+            return self.categories[value]
+        if isinstance(value, list):
+            return list(value)
+        return value.item() if isinstance(value, np.generic) else value
+
+    def get_array(self, size):
+        """
+        Gets the values of the first **size** elements.
+
+        :param size: Number of elements
+        :type size: int
+        :return: Values, masked where elements have no value. Strings and
+                 lists are in an array of Python objects
+        :rtype: :py:class:`numpy.ma.MaskedArray`
+        """
+        values = self.values[:size]
+        if self.categories is not None:
+            categories = np.empty(len(self.categories) + 1, dtype=object)
+            categories[:-1] = self.categories
+            values = categories[np.where(self.present[:size], values, -1)]
+        else:
+            values = values.copy()
+        return np.ma.MaskedArray(values, mask=~self.present[:size])
+
+
+class _ElementTable(object):
+    """
+    Nodes or edges stored as columns: element ids, the fixed fields of the element
+    (coordinates of nodes, source and target of edges) and attributes.
+    """
+
+    def __init__(self, fields):
+        """
+        :param fields: Name to CX2 data type of the fixed fields of each element
+        :type fields: dict
+        """
+        self.size = 0
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.fields = {name: _Column(datatype) for name, datatype in fields.items()}
+        self.columns = {}
+        # ids are in increasing order until an element is added out of order,
+        # after which rows are found with a dict built on first use
+        self._increasing = True
+        self._rows = None
+
+    def _get_all_columns(self):
+        return list(self.fields.values()) + list(self.columns.values())
+
+    def reserve(self, size):
+        """
+        Makes room for **size** elements, growing arrays by at least double so adding
+        one element at a time takes constant time on average.
+
+        :param size: Number of elements
+        :type size: int
+        """
+        if size <= len(self.ids):
+            return
+        capacity = max(size, 2 * len(self.ids), 16)
+        ids = np.zeros(capacity, dtype=np.int64)
+        ids[:self.size] = self.ids[:self.size]
+        self.ids = ids
+        for column in self._get_all_columns():
+            column.resize(capacity)
+
+    def get_column(self, name, datatype):
+        """
+        Gets column of attribute **name**, adding one of type **datatype** if there is none.
+
+        :rtype: :py:class:`_Column`
+        """
+        column = self.columns.get(name)
+        if column is None:
+            column = _Column(datatype, len(self.ids))
+            self.columns[name] = column
+        return column
+
+    def get_row(self, element_id):
+        """
+        Gets the position of element **element_id**.
+
+        :param element_id: ID of the element
+        :type element_id: int
+        :return: Position, or ``None`` if there is no element with **element_id**
+        :rtype: int
+        """
+        if not isinstance(element_id, (int, np.integer)) or isinstance(element_id, bool):
+            return None
+        if self._increasing:
+            row = int(np.searchsorted(self.ids[:self.size], element_id))
+            if row < self.size and self.ids[row] == element_id:
+                return row
+            return None
+        if self._rows is None:
+            self._rows = {element_id: row for row, element_id in enumerate(self.ids[:self.size].tolist())}
+        return self._rows.get(element_id)
+
+    def append(self, element_id, fields, attributes, datatypes):
+        """
+        Adds an element.
+
+        :param element_id: ID of the element
+        :type element_id: int
+        :param fields: Name to value of fixed fields
+        :type fields: dict
+        :param attributes: Name to value of attributes, already converted to their data types
+        :type attributes: dict
+        :param datatypes: Name to CX2 data type of attributes
+        :type datatypes: dict
+        """
+        row = self.size
+        self.reserve(row + 1)
+        if row and self.ids[row - 1] >= element_id:
+            self._increasing = False
+        self.ids[row] = element_id
+        if self._rows is not None:
+            self._rows[element_id] = row
+        for name, value in fields.items():
+            self.fields[name].set(row, value)
+        for name, value in attributes.items():
+            self.get_column(name, datatypes[name]).set(row, value)
+        self.size += 1
+
+    def load(self, ids, fields, attributes, datatypes):
+        """
+        Replaces all elements, a column at a time.
+
+        :param ids: IDs of the elements
+        :type ids: list
+        :param fields: Name to values of fixed fields, one per element
+        :type fields: dict
+        :param attributes: Name to tuple of (positions of elements with the attribute, values)
+        :type attributes: dict
+        :param datatypes: Name to CX2 data type of attributes
+        :type datatypes: dict
+        """
+        self.size = 0
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.columns = {}
+        self._rows = None
+        self.reserve(len(ids))
+        self.ids[:len(ids)] = ids
+        self.size = len(ids)
+        self._increasing = bool(np.all(np.diff(self.ids[:self.size]) > 0))
+        for name, values in fields.items():
+            rows = [row for row, value in enumerate(values) if value is not None]
+            self.fields[name].set_all(rows, [values[row] for row in rows])
+        for name, (rows, values) in attributes.items():
+            self.get_column(name, datatypes[name]).set_all(rows, values)
+
+    def get_attributes(self, row):
+        """
+        Gets the attributes of the element at **row**.
+
+        :rtype: dict
+        """
+        attributes = {}
+        for name, column in self.columns.items():
+            if column.present[row]:
+                attributes[name] = column.get(row)
+        return attributes
+
+    def get_nbytes(self):
+        """
+        Gets the number of bytes used by the arrays of this table.
+
+        :rtype: int
+        """
+        nbytes = self.ids.nbytes
+        for column in self._get_all_columns():
+            nbytes += column.values.nbytes + column.present.nbytes
+        return nbytes
+
+
+class _ElementsView(Mapping):
+    """
+    Read only view of the nodes or edges of a :py:class:`ColumnarCX2Network`
+    as a map of id to element, building each element as it is accessed.
+    """
+
+    def __init__(self, network, aspect_name):
+        self._network = network
+        self._aspect_name = aspect_name
+
+    def __getitem__(self, element_id):
+        element = self._network._get_element(self._aspect_name, element_id)
+        if element is None:
+            raise KeyError(element_id)
+        return element
+
+    def __iter__(self):
+        table = self._network._tables[self._aspect_name]
+        return iter(table.ids[:table.size].tolist())
+
+    def __len__(self):
+        return self._network._tables[self._aspect_name].size
+
+    def __contains__(self, element_id):
+        return self._network._tables[self._aspect_name].get_row(element_id) is not None
+
+
+class ColumnarCX2Network(object):
+    """
+    A `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__
+    network that stores each attribute of its nodes and edges in a typed :py:mod:`numpy` array,
+    with a mask of which elements have a value, instead of a dict of Python values per element.
+    Strings are stored as codes into a list of distinct strings. Networks of mostly
+    numbers take several times less memory than in :py:class:`~ndex2.cx2.CX2Network`
+    and attributes can be read and set for all elements at once with
+    :py:func:`get_attribute_values` and :py:func:`set_attribute_values`.
+
+    Nodes and edges are added and read as in :py:class:`~ndex2.cx2.CX2Network`,
+    with each node or edge built as a dict when read. Use :py:func:`from_cx2network`
+    and :py:func:`to_cx2network` to convert between the two.
+
+    .. versionadded:: 3.12.0
+
+    **Usage Example:**
+
+    .. code-block:: python
+
+        from ndex2.columnar import ColumnarCX2Network
+
+        net = ColumnarCX2Network()
+        node_one = net.add_node(attributes={'name': 'node 1', 'score': 0.5})
+        node_two = net.add_node(attributes={'name': 'node 2', 'score': 1.5})
+        net.add_edge(source=node_one, target=node_two)
+
+        scores = net.get_attribute_values('nodes', 'score')
+        net.set_attribute_values('nodes', 'score', scores * 2)
+
+        cx2_network = net.to_cx2network()
+    """
+
+    # attribute declarations are handled as in CX2Network
+    _get_next_id = CX2Network._get_next_id
+    _check_and_cast_id = staticmethod(CX2Network._check_and_cast_id)
+    _get_cx2_type = CX2Network._get_cx2_type
+    _get_declaration_table = CX2Network._get_declaration_table
+    _process_attributes = CX2Network._process_attributes
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self._attribute_declarations = {}
+        self._declaration_tables = {}
+        self._network_attributes = {}
+        self._visual_properties = {}
+        self._node_bypasses = {}
+        self._edge_bypasses = {}
+        self._opaque_aspects = []
+        self._status = {}
+        self._int_id_generator = {constants.NODES_ASPECT: 0, constants.EDGES_ASPECT: 0}
+        self._tables = {
+            constants.NODES_ASPECT: _ElementTable({constants.LAYOUT_X: constants.DOUBLE_DATATYPE,
+                                                   constants.LAYOUT_Y: constants.DOUBLE_DATATYPE,
+                                                   constants.LAYOUT_Z: constants.DOUBLE_DATATYPE}),
+            constants.EDGES_ASPECT: _ElementTable({constants.EDGE_SOURCE: constants.LONG_DATATYPE,
+                                                   constants.EDGE_TARGET: constants.LONG_DATATYPE})
+        }
+
+    def get_attribute_declarations(self):
+        """
+        Gets the attribute declarations, in the format of
+        :py:func:`~ndex2.cx2.CX2Network.get_attribute_declarations`
+
+        :rtype: dict
+        """
+        return self._attribute_declarations
+
+    def get_network_attributes(self):
+        """
+        Gets the network attributes.
+
+        :rtype: dict
+        """
+        return self._network_attributes
+
+    def get_nodes(self):
+        """
+        Gets the nodes as a read only map of node id to node, in the format of
+        :py:func:`~ndex2.cx2.CX2Network.get_nodes`. Each node is built when read,
+        so changing it does not change the network.
+
+        :rtype: :py:class:`collections.abc.Mapping`
+        """
+        return _ElementsView(self, constants.NODES_ASPECT)
+
+    def get_node(self, node_id):
+        """
+        Gets a node, in the format of :py:func:`~ndex2.cx2.CX2Network.get_node`
+
+        :param node_id: ID of the node
+        :type node_id: int
+        :return: Node with the given ID or ``None`` if not found
+        :rtype: dict
+        """
+        return self._get_element(constants.NODES_ASPECT, node_id)
+
+    def add_node(self, node_id=None, attributes=None, x=None, y=None, z=None):
+        """
+        Adds a node to the network, as :py:func:`~ndex2.cx2.CX2Network.add_node` does.
+
+        :param node_id: ID of the node to add.
+        :type node_id: int or str
+        :param attributes: Attributes of the node.
+        :type attributes: dict, optional
+        :param x: X-coordinate of the node.
+        :type x: float, optional
+        :param y: Y-coordinate of the node.
+        :type y: float, optional
+        :param z: Z-coordinate of the node.
+        :type z: float, optional
+        :raises NDExAlreadyExists: If node with **node_id** already exists
+        :return: ID of the node added
+        :rtype: int
+        """
+        return self._add_element(constants.NODES_ASPECT, node_id, attributes,
+                                 {constants.LAYOUT_X: x, constants.LAYOUT_Y: y, constants.LAYOUT_Z: z})
+
+    def get_edges(self):
+        """
+        Gets the edges as a read only map of edge id to edge, in the format of
+        :py:func:`~ndex2.cx2.CX2Network.get_edges`. Each edge is built when read,
+        so changing it does not change the network.
+
+        :rtype: :py:class:`collections.abc.Mapping`
+        """
+        return _ElementsView(self, constants.EDGES_ASPECT)
+
+    def get_edge(self, edge_id):
+        """
+        Gets an edge, in the format of :py:func:`~ndex2.cx2.CX2Network.get_edge`
+
+        :param edge_id: ID of the edge
+        :type edge_id: int
+        :return: Edge with the given ID or ``None`` if not found
+        :rtype: dict
+        """
+        return self._get_element(constants.EDGES_ASPECT, edge_id)
+
+    def add_edge(self, edge_id=None, source=None, target=None, attributes=None):
+        """
+        Adds an edge to the network, as :py:func:`~ndex2.cx2.CX2Network.add_edge` does.
+
+        :param edge_id: ID of the edge to add.
+        :type edge_id: int or str
+        :param source: Source node of the edge.
+        :type source: int or str
+        :param target: Target node of the edge.
+        :type target: int or str
+        :param attributes: Attributes of the edge.
+        :type attributes: dict, optional
+        :raises NDExError: If **source** or **target** is ``None``
+        :raises NDExAlreadyExists: If edge with **edge_id** already exists
+        :return: ID of the edge added
+        :rtype: int
+        """
+        if source is None or target is None:
+            raise NDExError("Edge must have source and target")
+        return self._add_element(constants.EDGES_ASPECT, edge_id, attributes,
+                                 {constants.EDGE_SOURCE: self._check_and_cast_id(source),
+                                  constants.EDGE_TARGET: self._check_and_cast_id(target)})
+
+    def get_ids(self, aspect_name):
+        """
+        Gets the ids of the nodes or edges, in the order of the arrays
+        returned by :py:func:`get_attribute_values`
+
+        :param aspect_name: 'nodes' or 'edges'
+        :type aspect_name: str
+        :rtype: :py:class:`numpy.ndarray`
+        """
+        table = self._get_table(aspect_name)
+        return table.ids[:table.size].copy()
+
+    def get_edge_endpoints(self):
+        """
+        Gets the sources and targets of all edges, in the order of :py:func:`get_ids`
+
+        :return: (sources, targets)
+        :rtype: tuple
+        """
+        table = self._tables[constants.EDGES_ASPECT]
+        return tuple(table.fields[name].values[:table.size].copy()
+                     for name in (constants.EDGE_SOURCE, constants.EDGE_TARGET))
+
+    def get_attribute_values(self, aspect_name, attribute):
+        """
+        Gets the values of an attribute for all nodes or edges, in the order of :py:func:`get_ids`
+
+        :param aspect_name: 'nodes' or 'edges'
+        :type aspect_name: str
+        :param attribute: Name of the attribute
+        :type attribute: str
+        :raises NDExNotFoundError: If no node or edge has **attribute**
+        :return: Values, masked for elements without the attribute. Strings
+                 and lists are in an array of Python objects
+        :rtype: :py:class:`numpy.ma.MaskedArray`
+        """
+        table = self._get_table(aspect_name)
+        column = table.columns.get(attribute)
+        if column is None:
+            raise NDExNotFoundError(f'No {aspect_name} have attribute {attribute}')
+        return column.get_array(table.size)
+
+    def set_attribute_values(self, aspect_name, attribute, values):
+        """
+        Sets the values of an attribute for all nodes or edges at once. Values are
+        converted to the declared type of the attribute, or if it is not declared yet,
+        the attribute is declared with the type of its first value.
+
+        :param aspect_name: 'nodes' or 'edges'
+        :type aspect_name: str
+        :param attribute: Name of the attribute
+        :type attribute: str
+        :param values: One value per element, in the order of :py:func:`get_ids`.
+                       ``None`` or masked values remove the attribute from the element
+        :type values: list, :py:class:`numpy.ndarray` or :py:class:`numpy.ma.MaskedArray`
+        :raises NDExInvalidParameterError: If the number of values does not match the number of elements
+        :raises NDExInvalidCX2Error: If a value does not match the declared type
+        """
+        table = self._get_table(aspect_name)
+        if len(values) != table.size:
+            raise NDExInvalidParameterError(f'Expected {table.size} values, got {len(values)}')
+        if isinstance(values, np.ma.MaskedArray):
+            present = ~np.ma.getmaskarray(values)
+            values = values.data
+        else:
+            present = np.array([value is not None for value in values], dtype=bool)
+        rows = np.flatnonzero(present)
+        values = values[rows] if isinstance(values, np.ndarray) else [values[row] for row in rows.tolist()]
+
+        declaration_table = self._get_declaration_table(aspect_name)
+        attribute = declaration_table.aliases.get(attribute, attribute)
+        datatype = declaration_table.datatypes.get(attribute)
+        if datatype is None and len(rows):
+            datatype = self._get_cx2_type(values[0])
+            self._attribute_declarations.setdefault(aspect_name, {})[attribute] = \
+                {constants.ATTR_DATATYPE: datatype}
+        if datatype is None:
+            table.columns.pop(attribute, None)
+            return
+        converted = _convert_values(datatype, values)
+        column = table.columns.get(attribute)
+        if column is None or column.datatype != datatype:
+            column = table.columns[attribute] = _Column(datatype, len(table.ids))
+        column.set_all(rows.tolist(), converted)
+
+    def get_nbytes(self):
+        """
+        Gets the number of bytes used by the arrays holding nodes and edges.
+
+        :rtype: int
+        """
+        return sum(table.get_nbytes() for table in self._tables.values())
+
+    def to_cx2network(self):
+        """
+        Creates a :py:class:`~ndex2.cx2.CX2Network` with the contents of this network.
+
+        :rtype: :py:class:`~ndex2.cx2.CX2Network`
+        """
+        network = CX2Network()
+        nodes = {node[constants.ASPECT_ID]: node for node in self._iter_elements(constants.NODES_ASPECT)}
+        edges = {edge[constants.ASPECT_ID]: edge for edge in self._iter_elements(constants.EDGES_ASPECT)}
+        network._load_elements(nodes, edges, copy.deepcopy(self._attribute_declarations),
+                               self._int_id_generator[constants.NODES_ASPECT],
+                               self._int_id_generator[constants.EDGES_ASPECT])
+        network.set_network_attributes(dict(self._network_attributes))
+        network.set_visual_properties(copy.deepcopy(self._visual_properties))
+        for node_id, value in self._node_bypasses.items():
+            network.add_node_bypass(node_id, copy.deepcopy(value))
+        for edge_id, value in self._edge_bypasses.items():
+            network.add_edge_bypass(edge_id, copy.deepcopy(value))
+        network.set_opaque_aspects(copy.deepcopy(self._opaque_aspects))
+        network.set_status(copy.deepcopy(self._status))
+        return network
+
+    def _get_table(self, aspect_name):
+        """
+        Gets the table of nodes or edges.
+
+        :raises NDExInvalidParameterError: If **aspect_name** is not 'nodes' or 'edges'
+        """
+        table = self._tables.get(aspect_name)
+        if table is None:
+            raise NDExInvalidParameterError(f"aspect_name must be '{constants.NODES_ASPECT}' "
+                                            f"or '{constants.EDGES_ASPECT}', got {aspect_name}")
+        return table
+
+    def _add_element(self, aspect_name, element_id, attributes, fields):
+        """
+        Adds a node or edge.
+
+        :return: ID of the element added
+        :rtype: int
+        """
+        table = self._tables[aspect_name]
+        if element_id is not None and table.get_row(self._check_and_cast_id(element_id)) is not None:
+            label = 'Node' if aspect_name == constants.NODES_ASPECT else 'Edge'
+            raise NDExAlreadyExists(f"{label} with ID {element_id} already exists.")
+        element_id = self._get_next_id(aspect_name, element_id)
+        processed_attributes = self._process_attributes(aspect_name, attributes)
+        datatypes = self._get_declaration_table(aspect_name).datatypes
+        datatypes = {name: datatypes.get(name) or self._get_cx2_type(value)
+                     for name, value in processed_attributes.items()}
+        table.append(element_id, fields, processed_attributes, datatypes)
+        return element_id
+
+    def _get_element(self, aspect_name, element_id):
+        """
+        Builds the node or edge with id **element_id**.
+
+        :return: Node or edge, or ``None`` if not found
+        :rtype: dict
+        """
+        table = self._tables[aspect_name]
+        row = table.get_row(element_id)
+        if row is None:
+            return None
+        return self._build_element(aspect_name, table, row)
+
+    def _iter_elements(self, aspect_name):
+        """
+        Builds all nodes or edges, in the order they were added.
+
+        :rtype: generator of dict
+        """
+        table = self._tables[aspect_name]
+        for row in range(table.size):
+            yield self._build_element(aspect_name, table, row)
+
+    @staticmethod
+    def _build_element(aspect_name, table, row):
+        """
+        Builds the node or edge at **row** of **table**, with the same keys as in
+        :py:class:`~ndex2.cx2.CX2Network`
+        """
+        element_id = int(table.ids[row])
+        if aspect_name == constants.NODES_ASPECT:
+            return {constants.ASPECT_ID: element_id,
+                    constants.ASPECT_VALUES: table.get_attributes(row),
+                    constants.LAYOUT_X: table.fields[constants.LAYOUT_X].get(row),
+                    constants.LAYOUT_Y: table.fields[constants.LAYOUT_Y].get(row),
+                    constants.LAYOUT_Z: table.fields[constants.LAYOUT_Z].get(row)}
+        return {constants.ASPECT_ID: element_id,
+                constants.EDGE_SOURCE: table.fields[constants.EDGE_SOURCE].get(row),
+                constants.EDGE_TARGET: table.fields[constants.EDGE_TARGET].get(row),
+                constants.ASPECT_VALUES: table.get_attributes(row)}
+
+
+def from_cx2network(network):
+    """
+    Creates a :py:class:`ColumnarCX2Network` with the contents of **network**,
+    reading nodes and edges a column at a time.
+
+    .. versionadded:: 3.12.0
+
+    **Usage Example:**
+
+    .. code-block:: python
+
+        from ndex2.cx2 import CX2Network
+        from ndex2.columnar import from_cx2network
+
+        cx2_network = CX2Network()
+        cx2_network.create_from_raw_cx2('mynetwork.cx2')
+        net = from_cx2network(cx2_network)
+        print(net.get_nbytes())
+
+    :param network: Network to copy
+    :type network: :py:class:`~ndex2.cx2.CX2Network`
+    :raises NDExError: If **network** is ``None``
+    :return: Columnar copy of **network**
+    :rtype: :py:class:`ColumnarCX2Network`
+    """
+    if network is None:
+        raise NDExError('network is None')
+    columnar = ColumnarCX2Network()
+    columnar._attribute_declarations = copy.deepcopy(network.get_attribute_declarations())
+    columnar._network_attributes = dict(network.get_network_attributes())
+    columnar._visual_properties = copy.deepcopy(network.get_visual_properties())
+    columnar._node_bypasses = copy.deepcopy(network.get_node_bypasses())
+    columnar._edge_bypasses = copy.deepcopy(network.get_edge_bypasses())
+    columnar._opaque_aspects = copy.deepcopy(network.get_opaque_aspects())
+    columnar._status = copy.deepcopy(network.get_status())
+    columnar._int_id_generator = dict(network._int_id_generator)
+
+    for aspect_name, fields in ((constants.NODES_ASPECT, (constants.LAYOUT_X, constants.LAYOUT_Y,
+                                                          constants.LAYOUT_Z)),
+                                (constants.EDGES_ASPECT, (constants.EDGE_SOURCE, constants.EDGE_TARGET))):
+        elements = network.get_nodes() if aspect_name == constants.NODES_ASPECT else network.get_edges()
+        ids = []
+        field_values = {name: [] for name in fields}
+        attributes = {}
+        for row, element in enumerate(elements.values()):
+            ids.append(element[constants.ASPECT_ID])
+            for name in fields:
+                field_values[name].append(element.get(name))
+            for name, value in element.get(constants.ASPECT_VALUES, {}).items():
+                if value is None:
+                    continue
+                rows_values = attributes.get(name)
+                if rows_values is None:
+                    rows_values = attributes[name] = ([], [])
+                rows_values[0].append(row)
+                rows_values[1].append(value)
+        declared = columnar._get_declaration_table(aspect_name).datatypes
+        datatypes = {name: declared.get(name) or columnar._get_cx2_type(values[0])
+                     for name, (rows, values) in attributes.items()}
+        columnar._tables[aspect_name].load(ids, field_values, attributes, datatypes)
+    return columnar
@@ -154,6 +154,11 @@ NODE_NAME_EXPANDED = 'name'
 Expanded key for node name
 """
 
+NODE_REPRESENTS_EXPANDED = 'represents'
+"""
+Expanded key for node represents
+"""
+
 NODE_ATTR_NAME = 'n'
 """
 Key for node attribute name
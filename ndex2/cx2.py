@@ -1,56 +1,489 @@
 import copy
+import gzip
+import io
+import bisect
 import json
+import string
 from copy import deepcopy
 
+import ijson
 import networkx as nx
 import numpy as np
 import pandas as pd
 
-from ndex2 import create_nice_cx_from_raw_cx, create_nice_cx_from_file, constants
-from ndex2.constants import VALID_ATTRIBUTE_DATATYPES_PLUS_SHORT
-from ndex2.exceptions import NDExInvalidCX2Error, NDExAlreadyExists, NDExError, NDExNotFoundError
+from ndex2 import create_nice_cx_from_raw_cx, create_nice_cx_from_file, constants, query
+from ndex2.exceptions import NDExInvalidCX2Error, NDExAlreadyExists, NDExError, NDExNotFoundError, \
+    NDExInvalidParameterError
 from ndex2.nice_cx_network import NiceCXNetwork
-from itertools import zip_longest
-from collections.abc import Iterable
+from itertools import compress, count, product, zip_longest
+from collections.abc import Iterable, Mapping
+
+
+_MISMATCH_MESSAGE = 'Declared value of attribute data does not match the actual value type: '
+
+
+def _convert_int(value):
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except ValueError as err:
+        raise NDExInvalidCX2Error(_MISMATCH_MESSAGE + str(err))
+
+
+def _convert_float(value):
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except ValueError as err:
+        raise NDExInvalidCX2Error(_MISMATCH_MESSAGE + str(err))
+
+
+def _convert_bool(value):
+    if isinstance(value, bool):
+        return value
+    return value.lower() == 'true'
+
+
+def _convert_str(value):
+    if type(value) is str:
+        return value
+    return str(value)
+
+
+def _make_list_converter(convert_element, element_type):
+    """
+    Creates converter for lists of values converted by **convert_element**, leaving
+    elements that are already of **element_type** as they are.
+    """
+    def convert_list(value):
+        if not isinstance(value, list):
+            raise NDExInvalidCX2Error(_MISMATCH_MESSAGE + 'list expected')
+        return [element if type(element) is element_type else convert_element(element) for element in value]
+    return convert_list
+
+
+_CONVERTERS = {constants.INTEGER_DATATYPE: _convert_int,
+               constants.LONG_DATATYPE: _convert_int,
+               'int': _convert_int,
+               constants.DOUBLE_DATATYPE: _convert_float,
+               'float': _convert_float,
+               constants.BOOLEAN_DATATYPE: _convert_bool,
+               'bool': _convert_bool,
+               constants.STRING_DATATYPE: _convert_str,
+               'str': _convert_str}
+for _element_dtype, _element_type in ((constants.STRING_DATATYPE, str), (constants.LONG_DATATYPE, int),
+                                      (constants.INTEGER_DATATYPE, int), (constants.DOUBLE_DATATYPE, float),
+                                      (constants.BOOLEAN_DATATYPE, bool)):
+    _CONVERTERS['list_of_' + _element_dtype] = _make_list_converter(_CONVERTERS[_element_dtype], _element_type)
+
+_CX2_TYPES = {bool: constants.BOOLEAN_DATATYPE,
+              float: constants.DOUBLE_DATATYPE,
+              str: constants.STRING_DATATYPE}
+
+
+def _get_converter(dtype):
+    """
+    Gets the function converting values to **dtype**, as :py:func:`convert_value` does.
+    Converters return values already of the right Python type as they are.
+
+    :param dtype: Declared data type for the values.
+    :type dtype: str
+    :raises NDExInvalidCX2Error: If **dtype** is not a valid data type
+    :return: Function taking a value and returning the converted value
+    :rtype: function
+    """
+    try:
+        return _CONVERTERS[dtype]
+    except (KeyError, TypeError):
+        raise NDExInvalidCX2Error(f'Data type {dtype} is invalid in CX2 format')
+
+
+def _get_cx2_value_type(value):
+    """
+    Gets the `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__
+    type of **value**, see :py:func:`CX2Network._get_cx2_type`
+    """
+    value_type = type(value)
+    cx2_type = _CX2_TYPES.get(value_type)
+    if cx2_type is not None:
+        return cx2_type
+    if value_type is not int:
+        if isinstance(value, (bool, np.bool_)):
+            return constants.BOOLEAN_DATATYPE
+        elif isinstance(value, (float, np.floating)):
+            return constants.DOUBLE_DATATYPE
+        elif isinstance(value, (str, np.str_)):
+            return constants.STRING_DATATYPE
+        elif isinstance(value, list):
+            if value:
+                return f"list_of_{_get_cx2_value_type(value[0])}"
+            return None
+        elif not isinstance(value, (int, np.integer)):
+            raise NDExError(f"Unsupported value type: {type(value)}")
+    if 2 ** 31 - 1 >= int(value) >= -2 ** 31:
+        return constants.INTEGER_DATATYPE
+    return constants.LONG_DATATYPE
 
 
 def convert_value(dtype, value):
     """
     Converts a value to its appropriate data type based on its declared type.
 
+    .. versionchanged:: 3.12.0
+
+        Uses a converter made once per data type, which returns values
+        already of the right Python type without converting them
+
     :param dtype: Declared data type for the value.
     :type dtype: str
     :param value: Value to be converted.
     :type value: any
     :raises NDExInvalidCX2Error: For invalid data
     """
-    if dtype not in VALID_ATTRIBUTE_DATATYPES_PLUS_SHORT:
-        raise NDExInvalidCX2Error(f'Data type {dtype} is invalid in CX2 format')
+    return _get_converter(dtype)(value)
 
-    if dtype.startswith("list_of_"):
-        if not isinstance(value, list):
-            raise NDExInvalidCX2Error('Declared value of attribute data does not match the actual value type: '
-                                      'list expected')
-        elem_type = dtype.split("_")[2]
-        if elem_type not in [constants.STRING_DATATYPE, constants.LONG_DATATYPE, constants.INTEGER_DATATYPE,
-                             constants.DOUBLE_DATATYPE, constants.BOOLEAN_DATATYPE]:
-            raise NDExInvalidCX2Error(f'Data type {dtype} is invalid in CX2 format')
-        return [convert_value(elem_type, v) for v in value]
 
-    try:
-        if dtype == constants.INTEGER_DATATYPE or dtype == constants.LONG_DATATYPE or dtype == 'int':
-            return int(value)
-        elif dtype == constants.DOUBLE_DATATYPE or dtype == 'float':
-            return float(value)
-        elif dtype == constants.BOOLEAN_DATATYPE or dtype == 'bool':
-            if isinstance(value, bool):
-                return value
+def _convert_values(dtype, values):
+    """
+    Converts **values** to **dtype** as :py:func:`convert_value` does, skipping the per value
+    conversion where the type of a :py:class:`numpy.ndarray` already matches.
+
+    :param dtype: Declared data type for the values.
+    :type dtype: str
+    :param values: Values to be converted.
+    :type values: :py:class:`numpy.ndarray` or list
+    :raises NDExInvalidCX2Error: For invalid data
+    :return: converted values
+    :rtype: list
+    """
+    kind = values.dtype.kind if isinstance(values, np.ndarray) else None
+    if dtype == constants.DOUBLE_DATATYPE and kind == 'f':
+        return values.tolist()
+    if dtype in (constants.INTEGER_DATATYPE, constants.LONG_DATATYPE) and kind in ('i', 'u'):
+        return values.tolist()
+    if dtype == constants.BOOLEAN_DATATYPE and kind == 'b':
+        return values.tolist()
+    converter = _get_converter(dtype)
+    return [converter(value) for value in values]
+
+
+def _build_json_value(event, value, events):
+    """
+    Builds the JSON value starting with **event** from events generated by :py:func:`ijson.basic_parse`,
+    consuming the events of the value from **events**.
+
+    :param event: First event of the value
+    :type event: str
+    :param value: Value of the first event
+    :param events: Events following the first one
+    :type events: iterator
+    :return: The value, as :py:func:`json.load` would return it
+    """
+    if event == 'start_map':
+        obj = {}
+        for event, value in events:
+            if event == 'map_key':
+                key = value
+            elif event == 'end_map':
+                return obj
+            elif event == 'start_map' or event == 'start_array':
+                obj[key] = _build_json_value(event, value, events)
             else:
-                return value.lower() == 'true'
+                obj[key] = value
+    elif event == 'start_array':
+        arr = []
+        for event, value in events:
+            if event == 'end_array':
+                return arr
+            elif event == 'start_map' or event == 'start_array':
+                arr.append(_build_json_value(event, value, events))
+            else:
+                arr.append(value)
+    return value
+
+
+def _iter_json_array(events):
+    """
+    Generates the elements of a JSON array, one at a time, from events generated by
+    :py:func:`ijson.basic_parse` after the start of the array.
+
+    :param events: Events following ``start_array``
+    :type events: iterator
+    :return: Elements of the array
+    :rtype: generator
+    """
+    for event, value in events:
+        if event == 'end_array':
+            return
+        yield _build_json_value(event, value, events)
+
+
+def _iter_cx2_sections(cx2_file):
+    """
+    Reads aspects of `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__
+    from **cx2_file** one at a time. For nodes and edges, the aspect is given as a generator
+    that reads one element at a time, which must be used up before reading the next aspect.
+
+    :param cx2_file: File object opened in binary mode
+    :return: Aspects, as they appear in the list of aspects in **cx2_file**
+    :rtype: generator of dict
+    :raises NDExInvalidCX2Error: If **cx2_file** is not a list of aspects
+    """
+    events = ijson.basic_parse(cx2_file, use_float=True)
+    event, value = next(events, (None, None))
+    if event != 'start_array':
+        raise NDExInvalidCX2Error('CX2 must be a list of aspects')
+    for event, value in events:
+        if event == 'end_array':
+            return
+        if event != 'start_map':
+            raise NDExInvalidCX2Error('Each aspect in CX2 must be an object')
+        section = {}
+        for event, value in events:
+            if event == 'end_map':
+                break
+            name = value
+            event, value = next(events)
+            if not section and event == 'start_array' and name in (constants.NODES_ASPECT,
+                                                                   constants.EDGES_ASPECT):
+                elements = _iter_json_array(events)
+                yield {name: elements}
+                for _ in elements:
+                    pass
+            else:
+                section[name] = _build_json_value(event, value, events)
+        if section:
+            yield section
+
+
+class _NodeEdgeIndex(Mapping):
+    """
+    Read only map of node id to list of ids of edges that have the node as source or
+    target, built on the fly from the source and target indexes kept by
+    :py:class:`CX2Network`. Edges with the node as source come first.
+    """
+
+    def __init__(self, outgoing, incoming):
+        self._outgoing = outgoing
+        self._incoming = incoming
+
+    def __getitem__(self, node_id):
+        outgoing = self._outgoing.get(node_id, {})
+        incoming = self._incoming.get(node_id, {})
+        if not outgoing and not incoming:
+            raise KeyError(node_id)
+        return list(outgoing) + [edge_id for edge_id in incoming if edge_id not in outgoing]
+
+    def __iter__(self):
+        return iter(dict.fromkeys(list(self._outgoing) + list(self._incoming)))
+
+    def __len__(self):
+        return len(self._outgoing.keys() | self._incoming.keys())
+
+
+class _DeclarationTable(object):
+    """
+    Attribute declarations of one aspect of a :py:class:`CX2Network`, arranged
+    for the lookups done when adding each node or edge.
+    """
+
+    def __init__(self, declarations):
+        """
+        :param declarations: attribute name => declaration, or ``None``
+        :type declarations: dict
+        """
+        self.declarations = declarations
+        self.size = len(declarations) if declarations else 0
+        # alias => attribute name
+        self.aliases = {}
+        # attribute name => declared data type
+        self.datatypes = {}
+        for name, details in (declarations or {}).items():
+            if details.get('a', None):
+                self.aliases[details['a']] = name
+            if details.get(constants.ATTR_DATATYPE) is not None:
+                self.datatypes[name] = details[constants.ATTR_DATATYPE]
+        # (attribute name, default value) for attributes with a default
+        self.defaults = [(self.aliases.get(name, name), details[constants.ASPECT_VALUES])
+                         for name, details in (declarations or {}).items()
+                         if details.get(constants.ASPECT_VALUES, None)]
+        # aliases and the names they stand for are never declared on the fly
+        self.reserved = set(self.aliases.keys()) | set(self.aliases.values())
+        # copy of the declarations, to spot declarations changed in place
+        self._snapshot = [(name, dict(details)) for name, details in (declarations or {}).items()]
+
+    def add(self, name, datatype):
+        """
+        Declares attribute **name** of data type **datatype**, in the table and in
+        the declarations it was built from, which must not be ``None``.
+        """
+        self.declarations[name] = {constants.ATTR_DATATYPE: datatype}
+        self.datatypes[name] = datatype
+        self.size += 1
+        self._snapshot.append((name, {constants.ATTR_DATATYPE: datatype}))
+
+    def is_current(self, declarations):
+        """
+        Checks if this table was built from **declarations**, as they are now. Declarations
+        can be changed in place through :py:func:`CX2Network.get_attribute_declarations`,
+        so they are compared with a copy taken when the table was built.
+
+        :rtype: bool
+        """
+        if declarations is not self.declarations or (len(declarations) if declarations else 0) != self.size:
+            return False
+        return not declarations or list(declarations.items()) == self._snapshot
+
+
+class _HashAttributeIndex(object):
+    """
+    Ids of the nodes or edges of a :py:class:`CX2Network` having each value of one attribute,
+    keyed as :py:func:`CX2Network._get_attribute_index_key` says. Ids of a value are kept in a
+    set, so adding and removing take the same time no matter how many nodes or edges share
+    the value, and are sorted when looked up.
+    """
+
+    def __init__(self):
+        self._ids = {}
+        # sorted ids of values looked up, until their ids change
+        self._sorted_ids = {}
+
+    def add(self, element_id, key):
+        """
+        Adds node or edge **element_id** with value of **key**
+        """
+        if key is not None:
+            self._ids.setdefault(key, set()).add(element_id)
+            self._sorted_ids.pop(key, None)
+
+    def remove(self, element_id, key):
+        """
+        Removes node or edge **element_id** that had value of **key**
+        """
+        element_ids = self._ids.get(key) if key is not None else None
+        if element_ids is not None and element_id in element_ids:
+            element_ids.remove(element_id)
+            if not element_ids:
+                del self._ids[key]
+            self._sorted_ids.pop(key, None)
+
+    def get(self, key):
+        """
+        Gets ids of nodes or edges with value of **key**, in no particular order
+
+        :rtype: set
+        """
+        return self._ids.get(key, ())
+
+    def find(self, key):
+        """
+        Gets ids of nodes or edges with value of **key**
+
+        :return: Ids in increasing order, not to be changed by the caller
+        :rtype: list
+        """
+        element_ids = self._sorted_ids.get(key)
+        if element_ids is None:
+            element_ids = sorted(self._ids.get(key, ()))
+            if len(element_ids) > 1:
+                self._sorted_ids[key] = element_ids
+        return element_ids
+
+
+class _SortedAttributeIndex(object):
+    """
+    Values of one attribute of the nodes or edges of a :py:class:`CX2Network`, in sorted order,
+    with the id of the node or edge having each value. Numbers and strings are indexed,
+    numbers sorting before strings, and are only compared with values of the same kind.
+    """
+
+    NUMBER = 0
+    STRING = 1
+
+    def __init__(self, elements, attribute):
+        """
+        :param elements: node or edge id => node or edge
+        :type elements: dict
+        :param attribute: Name of attribute
+        :type attribute: str
+        """
+        entries = []
+        for element_id, element in elements.items():
+            key = self.get_key(element.get(constants.ASPECT_VALUES, {}).get(attribute))
+            if key is not None:
+                entries.append((key, element_id))
+        entries.sort()
+        self.keys = [key for key, element_id in entries]
+        self.ids = [element_id for key, element_id in entries]
+
+    @staticmethod
+    def get_key(value):
+        """
+        Gets sort key of **value**
+
+        :return: (kind, value) or ``None`` if **value** is not a number or string, or is NaN
+        :rtype: tuple
+        """
+        if isinstance(value, str):
+            return _SortedAttributeIndex.STRING, value
+        if isinstance(value, (int, float, np.number)) and value == value:
+            return _SortedAttributeIndex.NUMBER, value
+        return None
+
+    def _get_position(self, key, element_id):
+        low = bisect.bisect_left(self.keys, key)
+        high = bisect.bisect_right(self.keys, key, low)
+        return bisect.bisect_left(self.ids, element_id, low, high)
+
+    def add(self, element_id, value):
+        """
+        Adds node or edge **element_id** with **value**
+        """
+        key = self.get_key(value)
+        if key is not None:
+            position = self._get_position(key, element_id)
+            self.keys.insert(position, key)
+            self.ids.insert(position, element_id)
+
+    def remove(self, element_id, value):
+        """
+        Removes node or edge **element_id** that had **value**
+        """
+        key = self.get_key(value)
+        if key is not None:
+            position = self._get_position(key, element_id)
+            if position < len(self.ids) and self.ids[position] == element_id and self.keys[position] == key:
+                del self.keys[position]
+                del self.ids[position]
+
+    def find(self, operator, value):
+        """
+        Finds nodes or edges whose value compares to **value** as **operator** says.
+
+        :param operator: One of 'eq', 'lt', 'lte', 'gt' or 'gte'
+        :type operator: str
+        :return: Ids of matching nodes or edges
+        :rtype: list
+        """
+        key = self.get_key(value)
+        if key is None:
+            return []
+        start = bisect.bisect_left(self.keys, (key[0],))
+        end = bisect.bisect_left(self.keys, (key[0] + 1,))
+        if operator in ('eq', 'lte', 'gte'):
+            low = bisect.bisect_left(self.keys, key, start, end)
+            high = bisect.bisect_right(self.keys, key, low, end)
         else:
-            return str(value)
-    except ValueError as err:
-        raise NDExInvalidCX2Error('Declared value of attribute data does not match the actual value type: ' + str(err))
+            low = high = bisect.bisect_left(self.keys, key, start, end)
+            if operator == 'gt':
+                low = bisect.bisect_right(self.keys, key, low, end)
+        if operator == 'eq':
+            return self.ids[low:high]
+        if operator in ('lt', 'lte'):
+            return self.ids[start:high if operator == 'lte' else low]
+        return self.ids[low:end]
 
 
 class CX2Network(object):
@@ -114,6 +547,8 @@ class CX2Network(object):
     .. versionadded:: 3.6.0
     """
 
+    _COW_ASPECTS = ('_nodes', '_edges', '_node_bypasses', '_edge_bypasses')
+
     def __init__(self):
         self._attribute_declarations = {}
         self._network_attributes = {}
@@ -125,6 +560,14 @@ class CX2Network(object):
         self._opaque_aspects = []
         self._status = {}
         self._int_id_generator = {constants.NODES_ASPECT: 0, constants.EDGES_ASPECT: 0}
+        self._adjacency_index = None
+        self._search_term_index = None
+        self._attribute_indexes = {constants.NODES_ASPECT: {}, constants.EDGES_ASPECT: {}}
+        self._sorted_attribute_indexes = {constants.NODES_ASPECT: {}, constants.EDGES_ASPECT: {}}
+        self._declaration_tables = {}
+        self._attribute_counts = {constants.NODES_ASPECT: {}, constants.EDGES_ASPECT: {}}
+        self._cow_shared = set()
+        self._cow_owned = {}
 
     def _get_next_id(self, aspect, aspect_id=None):
         """
@@ -227,23 +670,7 @@ class CX2Network(object):
         :rtype: str
         :raises NDExError: If the value is of an unsupported type.
         """
-        if isinstance(value, (bool, np.bool_)):
-            return constants.BOOLEAN_DATATYPE
-        elif isinstance(value, (int, np.integer)):
-            if 2 ** 31 - 1 >= int(value) >= -2 ** 31:
-                return constants.INTEGER_DATATYPE
-            else:
-                return constants.LONG_DATATYPE
-        elif isinstance(value, (float, np.floating)):
-            return constants.DOUBLE_DATATYPE
-        elif isinstance(value, (str, np.str_)):
-            return constants.STRING_DATATYPE
-        elif isinstance(value, list):
-            if value:
-                inner_type = self._get_cx2_type(value[0])
-                return f"list_of_{inner_type}"
-        else:
-            raise NDExError(f"Unsupported value type: {type(value)}")
+        return _get_cx2_value_type(value)
 
     def _generate_attribute_declarations_for_aspect(self, aspect, attributes, aliases):
         """
@@ -317,6 +744,7 @@ class CX2Network(object):
         :type value: dict
         """
         self._attribute_declarations = value
+        self._declaration_tables = {}
 
     def get_network_attributes(self):
         """
@@ -517,9 +945,73 @@ class CX2Network(object):
             constants.LAYOUT_Y: y,
             constants.LAYOUT_Z: z
         }
-        self._nodes[node_id] = node
+        self._get_writable_aspect('_nodes')[node_id] = node
+        self._search_term_index = None
+        self._update_attribute_indexes(constants.NODES_ASPECT, node_id, {}, processed_attributes)
+        self._update_attribute_counts(constants.NODES_ASPECT, processed_attributes, 1)
         return node_id
 
+    def add_nodes(self, ids=None, attributes=None, x=None, y=None, z=None):
+        """
+        Adds many nodes to the network at once. Gives the same result as calling
+        :py:func:`add_node` for each node, but checks ids, works out the data type of
+        each attribute and converts attribute values a column at a time.
+
+        Nodes are checked before any are added, so if an error is raised the network is unchanged.
+
+        .. versionadded:: 3.12.0
+
+        **Usage Example:**
+
+        .. code-block:: python
+
+            from ndex2.cx2 import CX2Network
+
+            cx2_network = CX2Network()
+            node_ids = cx2_network.add_nodes(attributes={'name': ['node 1', 'node 2'],
+                                                         'age': [5, None]},
+                                             x=[0.0, 10.5], y=[1.0, -2.0])
+
+        :param ids: IDs of the nodes to add. If ``None``, the next free IDs are used.
+        :type ids: list
+        :param attributes: Columns of node attributes, one value per node. ``None``, or
+                           missing values in a :py:class:`pandas.Series` column, leave
+                           the attribute off that node.
+        :type attributes: dict or :py:class:`pandas.DataFrame`, optional
+        :param x: X-coordinates of the nodes.
+        :type x: list, optional
+        :param y: Y-coordinates of the nodes.
+        :type y: list, optional
+        :param z: Z-coordinates of the nodes.
+        :type z: list, optional
+        :raises NDExAlreadyExists: If a node with one of **ids** already exists or **ids** has duplicates
+        :raises NDExInvalidParameterError: If columns passed in differ in length
+        :raises NDExInvalidCX2Error: If an id is not an integer or a value does not match its data type
+        :return: IDs of the nodes added
+        :rtype: list
+        """
+        ids = self._get_column_values(ids)
+        layouts = [self._get_column_values(layout) for layout in (x, y, z)]
+        num_nodes = self._get_number_of_elements([ids] + layouts, attributes)
+        node_ids, next_id = self._get_new_ids(constants.NODES_ASPECT, ids, num_nodes, self._nodes, 'Node')
+        node_values = self._process_attribute_columns(constants.NODES_ASPECT, attributes, num_nodes)
+        self._int_id_generator[constants.NODES_ASPECT] = next_id
+
+        nodes = self._get_writable_aspect('_nodes')
+        layouts = [layout if layout is not None else [None] * num_nodes for layout in layouts]
+        for node_id, values, node_x, node_y, node_z in zip(node_ids, node_values, *layouts):
+            nodes[node_id] = {
+                constants.ASPECT_ID: node_id,
+                constants.ASPECT_VALUES: values,
+                constants.LAYOUT_X: node_x,
+                constants.LAYOUT_Y: node_y,
+                constants.LAYOUT_Z: node_z
+            }
+            self._update_attribute_indexes(constants.NODES_ASPECT, node_id, {}, values)
+            self._update_attribute_counts(constants.NODES_ASPECT, values, 1)
+        self._search_term_index = None
+        return node_ids
+
     def get_node(self, node_id):
         """
         Retrieves a node based on its ID.
@@ -537,21 +1029,67 @@ class CX2Network(object):
 
         .. versionadded:: 3.8.0
 
+        .. versionchanged:: 3.12.0
+
+            Nodes are looked up in an index of node names instead of checking every node, see
+            :py:func:`lookup_node_ids_by_attribute`. If several nodes have the name, the one with
+            the lowest id is returned
+
         :param name: Name of the node to retrieve.
         :type name: str
-        :return: Node with the given name or None if not found.
+        :return: Node with the given name, the one with the lowest id if several have it,
+                 or None if not found.
         :rtype: int or str
         """
-        for node_id, node in self._nodes.items():
-            if node.get(constants.ASPECT_VALUES, {}).get(constants.NODE_NAME_EXPANDED, None) == name:
-                return node.get(constants.ASPECT_ID, None)
-        return None
+        node_ids = self.lookup_node_ids_by_attribute(constants.NODE_NAME_EXPANDED, name)
+        return node_ids[0] if node_ids else None
+
+    def lookup_node_ids_by_attribute(self, attribute, value):
+        """
+        Gets ids of nodes whose attribute **attribute** equals **value**.
+
+        The first lookup on an attribute builds an index of its values, which is then kept
+        current as nodes and node attributes are added, updated and removed, so later
+        lookups take the same time no matter the size of the network.
+
+        .. code-block:: python
+
+            from ndex2.cx2 import CX2Network
+
+            cx2_network = CX2Network()
+            cx2_network.add_node(attributes={'name': 'TP53', 'type': 'protein'})
+            cx2_network.add_node(attributes={'name': 'MDM2', 'type': 'protein'})
+
+            # would output [0, 1]
+            print(cx2_network.lookup_node_ids_by_attribute('type', 'protein'))
+
+        .. versionadded:: 3.12.0
+
+        :param attribute: Name, or alias, of node attribute
+        :type attribute: str
+        :param value: Value to look for
+        :type value: str, int, bool, float, list
+        :return: Ids of matching nodes, in increasing order
+        :rtype: list
+        """
+        attribute = self._get_declaration_table(constants.NODES_ASPECT).aliases.get(attribute, attribute)
+        key = self._get_attribute_index_key(value)
+        if key is None:
+            # values that cannot be indexed are compared with every node
+            return sorted(node_id for node_id, node in self._nodes.items()
+                          if node.get(constants.ASPECT_VALUES, {}).get(attribute) == value)
+        return list(self._get_attribute_index(constants.NODES_ASPECT, attribute).find(key))
 
     def remove_node(self, node_id):
         """
         Removes a node and checks for dangling edges
         (edges without both source and target).
 
+        .. versionchanged:: 3.12.0
+
+            Edges of the node are found with the source and target indexes
+            instead of checking every edge in the network.
+
         :param node_id: ID of the node to remove.
         :type node_id: int or str
         :raises NDExNotFoundError: If ``None`` is passed in as
@@ -564,13 +1102,118 @@ class CX2Network(object):
         if node_id not in self._nodes:
             raise NDExNotFoundError(f"Node {node_id} does not exist.")
 
-        del self._nodes[node_id]
+        removed_node = self._get_writable_aspect('_nodes').pop(node_id)
+        self._search_term_index = None
+        self._update_attribute_indexes(constants.NODES_ASPECT, node_id, removed_node.get(constants.ASPECT_VALUES, {}), {})
+        self._update_attribute_counts(constants.NODES_ASPECT, removed_node.get(constants.ASPECT_VALUES, {}), -1)
 
-        edges_to_remove = [edge_id for edge_id, edge in self._edges.items() if
-                           edge[constants.EDGE_SOURCE] == node_id or edge[constants.EDGE_TARGET] == node_id]
+        outgoing, incoming = self._get_adjacency_index()
+        edges_to_remove = dict.fromkeys(list(outgoing.get(node_id, ())) + list(incoming.get(node_id, ())))
         for edge_id in edges_to_remove:
             self.remove_edge(edge_id)
 
+    def get_out_edges(self, node_id):
+        """
+        Gets ids of edges that have node **node_id** as source.
+
+        Like :py:func:`get_in_edges`, :py:func:`get_neighbors` and :py:func:`get_degree`,
+        this uses source and target indexes that are built the first time one of these
+        methods is called and then kept current as edges are added and removed, so each
+        call only takes time in proportion to the number of edges of the node.
+
+        .. versionadded:: 3.12.0
+
+        :param node_id: ID of the node.
+        :type node_id: int or str
+        :raises NDExNotFoundError: If node **node_id** does not exist
+        :return: Edge ids, in the order the edges were added
+        :rtype: list
+        """
+        self._check_node_exists(node_id)
+        return list(self._get_adjacency_index()[0].get(node_id, ()))
+
+    def get_in_edges(self, node_id):
+        """
+        Gets ids of edges that have node **node_id** as target.
+
+        .. versionadded:: 3.12.0
+
+        :param node_id: ID of the node.
+        :type node_id: int or str
+        :raises NDExNotFoundError: If node **node_id** does not exist
+        :return: Edge ids, in the order the edges were added
+        :rtype: list
+        """
+        self._check_node_exists(node_id)
+        return list(self._get_adjacency_index()[1].get(node_id, ()))
+
+    def get_neighbors(self, node_id):
+        """
+        Gets ids of nodes connected to node **node_id** by an edge in either direction.
+        A node with an edge to itself is its own neighbor.
+
+        .. code-block:: python
+
+            from ndex2.cx2 import CX2Network
+
+            cx2_network = CX2Network()
+            node_one = cx2_network.add_node(attributes={'name': 'TP53'})
+            node_two = cx2_network.add_node(attributes={'name': 'MDM2'})
+            cx2_network.add_edge(source=node_one, target=node_two)
+
+            # would output [1]
+            print(cx2_network.get_neighbors(node_one))
+
+        .. versionadded:: 3.12.0
+
+        :param node_id: ID of the node.
+        :type node_id: int or str
+        :raises NDExNotFoundError: If node **node_id** does not exist
+        :return: Node ids, targets of edges from the node first, then sources of edges to the node
+        :rtype: list
+        """
+        self._check_node_exists(node_id)
+        outgoing, incoming = self._get_adjacency_index()
+        neighbors = [self._edges[edge_id][constants.EDGE_TARGET] for edge_id in outgoing.get(node_id, ())]
+        neighbors.extend(self._edges[edge_id][constants.EDGE_SOURCE] for edge_id in incoming.get(node_id, ()))
+        return list(dict.fromkeys(neighbors))
+
+    def get_degree(self, node_id, direction=None):
+        """
+        Gets number of edges of node **node_id**. An edge from the node to itself
+        counts twice, once as outgoing and once as incoming.
+
+        .. versionadded:: 3.12.0
+
+        :param node_id: ID of the node.
+        :type node_id: int or str
+        :param direction: ``'out'`` to only count edges with the node as source,
+                          ``'in'`` to only count edges with the node as target,
+                          ``None`` to count both
+        :type direction: str
+        :raises NDExNotFoundError: If node **node_id** does not exist
+        :raises NDExInvalidParameterError: If **direction** is not ``'in'``, ``'out'`` or ``None``
+        :return: Number of edges
+        :rtype: int
+        """
+        if direction not in (None, 'in', 'out'):
+            raise NDExInvalidParameterError("direction must be None, 'in' or 'out'")
+        self._check_node_exists(node_id)
+        outgoing, incoming = self._get_adjacency_index()
+        degree = 0
+        if direction != 'in':
+            degree += len(outgoing.get(node_id, ()))
+        if direction != 'out':
+            degree += len(incoming.get(node_id, ()))
+        return degree
+
+    def _check_node_exists(self, node_id):
+        """
+        :raises NDExNotFoundError: If node **node_id** does not exist
+        """
+        if node_id not in self._nodes:
+            raise NDExNotFoundError(f"Node {node_id} does not exist.")
+
     def update_node(self, node_id, attributes=None, x=None, y=None, z=None):
         """
         Updates the attributes of a node.
@@ -590,15 +1233,22 @@ class CX2Network(object):
         if node_id not in self._nodes:
             raise NDExError(f"Node with ID {node_id} does not exist.")
 
+        node = self._get_writable_element('_nodes', node_id)
         if attributes:
             processed_attributes = self._process_attributes(constants.NODES_ASPECT, attributes)
-            self._nodes[node_id][constants.ASPECT_VALUES].update(processed_attributes)
+            old_values = self._get_indexed_values(constants.NODES_ASPECT, node[constants.ASPECT_VALUES])
+            self._update_attribute_counts(constants.NODES_ASPECT,
+                                          [attribute for attribute in processed_attributes
+                                           if attribute not in node[constants.ASPECT_VALUES]], 1)
+            node[constants.ASPECT_VALUES].update(processed_attributes)
+            self._search_term_index = None
+            self._update_attribute_indexes(constants.NODES_ASPECT, node_id, old_values, node[constants.ASPECT_VALUES])
         if x is not None:
-            self._nodes[node_id][constants.LAYOUT_X] = x
+            node[constants.LAYOUT_X] = x
         if y is not None:
-            self._nodes[node_id][constants.LAYOUT_Y] = y
+            node[constants.LAYOUT_Y] = y
         if z is not None:
-            self._nodes[node_id][constants.LAYOUT_Z] = z
+            node[constants.LAYOUT_Z] = z
 
     def set_node_attribute(self, node_id, attribute, value):
         """
@@ -652,7 +1302,13 @@ class CX2Network(object):
             raise NDExError(f'Node with id {node_id} does not exist. Attribute cannot be added to nonexistent node')
         declared_type = datatype if datatype is not None else self.get_declared_type(constants.NODES_ASPECT, key, value)
         converted_value = convert_value(declared_type, value)
-        self._nodes[node_id][constants.ASPECT_VALUES].update({key: converted_value})
+        values = self._get_writable_element('_nodes', node_id)[constants.ASPECT_VALUES]
+        old_values = {key: values[key]} if key in values else {}
+        if not old_values:
+            self._update_attribute_counts(constants.NODES_ASPECT, [key], 1)
+        values[key] = converted_value
+        self._search_term_index = None
+        self._update_attribute_indexes(constants.NODES_ASPECT, node_id, old_values, {key: converted_value})
         self._generate_attribute_declarations_for_aspect(constants.NODES_ASPECT, {key: converted_value}, {})
 
     def remove_node_attribute(self, node_id, attribute_name):
@@ -669,7 +1325,11 @@ class CX2Network(object):
         if node_id not in self._nodes:
             raise NDExNotFoundError(f"Node {node_id} does not exist.")
 
-        self._nodes[node_id]['v'].pop(attribute_name, None)
+        values = self._get_writable_element('_nodes', node_id)[constants.ASPECT_VALUES]
+        if attribute_name in values:
+            self._update_attribute_indexes(constants.NODES_ASPECT, node_id, {attribute_name: values.pop(attribute_name)}, {})
+            self._update_attribute_counts(constants.NODES_ASPECT, [attribute_name], -1)
+        self._search_term_index = None
 
     def get_edges(self):
         """
@@ -706,9 +1366,76 @@ class CX2Network(object):
             constants.EDGE_TARGET: self._check_and_cast_id(target),
             constants.ASPECT_VALUES: processed_attributes
         }
-        self._edges[edge_id] = edge
+        self._get_writable_aspect('_edges')[edge_id] = edge
+        self._add_edge_to_adjacency_index(edge)
+        self._update_attribute_indexes(constants.EDGES_ASPECT, edge_id, {}, processed_attributes)
+        self._update_attribute_counts(constants.EDGES_ASPECT, processed_attributes, 1)
         return edge_id
 
+    def add_edges(self, sources, targets, ids=None, attributes=None):
+        """
+        Adds many edges to the network at once. Gives the same result as calling
+        :py:func:`add_edge` for each edge, but checks ids, works out the data type of
+        each attribute and converts attribute values a column at a time.
+
+        Edges are checked before any are added, so if an error is raised the network is unchanged.
+
+        .. versionadded:: 3.12.0
+
+        **Usage Example:**
+
+        .. code-block:: python
+
+            from ndex2.cx2 import CX2Network
+
+            cx2_network = CX2Network()
+            node_ids = cx2_network.add_nodes(attributes={'name': ['A', 'B', 'C']})
+            edge_ids = cx2_network.add_edges(sources=node_ids[:2], targets=node_ids[1:],
+                                             attributes={'interaction': ['binds', 'inhibits'],
+                                                         'weight': [0.3, 0.8]})
+
+        :param sources: Source nodes of the edges.
+        :type sources: list
+        :param targets: Target nodes of the edges.
+        :type targets: list
+        :param ids: IDs of the edges to add. If ``None``, the next free IDs are used.
+        :type ids: list
+        :param attributes: Columns of edge attributes, one value per edge. ``None``, or
+                           missing values in a :py:class:`pandas.Series` column, leave
+                           the attribute off that edge.
+        :type attributes: dict or :py:class:`pandas.DataFrame`, optional
+        :raises NDExError: If **sources** or **targets** is ``None``
+        :raises NDExAlreadyExists: If an edge with one of **ids** already exists or **ids** has duplicates
+        :raises NDExInvalidParameterError: If columns passed in differ in length
+        :raises NDExInvalidCX2Error: If an id is not an integer or a value does not match its data type
+        :return: IDs of the edges added
+        :rtype: list
+        """
+        if sources is None or targets is None:
+            raise NDExError("Edges must have sources and targets")
+        sources, targets = [[node_id if type(node_id) is int else self._check_and_cast_id(node_id)
+                             for node_id in self._get_column_values(column)] for column in (sources, targets)]
+        ids = self._get_column_values(ids)
+        num_edges = self._get_number_of_elements([sources, targets, ids], attributes)
+        edge_ids, next_id = self._get_new_ids(constants.EDGES_ASPECT, ids, num_edges, self._edges, 'Edge')
+        edge_values = self._process_attribute_columns(constants.EDGES_ASPECT, attributes, num_edges)
+        self._int_id_generator[constants.EDGES_ASPECT] = next_id
+
+        edges = self._get_writable_aspect('_edges')
+        for edge_id, source, target, values in zip(edge_ids, sources, targets, edge_values):
+            edge = {
+                constants.ASPECT_ID: edge_id,
+                constants.EDGE_SOURCE: source,
+                constants.EDGE_TARGET: target,
+                constants.ASPECT_VALUES: values
+            }
+            edges[edge_id] = edge
+            if self._adjacency_index is not None:
+                self._add_edge_to_adjacency_index(edge)
+            self._update_attribute_indexes(constants.EDGES_ASPECT, edge_id, {}, values)
+            self._update_attribute_counts(constants.EDGES_ASPECT, values, 1)
+        return edge_ids
+
     def get_edge(self, edge_id):
         """
         Retrieves an edge based on its ID.
@@ -735,7 +1462,10 @@ class CX2Network(object):
         if edge_id not in self._edges:
             raise NDExNotFoundError(f"Edge {edge_id} does not exist.")
 
-        del self._edges[edge_id]
+        removed_edge = self._get_writable_aspect('_edges').pop(edge_id)
+        self._remove_edge_from_adjacency_index(removed_edge)
+        self._update_attribute_indexes(constants.EDGES_ASPECT, edge_id, removed_edge.get(constants.ASPECT_VALUES, {}), {})
+        self._update_attribute_counts(constants.EDGES_ASPECT, removed_edge.get(constants.ASPECT_VALUES, {}), -1)
 
     def update_edge(self, edge_id, attributes=None):
         """
@@ -751,7 +1481,12 @@ class CX2Network(object):
 
         if attributes:
             processed_attributes = self._process_attributes(constants.EDGES_ASPECT, attributes)
-            self._edges[edge_id][constants.ASPECT_VALUES].update(processed_attributes)
+            values = self._get_writable_element('_edges', edge_id)[constants.ASPECT_VALUES]
+            old_values = self._get_indexed_values(constants.EDGES_ASPECT, values)
+            self._update_attribute_counts(constants.EDGES_ASPECT,
+                                          [attribute for attribute in processed_attributes if attribute not in values], 1)
+            values.update(processed_attributes)
+            self._update_attribute_indexes(constants.EDGES_ASPECT, edge_id, old_values, values)
 
     def add_edge_attribute(self, edge_id, key, value, datatype=None):
         """
@@ -787,7 +1522,12 @@ class CX2Network(object):
             raise NDExError(f'Edge with id {edge_id} does not exist. Attribute cannot be added to nonexistent edge')
         declared_type = datatype if datatype is not None else self.get_declared_type(constants.EDGES_ASPECT, key, value)
         converted_value = convert_value(declared_type, value)
-        self._edges[edge_id][constants.ASPECT_VALUES].update({key: converted_value})
+        values = self._get_writable_element('_edges', edge_id)[constants.ASPECT_VALUES]
+        old_values = {key: values[key]} if key in values else {}
+        if not old_values:
+            self._update_attribute_counts(constants.EDGES_ASPECT, [key], 1)
+        values[key] = converted_value
+        self._update_attribute_indexes(constants.EDGES_ASPECT, edge_id, old_values, {key: converted_value})
         self._generate_attribute_declarations_for_aspect(constants.EDGES_ASPECT, {key: converted_value}, {})
 
     def remove_edge_attribute(self, edge_id, attribute_name):
@@ -804,45 +1544,718 @@ class CX2Network(object):
         if edge_id not in self._edges:
             raise NDExNotFoundError(f"Edge {edge_id} does not exist.")
 
-        self._edges[edge_id][constants.ASPECT_VALUES].pop(attribute_name, None)
+        values = self._get_writable_element('_edges', edge_id)[constants.ASPECT_VALUES]
+        if attribute_name in values:
+            self._update_attribute_indexes(constants.EDGES_ASPECT, edge_id, {attribute_name: values.pop(attribute_name)}, {})
+            self._update_attribute_counts(constants.EDGES_ASPECT, [attribute_name], -1)
+
+
+    def rename_attribute(self, aspect, old_key, new_key):
+        """
+        Renames an attribute in the given aspect (nodes, edges, or networkAttributes).
+
+        :param aspect: The aspect to modify ('nodes', 'edges', or 'networkAttributes').
+        :type aspect: str
+        :param old_key: The current attribute name.
+        :type old_key: str
+        :param new_key: The new attribute name to use.
+        :type new_key: str
+        :raises NDExError: If the aspect is invalid or old_key doesn't exist.
+        """
+        if aspect not in [constants.NODES_ASPECT, constants.EDGES_ASPECT, constants.NETWORK_ATTRIBUTES_ASPECT]:
+            raise NDExError(f"Unsupported aspect: {aspect}")
+
+        # Rename attribute in the relevant entities
+        if aspect == constants.NODES_ASPECT:
+            self._search_term_index = None
+            self._rename_attribute_indexes(aspect, old_key, new_key)
+            renamed = 0
+            for node_id, node in list(self._nodes.items()):
+                if old_key in node.get(constants.ASPECT_VALUES, {}):
+                    values = self._get_writable_element('_nodes', node_id)[constants.ASPECT_VALUES]
+                    renamed += new_key not in values
+                    values[new_key] = values.pop(old_key)
+            self._rename_attribute_count(aspect, old_key, new_key, renamed)
+
+        elif aspect == constants.EDGES_ASPECT:
+            self._rename_attribute_indexes(aspect, old_key, new_key)
+            renamed = 0
+            for edge_id, edge in list(self._edges.items()):
+                if old_key in edge.get(constants.ASPECT_VALUES, {}):
+                    values = self._get_writable_element('_edges', edge_id)[constants.ASPECT_VALUES]
+                    renamed += new_key not in values
+                    values[new_key] = values.pop(old_key)
+            self._rename_attribute_count(aspect, old_key, new_key, renamed)
+
+        elif aspect == constants.NETWORK_ATTRIBUTES_ASPECT:
+            if old_key in self._network_attributes:
+                self._network_attributes[new_key] = self._network_attributes.pop(old_key)
+
+        # Update attribute declarations
+        aspect_decls = self._attribute_declarations.get(aspect, {})
+        if old_key in aspect_decls:
+            aspect_decls[new_key] = aspect_decls.pop(old_key)
+            self._declaration_tables.pop(aspect, None)
+
+    def copy(self):
+        """
+        Creates a copy of this network that can be changed without changing this network and vice versa.
+
+        Unlike :py:func:`copy.deepcopy`, nodes, edges and bypasses are not copied up front. The copy shares
+        them with this network and the nodes, edges or bypasses, or a single node or edge, are copied the
+        first time either network changes them through methods such as :py:func:`add_node_attribute`
+        or :py:func:`remove_edge`. Copying is fast no matter the size of the network and memory only grows
+        with the changes made afterwards. The smaller aspects, such as network attributes and attribute
+        declarations, are copied right away.
+
+        .. code-block:: python
+
+            variant = cx2_network.copy()
+            variant.add_node_attribute(node_id, 'condition', 'treated')
+
+        .. warning::
+
+            The nodes and edges returned by methods such as :py:func:`get_node` are shared until changed
+            through this class. Altering them directly will change both networks, use
+            :py:func:`copy.deepcopy` on the network if that is needed.
+
+        .. versionadded:: 3.12.0
+
+        :return: Copy of this network
+        :rtype: :py:class:`~ndex2.cx2.CX2Network`
+        """
+        clone = copy.copy(self)
+        self._cow_shared.update(CX2Network._COW_ASPECTS)
+        clone._cow_shared = set(self._cow_shared)
+        self._cow_owned = {}
+        clone._cow_owned = {}
+        clone._attribute_declarations = copy.deepcopy(self._attribute_declarations)
+        clone._declaration_tables = {}
+        if self._attribute_counts is not None:
+            clone._attribute_counts = {aspect_name: dict(counts)
+                                       for aspect_name, counts in self._attribute_counts.items()}
+        clone._network_attributes = dict(self._network_attributes)
+        clone._visual_properties = copy.deepcopy(self._visual_properties)
+        clone._opaque_aspects = [dict(aspect) for aspect in self._opaque_aspects]
+        clone._status = dict(self._status)
+        clone._int_id_generator = dict(self._int_id_generator)
+        clone._adjacency_index = None
+        clone._search_term_index = None
+        clone._attribute_indexes = {aspect_name: dict.fromkeys(indexes)
+                                    for aspect_name, indexes in self._attribute_indexes.items()}
+        clone._sorted_attribute_indexes = {aspect_name: dict.fromkeys(indexes)
+                                           for aspect_name, indexes in self._sorted_attribute_indexes.items()}
+        return clone
+
+    def _get_writable_aspect(self, aspect_name):
+        """
+        Gets the aspect **aspect_name**, first giving this network its own copy of the aspect if it is
+        still shared with a network created by or creating this one via :py:func:`copy`
+
+        :param aspect_name: Name of attribute holding aspect such as ``_nodes``
+        :type aspect_name: str
+        :return: Aspect that can be changed
+        :rtype: dict
+        """
+        if aspect_name in self._cow_shared:
+            self._cow_shared.discard(aspect_name)
+            setattr(self, aspect_name, dict(getattr(self, aspect_name)))
+            self._cow_owned[aspect_name] = set()
+        return getattr(self, aspect_name)
+
+    def _get_writable_element(self, aspect_name, element_id):
+        """
+        Gets node or edge **element_id**, first giving this network its own copy of the element, and of
+        its attributes, if it is still shared with a network created by or creating this one
+        via :py:func:`copy`
+
+        :param aspect_name: Name of attribute holding aspect, either ``_nodes`` or ``_edges``
+        :type aspect_name: str
+        :param element_id: ID of node or edge
+        :type element_id: int or str
+        :return: Node or edge that can be changed
+        :rtype: dict
+        """
+        aspect = self._get_writable_aspect(aspect_name)
+        owned = self._cow_owned.get(aspect_name)
+        if owned is not None and element_id not in owned:
+            owned.add(element_id)
+            element = dict(aspect[element_id])
+            element[constants.ASPECT_VALUES] = dict(element.get(constants.ASPECT_VALUES, {}))
+            aspect[element_id] = element
+        return aspect[element_id]
+
+    def _load_elements(self, nodes, edges, attribute_declarations, next_node_id, next_edge_id):
+        """
+        Replaces nodes, edges and attribute declarations of this network in one step. Used by factories that
+        have already converted all attribute values to their declared types, skipping the checks
+        done by :py:func:`add_node` and :py:func:`add_edge` for each element.
+
+        :param nodes: node id => node
+        :type nodes: dict
+        :param edges: edge id => edge
+        :type edges: dict
+        :param attribute_declarations: Attribute declarations for **nodes** and **edges**
+        :type attribute_declarations: dict
+        :param next_node_id: Id to give the next node added without an id
+        :type next_node_id: int
+        :param next_edge_id: Id to give the next edge added without an id
+        :type next_edge_id: int
+        """
+        self._nodes = nodes
+        self._edges = edges
+        self._cow_shared.difference_update(('_nodes', '_edges'))
+        self._cow_owned.pop('_nodes', None)
+        self._cow_owned.pop('_edges', None)
+        self._attribute_declarations = attribute_declarations
+        self._declaration_tables = {}
+        self._attribute_counts = None
+        self._int_id_generator[constants.NODES_ASPECT] = next_node_id
+        self._int_id_generator[constants.EDGES_ASPECT] = next_edge_id
+        self._adjacency_index = None
+        self._search_term_index = None
+        for indexes in list(self._attribute_indexes.values()) + list(self._sorted_attribute_indexes.values()):
+            for attribute in indexes:
+                indexes[attribute] = None
+
+    def _get_node_edge_index(self):
+        """
+        Gets map of node id to list of ids of edges that have the node as source or target,
+        for the queries in :py:mod:`ndex2.query`. The map is a view of the source and target
+        indexes from :py:func:`_get_adjacency_index`.
+
+        :return: node id => list of edge ids
+        :rtype: :py:class:`collections.abc.Mapping`
+        """
+        return _NodeEdgeIndex(*self._get_adjacency_index())
+
+    def _get_adjacency_index(self):
+        """
+        Gets maps of node id to ids of edges that have the node as source, and as target.
+        The maps are built on first use and then kept current by :py:func:`add_edge` and
+        :py:func:`remove_edge`. They are rebuilt if the number of edges no longer matches.
+
+        :return: (node id => edge ids with node as source, node id => edge ids with node as target),
+                 edge ids are kept as keys of a dict, in the order edges were added
+        :rtype: tuple
+        """
+        if self._adjacency_index is None or self._adjacency_index[0] != len(self._edges):
+            outgoing, incoming = {}, {}
+            for edge_id, edge in self._edges.items():
+                outgoing.setdefault(edge[constants.EDGE_SOURCE], {})[edge_id] = None
+                incoming.setdefault(edge[constants.EDGE_TARGET], {})[edge_id] = None
+            self._adjacency_index = [len(self._edges), outgoing, incoming]
+        return self._adjacency_index[1], self._adjacency_index[2]
+
+    def _add_edge_to_adjacency_index(self, edge):
+        """
+        Adds **edge** to source and target indexes if they have been built.
+
+        :param edge: Edge just added to the network.
+        :type edge: dict
+        """
+        if self._adjacency_index is None:
+            return
+        _, outgoing, incoming = self._adjacency_index
+        outgoing.setdefault(edge[constants.EDGE_SOURCE], {})[edge[constants.ASPECT_ID]] = None
+        incoming.setdefault(edge[constants.EDGE_TARGET], {})[edge[constants.ASPECT_ID]] = None
+        self._adjacency_index[0] += 1
+
+    def _remove_edge_from_adjacency_index(self, edge):
+        """
+        Removes **edge** from source and target indexes if they have been built.
+
+        :param edge: Edge just removed from the network.
+        :type edge: dict
+        """
+        if self._adjacency_index is None:
+            return
+        _, outgoing, incoming = self._adjacency_index
+        for index, node_id in ((outgoing, edge[constants.EDGE_SOURCE]), (incoming, edge[constants.EDGE_TARGET])):
+            edge_ids = index.get(node_id)
+            if edge_ids is not None:
+                edge_ids.pop(edge[constants.ASPECT_ID], None)
+                if not edge_ids:
+                    del index[node_id]
+        self._adjacency_index[0] -= 1
+
+    def _get_search_term_index(self):
+        """
+        Gets map of search term to ids of nodes matching that term.
+        See :py:func:`ndex2.query.build_search_term_index`. The map is dropped
+        whenever a node or node attribute changes and rebuilt on next use.
+
+        :return: search term => set of node ids
+        :rtype: dict
+        """
+        if self._search_term_index is None or self._search_term_index[0] != len(self._nodes):
+            index = query.build_search_term_index(
+                (node_id, node.get(constants.ASPECT_VALUES, {}).get(constants.NODE_NAME_EXPANDED),
+                 node.get(constants.ASPECT_VALUES, {}).get(constants.NODE_REPRESENTS_EXPANDED))
+                for node_id, node in self._nodes.items())
+            self._search_term_index = [len(self._nodes), index]
+        return self._search_term_index[1]
+
+    @staticmethod
+    def _get_attribute_index_key(value):
+        """
+        Gets key for **value** in an attribute index. Lists are stored as tuples.
+
+        :return: Key or ``None`` if **value** is ``None``, NaN, which equals nothing, or cannot be a key
+        :rtype: object
+        """
+        if isinstance(value, list):
+            value = tuple(value)
+        elif isinstance(value, (float, np.floating)) and value != value:
+            return None
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        return value
+
+    def _get_attribute_index(self, aspect_name, attribute):
+        """
+        Gets the ids of nodes or edges having each value of node or edge attribute **attribute**,
+        see :py:class:`_HashAttributeIndex`. The index is built on first use and then kept
+        current by :py:func:`_update_attribute_indexes`.
+
+        :param aspect_name: 'nodes' or 'edges'
+        :type aspect_name: str
+        :param attribute: Name of attribute
+        :type attribute: str
+        :rtype: :py:class:`_HashAttributeIndex`
+        """
+        index = self._attribute_indexes[aspect_name].get(attribute)
+        if index is None:
+            index = _HashAttributeIndex()
+            elements = self._nodes if aspect_name == constants.NODES_ASPECT else self._edges
+            for element_id, element in elements.items():
+                index.add(element_id,
+                          self._get_attribute_index_key(element.get(constants.ASPECT_VALUES, {}).get(attribute)))
+            self._attribute_indexes[aspect_name][attribute] = index
+        return index
+
+    def _get_sorted_attribute_index(self, aspect_name, attribute):
+        """
+        Gets the values of node or edge attribute **attribute** in sorted order, see
+        :py:class:`_SortedAttributeIndex`. The index is built on first use and then kept
+        current by :py:func:`_update_attribute_indexes`.
+
+        :param aspect_name: 'nodes' or 'edges'
+        :type aspect_name: str
+        :param attribute: Name of attribute
+        :type attribute: str
+        :rtype: :py:class:`_SortedAttributeIndex`
+        """
+        index = self._sorted_attribute_indexes[aspect_name].get(attribute)
+        if index is None:
+            elements = self._nodes if aspect_name == constants.NODES_ASPECT else self._edges
+            index = _SortedAttributeIndex(elements, attribute)
+            self._sorted_attribute_indexes[aspect_name][attribute] = index
+        return index
+
+    def _get_indexed_values(self, aspect_name, values):
+        """
+        Gets the attributes in **values** that have an index, to pass as old values
+        to :py:func:`_update_attribute_indexes` before **values** change.
+
+        :rtype: dict
+        """
+        indexed = {}
+        for indexes in (self._attribute_indexes[aspect_name], self._sorted_attribute_indexes[aspect_name]):
+            for attribute in indexes:
+                if attribute in values:
+                    indexed[attribute] = values[attribute]
+        return indexed
+
+    def _update_attribute_indexes(self, aspect_name, element_id, old_values, new_values):
+        """
+        Updates the node or edge attribute indexes built so far after the attributes of node or
+        edge **element_id** changed from **old_values** to **new_values**.
+
+        :param aspect_name: 'nodes' or 'edges'
+        :type aspect_name: str
+        :param element_id: ID of the node or edge
+        :type element_id: int or str
+        :param old_values: Attributes changed or removed, with their previous values
+        :type old_values: dict
+        :param new_values: Attributes added or changed, with their new values
+        :type new_values: dict
+        """
+        for attribute, index in self._attribute_indexes[aspect_name].items():
+            if index is None:
+                continue
+            old_key = self._get_attribute_index_key(old_values.get(attribute))
+            new_key = self._get_attribute_index_key(new_values.get(attribute))
+            if old_key == new_key and type(old_key) is type(new_key):
+                continue
+            index.remove(element_id, old_key)
+            index.add(element_id, new_key)
+
+        for attribute, index in self._sorted_attribute_indexes[aspect_name].items():
+            if index is None:
+                continue
+            old_value = old_values.get(attribute)
+            new_value = new_values.get(attribute)
+            if old_value is new_value:
+                continue
+            index.remove(element_id, old_value)
+            index.add(element_id, new_value)
+
+    def _rename_attribute_indexes(self, aspect_name, old_key, new_key):
+        """
+        Moves indexes of attribute **old_key** to **new_key** after :py:func:`rename_attribute`,
+        to be built again on next use.
+        """
+        for indexes in (self._attribute_indexes[aspect_name], self._sorted_attribute_indexes[aspect_name]):
+            if old_key in indexes or new_key in indexes:
+                indexes.pop(old_key, None)
+                indexes[new_key] = None
+
+    def create_index(self, aspect_name, attribute, kind='hash'):
+        """
+        Creates an index of the values of a node or edge attribute used by :py:func:`find_nodes`
+        and :py:func:`find_edges`. The index is kept current as nodes, edges and their attributes
+        are added, updated and removed through this class.
+
+        * ``'hash'`` indexes find nodes or edges equal to a value, or to one of a list of values,
+          in time that does not depend on the size of the network, and are updated in constant time.
+        * ``'sorted'`` indexes also find nodes or edges with values less or greater than a value.
+          Only numbers and strings are indexed.
+
+        .. code-block:: python
+
+            cx2_network.create_index('nodes', 'type')
+            cx2_network.create_index('nodes', 'score', kind='sorted')
+
+            # ids of protein nodes with score above 0.9
+            node_ids = cx2_network.find_nodes(type='protein', score__gt=0.9)
+
+        .. note::
+
+            Changes made directly to the nodes and edges returned by methods such as
+            :py:func:`get_node` are not seen by indexes.
+
+        .. versionadded:: 3.12.0
+
+        :param aspect_name: 'nodes' or 'edges'
+        :type aspect_name: str
+        :param attribute: Name, or alias, of attribute
+        :type attribute: str
+        :param kind: 'hash' or 'sorted'
+        :type kind: str
+        :raises NDExInvalidParameterError: If **aspect_name** or **kind** is invalid
+        """
+        if aspect_name not in (constants.NODES_ASPECT, constants.EDGES_ASPECT):
+            raise NDExInvalidParameterError(f"aspect_name must be '{constants.NODES_ASPECT}' or "
+                                            f"'{constants.EDGES_ASPECT}', got {aspect_name}")
+        attribute = self._get_declaration_table(aspect_name).aliases.get(attribute, attribute)
+        if kind == 'hash':
+            self._get_attribute_index(aspect_name, attribute)
+        elif kind == 'sorted':
+            self._get_sorted_attribute_index(aspect_name, attribute)
+        else:
+            raise NDExInvalidParameterError(f"kind must be 'hash' or 'sorted', got {kind}")
+
+    def find_nodes(self, conditions=None, **kwargs):
+        """
+        Finds nodes whose attributes meet all the conditions passed in. Each condition is
+        an attribute name, or alias, optionally followed by ``__`` and an operator, set to
+        the value to compare with:
+
+        * ``name='TP53'`` or ``name__eq='TP53'``: equal to the value
+        * ``name__ne='TP53'``: not equal to the value
+        * ``score__lt=0.5``, ``score__lte=0.5``, ``score__gt=0.5``, ``score__gte=0.5``: less than,
+          less than or equal, greater than or greater than or equal to the value. Numbers are
+          only compared with numbers and strings with strings
+        * ``type__in=['protein', 'gene']``: equal to one of the values
+
+        Nodes without the attribute never match. Conditions on attributes with an index
+        created by :py:func:`create_index` are answered with the index, other conditions
+        are checked against each node left.
+
+        .. code-block:: python
+
+            node_ids = cx2_network.find_nodes(type='protein', score__gt=0.9)
+
+            # attribute names that are not valid Python names
+            node_ids = cx2_network.find_nodes({'GO:term': 'GO:0008150'})
+
+        .. versionadded:: 3.12.0
+
+        :param conditions: Conditions as a dict, for attribute names that cannot be passed as keywords
+        :type conditions: dict
+        :param kwargs: Conditions
+        :raises NDExInvalidParameterError: If a value for ``__in`` is not a list, tuple or set
+        :return: Ids of matching nodes, in increasing order
+        :rtype: list
+        """
+        return self._find_elements(constants.NODES_ASPECT, dict(conditions or {}, **kwargs))
+
+    def find_edges(self, conditions=None, **kwargs):
+        """
+        Finds edges whose attributes meet all the conditions passed in, see :py:func:`find_nodes`
+
+        .. code-block:: python
+
+            edge_ids = cx2_network.find_edges(interaction='binds', weight__gte=0.5)
+
+        .. versionadded:: 3.12.0
+
+        :param conditions: Conditions as a dict, for attribute names that cannot be passed as keywords
+        :type conditions: dict
+        :param kwargs: Conditions
+        :raises NDExInvalidParameterError: If a value for ``__in`` is not a list, tuple or set
+        :return: Ids of matching edges, in increasing order
+        :rtype: list
+        """
+        return self._find_elements(constants.EDGES_ASPECT, dict(conditions or {}, **kwargs))
+
+    _FIND_OPERATORS = ('eq', 'ne', 'lt', 'lte', 'gt', 'gte', 'in')
+
+    def _find_elements(self, aspect_name, conditions):
+        """
+        Finds nodes or edges meeting **conditions**, see :py:func:`find_nodes`
+
+        :return: Ids of matching nodes or edges, in increasing order
+        :rtype: list
+        """
+        aliases = self._get_declaration_table(aspect_name).aliases
+        indexed = []
+        unindexed = []
+        for condition, value in conditions.items():
+            attribute, _, operator = condition.rpartition('__')
+            if operator not in CX2Network._FIND_OPERATORS or not attribute:
+                attribute, operator = condition, 'eq'
+            if operator == 'in' and not isinstance(value, (list, tuple, set)):
+                raise NDExInvalidParameterError(f'Value for {condition} must be a list, tuple or set')
+            attribute = aliases.get(attribute, attribute)
+            element_ids = self._find_in_indexes(aspect_name, attribute, operator, value)
+            if element_ids is None:
+                unindexed.append((attribute, operator, value))
+            else:
+                indexed.append((element_ids, (attribute, operator, value)))
+
+        elements = self._nodes if aspect_name == constants.NODES_ASPECT else self._edges
+        if indexed:
+            # start from the fewest matches
+            indexed.sort(key=lambda entry: len(entry[0]))
+            candidates = set(indexed[0][0])
+            for element_ids, condition in indexed[1:]:
+                if len(element_ids) > len(candidates):
+                    # checking the few candidates left is cheaper than going through the matches
+                    unindexed.append(condition)
+                else:
+                    candidates.intersection_update(element_ids)
+        else:
+            candidates = elements.keys()
+        found = [element_id for element_id in candidates
+                 if all(self._check_condition(elements[element_id].get(constants.ASPECT_VALUES, {}).get(attribute),
+                                              operator, value)
+                        for attribute, operator, value in unindexed)]
+        return sorted(found)
+
+    def _find_in_indexes(self, aspect_name, attribute, operator, value):
+        """
+        Finds nodes or edges whose attribute **attribute** compares to **value** as **operator**
+        says, using an index.
+
+        :return: Ids of matching nodes or edges, not to be changed, or ``None`` if no index can be used
+        :rtype: list or set
+        """
+        values = value if operator == 'in' else [value]
+        if operator in ('eq', 'in') and attribute in self._attribute_indexes[aspect_name]:
+            keys = [self._get_attribute_index_key(item) for item in values]
+            if None not in keys:
+                index = self._get_attribute_index(aspect_name, attribute)
+                if len(keys) == 1:
+                    return index.get(keys[0])
+                return [element_id for key in keys for element_id in index.get(key)]
+        if operator == 'ne' or attribute not in self._sorted_attribute_indexes[aspect_name]:
+            return None
+        if operator in ('eq', 'in'):
+            if any(_SortedAttributeIndex.get_key(item) is None for item in values):
+                return None
+            operator = 'eq'
+        index = self._get_sorted_attribute_index(aspect_name, attribute)
+        if len(values) == 1:
+            return index.find(operator, values[0])
+        return [element_id for item in values for element_id in index.find(operator, item)]
+
+    @staticmethod
+    def _check_condition(attribute_value, operator, value):
+        """
+        Checks if **attribute_value** compares to **value** as **operator** says, in
+        the same way indexes do.
+
+        :rtype: bool
+        """
+        if attribute_value is None:
+            return False
+        if operator == 'eq':
+            return attribute_value == value
+        if operator == 'ne':
+            return attribute_value != value
+        if operator == 'in':
+            return any(attribute_value == item for item in value)
+        attribute_key = _SortedAttributeIndex.get_key(attribute_value)
+        key = _SortedAttributeIndex.get_key(value)
+        if attribute_key is None or key is None or attribute_key[0] != key[0]:
+            return False
+        if operator == 'lt':
+            return attribute_key < key
+        if operator == 'lte':
+            return attribute_key <= key
+        if operator == 'gt':
+            return attribute_key > key
+        return attribute_key >= key
+
+    def get_neighborhood(self, search_string, search_depth=1, edge_limit=2500, error_when_limit=True):
+        """
+        Runs a neighborhood query on this network without contacting NDEx. This is a local
+        version of :py:func:`~ndex2.client.Ndex2.get_neighborhood` that takes the same parameters.
+
+        Nodes matching **search_string** are found by ``name`` and ``represents`` and then the
+        network is traversed **search_depth** steps out from them. The result is a new network
+        containing every node reached and every edge traversed, along with the attribute
+        declarations, network attributes, visual properties and the bypasses of those nodes and edges.
+        Call :py:func:`to_cx2` on the result to get CX2 like the server returns.
+
+        Unlike the server, which accepts `Lucene <https://lucene.apache.org/>`__ queries,
+        **search_string** is split on whitespace into terms (double quotes keep a term with spaces
+        together) and a node matches if its ``name`` or ``represents`` equals any of the terms,
+        ignoring case. If ``represents`` has a prefix, such as ``hgnc:TP53``, the value after the
+        prefix (``TP53``) also matches. ``AND``, ``OR`` and ``NOT`` are ignored.
+
+        .. versionadded:: 3.12.0
+
+        **Usage Example:**
+
+        .. code-block:: python
+
+            from ndex2.cx2 import CX2Network
+
+            cx2_network = CX2Network()
+            cx2_network.create_from_raw_cx2('mynetwork.cx2')
+            neighborhood = cx2_network.get_neighborhood('TP53 MDM2', search_depth=2)
+
+        :param search_string: Search string used to find the starting nodes.
+        :type search_string: str
+        :param search_depth: Number of steps to traverse out from the starting nodes.
+        :type search_depth: int
+        :param edge_limit: The maximum number of edges in the result, ``None`` means no limit.
+        :type edge_limit: int
+        :param error_when_limit: If ``True`` an error is raised if the result would have more
+                                 than **edge_limit** edges. If ``False`` the result is cut off at
+                                 **edge_limit** edges and gets network attribute
+                                 ``EdgeLimitExceeded`` set to ``'true'``.
+        :type error_when_limit: bool
+        :raises NDExError: If result has more than **edge_limit** edges and
+                           **error_when_limit** is ``True``
+        :return: New network
+        :rtype: :py:class:`~ndex2.cx2.CX2Network`
+        """
+        seed_node_ids = query.find_node_ids(self._get_search_term_index(), search_string)
+        node_ids, edge_ids, limit_exceeded = query.get_neighborhood_element_ids(seed_node_ids,
+                                                                                self._get_node_edge_index(),
+                                                                                self._edges,
+                                                                                search_depth=search_depth,
+                                                                                edge_limit=edge_limit,
+                                                                                error_when_limit=error_when_limit)
+        return self._create_query_result(node_ids, edge_ids, limit_exceeded)
+
+    def get_interconnectquery(self, search_string, search_depth=1, edge_limit=2500, error_when_limit=True):
+        """
+        Runs an interconnect query on this network without contacting NDEx. This is a local
+        version of :py:func:`~ndex2.client.Ndex2.get_interconnectquery` that takes the same parameters.
+
+        Nodes matching **search_string** are found the same way as :py:func:`get_neighborhood`
+        finds them. The result is a new network containing every edge that lies on a path of at
+        most **search_depth** steps starting at one matching node and ending at a different one,
+        along with the matching nodes, the nodes on those paths and the same data
+        :py:func:`get_neighborhood` copies.
 
+        .. versionadded:: 3.12.0
 
-    def rename_attribute(self, aspect, old_key, new_key):
-        """
-        Renames an attribute in the given aspect (nodes, edges, or networkAttributes).
+        **Usage Example:**
 
-        :param aspect: The aspect to modify ('nodes', 'edges', or 'networkAttributes').
-        :type aspect: str
-        :param old_key: The current attribute name.
-        :type old_key: str
-        :param new_key: The new attribute name to use.
-        :type new_key: str
-        :raises NDExError: If the aspect is invalid or old_key doesn't exist.
+        .. code-block:: python
+
+            from ndex2.cx2 import CX2Network
+
+            cx2_network = CX2Network()
+            cx2_network.create_from_raw_cx2('mynetwork.cx2')
+            interconnect = cx2_network.get_interconnectquery('TP53 MDM2 CDKN1A', search_depth=2)
+
+        :param search_string: Search string used to find the nodes paths start and end at.
+        :type search_string: str
+        :param search_depth: Maximum number of steps in a path.
+        :type search_depth: int
+        :param edge_limit: The maximum number of edges in the result, ``None`` means no limit.
+        :type edge_limit: int
+        :param error_when_limit: If ``True`` an error is raised if the result would have more
+                                 than **edge_limit** edges. If ``False`` the result is cut off at
+                                 **edge_limit** edges and gets network attribute
+                                 ``EdgeLimitExceeded`` set to ``'true'``.
+        :type error_when_limit: bool
+        :raises NDExError: If result has more than **edge_limit** edges and
+                           **error_when_limit** is ``True``
+        :return: New network
+        :rtype: :py:class:`~ndex2.cx2.CX2Network`
         """
-        if aspect not in [constants.NODES_ASPECT, constants.EDGES_ASPECT, constants.NETWORK_ATTRIBUTES_ASPECT]:
-            raise NDExError(f"Unsupported aspect: {aspect}")
+        seed_node_ids = query.find_node_ids(self._get_search_term_index(), search_string)
+        node_ids, edge_ids, limit_exceeded = query.get_interconnect_element_ids(seed_node_ids,
+                                                                                self._get_node_edge_index(),
+                                                                                self._edges,
+                                                                                search_depth=search_depth,
+                                                                                edge_limit=edge_limit,
+                                                                                error_when_limit=error_when_limit)
+        return self._create_query_result(node_ids, edge_ids, limit_exceeded)
 
-        # Rename attribute in the relevant entities
-        if aspect == constants.NODES_ASPECT:
-            for node in self._nodes.values():
-                values = node.get(constants.ASPECT_VALUES, {})
-                if old_key in values:
-                    values[new_key] = values.pop(old_key)
+    def _create_query_result(self, node_ids, edge_ids, limit_exceeded):
+        """
+        Creates subnetwork for result of a local query, flagging it with network attribute
+        :py:const:`~ndex2.query.EDGE_LIMIT_EXCEEDED` if **limit_exceeded** is ``True``.
 
-        elif aspect == constants.EDGES_ASPECT:
-            for edge in self._edges.values():
-                values = edge.get(constants.ASPECT_VALUES, {})
-                if old_key in values:
-                    values[new_key] = values.pop(old_key)
+        :return: New network
+        :rtype: :py:class:`~ndex2.cx2.CX2Network`
+        """
+        sub_net = self._create_subnetwork(node_ids, edge_ids)
+        if limit_exceeded is True:
+            sub_net.add_network_attribute(query.EDGE_LIMIT_EXCEEDED, 'true', datatype=constants.STRING_DATATYPE)
+        return sub_net
 
-        elif aspect == constants.NETWORK_ATTRIBUTES_ASPECT:
-            if old_key in self._network_attributes:
-                self._network_attributes[new_key] = self._network_attributes.pop(old_key)
+    def _create_subnetwork(self, node_ids, edge_ids):
+        """
+        Creates new network with copies of the nodes and edges passed in, the bypasses of
+        those nodes and edges, and copies of the attribute declarations, network attributes
+        and visual properties of this network. Node and edge ids are unchanged.
 
-        # Update attribute declarations
-        aspect_decls = self._attribute_declarations.get(aspect, {})
-        if old_key in aspect_decls:
-            aspect_decls[new_key] = aspect_decls.pop(old_key)
+        :param node_ids: IDs of nodes to copy.
+        :type node_ids: iterable
+        :param edge_ids: IDs of edges to copy, the source and target of each edge
+                         must be in **node_ids**.
+        :type edge_ids: iterable
+        :return: New network
+        :rtype: :py:class:`~ndex2.cx2.CX2Network`
+        """
+        sub_net = CX2Network()
+        sub_net._attribute_declarations = deepcopy(self._attribute_declarations)
+        sub_net._network_attributes = deepcopy(self._network_attributes)
+        for node_id in node_ids:
+            if node_id in self._nodes:
+                sub_net._nodes[node_id] = deepcopy(self._nodes[node_id])
+        for edge_id in edge_ids:
+            sub_net._edges[edge_id] = deepcopy(self._edges[edge_id])
+        sub_net._visual_properties = deepcopy(self._visual_properties)
+        sub_net._node_bypasses = {node_id: deepcopy(self._node_bypasses[node_id]) for node_id in sub_net._nodes
+                                  if node_id in self._node_bypasses}
+        sub_net._edge_bypasses = {edge_id: deepcopy(self._edge_bypasses[edge_id]) for edge_id in sub_net._edges
+                                  if edge_id in self._edge_bypasses}
+        sub_net._int_id_generator = dict(self._int_id_generator)
+        sub_net._attribute_counts = None
+        return sub_net
 
     def get_visual_properties(self):
         """
@@ -880,7 +2293,7 @@ class CX2Network(object):
         :param value: Visual property bypass value.
         :type value: Any
         """
-        self._node_bypasses[node_id] = value
+        self._get_writable_aspect('_node_bypasses')[node_id] = value
 
     def get_edge_bypasses(self):
         """
@@ -900,7 +2313,7 @@ class CX2Network(object):
         :param value: Visual property bypass value.
         :type value: Any
         """
-        self._edge_bypasses[edge_id] = value
+        self._get_writable_aspect('_edge_bypasses')[edge_id] = value
 
     def get_opaque_aspects(self):
         """
@@ -1076,68 +2489,328 @@ class CX2Network(object):
                     default_values[key] = default_value
         return default_values
 
+    def optimize_declarations(self, aliases=True, defaults=True):
+        """
+        Gets the attribute declarations with aliases and default values added to the node
+        and edge attributes to make the
+        `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__
+        written smaller. This is what :py:func:`to_cx2`, :py:func:`write_cx2` and :py:func:`iter_cx2`
+        write when **optimize** is ``True``.
+
+        * Attributes whose names take more space in the nodes or edges than declaring an alias
+          are given the shortest free alias, most used attributes first.
+        * Attributes set on every node, or every edge, get their most common value as default,
+          if it is on at least two of them. Nodes and edges with the default value are written
+          without the attribute.
+
+        Declarations of attributes not set on any node, edge or the network are left out.
+        The declarations returned are a copy, the network itself is not changed. The declarations
+        only fit the nodes and edges as they are now, so they are best made when writing the network,
+        loading the written
+        `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__
+        with :py:func:`create_from_raw_cx2` then gives back the same nodes and edges. Aliases and default
+        values already declared are kept. Default values of ``0``, ``False``, empty strings and empty lists
+        are not used as they are not applied when adding nodes and edges.
+
+        .. code-block:: python
+
+            cx2_network.write_cx2('mynetwork.cx2', optimize=True)
+
+        .. versionadded:: 3.12.0
+
+        :param aliases: If ``True``, add aliases
+        :type aliases: bool
+        :param defaults: If ``True``, add default values
+        :type defaults: bool
+        :return: Attribute declarations, in the format of :py:func:`get_attribute_declarations`
+        :rtype: dict
+        """
+        optimized = copy.deepcopy(self._attribute_declarations) if self._attribute_declarations else {}
+        for aspect_name, attrs in self._get_unused_declarations().items():
+            for attr in attrs:
+                optimized[aspect_name].pop(attr)
+        for aspect_name, elements in ((constants.NODES_ASPECT, self._nodes),
+                                      (constants.EDGES_ASPECT, self._edges)):
+            declarations = optimized.get(aspect_name)
+            if not declarations or not elements:
+                continue
+            table = self._get_declaration_table(aspect_name)
+            counts, value_counts = self._count_attribute_values(elements, declarations)
+
+            # number of nodes or edges each attribute is written to
+            written = dict(counts)
+            for attr, default in self._get_declared_defaults(aspect_name).items():
+                entry = value_counts.get(attr, {}).get((type(default), self._get_attribute_index_key(default)))
+                if entry is not None:
+                    written[attr] -= entry[0]
+            if defaults:
+                for attr, attr_value_counts in value_counts.items():
+                    if constants.ASPECT_VALUES in declarations[attr]:
+                        continue
+                    if counts[attr] != len(elements) or not attr_value_counts:
+                        continue
+                    default_count, default = max(attr_value_counts.values(), key=lambda x: x[0])
+                    if default_count < 2 or not default:
+                        continue
+                    declarations[attr][constants.ASPECT_VALUES] = copy.deepcopy(default)
+                    written[attr] -= default_count
+
+            if aliases:
+                taken = set(counts) | set(table.aliases)
+                free_aliases = self._iter_free_aliases(taken)
+                alias = next(free_aliases)
+                for attr in sorted(written, key=lambda x: (-written[x] * len(x), x)):
+                    if attr not in declarations or 'a' in declarations[attr] or attr in table.reserved:
+                        continue
+                    saved = written[attr] * (len(json.dumps(attr)) - len(json.dumps(alias)))
+                    # cost of declaring the alias, such as "a": "b",
+                    if saved <= len(json.dumps(alias)) + 6:
+                        continue
+                    declarations[attr]['a'] = alias
+                    alias = next(free_aliases)
+        return optimized
+
+    @staticmethod
+    def _count_attribute_values(elements, declarations):
+        """
+        Counts the nodes or edges having each attribute and, for declared attributes,
+        how many have each value.
+
+        :param elements: node or edge id => node or edge
+        :type elements: dict
+        :param declarations: Attribute declarations of the nodes or edges
+        :type declarations: dict
+        :return: (attribute name => number of nodes or edges with the attribute,
+                  attribute name => value key => [number of nodes or edges with the value, value])
+        :rtype: tuple
+        """
+        counts = dict.fromkeys(declarations, 0)
+        value_counts = {attr: {} for attr in declarations}
+        for element in elements.values():
+            for attr, value in element.get(constants.ASPECT_VALUES, {}).items():
+                counts[attr] = counts.get(attr, 0) + 1
+                attr_value_counts = value_counts.get(attr)
+                if attr_value_counts is None:
+                    continue
+                key = CX2Network._get_attribute_index_key(value)
+                if key is None:
+                    # values that cannot be counted rule out a default value
+                    del value_counts[attr]
+                    continue
+                key = (type(value), key)
+                entry = attr_value_counts.get(key)
+                if entry is None:
+                    attr_value_counts[key] = [1, value]
+                else:
+                    entry[0] += 1
+        return counts, value_counts
+
+    @staticmethod
+    def _iter_free_aliases(taken):
+        """
+        Generates aliases 'a', 'b', ..., 'z', 'aa', 'ab', ... not in **taken**
+
+        :param taken: Attribute names and aliases that cannot be used
+        :type taken: set
+        :rtype: generator of str
+        """
+        for length in count(1):
+            for letters in product(string.ascii_lowercase, repeat=length):
+                alias = ''.join(letters)
+                if alias not in taken:
+                    yield alias
+
+    def _get_declared_defaults(self, aspect_name, table=None):
+        """
+        Gets the default values declared for attributes of the nodes or edges that are set
+        on nodes or edges added without them, converted to the declared data types.
+
+        :param aspect_name: 'nodes' or 'edges'
+        :type aspect_name: str
+        :param table: Declarations to use instead of those of the network
+        :type table: :py:class:`_DeclarationTable`
+        :return: attribute name => default value
+        :rtype: dict
+        """
+        if table is None:
+            table = self._get_declaration_table(aspect_name)
+        defaults = {}
+        for name, default_value in table.defaults:
+            declared_type = table.datatypes.get(name)
+            try:
+                if declared_type is None:
+                    declared_type = self._get_cx2_type(default_value)
+                defaults[name] = _get_converter(declared_type)(default_value)
+            except (NDExError, AttributeError, TypeError):
+                continue
+        return defaults
+
     def create_from_raw_cx2(self, cx2_data):
         """
         Loads and processes a raw `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__
         data into structured data within the instance.
 
+        Files, file objects and HTTP responses are read with :py:mod:`ijson`, adding nodes and
+        edges to the network as they are read, so the whole
+        `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__
+        document is never held in memory. Attribute declarations are applied to all nodes, edges
+        and network attributes, even if they come later in the document, in which case the
+        elements before them are held until the declarations are read. Aspects split into
+        fragments, as allowed when ``hasFragments`` is ``true``, are combined.
+
+        .. versionchanged:: 3.12.0
+
+            Accepts file objects and HTTP responses and reads files incrementally
+
+        **Usage Example:**
+
+        .. code-block:: python
+
+            import requests
+            from ndex2.cx2 import CX2Network
+
+            response = requests.get('https://www.ndexbio.org/v3/networks/<UUID>', stream=True)
+            cx2_network = CX2Network()
+            cx2_network.create_from_raw_cx2(response)
+
         :param cx2_data: Path to the `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__
-                         file or a list representing `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__ data to be processed.
-        :type cx2_data: str or list
+                         file, a file object or HTTP response such as :py:class:`requests.Response`
+                         to read it from, or a list representing `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__ data to be processed.
+        :type cx2_data: str, list, file object or :py:class:`requests.Response`
         :raises NDExError: If **cx2_data** is ``None``
         :raises NDExInvalidCX2Error: If there is an error parsing **cx2_data**
         """
-        if not cx2_data:
+        if cx2_data is None or (isinstance(cx2_data, (str, list)) and not cx2_data):
             raise NDExError('CX2 is empty')
 
         if isinstance(cx2_data, str):
-            with open(cx2_data, 'r') as cx2_file:
-                raw_data = json.load(cx2_file)
+            with open(cx2_data, 'rb') as cx2_file:
+                self._load_cx2_file(cx2_file)
         elif isinstance(cx2_data, list):
-            raw_data = cx2_data
+            self._load_cx2_sections(cx2_data)
+        elif hasattr(cx2_data, 'read'):
+            self._load_cx2_file(cx2_data)
+        elif hasattr(cx2_data, 'raw') and hasattr(cx2_data, 'iter_content'):
+            # requests.Response, read the body as it arrives, decompressing it if needed
+            cx2_data.raw.decode_content = True
+            self._load_cx2_file(cx2_data.raw)
         else:
-            raise NDExInvalidCX2Error("Invalid input. The input parameter 'cx2_data' should be a file path (str) or a "
-                                      "list.")
+            raise NDExInvalidCX2Error("Invalid input. The input parameter 'cx2_data' should be a file path (str), "
+                                      "a list, a file object or an HTTP response.")
+
+    def _load_cx2_file(self, cx2_file):
+        """
+        Reads `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__
+        from file object **cx2_file** into this network.
+
+        :param cx2_file: File object
+        :raises NDExInvalidCX2Error: If **cx2_file** is not valid JSON
+        """
+        if isinstance(cx2_file, io.TextIOBase):
+            # ijson reads bytes
+            cx2_file = cx2_file.buffer if hasattr(cx2_file, 'buffer') else io.BytesIO(cx2_file.read().encode('utf-8'))
+        try:
+            self._load_cx2_sections(_iter_cx2_sections(cx2_file))
+        except ijson.JSONError as je:
+            raise NDExInvalidCX2Error('Unable to parse CX2: ' + str(je))
+
+    def _load_cx2_sections(self, sections):
+        """
+        Adds aspects of `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__
+        to this network. Nodes, edges and network attributes seen before the attribute declarations
+        are held until the declarations are read, unless ``metaData`` shows there are none.
+
+        :param sections: Aspects, each a dict
+        :type sections: iterable
+        """
+        has_fragments = False
+        declarations_expected = True
+        pending = []
 
-        for section in raw_data:
+        for section in sections:
             if 'attributeDeclarations' in section:
-                self.set_attribute_declarations(section['attributeDeclarations'][0])
-
-            elif constants.NETWORK_ATTRIBUTES_ASPECT in section:
-                self.set_network_attributes(section[constants.NETWORK_ATTRIBUTES_ASPECT][0])
-
-            elif constants.NODES_ASPECT in section:
-                for node in section[constants.NODES_ASPECT]:
-                    if constants.ASPECT_ID not in node:
-                        raise NDExInvalidCX2Error('CX2 is not properly designed. Node requires id.')
-                    self.add_node(node[constants.ASPECT_ID], node.get(constants.ASPECT_VALUES, None),
-                                  node.get(constants.LAYOUT_X, None),
-                                  node.get(constants.LAYOUT_Y, None),
-                                  node.get(constants.LAYOUT_Z, None))
-
-            elif constants.EDGES_ASPECT in section:
-                for edge in section[constants.EDGES_ASPECT]:
-                    if constants.ASPECT_ID not in edge or constants.EDGE_SOURCE not in edge or constants.EDGE_TARGET not in edge:
-                        raise NDExInvalidCX2Error('CX2 is not properly designed. Edge requires id, source (s) and '
-                                                  'target (t).')
-                    self.add_edge(edge[constants.ASPECT_ID], edge[constants.EDGE_SOURCE], edge[constants.EDGE_TARGET],
-                                  edge.get(constants.ASPECT_VALUES, None))
+                declarations = section['attributeDeclarations'][0]
+                if has_fragments and self._attribute_declarations:
+                    for aspect_name, aspect_declarations in declarations.items():
+                        self._attribute_declarations.setdefault(aspect_name, {}).update(aspect_declarations)
+                    self._declaration_tables = {}
+                else:
+                    self.set_attribute_declarations(declarations)
+                declarations_expected = False
+                for aspect_name, value in pending:
+                    self._add_cx2_aspect(aspect_name, value, has_fragments)
+                pending = []
+
+            elif (constants.NETWORK_ATTRIBUTES_ASPECT in section or constants.NODES_ASPECT in section or
+                  constants.EDGES_ASPECT in section):
+                aspect_name = next(name for name in (constants.NETWORK_ATTRIBUTES_ASPECT, constants.NODES_ASPECT,
+                                                     constants.EDGES_ASPECT) if name in section)
+                if declarations_expected:
+                    pending.append((aspect_name, list(section[aspect_name])))
+                else:
+                    self._add_cx2_aspect(aspect_name, section[aspect_name], has_fragments)
 
             elif "visualProperties" in section:
-                self.set_visual_properties(section["visualProperties"][0])
+                if has_fragments and self._visual_properties:
+                    self._visual_properties.update(section["visualProperties"][0])
+                else:
+                    self.set_visual_properties(section["visualProperties"][0])
             elif "nodeBypasses" in section:
                 for nodeBypass in section["nodeBypasses"]:
                     self.add_node_bypass(nodeBypass[constants.ASPECT_ID], nodeBypass[constants.ASPECT_VALUES])
             elif "edgeBypasses" in section:
                 for edgeBypass in section["edgeBypasses"]:
                     self.add_edge_bypass(edgeBypass[constants.ASPECT_ID], edgeBypass[constants.ASPECT_VALUES])
-            elif "metaData" in section or "CXVersion" in section:
-                pass
+            elif "metaData" in section:
+                if not any(isinstance(entry, dict) and entry.get('name') == 'attributeDeclarations'
+                           for entry in section["metaData"]):
+                    declarations_expected = False
+            elif "CXVersion" in section:
+                has_fragments = bool(section.get('hasFragments', False))
             elif "status" in section:
                 self.set_status(section["status"][0])
             else:
                 self.add_opaque_aspect(section)
 
+        for aspect_name, value in pending:
+            self._add_cx2_aspect(aspect_name, value, has_fragments)
+
+    def _add_cx2_aspect(self, aspect_name, value, has_fragments=False):
+        """
+        Adds the network attributes, nodes or edges of a
+        `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__ aspect.
+
+        :param aspect_name: 'networkAttributes', 'nodes' or 'edges'
+        :type aspect_name: str
+        :param value: Elements of the aspect
+        :type value: iterable
+        :param has_fragments: If ``True``, network attributes are added to those already set
+        :type has_fragments: bool
+        :raises NDExInvalidCX2Error: If a node has no id, or an edge has no id, source or target
+        """
+        if aspect_name == constants.NETWORK_ATTRIBUTES_ASPECT:
+            network_attributes = value[0]
+            if has_fragments and self._network_attributes:
+                network_attributes = dict(self._network_attributes, **network_attributes)
+            self.set_network_attributes(network_attributes)
+
+        elif aspect_name == constants.NODES_ASPECT:
+            for node in value:
+                if constants.ASPECT_ID not in node:
+                    raise NDExInvalidCX2Error('CX2 is not properly designed. Node requires id.')
+                self.add_node(node[constants.ASPECT_ID], node.get(constants.ASPECT_VALUES, None),
+                              node.get(constants.LAYOUT_X, None),
+                              node.get(constants.LAYOUT_Y, None),
+                              node.get(constants.LAYOUT_Z, None))
+
+        else:
+            for edge in value:
+                if constants.ASPECT_ID not in edge or constants.EDGE_SOURCE not in edge or constants.EDGE_TARGET not in edge:
+                    raise NDExInvalidCX2Error('CX2 is not properly designed. Edge requires id, source (s) and '
+                                              'target (t).')
+                self.add_edge(edge[constants.ASPECT_ID], edge[constants.EDGE_SOURCE], edge[constants.EDGE_TARGET],
+                              edge.get(constants.ASPECT_VALUES, None))
+
     def write_as_raw_cx2(self, output_path):
         """
         Writes data from CX2Network object to a raw `CX2 formatted <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__ JSON file.
@@ -1147,8 +2820,135 @@ class CX2Network(object):
         """
 
         with open(output_path, 'w') as output_file:
-            output_data = self.to_cx2()
-            json.dump(output_data, output_file, indent=4)
+            self.write_cx2(output_file, indent=4)
+
+    def write_cx2(self, output_file, indent=None, compress=None, optimize=False):
+        """
+        Writes network in `CX2 format <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__
+        to **output_file**. The output is the same as passing the result of :py:func:`to_cx2` to
+        :py:func:`json.dump`, but nodes and edges are written straight from the network a
+        batch at a time instead of first being copied into one large list.
+
+        .. versionadded:: 3.12.0
+
+        **Usage Example:**
+
+        .. code-block:: python
+
+            from ndex2.cx2 import CX2Network
+
+            cx2_network = CX2Network()
+            cx2_network.add_node(attributes={'name': 'node 1'})
+
+            with open('network.cx2.gz', 'wb') as f:
+                cx2_network.write_cx2(f, compress='gzip')
+
+        :param output_file: Path or file object to write to. Text is written to
+                            text file objects and UTF-8 encoded bytes to any other
+                            file object
+        :type output_file: str or file object
+        :param indent: Passed to :py:func:`json.dump`, ``None`` for the most compact output
+        :type indent: int
+        :param compress: Set to ``gzip`` to write gzip compressed output, in which
+                         case **output_file** must be a path or binary file object
+        :type compress: str
+        :param optimize: If ``True``, write the attribute declarations of :py:func:`optimize_declarations`
+        :type optimize: bool
+        :raises NDExInvalidParameterError: If **compress** is not ``None`` or ``gzip``
+        """
+        if compress not in (None, 'gzip'):
+            raise NDExInvalidParameterError(f'Unsupported compression: {compress}')
+        if isinstance(output_file, str):
+            with open(output_file, 'wb') as binary_file:
+                self.write_cx2(binary_file, indent=indent, compress=compress, optimize=optimize)
+            return
+        if compress == 'gzip':
+            with gzip.GzipFile(fileobj=output_file, mode='wb') as gzip_file:
+                for chunk in self.iter_cx2(indent=indent, optimize=optimize):
+                    gzip_file.write(chunk)
+            return
+        encode = not isinstance(output_file, io.TextIOBase)
+        for text in self._iter_cx2_text(indent, optimize=optimize):
+            output_file.write(text.encode('utf-8') if encode else text)
+
+    def iter_cx2(self, indent=None, chunk_size=65536, optimize=False):
+        """
+        Generates network in `CX2 format <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__
+        as chunks of UTF-8 encoded JSON, for writing or uploading the network without holding
+        all of it in memory as text. Joined together, the chunks are the output of :py:func:`write_cx2`.
+
+        .. versionadded:: 3.12.0
+
+        :param indent: Passed to :py:func:`json.dump`, ``None`` for the most compact output
+        :type indent: int
+        :param chunk_size: Approximate size of each chunk in bytes
+        :type chunk_size: int
+        :param optimize: If ``True``, write the attribute declarations of :py:func:`optimize_declarations`
+        :type optimize: bool
+        :return: Chunks of the network in CX2 format
+        :rtype: generator of bytes
+        """
+        buffer = []
+        buffer_size = 0
+        for text in self._iter_cx2_text(indent, optimize=optimize):
+            buffer.append(text)
+            buffer_size += len(text)
+            if buffer_size >= chunk_size:
+                yield ''.join(buffer).encode('utf-8')
+                buffer = []
+                buffer_size = 0
+        if buffer:
+            yield ''.join(buffer).encode('utf-8')
+
+    def _iter_cx2_text(self, indent=None, batch_size=1000, optimize=False):
+        """
+        Generates the JSON text of :py:func:`to_cx2` in pieces, encoding nodes and edges
+        **batch_size** at a time as they are read from the network.
+
+        :param indent: Passed to :py:func:`json.dumps`
+        :type indent: int
+        :param batch_size: Number of nodes or edges to encode at once
+        :type batch_size: int
+        :param optimize: Passed to :py:func:`_get_cx2_aspects`
+        :type optimize: bool
+        :return: Pieces of JSON text
+        :rtype: generator of str
+        """
+        if indent is None:
+            item_separator, newline, level = ', ', '', ''
+        else:
+            item_separator, newline = ',', '\n'
+            level = ' ' * indent if isinstance(indent, int) else indent
+
+        yield '['
+        for position, aspect in enumerate(self._get_cx2_aspects(copy_values=False, optimize=optimize)):
+            if position:
+                yield item_separator
+            yield newline + level
+            name = next(iter(aspect))
+            if name not in (constants.NODES_ASPECT, constants.EDGES_ASPECT):
+                yield json.dumps(aspect, indent=indent).replace('\n', '\n' + level)
+                continue
+
+            yield '{' + newline + level * 2 + json.dumps(name) + ': ['
+            elements = aspect[name]
+            first_batch = True
+            while True:
+                batch = [element for _, element in zip(range(batch_size), elements)]
+                if not batch:
+                    break
+                if not first_batch:
+                    yield item_separator
+                if indent is None:
+                    yield json.dumps(batch)[1:-1]
+                else:
+                    # re-indent the elements of the list from one level deep to three levels deep
+                    yield newline + level * 2 + json.dumps(batch, indent=indent)[2:-2].replace('\n', '\n' + level * 2)
+                first_batch = False
+            if not first_batch:
+                yield newline + level * 2
+            yield ']' + newline + level + '}'
+        yield newline + ']'
 
     def _get_meta_data(self):
         """
@@ -1210,36 +3010,160 @@ class CX2Network(object):
     def _cleanup_attribute_declarations(self):
         """
         Removes attribute declarations that are no longer used in any node, edge, or network attribute.
+
+        .. versionchanged:: 3.12.0
+
+            Node and edge declarations are checked against the number of nodes and edges having
+            each attribute, see :py:func:`_get_attribute_counts`, instead of every node and edge.
+            Nodes or edges are only recounted when a declaration looks unused, in case attributes
+            were set directly on the dicts returned by methods such as :py:func:`get_node`.
+            Attributes deleted directly from those dicts are not noticed, so their declarations are kept
+        """
+        for aspect_name, attrs in self._get_unused_declarations().items():
+            for attr in attrs:
+                self._attribute_declarations[aspect_name].pop(attr, None)
+            self._declaration_tables.pop(aspect_name, None)
+
+    def _get_unused_declarations(self):
         """
-        used_node_attrs = set()
-        for node in self._nodes.values():
-            used_node_attrs.update(node.get(constants.ASPECT_VALUES, {}).keys())
-        node_attrs_to_remove = set(self._attribute_declarations.get(constants.NODES_ASPECT, {}).keys()) - used_node_attrs
-        for attr in node_attrs_to_remove:
-            self._attribute_declarations[constants.NODES_ASPECT].pop(attr, None)
+        Finds the attribute declarations not used by any node, edge, or network attribute,
+        see :py:func:`_cleanup_attribute_declarations`
 
-        used_edge_attrs = set()
-        for edge in self._edges.values():
-            used_edge_attrs.update(edge.get('v', {}).keys())
-        edge_attrs_to_remove = set(self._attribute_declarations.get(constants.EDGES_ASPECT, {}).keys()) - used_edge_attrs
-        for attr in edge_attrs_to_remove:
-            self._attribute_declarations[constants.EDGES_ASPECT].pop(attr, None)
+        :return: aspect name => names of the attributes declared but not used, for aspects with any
+        :rtype: dict
+        """
+        unused = {}
+        declared = self._attribute_declarations or {}
+        attribute_counts = self._get_attribute_counts()
+        for aspect_name, elements in ((constants.NODES_ASPECT, self._nodes),
+                                      (constants.EDGES_ASPECT, self._edges)):
+            declarations = declared.get(aspect_name) or {}
+            counts = attribute_counts[aspect_name]
+            if all(counts.get(attr) for attr in declarations):
+                continue
+            counts = attribute_counts[aspect_name] = self._count_attributes(elements)
+            attrs = [attr for attr in declarations if attr not in counts]
+            if attrs:
+                unused[aspect_name] = attrs
 
         used_network_attrs = set(self._network_attributes.keys())
-        network_attrs_to_remove = set(self._attribute_declarations.get(constants.NETWORK_ATTRIBUTES_ASPECT, {}).keys()) - used_network_attrs
-        for attr in network_attrs_to_remove:
-            self._attribute_declarations[constants.NETWORK_ATTRIBUTES_ASPECT].pop(attr, None)
+        network_attrs_to_remove = [attr for attr in declared.get(constants.NETWORK_ATTRIBUTES_ASPECT) or {}
+                                   if attr not in used_network_attrs]
+        if network_attrs_to_remove:
+            unused[constants.NETWORK_ATTRIBUTES_ASPECT] = network_attrs_to_remove
+        return unused
+
+    @staticmethod
+    def _count_attributes(elements):
+        """
+        Counts the nodes or edges having each attribute.
+
+        :param elements: node or edge id => node or edge
+        :type elements: dict
+        :return: attribute name => number of nodes or edges with the attribute
+        :rtype: dict
+        """
+        counts = {}
+        for element in elements.values():
+            for attr in element.get(constants.ASPECT_VALUES, {}):
+                counts[attr] = counts.get(attr, 0) + 1
+        return counts
+
+    def _get_attribute_counts(self):
+        """
+        Gets the number of nodes and of edges having each attribute. The counts are built on first
+        use and then kept current by :py:func:`_update_attribute_counts` as nodes, edges and their
+        attributes are added, updated and removed through this class.
+
+        :return: 'nodes' or 'edges' => attribute name => number of nodes or edges with the attribute
+        :rtype: dict
+        """
+        if self._attribute_counts is None:
+            self._attribute_counts = {constants.NODES_ASPECT: self._count_attributes(self._nodes),
+                                      constants.EDGES_ASPECT: self._count_attributes(self._edges)}
+        return self._attribute_counts
+
+    def _update_attribute_counts(self, aspect_name, attributes, change):
+        """
+        Adds **change** to the counts of nodes or edges having each of **attributes**, if the
+        counts have been built.
+
+        :param aspect_name: 'nodes' or 'edges'
+        :type aspect_name: str
+        :param attributes: Names of attributes added to or removed from one node or edge
+        :type attributes: iterable
+        :param change: ``1`` if the attributes were added, ``-1`` if removed
+        :type change: int
+        """
+        if self._attribute_counts is None:
+            return
+        counts = self._attribute_counts[aspect_name]
+        for attr in attributes:
+            count = counts.get(attr, 0) + change
+            if count > 0:
+                counts[attr] = count
+            else:
+                counts.pop(attr, None)
+
+    def _rename_attribute_count(self, aspect_name, old_key, new_key, renamed):
+        """
+        Moves the count of attribute **old_key** to **new_key** after :py:func:`rename_attribute`
 
-    def to_cx2(self):
+        :param aspect_name: 'nodes' or 'edges'
+        :type aspect_name: str
+        :param renamed: Number of nodes or edges that did not have **new_key** before
+        :type renamed: int
+        """
+        if self._attribute_counts is None or old_key == new_key:
+            return
+        counts = self._attribute_counts[aspect_name]
+        counts.pop(old_key, None)
+        if renamed:
+            counts[new_key] = counts.get(new_key, 0) + renamed
+
+    def to_cx2(self, optimize=False):
         """
         Generates the `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__ representation of the current state of the instance.
 
         This method constructs a list structure representing the current state of the network
         in the `CX2 format. <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__
 
+        .. note::
+
+            Declarations of attributes no longer on any node or edge are left out. Removals are
+            tracked by methods such as :py:func:`remove_node_attribute` and :py:func:`update_node`,
+            an attribute deleted directly from the dict returned by :py:func:`get_node` or
+            :py:func:`get_edge` keeps its declaration.
+
+        :param optimize: If ``True``, output the attribute declarations of :py:func:`optimize_declarations`,
+                         with aliases and default values that make the output smaller.
+
+                         .. versionadded:: 3.12.0
+
+        :type optimize: bool
         :return: A list representing the `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__ formatted data of the current network state.
         :rtype: list
         """
+        output_data = self._get_cx2_aspects(optimize=optimize)
+        for aspect in output_data:
+            for aspect_name in (constants.NODES_ASPECT, constants.EDGES_ASPECT):
+                if aspect_name in aspect:
+                    aspect[aspect_name] = list(aspect[aspect_name])
+        return output_data
+
+    def _get_cx2_aspects(self, copy_values=True, optimize=False):
+        """
+        Gets the aspects returned by :py:func:`to_cx2`, with nodes and edges left as generators
+        from :py:func:`_iter_cx2_elements` so they can be written out one at a time.
+
+        :param copy_values: If ``True``, attributes of nodes and edges are copied so changes to
+                            the output do not change the network
+        :type copy_values: bool
+        :param optimize: If ``True``, use the attribute declarations of :py:func:`optimize_declarations`
+        :type optimize: bool
+        :return: Aspects of the network in `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__ format
+        :rtype: list
+        """
         output_data = [
             {
                 "CXVersion": "2.0",
@@ -1248,25 +3172,26 @@ class CX2Network(object):
             {"metaData": self._get_meta_data()}]
 
         self._cleanup_attribute_declarations()
-        if self._attribute_declarations:
-            filtered_attribute_declarations = {k: v for k, v in self.get_attribute_declarations().items()
+        declarations = self.optimize_declarations() if optimize else self.get_attribute_declarations()
+        if declarations:
+            filtered_attribute_declarations = {k: v for k, v in declarations.items()
                                                if v is not None and v != {}}
             output_data.append({"attributeDeclarations": [filtered_attribute_declarations]})
+        tables = {aspect_name: _DeclarationTable(declarations.get(aspect_name)) if optimize else None
+                  for aspect_name in (constants.NODES_ASPECT, constants.EDGES_ASPECT)}
 
         if self._network_attributes:
             output_data.append({"networkAttributes": [self.get_network_attributes()]})
 
-        nodes_list = self._replace_with_alias(list(self.get_nodes().values()), constants.NODES_ASPECT)
-        output_nodes = self._clean_aspect_data(nodes_list, [constants.LAYOUT_X, constants.LAYOUT_Y,
-                                                            constants.LAYOUT_Z, constants.ASPECT_VALUES])
         output_data.append({
-            constants.NODES_ASPECT: output_nodes
+            constants.NODES_ASPECT: self._iter_cx2_elements(constants.NODES_ASPECT,
+                                                            [constants.LAYOUT_X, constants.LAYOUT_Y,
+                                                             constants.LAYOUT_Z, constants.ASPECT_VALUES],
+                                                            copy_values, tables[constants.NODES_ASPECT])
         })
-
-        edges_list = self._replace_with_alias(list(self.get_edges().values()), constants.EDGES_ASPECT)
-        output_edges = self._clean_aspect_data(edges_list, [constants.ASPECT_VALUES])
         output_data.append({
-            constants.EDGES_ASPECT: output_edges
+            constants.EDGES_ASPECT: self._iter_cx2_elements(constants.EDGES_ASPECT, [constants.ASPECT_VALUES],
+                                                            copy_values, tables[constants.EDGES_ASPECT])
         })
 
         if self._visual_properties:
@@ -1291,6 +3216,58 @@ class CX2Network(object):
 
         return output_data
 
+    def _iter_cx2_elements(self, aspect_name, fields_to_check, copy_values=True, table=None):
+        """
+        Generates the nodes or edges of the network as they appear in
+        `CX2 <https://cytoscape.org/cx/cx2/specification/cytoscape-exchange-format-specification-(version-2)>`__,
+        doing what :py:func:`_replace_with_alias` and :py:func:`_clean_aspect_data` do, one element
+        at a time. Aliased attributes are placed after the other attributes, as
+        :py:func:`_replace_with_alias` does. When **table** is given, attributes equal to their
+        declared default value are left out, since they are set back to the default when the
+        network is loaded.
+
+        :param aspect_name: Name of the aspect ('nodes' or 'edges')
+        :type aspect_name: str
+        :param fields_to_check: Fields left out when ``None``, or for attributes, when empty
+        :type fields_to_check: list
+        :param copy_values: If ``True``, attributes are copied instead of shared with the network
+        :type copy_values: bool
+        :param table: Declarations to use instead of those of the network, from
+                      :py:func:`optimize_declarations`
+        :type table: :py:class:`_DeclarationTable`
+        :return: Nodes or edges
+        :rtype: generator of dict
+        """
+        elements = self._nodes if aspect_name == constants.NODES_ASPECT else self._edges
+        if table is None:
+            table = self._get_declaration_table(aspect_name)
+            defaults = None
+        else:
+            defaults = self._get_declared_defaults(aspect_name, table)
+        reverse_aliases = {name: alias for alias, name in table.aliases.items()}
+        for item in list(elements.values()):
+            clean_item = {k: v for k, v in item.items() if k not in fields_to_check}
+            for field in fields_to_check:
+                value = item.get(field)
+                if value is None:
+                    continue
+                if field == constants.ASPECT_VALUES:
+                    if defaults and not defaults.keys().isdisjoint(value):
+                        value = {k: v for k, v in value.items()
+                                 if k not in defaults or type(v) is not type(defaults[k]) or v != defaults[k]}
+                    if not value:
+                        continue
+                    if copy_values:
+                        value = {k: list(v) if isinstance(v, list) else v for k, v in value.items()}
+                    if reverse_aliases and not reverse_aliases.keys().isdisjoint(value):
+                        renamed = {k: v for k, v in value.items() if k not in reverse_aliases}
+                        for k, v in value.items():
+                            if k in reverse_aliases:
+                                renamed[reverse_aliases[k]] = v
+                        value = renamed
+                clean_item[field] = value
+            yield clean_item
+
     def _process_attributes(self, aspect_name, attributes):
         """
         Process the attributes for the given aspect by assigning default or declared values,
@@ -1301,25 +3278,199 @@ class CX2Network(object):
         :param attributes: Dictionary of attributes to be processed.
         :type attributes: dict
         """
+        table = self._get_declaration_table(aspect_name)
         processed_attrs = {}
-        aliases = self.get_aliases(aspect_name)
-        default_values = self.get_default_values(aspect_name)
 
-        for key, default_value in default_values.items():
-            actual_key = aliases.get(key, key)
-            declared_type = self.get_declared_type(aspect_name, actual_key, default_value)
-            processed_attrs[actual_key] = convert_value(declared_type, default_value)
+        for actual_key, default_value in table.defaults:
+            declared_type = table.datatypes.get(actual_key)
+            if declared_type is None:
+                declared_type = self._get_cx2_type(default_value)
+            processed_attrs[actual_key] = _get_converter(declared_type)(default_value)
 
         if attributes is not None:
             for key, value in attributes.items():
-                actual_key = aliases.get(key, key)
-                declared_type = self.get_declared_type(aspect_name, actual_key, value)
-                if value is not None:
-                    processed_attrs[actual_key] = convert_value(declared_type, value)
-
-        self._generate_attribute_declarations_for_aspect(aspect_name, processed_attrs, aliases)
+                if value is None:
+                    continue
+                actual_key = table.aliases.get(key, key)
+                declared_type = table.datatypes.get(actual_key)
+                if declared_type is None:
+                    declared_type = self._get_cx2_type(value)
+                processed_attrs[actual_key] = _get_converter(declared_type)(value)
+
+        declarations = self._attribute_declarations.get(aspect_name)
+        if declarations is None:
+            declarations = self._attribute_declarations[aspect_name] = {}
+            table = self._get_declaration_table(aspect_name)
+        for attr, value in processed_attrs.items():
+            if attr not in declarations and attr not in table.reserved:
+                table.add(attr, self._get_cx2_type(value))
         return processed_attrs
 
+    @staticmethod
+    def _get_column_values(values):
+        """
+        Gets a column passed to :py:func:`add_nodes` or :py:func:`add_edges` as a list, turning
+        :py:mod:`numpy` and :py:mod:`pandas` scalars into Python values.
+
+        :param values: Column of values, or ``None``
+        :type values: list, :py:class:`numpy.ndarray` or :py:class:`pandas.Series`
+        :return: values, or ``None`` if **values** is ``None``
+        :rtype: list
+        """
+        if values is None:
+            return None
+        if isinstance(values, (np.ndarray, pd.Series, pd.Index)):
+            return values.tolist()
+        return list(values)
+
+    @staticmethod
+    def _get_number_of_elements(columns, attributes):
+        """
+        Gets the number of nodes or edges described by **columns** and **attributes**, checking
+        they all have the same length.
+
+        :param columns: Columns of ids, coordinates, sources or targets, ``None`` if not passed in
+        :type columns: list
+        :param attributes: Columns of attributes
+        :type attributes: dict or :py:class:`pandas.DataFrame`
+        :raises NDExInvalidParameterError: If columns differ in length
+        :return: Number of elements
+        :rtype: int
+        """
+        lengths = {len(column) for column in columns if column is not None}
+        if isinstance(attributes, pd.DataFrame):
+            lengths.add(len(attributes.index))
+        elif attributes is not None:
+            lengths.update(len(column) for column in attributes.values())
+        if len(lengths) > 1:
+            raise NDExInvalidParameterError(f'Columns passed in must have the same length, '
+                                            f'got lengths {sorted(lengths)}')
+        return lengths.pop() if lengths else 0
+
+    def _get_new_ids(self, aspect_name, ids, num_elements, existing, label):
+        """
+        Checks **ids** are free and works out the value of the id counter of **aspect_name**
+        after adding them, as :py:func:`_get_next_id` does for one id. If **ids** is ``None``
+        the next **num_elements** free ids are used. The id counter is left as is.
+
+        :param aspect_name: Name of the aspect ('nodes' or 'edges')
+        :type aspect_name: str
+        :param ids: Ids asked for, or ``None``
+        :type ids: list
+        :param num_elements: Number of ids to reserve
+        :type num_elements: int
+        :param existing: Elements of the aspect, by id
+        :type existing: dict
+        :param label: 'Node' or 'Edge', for error messages
+        :type label: str
+        :raises NDExAlreadyExists: If an id is taken or appears more than once
+        :raises NDExInvalidCX2Error: If an id is not an integer
+        :return: (ids of the elements to add, next value of the id counter)
+        :rtype: tuple
+        """
+        next_id = self._int_id_generator[aspect_name]
+        if ids is None:
+            return list(range(next_id, next_id + num_elements)), next_id + num_elements
+
+        ids = [self._check_and_cast_id(element_id) for element_id in ids]
+        seen = set()
+        for element_id in ids:
+            if element_id in seen or element_id in existing:
+                raise NDExAlreadyExists(f"{label} with ID {element_id} already exists.")
+            seen.add(element_id)
+            next_id = max(element_id, next_id) + 1
+        return ids, next_id
+
+    def _process_attribute_columns(self, aspect_name, attributes, num_elements):
+        """
+        Processes columns of attributes as :py:func:`_process_attributes` does for the
+        attributes of one element, a column at a time. The data type of an attribute not
+        declared yet is taken from its first value, then the attribute is declared in the
+        order :py:func:`_process_attributes` would have declared it.
+
+        :param aspect_name: Name of the aspect (e.g., 'nodes', 'edges')
+        :type aspect_name: str
+        :param attributes: Columns of attributes, one value per element
+        :type attributes: dict or :py:class:`pandas.DataFrame`
+        :param num_elements: Number of elements
+        :type num_elements: int
+        :return: Processed attributes of each element
+        :rtype: list
+        """
+        if not num_elements:
+            return []
+        table = self._get_declaration_table(aspect_name)
+        defaults = {}
+        for actual_key, default_value in table.defaults:
+            declared_type = table.datatypes.get(actual_key)
+            if declared_type is None:
+                declared_type = self._get_cx2_type(default_value)
+            defaults[actual_key] = convert_value(declared_type, default_value)
+        element_values = [dict(defaults) for _ in range(num_elements)]
+        list_defaults = [key for key, value in defaults.items() if isinstance(value, list)]
+        if list_defaults:
+            for values in element_values:
+                for key in list_defaults:
+                    values[key] = list(values[key])
+
+        new_datatypes = {}
+        first_seen = []
+        columns = attributes.items() if attributes is not None else []
+        for rank, (key, column) in enumerate(columns):
+            if isinstance(column, (pd.Series, pd.Index, pd.api.extensions.ExtensionArray)) and \
+                    not isinstance(column.dtype, np.dtype):
+                # nullable columns, which numpy would turn into floats if values are missing
+                rows = np.flatnonzero(~np.asarray(pd.isna(column), dtype=bool))
+                values = np.asarray(column, dtype=object)[rows]
+                rows = rows.tolist()
+            elif isinstance(column, (pd.Series, np.ndarray)):
+                column = np.asarray(column)
+                rows = np.flatnonzero(~pd.isna(column))
+                values = column[rows]
+                rows = rows.tolist()
+            else:
+                rows = [row for row, value in enumerate(column) if value is not None]
+                column = list(column)
+                values = [column[row] for row in rows]
+            if not rows:
+                continue
+            actual_key = table.aliases.get(key, key)
+            declared_type = table.datatypes.get(actual_key, new_datatypes.get(actual_key))
+            if declared_type is None:
+                declared_type = self._get_cx2_type(values[0])
+                new_datatypes[actual_key] = declared_type
+                first_seen.append((rows[0], rank, actual_key))
+            for row, value in zip(rows, _convert_values(declared_type, values)):
+                element_values[row][actual_key] = value
+
+        declarations = self._attribute_declarations.get(aspect_name)
+        if declarations is None:
+            declarations = self._attribute_declarations[aspect_name] = {}
+            table = self._get_declaration_table(aspect_name)
+        for row, rank, actual_key in sorted(first_seen):
+            if actual_key not in declarations and actual_key not in table.reserved:
+                table.add(actual_key, new_datatypes[actual_key])
+        return element_values
+
+    def _get_declaration_table(self, aspect_name):
+        """
+        Gets the attribute declarations of aspect **aspect_name** arranged for quick lookup of
+        aliases, declared data types and default values. The table is built on first use and
+        rebuilt when declarations are set, renamed or cleaned up, or when declarations are
+        added or removed other than by :py:func:`_process_attributes`.
+
+        :param aspect_name: Name of the aspect (e.g., 'nodes', 'edges')
+        :type aspect_name: str
+        :return: Table of declarations
+        :rtype: :py:class:`_DeclarationTable`
+        """
+        declarations = self._attribute_declarations.get(aspect_name) if self._attribute_declarations else None
+        table = self._declaration_tables.get(aspect_name)
+        if table is None or not table.is_current(declarations):
+            table = _DeclarationTable(declarations)
+            self._declaration_tables[aspect_name] = table
+        return table
+
     def _replace_with_alias(self, aspect_list, aspect_name):
         """
         Replaces attribute names in a data list with their corresponding aliases, if available.
@@ -1644,6 +3795,16 @@ class PandasDataFrameToCX2NetworkFactory(CX2NetworkFactory):
         contain columns 'source' and 'target' to represent source node and target node of edge,
         and may contain additional columns for edge and node attributes.
 
+        .. versionchanged:: 3.12.0
+
+            Columns are read whole instead of row by row and nodes are matched by name with a
+            lookup table, so large DataFrames convert much faster. If a node appears in several
+            rows, each attribute and coordinate takes the last value found for it, as before.
+
+            **input_data** can also be an iterable of DataFrame chunks, such as the one returned
+            by :py:func:`pandas.read_csv` with ``chunksize`` set. Nodes are matched by id or name
+            across chunks, and edges are numbered on from the edges of earlier chunks.
+
         .. versionchanged:: 3.10.0
 
             Added interaction_col parameter.
@@ -1698,8 +3859,8 @@ class PandasDataFrameToCX2NetworkFactory(CX2NetworkFactory):
             The ``edge_interaction`` parameter defines the default interaction type for edges. If not specified in the data frame as edge attribute,
             this default value is used. If not set, the default interaction is set to ``interacts-with``.
 
-        :param input_data: The Pandas DataFrame to be converted into CX2Network.
-        :type input_data: pd.DataFrame
+        :param input_data: The Pandas DataFrame, or iterable of DataFrames, to be converted into CX2Network.
+        :type input_data: pd.DataFrame or iterable
         :param source_field: The field name for the source node name.
         :type source_field: str or int
         :param target_field: The field name for the target node name.
@@ -1729,75 +3890,392 @@ class PandasDataFrameToCX2NetworkFactory(CX2NetworkFactory):
         if input_data is None:
             raise NDExError('DataFrame input is empty')
 
-        if not isinstance(input_data, pd.DataFrame):
+        chunked = not isinstance(input_data, pd.DataFrame)
+        if not chunked:
+            chunks = [input_data]
+        elif isinstance(input_data, Iterable) and not isinstance(input_data, (str, bytes)):
+            chunks = input_data
+        else:
             raise NDExError("Input data must be a Pandas DataFrame")
 
         cx2network = CX2Network()
-
-        for index, row in input_data.iterrows():
-            source_id_value = int(row.pop(source_id)) if source_id in row else None
-            target_id_value = int(row.pop(target_id)) if target_id in row else None
-            source = row.pop(source_field) if source_field in row else None
-            target = row.pop(target_field) if target_field in row else None
-
-            if (source_id_value is None and target_id_value is None and source is None and target is None) or \
-                    ((source_id_value is None or target_id_value is None) and (source is None or target is None)):
-                if row.get(0, None) is not None and row.get(1, None) is not None:
-                    source = row.get(0)
-                    target = row.get(1)
-                else:
-                    raise NDExError("Missing 'source' or 'target' columns in the DataFrame")
-
-            source_attrs, target_attrs, edge_attrs = self._process_row_for_attributes(
-                row, source_node_attr, source_node_attr_prefix,
-                target_node_attr, target_node_attr_prefix, edge_attr, interaction_col
-            )
-
-            source_node_id = self._add_or_update_node(cx2network, source_id_value, source, source_attrs)
-            target_node_id = self._add_or_update_node(cx2network, target_id_value, target, target_attrs)
-            self._add_edge(cx2network, source_node_id, target_node_id, edge_attrs, edge_interaction)
-
+        nodes, edges = {}, {}
+        node_declarations, edge_declarations = {}, {}
+        # node names seen so far, so a node in a later chunk gets the same id
+        ids_by_name = {}
+        next_node_id = 0
+        for chunk in chunks:
+            if not isinstance(chunk, pd.DataFrame):
+                raise NDExError("Input data must be a Pandas DataFrame")
+            if len(chunk.index) == 0:
+                continue
+            next_node_id = self._add_chunk(cx2network, chunk, nodes, edges, node_declarations,
+                                           edge_declarations, ids_by_name, next_node_id,
+                                           source_field, target_field, source_id, target_id,
+                                           source_node_attr, target_node_attr, source_node_attr_prefix,
+                                           target_node_attr_prefix, edge_attr, edge_interaction, interaction_col,
+                                           chunked)
+        if len(edges) == 0:
+            return cx2network
+
+        cx2network._load_elements(nodes, edges, {constants.NODES_ASPECT: node_declarations,
+                                                 constants.EDGES_ASPECT: edge_declarations},
+                                  next_node_id, len(edges))
         return cx2network
 
-    def _process_row_for_attributes(self, row, source_node_attr, source_node_attr_prefix,
-                                    target_node_attr, target_node_attr_prefix, edge_attr, interaction_col=None):
+    def _add_chunk(self, cx2network, input_data, nodes, edges, node_declarations, edge_declarations,
+                   ids_by_name, next_node_id, source_field, target_field, source_id, target_id,
+                   source_node_attr, target_node_attr, source_node_attr_prefix, target_node_attr_prefix,
+                   edge_attr, edge_interaction, interaction_col, chunked=False):
         """
-        Process a single DataFrame row to extract source attributes, target attributes, and edge attributes.
+        Adds the nodes and edges of the rows of **input_data** to **nodes** and **edges**,
+        adding any new attributes to **node_declarations** and **edge_declarations**.
 
-        :param row: A single row from a Pandas DataFrame.
-        :param source_node_attr: List of column names for source node attributes.
-        :param source_node_attr_prefix: Prefix for source node attribute columns.
-        :param target_node_attr: List of column names for target node attributes.
-        :param target_node_attr_prefix: Prefix for target node attribute columns.
-        :param edge_attr: List of column names for edge attributes.
-        :return: Tuple of dictionaries for source attributes, target attributes, and edge attributes.
+        If **chunked** is ``True``, node ids and names are read with the type of their own column, since
+        the common type of all columns can differ from chunk to chunk and with it the name of a node.
+
+        :return: next free node id
+        :rtype: int
         """
-        source_attrs, target_attrs, edge_attrs = {}, {}, {}
-        for col, value in row.items():
-            if not isinstance(value, Iterable) and pd.isna(value):
-                continue
+        num_rows = len(input_data.index)
+
+        # values are read as DataFrame.iterrows() would return them, cast to the common type of all columns
+        row_dtype = input_data.iloc[:0].to_numpy().dtype
+        name_dtype = None if chunked else row_dtype
+        columns = list(input_data.columns)
+
+        # node id and name columns are used up, the remaining columns hold attributes
+        node_columns = []
+        for col in (source_id, target_id, source_field, target_field):
+            if col in columns:
+                columns.remove(col)
+                node_columns.append(input_data[col].to_numpy(dtype=name_dtype))
+            else:
+                node_columns.append(None)
+        source_ids, target_ids, source_names, target_names = node_columns
+
+        if source_ids is None or target_ids is None:
+            source_names, target_names = self._get_fallback_node_names(input_data, name_dtype, columns, num_rows,
+                                                                       source_names, target_names)
+
+        source_attrs, target_attrs, edge_attrs = self._get_column_roles(
+            input_data, columns, source_node_attr, source_node_attr_prefix,
+            target_node_attr, target_node_attr_prefix, edge_attr, interaction_col)
+
+        node_names = np.empty(2 * num_rows, dtype=object)
+        node_names[0::2] = source_names if source_names is not None else None
+        node_names[1::2] = target_names if target_names is not None else None
+        node_ids, next_node_id = self._get_node_ids(node_names, self._get_id_list(source_ids),
+                                                    self._get_id_list(target_ids), nodes, ids_by_name,
+                                                    next_node_id)
+
+        self._add_nodes(cx2network, input_data, row_dtype, node_ids, node_names, source_attrs, target_attrs,
+                        nodes, node_declarations)
+        self._add_edges(cx2network, input_data, row_dtype, node_ids, edge_attrs, edge_interaction,
+                        edges, edge_declarations)
+        return next_node_id
 
-            # Process source attributes
-            extracted_source_attr = self._extract_attributes_by_list_or_prefix(col, value, source_node_attr,
+    @staticmethod
+    def _get_fallback_node_names(input_data, row_dtype, columns, num_rows, source_names, target_names):
+        """
+        Gets source and target node names, replacing them with the values of columns ``0`` and ``1``
+        in rows where either name is missing.
+
+        :raises NDExError: If names are missing and columns ``0`` or ``1`` do not exist or have no value
+        :return: source names, target names
+        :rtype: tuple
+        """
+        missing = np.zeros(num_rows, dtype=bool)
+        for names in (source_names, target_names):
+            missing |= True if names is None else np.equal(names, None)
+        if not missing.any():
+            return source_names, target_names
+
+        if 0 not in columns or 1 not in columns:
+            raise NDExError("Missing 'source' or 'target' columns in the DataFrame")
+        fallback_source = input_data[0].to_numpy(dtype=row_dtype)
+        fallback_target = input_data[1].to_numpy(dtype=row_dtype)
+        if (np.equal(fallback_source, None) | np.equal(fallback_target, None))[missing].any():
+            raise NDExError("Missing 'source' or 'target' columns in the DataFrame")
+
+        if source_names is None:
+            source_names = np.full(num_rows, None, dtype=object)
+        if target_names is None:
+            target_names = np.full(num_rows, None, dtype=object)
+        return np.where(missing, fallback_source, source_names), np.where(missing, fallback_target, target_names)
+
+    def _get_column_roles(self, input_data, columns, source_node_attr, source_node_attr_prefix,
+                          target_node_attr, target_node_attr_prefix, edge_attr, interaction_col):
+        """
+        Decides once for each column whether it holds a source node, target node and/or edge attribute.
+        A column named in **edge_attr**, or in neither node attribute list nor prefix if **edge_attr**
+        is ``None``, holds an edge attribute.
+
+        :return: Three lists of ``(column, attribute name)`` tuples, for source node, target node and edge
+                 attributes
+        :rtype: tuple
+        """
+        source_attrs, target_attrs, edge_attrs = [], [], []
+        for col in columns:
+            if ((source_node_attr is None and len(source_node_attr_prefix) == 0) or
+                    (target_node_attr is None and len(target_node_attr_prefix) == 0)):
+                # only raised for columns with values, as when rows were processed one at a time
+                if input_data[col].isna().all():
+                    continue
+            extracted_source_attr = self._extract_attributes_by_list_or_prefix(col, None, source_node_attr,
                                                                                source_node_attr_prefix)
             if extracted_source_attr is not None:
-                source_attrs[extracted_source_attr[0]] = extracted_source_attr[1]
+                source_attrs.append((col, extracted_source_attr[0]))
 
-            # Process target attributes
-            extracted_target_attr = self._extract_attributes_by_list_or_prefix(col, value, target_node_attr,
+            extracted_target_attr = self._extract_attributes_by_list_or_prefix(col, None, target_node_attr,
                                                                                target_node_attr_prefix)
             if extracted_target_attr is not None:
-                target_attrs[extracted_target_attr[0]] = extracted_target_attr[1]
-
-            if (edge_attr is not None and col in edge_attr) or (edge_attr is None and extracted_source_attr is None and
-                                                                extracted_target_attr is None):
-                if col == interaction_col:
-                    edge_attrs[constants.EDGE_INTERACTION_EXPANDED] = value
-                else:
-                    edge_attrs[col] = value
+                target_attrs.append((col, extracted_target_attr[0]))
 
+            if (edge_attr is not None and col in edge_attr) or (edge_attr is None and extracted_source_attr is None
+                                                                and extracted_target_attr is None):
+                edge_attrs.append((col, constants.EDGE_INTERACTION_EXPANDED if col == interaction_col else col))
         return source_attrs, target_attrs, edge_attrs
 
+    @staticmethod
+    def _get_id_list(ids):
+        """
+        Converts node ids read from a column to :py:class:`int`
+
+        :return: ids or ``None`` if **ids** is ``None``
+        :rtype: list
+        """
+        if ids is None:
+            return None
+        if ids.dtype.kind in 'iu':
+            return ids.tolist()
+        return [int(node_id) for node_id in ids]
+
+    @staticmethod
+    def _get_node_ids(node_names, source_ids, target_ids, nodes, ids_by_name, next_node_id):
+        """
+        Gets the id of the node of every edge end. Ends are ordered source then target for each row, which
+        is also the order nodes are created in. Given ids are used as is, otherwise nodes are matched by name,
+        including the names in **ids_by_name** of nodes created before, and new nodes get the next free id.
+
+        :param node_names: Names of source and target nodes, interleaved
+        :type node_names: :py:class:`numpy.ndarray`
+        :param source_ids: Ids of source nodes or ``None``
+        :type source_ids: list
+        :param target_ids: Ids of target nodes or ``None``
+        :type target_ids: list
+        :param nodes: Nodes created before, by id
+        :type nodes: dict
+        :param ids_by_name: Ids of the nodes created before by name, updated with the new nodes
+        :type ids_by_name: dict
+        :param next_node_id: Next free node id
+        :type next_node_id: int
+        :return: (node id for each edge end, next free node id)
+        :rtype: tuple
+        """
+        if source_ids is not None and target_ids is not None:
+            node_ids = np.empty(len(node_names), dtype=object)
+            node_ids[0::2] = source_ids
+            node_ids[1::2] = target_ids
+            codes, unique_ids = pd.factorize(node_ids)
+            first_positions = np.unique(codes, return_index=True)[1]
+            for node_id, name in zip(unique_ids, node_names[first_positions]):
+                if node_id not in nodes:
+                    next_node_id = max(node_id, next_node_id) + 1
+                    if name is not None and (isinstance(name, Iterable) or not pd.isna(name)):
+                        ids_by_name.setdefault(name, node_id)
+            return node_ids, next_node_id
+
+        if source_ids is None and target_ids is None and not pd.isna(node_names).any():
+            codes, unique_names = pd.factorize(node_names)
+            unique_ids = []
+            for name in unique_names:
+                node_id = ids_by_name.get(name)
+                if node_id is None:
+                    node_id = next_node_id
+                    next_node_id += 1
+                    ids_by_name[name] = node_id
+                unique_ids.append(node_id)
+            return np.asarray(unique_ids, dtype=np.int64)[codes], next_node_id
+
+        # some nodes are given by id and some by name, or there are names that
+        # match no other name such as NaN, so resolve them one at a time
+        node_ids = np.empty(len(node_names), dtype=object)
+        id_lists = (source_ids, target_ids)
+        created = set()
+        for index, name in enumerate(node_names):
+            matchable = name is not None and (isinstance(name, Iterable) or not pd.isna(name))
+            id_list = id_lists[index % 2]
+            if id_list is not None:
+                node_id = id_list[index // 2]
+                if node_id not in created and node_id not in nodes:
+                    created.add(node_id)
+                    next_node_id = max(node_id, next_node_id) + 1
+                    if matchable:
+                        ids_by_name.setdefault(name, node_id)
+            else:
+                node_id = ids_by_name.get(name) if matchable else None
+                if node_id is None:
+                    node_id = next_node_id
+                    next_node_id += 1
+                    created.add(node_id)
+                    if matchable:
+                        ids_by_name[name] = node_id
+            node_ids[index] = node_id
+        return node_ids, next_node_id
+
+    def _add_nodes(self, cx2network, input_data, row_dtype, node_ids, node_names, source_attrs, target_attrs,
+                   nodes, declarations):
+        """
+        Adds the nodes not in **nodes** yet. A node gets the name of the edge end it first appears in and,
+        for each attribute and layout coordinate, the last value found in any edge end it appears in.
+        Attributes not in **declarations** yet are declared with the type of their first value.
+
+        :param nodes: Nodes by id, updated in place
+        :type nodes: dict
+        :param declarations: Node attribute declarations, updated in place
+        :type declarations: dict
+        """
+        unique_ids, first_positions = np.unique(node_ids, return_index=True)
+        order = np.argsort(first_positions, kind='stable')
+        unique_ids = unique_ids[order].tolist()
+        new_nodes = np.array([node_id not in nodes for node_id in unique_ids], dtype=bool)
+        creation_positions = first_positions[order][new_nodes]
+        for node_id in compress(unique_ids, new_nodes):
+            nodes[node_id] = {constants.ASPECT_ID: node_id, constants.ASPECT_VALUES: {},
+                              constants.LAYOUT_X: None, constants.LAYOUT_Y: None, constants.LAYOUT_Z: None}
+
+        side_columns = ({}, {})
+        for side, attrs in enumerate((source_attrs, target_attrs)):
+            for col, name in attrs:
+                side_columns[side][name] = col
+        attr_names = list(dict.fromkeys(list(side_columns[0]) + list(side_columns[1])))
+        if constants.NODE_NAME_EXPANDED not in attr_names:
+            attr_names.append(constants.NODE_NAME_EXPANDED)
+
+        column_cache = {}
+        first_seen = []
+        for attr_name in attr_names:
+            values = np.empty(len(node_ids), dtype=object)
+            present = np.zeros(len(node_ids), dtype=bool)
+            for side in (0, 1):
+                col = side_columns[side].get(attr_name)
+                if col is None:
+                    continue
+                if col not in column_cache:
+                    column_cache[col] = input_data[col].to_numpy(dtype=row_dtype)
+                values[side::2] = column_cache[col]
+                present[side::2] = ~pd.isna(column_cache[col])
+            if attr_name == constants.NODE_NAME_EXPANDED:
+                # the name a node is created with replaces any name attribute at that edge end
+                named = creation_positions[~np.equal(node_names[creation_positions], None)]
+                values[named] = node_names[named]
+                present[named] = True
+
+            positions = np.flatnonzero(present)
+            if len(positions) == 0:
+                continue
+            reversed_positions = positions[::-1]
+            last_ids, last_index = np.unique(node_ids[reversed_positions], return_index=True)
+            last_positions = reversed_positions[last_index]
+
+            if attr_name in (constants.LAYOUT_X, constants.LAYOUT_Y, constants.LAYOUT_Z):
+                for node_id, value in zip(last_ids.tolist(), values[last_positions]):
+                    nodes[node_id][attr_name] = value
+                continue
+
+            if attr_name in declarations:
+                datatype = declarations[attr_name][constants.ATTR_DATATYPE]
+            else:
+                datatype = cx2network._get_cx2_type(values[positions[0]])
+                side = positions[0] % 2
+                rank = list(side_columns[side]).index(attr_name) if attr_name in side_columns[side] \
+                    else len(side_columns[side])
+                first_seen.append((positions[0], rank, attr_name, datatype))
+            for node_id, value in zip(last_ids.tolist(), _convert_values(datatype, values[last_positions])):
+                nodes[node_id][constants.ASPECT_VALUES][attr_name] = value
+
+        for position, rank, attr_name, datatype in sorted(first_seen, key=lambda x: x[:2]):
+            declarations[attr_name] = {constants.ATTR_DATATYPE: datatype}
+
+    def _add_edges(self, cx2network, input_data, row_dtype, node_ids, edge_attrs, edge_interaction,
+                   edges, declarations):
+        """
+        Adds one edge per row, with ids following those in **edges**, setting interaction to
+        **edge_interaction** on edges without one. Attributes not in **declarations** yet are
+        declared with the type of their first value.
+
+        :param edges: Edges by id, updated in place
+        :type edges: dict
+        :param declarations: Edge attribute declarations, updated in place
+        :type declarations: dict
+        """
+        num_rows = len(input_data.index)
+        edge_values = [{} for _ in range(num_rows)]
+
+        columns_by_name = {}
+        for col, name in edge_attrs:
+            columns_by_name.setdefault(name, []).append(col)
+
+        interaction = constants.EDGE_INTERACTION_EXPANDED
+        interaction_present = np.zeros(num_rows, dtype=bool)
+        interaction_type = None
+        if interaction in declarations:
+            interaction_type = declarations[interaction][constants.ATTR_DATATYPE]
+        elif edge_interaction is not None:
+            interaction_type = cx2network._get_cx2_type(edge_interaction)
+
+        first_seen = []
+        for rank, (name, cols) in enumerate(columns_by_name.items()):
+            values = input_data[cols[0]].to_numpy(dtype=row_dtype)
+            present = ~pd.isna(values)
+            if len(cols) > 1:
+                # like a dict, the last column with a value wins
+                values = values.astype(object)
+                for col in cols[1:]:
+                    more_values = input_data[col].to_numpy(dtype=row_dtype)
+                    more_present = ~pd.isna(more_values)
+                    values[more_present] = more_values[more_present]
+                    present |= more_present
+            rows = np.flatnonzero(present)
+            if len(rows) == 0:
+                continue
+            if name in declarations:
+                datatype = declarations[name][constants.ATTR_DATATYPE]
+            else:
+                datatype = cx2network._get_cx2_type(values[rows[0]])
+                if name == interaction:
+                    if interaction_type is not None and rows[0] > 0:
+                        # an edge before this one got the default interaction, declaring the type
+                        datatype = interaction_type
+                    else:
+                        interaction_type = datatype
+                first_seen.append((rows[0], rank, name, datatype))
+            if name == interaction:
+                interaction_present = present
+            for row, value in zip(rows.tolist(), _convert_values(datatype, values[rows])):
+                edge_values[row][name] = value
+
+        if edge_interaction is not None and not interaction_present.all():
+            rows = np.flatnonzero(~interaction_present)
+            if rows[0] == 0 and interaction not in declarations:
+                first_seen = [entry for entry in first_seen if entry[2] != interaction]
+                first_seen.append((0, len(columns_by_name), interaction, interaction_type))
+            value = convert_value(interaction_type, edge_interaction)
+            for row in rows.tolist():
+                edge_values[row][interaction] = value
+
+        sources = node_ids[0::2].tolist()
+        targets = node_ids[1::2].tolist()
+        first_edge_id = len(edges)
+        for row in range(num_rows):
+            edge_id = first_edge_id + row
+            edges[edge_id] = {constants.ASPECT_ID: edge_id, constants.EDGE_SOURCE: sources[row],
+                              constants.EDGE_TARGET: targets[row], constants.ASPECT_VALUES: edge_values[row]}
+
+        for position, rank, name, datatype in sorted(first_seen, key=lambda x: x[:2]):
+            declarations[name] = {constants.ATTR_DATATYPE: datatype}
+
     def _extract_attributes_by_list_or_prefix(self, col, value, attr_list, attr_prefix):
         """
         Extracts attributes based on a direct list of attribute names or a prefix.
@@ -1818,51 +4296,6 @@ class PandasDataFrameToCX2NetworkFactory(CX2NetworkFactory):
             return col[len(attr_prefix):], value
         return None
 
-    def _add_edge(self, cx2network, source_node_id, target_node_id, edge_attrs, edge_interaction):
-        """
-        Add an edge between two nodes in the CX2Network and sets default interaction if it was not specified.
-
-        :param cx2network: an object of CX2Network class
-        :type cx2network: :py:class:`~ndex2.cx.CX2Network`
-        :param source_node_id: ID of the source node
-        :type source_node_id: int
-        :param target_node_id: ID of the target node
-        :type target_node_id: int
-        :param edge_attrs: attributes of the edge
-        :type edge_attrs: dict
-        :param edge_interaction: default interaction value
-        :type edge_interaction: str
-        """
-        if edge_attrs.get(constants.EDGE_INTERACTION_EXPANDED, None) is None:
-            edge_attrs[constants.EDGE_INTERACTION_EXPANDED] = edge_interaction
-        cx2network.add_edge(source=source_node_id, target=target_node_id, attributes=edge_attrs)
-
-    def _add_or_update_node(self, cx2network, node_id_value, node_name, node_attrs):
-        """
-        Add a new node or update an existing one in the CX2Network, including layout attributes if present.
-
-        :param cx2network: an object of CX2Network class
-        :type cx2network: :py:class:`~ndex2.cx.CX2Network`
-        :param node_id_value: ID of the node
-        :type node_id_value: int or None
-        :param node_name: name of the node
-        :type node_name: str or None
-        :param node_attrs: attributes of the node
-        :type node_attrs: dict
-        """
-        x = node_attrs.pop(constants.LAYOUT_X, None)
-        y = node_attrs.pop(constants.LAYOUT_Y, None)
-        z = node_attrs.pop(constants.LAYOUT_Z, None)
-
-        node_id = node_id_value if node_id_value is not None else cx2network.lookup_node_id_by_name(node_name)
-        if node_id is None or node_id not in cx2network.get_nodes():
-            if node_name is not None:
-                node_attrs[constants.NODE_NAME_EXPANDED] = node_name
-            node_id = cx2network.add_node(node_id=node_id_value, x=x, y=y, z=z, attributes=node_attrs)
-        else:
-            cx2network.update_node(node_id=node_id, x=x, y=y, z=z, attributes=node_attrs)
-        return node_id
-
 
 class CX2NetworkXFactory(object):
     """
@@ -1902,12 +4335,13 @@ class CX2NetworkXFactory(object):
         if networkx_graph is None:
             networkx_graph = nx.MultiDiGraph()
 
-        cx2network = copy.deepcopy(cx2network)
         networkx_graph.pos = {}
         networkx_graph.zpos = {}
 
+        # lists are copied so changing them in the graph does not change the network
         for node_id, node_data in cx2network.get_nodes().items():
-            attrs = node_data.get(constants.ASPECT_VALUES, {})
+            attrs = {k: list(v) if isinstance(v, list) else v
+                     for k, v in node_data.get(constants.ASPECT_VALUES, {}).items()}
             if store_layout_in_pos:
                 networkx_graph.pos[node_id] = (node_data.get(constants.LAYOUT_X, None),
                                                -node_data.get(constants.LAYOUT_Y, None))
@@ -1924,11 +4358,12 @@ class CX2NetworkXFactory(object):
         for edge_id, edge_data in cx2network.get_edges().items():
             source = edge_data[constants.EDGE_SOURCE]
             target = edge_data[constants.EDGE_TARGET]
-            attrs = edge_data.get(constants.ASPECT_VALUES, {})
+            attrs = {k: list(v) if isinstance(v, list) else v
+                     for k, v in edge_data.get(constants.ASPECT_VALUES, {}).items()}
             networkx_graph.add_edge(source, target, **attrs)
 
         for attr, value in cx2network.get_network_attributes().items():
-            networkx_graph.graph[attr] = value
+            networkx_graph.graph[attr] = list(value) if isinstance(value, list) else value
 
         return networkx_graph
 
@@ -1946,7 +4381,7 @@ class CX2NetworkPandasDataFrameFactory(object):
         """
         pass
 
-    def get_dataframe(self, cx2network):
+    def get_dataframe(self, cx2network, node_attributes=None, edge_attributes=None):
         """
         Converts a given CX2Network object into a Pandas DataFrame. The
         DataFrame will contain columns for 'source_id' and 'target_id' of nodes
@@ -1956,9 +4391,33 @@ class CX2NetworkPandasDataFrameFactory(object):
         added as
         ``source_x, source_y, source_z, target_x, target_y, target_z``
 
+        .. versionchanged:: 3.12.0
+
+            Added **node_attributes** and **edge_attributes** parameters. The DataFrame is now built
+            by joining a table of nodes onto a table of edges, and columns get a data type matching the
+            attribute declarations of the network, so integer columns with missing values use the
+            ``Int64`` data type instead of becoming ``float64``
+
+        .. code-block:: python
+
+            from ndex2.cx2 import CX2NetworkPandasDataFrameFactory
+
+            factory = CX2NetworkPandasDataFrameFactory()
+
+            # only node name and coordinates, edges keep all attributes
+            df = factory.get_dataframe(cx2_network, node_attributes=['name', 'x', 'y'])
+
         :param cx2network: The CX2Network object to be converted into a DataFrame.
         :type cx2network: :py:class:`~ndex2.cx2.CX2Network`
+        :param node_attributes: Names of node attributes to include, which can also be ``x``, ``y`` or ``z``
+                                for coordinates. If ``None`` all node attributes and coordinates are included
+        :type node_attributes: list
+        :param edge_attributes: Names of edge attributes to include. If ``None`` all edge attributes
+                                are included
+        :type edge_attributes: list
         :raises NDExError: If the input CX2Network is None or not an instance of CX2Network.
+        :raises NDExInvalidParameterError: If **node_attributes** or **edge_attributes** is not ``None``
+                                           or a list
         :return: A Pandas DataFrame representing the network data from CX2Network.
         :rtype: :py:class:`pandas.DataFrame`
         """
@@ -1968,45 +4427,112 @@ class CX2NetworkPandasDataFrameFactory(object):
         if not isinstance(cx2network, CX2Network):
             raise NDExError("Input must be a CX2Network object")
 
-        rows = []
-
-        for edge_id, edge in cx2network.get_edges().items():
-            row = {}
-            source_node_id = edge.get(constants.EDGE_SOURCE)
-            target_node_id = edge.get(constants.EDGE_TARGET)
-
-            row['source_id'] = source_node_id
-            row['target_id'] = target_node_id
-
-            source_node_attrs = cx2network.get_node(source_node_id)
-            target_node_attrs = cx2network.get_node(target_node_id)
-
-            # Add node attributes with prefixes to the row
-            for attr_key, attr_value in source_node_attrs.get('v', {}).items():
-                row[f'source_{attr_key}'] = attr_value
-            for attr_key, attr_value in target_node_attrs.get('v', {}).items():
-                row[f'target_{attr_key}'] = attr_value
-
-            # Add coordinates if available
-            if constants.LAYOUT_X in source_node_attrs:
-                row['source_x'] = source_node_attrs[constants.LAYOUT_X]
-            if constants.LAYOUT_Y in source_node_attrs:
-                row['source_y'] = source_node_attrs[constants.LAYOUT_Y]
-            if constants.LAYOUT_Z in source_node_attrs:
-                row['source_z'] = source_node_attrs[constants.LAYOUT_Z]
-            if constants.LAYOUT_X in target_node_attrs:
-                row['target_x'] = target_node_attrs[constants.LAYOUT_X]
-            if constants.LAYOUT_Y in target_node_attrs:
-                row['target_y'] = target_node_attrs[constants.LAYOUT_Y]
-            if constants.LAYOUT_Z in target_node_attrs:
-                row['target_z'] = target_node_attrs[constants.LAYOUT_Z]
-
-            for attr_key, attr_value in edge.get(constants.ASPECT_VALUES, {}).items():
-                row[attr_key] = attr_value
-
-            rows.append(row)
-
-        return pd.DataFrame(rows)
+        for param_name, param in (('node_attributes', node_attributes), ('edge_attributes', edge_attributes)):
+            if param is not None and not isinstance(param, list):
+                raise NDExInvalidParameterError(param_name + ' must be None or a list')
+
+        edges = cx2network.get_edges()
+        if len(edges) == 0:
+            return pd.DataFrame()
+        nodes = cx2network.get_nodes()
+
+        df = pd.DataFrame({'source_id': [edge.get(constants.EDGE_SOURCE) for edge in edges.values()],
+                           'target_id': [edge.get(constants.EDGE_TARGET) for edge in edges.values()]})
+
+        node_table = self._get_attribute_table(cx2network, constants.NODES_ASPECT, nodes, node_attributes)
+        layout_table = pd.DataFrame({coord: [node.get(coord) for node in nodes.values()]
+                                     for coord in (constants.LAYOUT_X, constants.LAYOUT_Y, constants.LAYOUT_Z)
+                                     if (node_attributes is None or coord in node_attributes) and
+                                     any(coord in node for node in nodes.values())},
+                                    index=list(nodes.keys()))
+        # coordinates replace node attributes of the same name
+        node_table = node_table.drop(columns=[col for col in layout_table.columns if col in node_table.columns])
+
+        for prefix in ('source_', 'target_'):
+            # only add attributes set on at least one of the source, or target, nodes
+            present = node_table.notna().reindex(df[prefix + 'id'].unique(), fill_value=False).any()
+            df = df.merge(node_table.loc[:, present.to_numpy()].add_prefix(prefix), how='left',
+                          left_on=prefix + 'id', right_index=True)
+        for prefix in ('source_', 'target_'):
+            df = df.merge(layout_table.add_prefix(prefix), how='left', left_on=prefix + 'id', right_index=True)
+        df = df.reset_index(drop=True)
+
+        edge_table = self._get_attribute_table(cx2network, constants.EDGES_ASPECT, edges, edge_attributes)
+        for col in edge_table.columns:
+            values = edge_table[col].reset_index(drop=True)
+            if col in df.columns:
+                # edge attributes named like a node column only replace it on edges that have them
+                values = values.where(values.notna(), df[col])
+            df[col] = values
+        return df
+
+    def _get_attribute_table(self, cx2network, aspect_name, elements, attribute_names=None):
+        """
+        Creates a table of the attributes of nodes or edges, with a column per attribute in
+        the order they are first found, typed by :py:func:`_get_typed_series`
+
+        :param cx2network: Network the nodes or edges belong to
+        :type cx2network: :py:class:`~ndex2.cx2.CX2Network`
+        :param aspect_name: Either ``nodes`` or ``edges``
+        :type aspect_name: str
+        :param elements: node or edge id => node or edge
+        :type elements: dict
+        :param attribute_names: Names of attributes to include, if ``None`` all are included
+        :type attribute_names: list
+        :return: Table indexed by node or edge id
+        :rtype: :py:class:`pandas.DataFrame`
+        """
+        wanted = None if attribute_names is None else set(attribute_names)
+        columns = {}
+        for position, element in enumerate(elements.values()):
+            for name, value in element.get(constants.ASPECT_VALUES, {}).items():
+                column = columns.get(name)
+                if column is None:
+                    if wanted is not None and name not in wanted:
+                        continue
+                    column = [None] * len(elements)
+                    columns[name] = column
+                column[position] = value
+
+        index = pd.Index(list(elements.keys()))
+        declarations = cx2network.get_attribute_declarations().get(aspect_name, {})
+        return pd.DataFrame({name: self._get_typed_series(values,
+                                                          declarations.get(name, {}).get(constants.ATTR_DATATYPE),
+                                                          index)
+                             for name, values in columns.items()}, index=index)
+
+    @staticmethod
+    def _get_typed_series(values, datatype, index):
+        """
+        Creates a :py:class:`pandas.Series` from **values** with a data type matching **datatype**,
+        ``None`` in **values** marks a missing value. Doubles become ``float64`` and integers and
+        booleans become ``int64`` and ``bool``, or the nullable ``Int64`` and ``boolean`` data types
+        if values are missing. Other types, or values that do not match **datatype**, are left to
+        pandas to infer.
+
+        :param values: Values of column
+        :type values: list
+        :param datatype: CX2 data type of the values
+        :type datatype: str
+        :param index: Index of column
+        :type index: :py:class:`pandas.Index`
+        :rtype: :py:class:`pandas.Series`
+        """
+        missing = any(value is None for value in values)
+        dtype = None
+        if datatype == constants.DOUBLE_DATATYPE:
+            dtype = 'float64'
+        elif datatype in (constants.INTEGER_DATATYPE, constants.LONG_DATATYPE):
+            dtype = 'Int64' if missing else 'int64'
+        elif datatype == constants.BOOLEAN_DATATYPE and \
+                all(isinstance(value, (bool, np.bool_)) for value in values if value is not None):
+            dtype = 'boolean' if missing else 'bool'
+        if dtype is not None:
+            try:
+                return pd.Series(values, index=index, dtype=dtype)
+            except (TypeError, ValueError):
+                pass
+        return pd.Series(values, index=index)
 
     def get_nodelist_table(self, cx2network):
         """
@@ -0,0 +1,469 @@
+# -*- coding: utf-8 -*-
+
+"""
+Finds what changed between two versions of a network.
+
+.. versionadded:: 3.12.0
+"""
+
+import numbers
+
+from ndex2 import constants
+from ndex2.exceptions import NDExInvalidParameterError
+from ndex2.nice_cx_network import NiceCXNetwork
+from ndex2.cx2 import CX2Network
+
+
+class NetworkDiff(object):
+    """
+    Differences between two networks as found by :py:func:`diff`.
+    The network passed in first is referred to as **a** and the
+    second as **b**
+
+    .. versionadded:: 3.12.0
+
+    Nodes and edges are reported in dicts keyed by the value they
+    were matched on (see :py:func:`diff`):
+
+    * ``added_nodes``, ``added_edges`` map key to id of element in **b**
+
+    * ``removed_nodes``, ``removed_edges`` map key to id of element in **a**
+
+    * ``changed_nodes``, ``changed_edges`` map key to a dict with
+      id in **a** under ``'a'``, id in **b** under ``'b'`` and under
+      ``'attributes'`` a dict of changed attribute name to tuple of
+      (value in **a**, value in **b**). A value is ``None`` if the
+      attribute is missing. Node name and represents and edge interaction
+      are reported as attributes ``name``, ``represents`` and
+      ``interaction``, and for :py:class:`~ndex2.cx2.CX2Network`
+      node coordinates as ``x``, ``y`` and ``z``. For edges a changed
+      source or target is reported under ``'source'`` or ``'target'``
+      as a tuple of (value in **a**, value in **b**)
+
+    Network attributes are in ``added_network_attributes`` (name to value
+    in **b**), ``removed_network_attributes`` (name to value in **a**)
+    and ``changed_network_attributes`` (name to tuple of
+    (value in **a**, value in **b**))
+
+    Names of the other aspects whose content differs, such as
+    visual properties, layout, citations, supports and opaque aspects,
+    are in the sorted list ``changed_aspects``
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.added_nodes = {}
+        self.removed_nodes = {}
+        self.changed_nodes = {}
+        self.added_edges = {}
+        self.removed_edges = {}
+        self.changed_edges = {}
+        self.added_network_attributes = {}
+        self.removed_network_attributes = {}
+        self.changed_network_attributes = {}
+        self.changed_aspects = []
+
+    def is_empty(self):
+        """
+        Tells if the networks had no differences
+
+        :return: ``True`` if nothing changed
+        :rtype: bool
+        """
+        return not (self.added_nodes or self.removed_nodes or
+                    self.changed_nodes or self.added_edges or
+                    self.removed_edges or self.changed_edges or
+                    self.added_network_attributes or
+                    self.removed_network_attributes or
+                    self.changed_network_attributes or
+                    self.changed_aspects)
+
+    def get_patch(self):
+        """
+        Gets the differences as a patch that turns **a** into **b**,
+        suitable for applying to a cache of **a** keyed by element id
+        or for converting to JSON
+
+        .. code-block:: python
+
+            {'networkAttributes': {'set': {'<NAME>': <VALUE IN B>},
+                                   'remove': ['<NAME>']},
+             'nodes': {'add': [<ID IN B>],
+                       'remove': [<ID IN A>],
+                       'update': [{'a': <ID IN A>, 'b': <ID IN B>,
+                                   'set': {'<NAME>': <VALUE IN B>},
+                                   'remove': ['<NAME>']}]},
+             'edges': {...same as nodes...}}
+
+        For edges, ``'update'`` entries also hold ``'s'`` and ``'t'``
+        if source or target changed. Aspects in ``changed_aspects``
+        are not part of the patch
+
+        :return: patch
+        :rtype: dict
+        """
+        net_attrs = dict(self.added_network_attributes)
+        for name, values in self.changed_network_attributes.items():
+            net_attrs[name] = values[1]
+        return {constants.NETWORK_ATTRIBUTES_ASPECT: {
+                    'set': net_attrs,
+                    'remove': list(self.removed_network_attributes.keys())},
+                constants.NODES_ASPECT: NetworkDiff._get_aspect_patch(
+                    self.added_nodes, self.removed_nodes, self.changed_nodes),
+                constants.EDGES_ASPECT: NetworkDiff._get_aspect_patch(
+                    self.added_edges, self.removed_edges, self.changed_edges)}
+
+    @staticmethod
+    def _get_aspect_patch(added, removed, changed):
+        """
+        Gets patch for nodes or edges, see :py:func:`get_patch`
+
+        :rtype: dict
+        """
+        updates = []
+        for change in changed.values():
+            update = {'a': change['a'], 'b': change['b'],
+                      'set': {}, 'remove': []}
+            for name, values in change['attributes'].items():
+                if values[1] is None:
+                    update['remove'].append(name)
+                else:
+                    update['set'][name] = values[1]
+            if 'source' in change:
+                update[constants.EDGE_SOURCE] = change['source'][1]
+            if 'target' in change:
+                update[constants.EDGE_TARGET] = change['target'][1]
+            updates.append(update)
+        return {'add': list(added.values()),
+                'remove': list(removed.values()),
+                'update': updates}
+
+
+def diff(net_a, net_b, key=None):
+    """
+    Finds nodes, edges and attributes that differ between **net_a**
+    and **net_b**. Use :py:func:`NetworkDiff.is_empty` on the
+    result to check if the networks are the same, for example to
+    skip an upload.
+
+    .. versionadded:: 3.12.0
+
+    Other aspects, such as visual properties, layout, citations,
+    supports and opaque aspects, are compared as a whole and the
+    names of those that differ are listed in
+    :py:attr:`NetworkDiff.changed_aspects`
+
+    If **key** is ``None``, nodes and edges are matched by id. Otherwise
+    nodes are matched by **key**, which is ``'name'``, ``'represents'``
+    or the name of a node attribute, and edges by the key of their
+    source, the key of their target and their interaction. If several
+    elements share a key, they are matched in the order they appear.
+
+    A content hash of every element is compared first so the full
+    contents are only compared when the hashes match. This makes
+    the cost linear in the size of the networks.
+
+    .. code-block:: python
+
+        from ndex2.diff import diff
+
+        result = diff(old_net, new_net)
+        if not result.is_empty():
+            client.update_cx2_network(...)
+
+    :param net_a: Original network
+    :type net_a: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork` or
+                 :py:class:`~ndex2.cx2.CX2Network`
+    :param net_b: New network, must be the same type as **net_a**
+    :type net_b: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork` or
+                 :py:class:`~ndex2.cx2.CX2Network`
+    :param key: What to match nodes by, ``None`` means match by id
+    :type key: str
+    :raises NDExInvalidParameterError: If networks are not both
+                                       :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+                                       or both :py:class:`~ndex2.cx2.CX2Network`
+    :return: differences
+    :rtype: :py:class:`NetworkDiff`
+    """
+    if isinstance(net_a, NiceCXNetwork) and isinstance(net_b, NiceCXNetwork):
+        get_elements = _get_nice_cx_elements
+        get_aspects = _get_nice_cx_aspects
+    elif isinstance(net_a, CX2Network) and isinstance(net_b, CX2Network):
+        get_elements = _get_cx2_elements
+        get_aspects = _get_cx2_aspects
+    else:
+        raise NDExInvalidParameterError('Networks must both be NiceCXNetwork '
+                                        'or both be CX2Network objects')
+    result = NetworkDiff()
+    net_attrs_a, nodes_a, edges_a = get_elements(net_a)
+    net_attrs_b, nodes_b, edges_b = get_elements(net_b)
+
+    for name, value in net_attrs_a.items():
+        if name not in net_attrs_b:
+            result.removed_network_attributes[name] = value[0]
+        elif _get_hashable(value) != _get_hashable(net_attrs_b[name]):
+            result.changed_network_attributes[name] = (value[0],
+                                                       net_attrs_b[name][0])
+    for name, value in net_attrs_b.items():
+        if name not in net_attrs_a:
+            result.added_network_attributes[name] = value[0]
+
+    node_keys_a = _get_node_keys(nodes_a, key)
+    node_keys_b = _get_node_keys(nodes_b, key)
+    _diff_elements(_key_elements(nodes_a, node_keys_a, None),
+                   _key_elements(nodes_b, node_keys_b, None),
+                   result.added_nodes, result.removed_nodes,
+                   result.changed_nodes)
+    if key is None:
+        edge_key_a = edge_key_b = None
+    else:
+        edge_key_a = node_keys_a
+        edge_key_b = node_keys_b
+    _diff_elements(_key_elements(edges_a, None, edge_key_a),
+                   _key_elements(edges_b, None, edge_key_b),
+                   result.added_edges, result.removed_edges,
+                   result.changed_edges)
+
+    aspects_a = get_aspects(net_a)
+    aspects_b = get_aspects(net_b)
+    for name in sorted(set(aspects_a) | set(aspects_b)):
+        if _get_hashable(aspects_a.get(name)) != _get_hashable(aspects_b.get(name)):
+            result.changed_aspects.append(name)
+    return result
+
+
+class _Element(object):
+    """
+    Node or edge flattened to a common form for comparison
+    """
+
+    def __init__(self, element_id, attrs, source=None, target=None):
+        """
+        :param attrs: attribute name => (value, datatype)
+        :type attrs: dict
+        """
+        self.element_id = element_id
+        self.attrs = attrs
+        self.source = source
+        self.target = target
+
+
+def _get_nice_cx_elements(net):
+    """
+    Gets network attributes, nodes and edges of **net**
+
+    :return: (network attribute name => (value, datatype),
+              list of :py:class:`_Element` nodes,
+              list of :py:class:`_Element` edges)
+    :rtype: tuple
+    """
+    net_attrs = {}
+    for net_attr in net.networkAttributes:
+        net_attrs[net_attr.get('n')] = (net_attr.get('v'),
+                                        net_attr.get('d', constants.STRING_DATATYPE))
+    nodes = []
+    for node_id, node in net.nodes.items():
+        attrs = {constants.NODE_NAME_EXPANDED: (node.get(constants.NODE_NAME),
+                                                constants.STRING_DATATYPE),
+                 constants.NODE_REPRESENTS_EXPANDED: (node.get(constants.NODE_REPRESENTS),
+                                                      constants.STRING_DATATYPE)}
+        for n_a in net.nodeAttributes.get(node_id, []):
+            attrs[n_a.get(constants.NODE_ATTR_NAME)] = \
+                (n_a.get(constants.NODE_ATTR_VALUE),
+                 n_a.get(constants.NODE_ATTR_DATATYPE, constants.STRING_DATATYPE))
+        nodes.append(_Element(node_id, attrs))
+    edges = []
+    for edge_id, edge in net.edges.items():
+        attrs = {constants.EDGE_INTERACTION_EXPANDED: (edge.get(constants.EDGE_INTERACTION),
+                                                       constants.STRING_DATATYPE)}
+        for e_a in net.edgeAttributes.get(edge_id, []):
+            attrs[e_a.get('n')] = (e_a.get('v'),
+                                   e_a.get('d', constants.STRING_DATATYPE))
+        edges.append(_Element(edge_id, attrs, edge.get(constants.EDGE_SOURCE),
+                              edge.get(constants.EDGE_TARGET)))
+    return net_attrs, nodes, edges
+
+
+def _get_cx2_elements(net):
+    """
+    Gets network attributes, nodes and edges of **net**
+
+    :return: (network attribute name => (value, datatype),
+              list of :py:class:`_Element` nodes,
+              list of :py:class:`_Element` edges)
+    :rtype: tuple
+    """
+    net_attrs = {name: (value, net.get_declared_type(constants.NETWORK_ATTRIBUTES_ASPECT,
+                                                     name, value))
+                 for name, value in net.get_network_attributes().items()}
+    nodes = []
+    for node_id, node in net.get_nodes().items():
+        attrs = {name: (value, net.get_declared_type(constants.NODES_ASPECT, name, value))
+                 for name, value in node.get(constants.ASPECT_VALUES, {}).items()}
+        for coord in (constants.LAYOUT_X, constants.LAYOUT_Y, constants.LAYOUT_Z):
+            if node.get(coord) is not None:
+                attrs[coord] = (node.get(coord), constants.DOUBLE_DATATYPE)
+        nodes.append(_Element(node_id, attrs))
+    edges = []
+    for edge_id, edge in net.get_edges().items():
+        attrs = {name: (value, net.get_declared_type(constants.EDGES_ASPECT, name, value))
+                 for name, value in edge.get(constants.ASPECT_VALUES, {}).items()}
+        edges.append(_Element(edge_id, attrs, edge.get(constants.EDGE_SOURCE),
+                              edge.get(constants.EDGE_TARGET)))
+    return net_attrs, nodes, edges
+
+
+def _get_nice_cx_aspects(net):
+    """
+    Gets the aspects of **net** other than network attributes,
+    nodes, edges and their attributes, leaving out empty ones
+
+    :return: aspect name => aspect content
+    :rtype: dict
+    """
+    aspects = {'citations': net.citations,
+               'nodeCitations': net.nodeCitations,
+               'edgeCitations': net.edgeCitations,
+               'supports': net.supports,
+               'nodeSupports': net.nodeSupports,
+               'edgeSupports': net.edgeSupports,
+               'provenance': net.provenance}
+    aspects.update(net.nodeAssociatedAspects)
+    aspects.update(net.edgeAssociatedAspects)
+    aspects.update(net.opaqueAspects)
+    return {name: value for name, value in aspects.items() if value}
+
+
+def _get_cx2_aspects(net):
+    """
+    Gets the aspects of **net** other than network attributes,
+    nodes and edges, leaving out empty ones
+
+    :return: aspect name => aspect content
+    :rtype: dict
+    """
+    aspects = {'visualProperties': net.get_visual_properties(),
+               'nodeBypasses': net.get_node_bypasses(),
+               'edgeBypasses': net.get_edge_bypasses()}
+    for aspect in net.get_opaque_aspects():
+        for name, value in aspect.items():
+            aspects.setdefault(name, []).append(value)
+    return {name: value for name, value in aspects.items() if value}
+
+
+class _NaN(object):
+    """
+    Stands for NaN in :py:func:`_get_hashable`, as NaN is not equal to itself
+    """
+
+    def __repr__(self):
+        return 'NaN'
+
+
+_NAN = _NaN()
+
+
+def _get_hashable(value):
+    """
+    Converts **value**, including lists within tuples, to
+    something that can be hashed. NaN is converted to a value
+    equal to itself
+    """
+    if isinstance(value, numbers.Number) and value != value:
+        return _NAN
+    if isinstance(value, (list, tuple)):
+        return tuple(_get_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _get_hashable(v)) for k, v in value.items()))
+    return value
+
+
+def _get_node_keys(nodes, key):
+    """
+    Gets map of node id to value nodes are matched by
+
+    :return: node id => key value
+    :rtype: dict
+    """
+    node_keys = {}
+    for node in nodes:
+        if key is None:
+            node_keys[node.element_id] = node.element_id
+        else:
+            node_keys[node.element_id] = _get_hashable(node.attrs.get(key, (None,))[0])
+    return node_keys
+
+
+def _key_elements(elements, node_keys, edge_node_keys):
+    """
+    Builds map of match key to element along with its content
+    hash and content. Elements with the same key get an occurrence
+    count added to their key
+
+    :param node_keys: node id => key value, or ``None`` for edges
+    :type node_keys: dict
+    :param edge_node_keys: node id => key value used to match edges
+                           by their source and target, or ``None`` to
+                           match edges by id
+    :type edge_node_keys: dict
+    :return: key => (element, content hash, content, source, target)
+    :rtype: dict
+    """
+    keyed = {}
+    counts = {}
+    for element in elements:
+        source = element.source
+        target = element.target
+        if edge_node_keys is not None:
+            source = edge_node_keys.get(source)
+            target = edge_node_keys.get(target)
+            element_key = (source, target,
+                           element.attrs.get(constants.EDGE_INTERACTION_EXPANDED,
+                                             (None,))[0])
+        elif node_keys is not None:
+            element_key = node_keys[element.element_id]
+        else:
+            element_key = element.element_id
+        if element_key in keyed or element_key in counts:
+            counts[element_key] = counts.get(element_key, 0) + 1
+            element_key = (element_key, counts[element_key])
+        content = (source, target,
+                   tuple(sorted((name, _get_hashable(value))
+                                for name, value in element.attrs.items())))
+        keyed[element_key] = (element, hash(content), content, source, target)
+    return keyed
+
+
+def _diff_elements(keyed_a, keyed_b, added, removed, changed):
+    """
+    Compares elements keyed by :py:func:`_key_elements`, filling in
+    **added**, **removed** and **changed**
+    """
+    for element_key, (element_a, hash_a, content_a, source_a, target_a) in keyed_a.items():
+        entry_b = keyed_b.get(element_key)
+        if entry_b is None:
+            removed[element_key] = element_a.element_id
+            continue
+        element_b, hash_b, content_b, source_b, target_b = entry_b
+        if hash_a == hash_b and content_a == content_b:
+            continue
+        change = {'a': element_a.element_id, 'b': element_b.element_id,
+                  'attributes': {}}
+        for name, value in element_a.attrs.items():
+            value_b = element_b.attrs.get(name)
+            if value_b is None or _get_hashable(value) != _get_hashable(value_b):
+                change['attributes'][name] = (value[0], value_b[0] if value_b else None)
+        for name, value in element_b.attrs.items():
+            if name not in element_a.attrs:
+                change['attributes'][name] = (None, value[0])
+        if source_a != source_b:
+            change['source'] = (source_a, source_b)
+        if target_a != target_b:
+            change['target'] = (target_a, target_b)
+        changed[element_key] = change
+
+    for element_key, entry_b in keyed_b.items():
+        if element_key not in keyed_a:
+            added[element_key] = entry_b[0].element_id
@@ -0,0 +1,471 @@
+# -*- coding: utf-8 -*-
+
+"""
+Merges several networks into one, unifying nodes by
+a key such as name or represents.
+
+.. versionadded:: 3.12.0
+"""
+
+import copy
+
+from ndex2 import constants
+from ndex2.exceptions import NDExInvalidParameterError
+from ndex2.exceptions import NDExInvalidCX2Error
+from ndex2.nice_cx_network import NiceCXNetwork
+from ndex2.cx2 import CX2Network, convert_value
+
+NAME_KEY = 'name'
+"""
+Value for ``node_key`` in :py:func:`merge_networks` to unify
+nodes with the same name
+"""
+
+REPRESENTS_KEY = 'represents'
+"""
+Value for ``node_key`` in :py:func:`merge_networks` to unify
+nodes with the same represents
+"""
+
+FIRST_POLICY = 'first'
+"""
+Attribute policy where the value from the first network
+with the attribute is kept
+"""
+
+UNION_POLICY = 'union'
+"""
+Attribute policy where differing values are combined
+into a list of distinct values
+"""
+
+CONCAT_POLICY = 'concat'
+"""
+Attribute policy where differing values are combined
+into a list of all values, including duplicates
+"""
+
+ATTRIBUTE_POLICIES = [FIRST_POLICY, UNION_POLICY, CONCAT_POLICY]
+"""
+Valid values for ``attribute_policy`` in :py:func:`merge_networks`
+"""
+
+_NUMERIC_DATATYPES = [constants.INTEGER_DATATYPE, constants.LONG_DATATYPE,
+                      constants.DOUBLE_DATATYPE]
+
+_LIST_PREFIX = 'list_of_'
+
+
+def merge_networks(networks, node_key=NAME_KEY, attribute_policy=FIRST_POLICY,
+                   deduplicate_edges=False):
+    """
+    Merges **networks** into a new network.
+
+    .. versionadded:: 3.12.0
+
+    Nodes are unified by **node_key**, which is :py:const:`NAME_KEY`,
+    :py:const:`REPRESENTS_KEY` or the name of a node attribute. Nodes
+    without a value for the key are never unified. If
+    **deduplicate_edges** is ``True`` edges with the same source, target
+    and interaction are unified too. Nodes and edges get new ids,
+    numbered from ``0`` in the order they are first seen.
+
+    When a unified node or edge has different values for an attribute,
+    **attribute_policy** decides the outcome:
+
+    * :py:const:`FIRST_POLICY` keeps the value from the first network
+
+    * :py:const:`UNION_POLICY` keeps a list of the distinct values
+
+    * :py:const:`CONCAT_POLICY` keeps a list of all values
+
+    With :py:const:`UNION_POLICY` and :py:const:`CONCAT_POLICY` an attribute
+    that has differing values on any element becomes a list type on every
+    element, so each attribute keeps a single data type. Node name,
+    represents and edge interaction always use :py:const:`FIRST_POLICY`.
+    If networks disagree on the data type of an attribute, integer
+    and long values are widened to long or double and any other
+    mix becomes string.
+
+    Network attributes are taken from the first network. Citations,
+    supports, layout and visual style are not carried over.
+
+    The merge is done in a single pass over the elements of all
+    networks followed by a pass over the merged elements, so the
+    cost is linear in the total size of the input.
+
+    .. code-block:: python
+
+        from ndex2.merge import merge_networks
+
+        interactome = merge_networks([net_one, net_two, net_three],
+                                     node_key='represents',
+                                     attribute_policy='union',
+                                     deduplicate_edges=True)
+
+    :param networks: Networks to merge, all must be
+                     :py:class:`~ndex2.nice_cx_network.NiceCXNetwork` or
+                     all must be :py:class:`~ndex2.cx2.CX2Network`
+    :type networks: list
+    :param node_key: What to unify nodes by
+    :type node_key: str
+    :param attribute_policy: How to combine differing attribute values,
+                             one of :py:const:`ATTRIBUTE_POLICIES`
+    :type attribute_policy: str
+    :param deduplicate_edges: If ``True`` unify edges with the same source,
+                              target and interaction
+    :type deduplicate_edges: bool
+    :raises NDExInvalidParameterError: If **networks** is empty or holds
+                                       anything other than networks of one
+                                       type or if **attribute_policy**
+                                       is invalid
+    :return: Merged network, same type as **networks**
+    :rtype: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork` or
+            :py:class:`~ndex2.cx2.CX2Network`
+    """
+    if not networks:
+        raise NDExInvalidParameterError('networks must be a non empty list')
+    if attribute_policy not in ATTRIBUTE_POLICIES:
+        raise NDExInvalidParameterError('attribute_policy must be one of ' +
+                                        str(ATTRIBUTE_POLICIES))
+    if all(isinstance(net, NiceCXNetwork) for net in networks):
+        get_elements = _get_nice_cx_elements
+        protected_node_attrs = []
+        protected_edge_attrs = []
+    elif all(isinstance(net, CX2Network) for net in networks):
+        get_elements = _get_cx2_elements
+        protected_node_attrs = [constants.NODE_NAME_EXPANDED,
+                                constants.NODE_REPRESENTS_EXPANDED]
+        protected_edge_attrs = [constants.EDGE_INTERACTION_EXPANDED]
+    else:
+        raise NDExInvalidParameterError('networks must all be NiceCXNetwork '
+                                        'or all be CX2Network objects')
+
+    merged_nodes = []
+    merged_edges = []
+    node_key_map = {}
+    edge_key_map = {}
+    for net in networks:
+        nodes, edges = get_elements(net, node_key)
+        node_id_map = {}
+        for node_id, key, name, represents, attrs in nodes:
+            merged_node = node_key_map.get(key) if key is not None else None
+            if merged_node is None:
+                merged_node = _MergedElement(len(merged_nodes))
+                merged_nodes.append(merged_node)
+                if key is not None:
+                    node_key_map[key] = merged_node
+            merged_node.add(name, represents, attrs)
+            node_id_map[node_id] = merged_node.element_id
+
+        for src_id, target_id, interaction, attrs in edges:
+            src_id = node_id_map.get(src_id)
+            target_id = node_id_map.get(target_id)
+            if src_id is None or target_id is None:
+                continue
+            merged_edge = None
+            if deduplicate_edges is True:
+                edge_key = (src_id, target_id, interaction)
+                merged_edge = edge_key_map.get(edge_key)
+            if merged_edge is None:
+                merged_edge = _MergedElement(len(merged_edges), src_id,
+                                             target_id)
+                merged_edges.append(merged_edge)
+                if deduplicate_edges is True:
+                    edge_key_map[edge_key] = merged_edge
+            merged_edge.add(interaction, None, attrs)
+
+    node_types = _get_merged_datatypes(merged_nodes, attribute_policy,
+                                       protected_node_attrs)
+    edge_types = _get_merged_datatypes(merged_edges, attribute_policy,
+                                       protected_edge_attrs)
+    if isinstance(networks[0], NiceCXNetwork):
+        return _create_nice_cx(networks[0], merged_nodes, node_types,
+                               merged_edges, edge_types, attribute_policy)
+    return _create_cx2(networks[0], merged_nodes, node_types,
+                       merged_edges, edge_types, attribute_policy)
+
+
+class _MergedElement(object):
+    """
+    Node or edge in merged network along with every attribute value
+    found for it
+    """
+
+    def __init__(self, element_id, source=None, target=None):
+        self.element_id = element_id
+        self.source = source
+        self.target = target
+        self.name = None
+        self.represents = None
+        self.attrs = {}
+
+    def add(self, name, represents, attrs):
+        """
+        Adds name/interaction, represents and attributes of
+        an element being merged into this one
+
+        :param attrs: tuples of (attribute name, value, datatype)
+        :type attrs: list
+        """
+        if self.name is None:
+            self.name = name
+        if self.represents is None:
+            self.represents = represents
+        for attr_name, value, datatype in attrs:
+            self.attrs.setdefault(attr_name, []).append((value, datatype))
+
+
+def _get_nice_cx_elements(net, node_key):
+    """
+    Gets nodes and edges of **net** as tuples, see :py:func:`merge_networks`
+
+    :return: (list of (node id, key, name, represents, attributes),
+              list of (source, target, interaction, attributes))
+    :rtype: tuple
+    """
+    nodes = []
+    for node_id, node in net.nodes.items():
+        attrs = [(n_a.get(constants.NODE_ATTR_NAME),
+                  n_a.get(constants.NODE_ATTR_VALUE),
+                  n_a.get(constants.NODE_ATTR_DATATYPE,
+                          constants.STRING_DATATYPE))
+                 for n_a in net.nodeAttributes.get(node_id, [])]
+        if node_key == NAME_KEY:
+            key = node.get(constants.NODE_NAME)
+        elif node_key == REPRESENTS_KEY:
+            key = node.get(constants.NODE_REPRESENTS)
+        else:
+            key = _get_attribute_key(attrs, node_key)
+        nodes.append((node_id, key, node.get(constants.NODE_NAME),
+                      node.get(constants.NODE_REPRESENTS), attrs))
+
+    edges = []
+    for edge_id, edge in net.edges.items():
+        attrs = [(e_a.get('n'), e_a.get('v'),
+                  e_a.get('d', constants.STRING_DATATYPE))
+                 for e_a in net.edgeAttributes.get(edge_id, [])]
+        edges.append((edge.get(constants.EDGE_SOURCE),
+                      edge.get(constants.EDGE_TARGET),
+                      edge.get(constants.EDGE_INTERACTION), attrs))
+    return nodes, edges
+
+
+def _get_cx2_elements(net, node_key):
+    """
+    Gets nodes and edges of **net** as tuples, see :py:func:`merge_networks`
+
+    :return: (list of (node id, key, name, represents, attributes),
+              list of (source, target, interaction, attributes))
+    :rtype: tuple
+    """
+    nodes = []
+    for node_id, node in net.get_nodes().items():
+        values = node.get(constants.ASPECT_VALUES, {})
+        attrs = [(attr_name, value,
+                  net.get_declared_type(constants.NODES_ASPECT, attr_name,
+                                        value))
+                 for attr_name, value in values.items()]
+        key = _get_attribute_key(attrs, node_key)
+        nodes.append((node_id, key,
+                      values.get(constants.NODE_NAME_EXPANDED),
+                      values.get(constants.NODE_REPRESENTS_EXPANDED), attrs))
+
+    edges = []
+    for edge_id, edge in net.get_edges().items():
+        values = edge.get(constants.ASPECT_VALUES, {})
+        attrs = [(attr_name, value,
+                  net.get_declared_type(constants.EDGES_ASPECT, attr_name,
+                                        value))
+                 for attr_name, value in values.items()]
+        edges.append((edge.get(constants.EDGE_SOURCE),
+                      edge.get(constants.EDGE_TARGET),
+                      values.get(constants.EDGE_INTERACTION_EXPANDED), attrs))
+    return nodes, edges
+
+
+def _get_attribute_key(attrs, attr_name):
+    """
+    Gets value of attribute **attr_name** in **attrs** for
+    use as a node key, lists are converted to tuples
+
+    :return: value or ``None`` if not found
+    """
+    for name, value, datatype in attrs:
+        if name == attr_name:
+            return _get_hashable(value)
+    return None
+
+
+def _get_hashable(value):
+    """
+    Converts list **value** to a tuple so it can be hashed
+    """
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _merge_datatypes(datatype, other_datatype):
+    """
+    Gets datatype that can hold values of both **datatype**
+    and **other_datatype**. Numeric types are widened and any
+    other mix becomes string. If either is a list type so is
+    the result
+
+    :param datatype: datatype or ``None``
+    :type datatype: str
+    :param other_datatype: datatype
+    :type other_datatype: str
+    :return: merged datatype
+    :rtype: str
+    """
+    if datatype is None or datatype == other_datatype:
+        return other_datatype
+    is_list = datatype.startswith(_LIST_PREFIX) or \
+        other_datatype.startswith(_LIST_PREFIX)
+    base = datatype.replace(_LIST_PREFIX, '')
+    other_base = other_datatype.replace(_LIST_PREFIX, '')
+    if base == other_base:
+        merged_base = base
+    elif base in _NUMERIC_DATATYPES and other_base in _NUMERIC_DATATYPES:
+        if constants.DOUBLE_DATATYPE in (base, other_base):
+            merged_base = constants.DOUBLE_DATATYPE
+        else:
+            merged_base = constants.LONG_DATATYPE
+    else:
+        merged_base = constants.STRING_DATATYPE
+    if is_list is True:
+        return _LIST_PREFIX + merged_base
+    return merged_base
+
+
+def _get_merged_datatypes(merged_elements, attribute_policy,
+                          protected_attrs):
+    """
+    Gets datatype of every attribute in merged elements. With
+    :py:const:`UNION_POLICY` and :py:const:`CONCAT_POLICY` an attribute
+    with differing values on any element gets a list type
+
+    :return: attribute name => datatype
+    :rtype: dict
+    """
+    datatypes = {}
+    combined = set()
+    for element in merged_elements:
+        for attr_name, values in element.attrs.items():
+            for value, datatype in values:
+                datatypes[attr_name] = _merge_datatypes(datatypes.get(attr_name),
+                                                        datatype)
+            if attribute_policy != FIRST_POLICY and len(values) > 1 and \
+                    attr_name not in protected_attrs and attr_name not in combined:
+                first_value = _get_hashable(values[0][0])
+                for value, datatype in values[1:]:
+                    if _get_hashable(value) != first_value:
+                        combined.add(attr_name)
+                        break
+    for attr_name in combined:
+        if not datatypes[attr_name].startswith(_LIST_PREFIX):
+            datatypes[attr_name] = _LIST_PREFIX + datatypes[attr_name]
+    return datatypes
+
+
+def _convert(value, datatype, new_datatype):
+    """
+    Converts **value** of type **datatype** to **new_datatype**
+    """
+    if datatype == new_datatype:
+        return value
+    if new_datatype.startswith(_LIST_PREFIX) and not isinstance(value, list):
+        value = [value]
+    try:
+        return convert_value(new_datatype, value)
+    except NDExInvalidCX2Error:
+        return convert_value(new_datatype, str(value))
+
+
+def _get_merged_attributes(element, datatypes, attribute_policy):
+    """
+    Gets final attributes of merged **element**
+
+    :return: tuples of (attribute name, value, datatype)
+    :rtype: list
+    """
+    merged_attrs = []
+    for attr_name, values in element.attrs.items():
+        datatype = datatypes[attr_name]
+        value, value_datatype = values[0]
+        if attribute_policy == FIRST_POLICY or len(values) == 1 or \
+                not datatype.startswith(_LIST_PREFIX) or \
+                all(_get_hashable(v) == _get_hashable(value) for v, d in values[1:]):
+            merged_attrs.append((attr_name,
+                                 _convert(value, value_datatype, datatype),
+                                 datatype))
+            continue
+        combined_value = []
+        seen = set()
+        for value, value_datatype in values:
+            for item in _convert(value, value_datatype, datatype):
+                if attribute_policy == UNION_POLICY:
+                    if item in seen:
+                        continue
+                    seen.add(item)
+                combined_value.append(item)
+        merged_attrs.append((attr_name, combined_value, datatype))
+    return merged_attrs
+
+
+def _create_nice_cx(first_net, merged_nodes, node_types, merged_edges,
+                    edge_types, attribute_policy):
+    """
+    Creates :py:class:`~ndex2.nice_cx_network.NiceCXNetwork` from
+    merged elements
+
+    :rtype: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+    """
+    net = NiceCXNetwork()
+    net.networkAttributes = copy.deepcopy(first_net.networkAttributes)
+    for node in merged_nodes:
+        net.create_node(node_name=node.name, node_represents=node.represents)
+        for attr_name, value, datatype in _get_merged_attributes(node, node_types,
+                                                                 attribute_policy):
+            net.add_node_attribute(property_of=node.element_id, name=attr_name,
+                                   values=value, type=datatype)
+    for edge in merged_edges:
+        net.create_edge(edge_source=edge.source, edge_target=edge.target,
+                        edge_interaction=edge.name)
+        for attr_name, value, datatype in _get_merged_attributes(edge, edge_types,
+                                                                 attribute_policy):
+            net.add_edge_attribute(property_of=edge.element_id, name=attr_name,
+                                   values=value, type=datatype)
+    return net
+
+
+def _create_cx2(first_net, merged_nodes, node_types, merged_edges,
+                edge_types, attribute_policy):
+    """
+    Creates :py:class:`~ndex2.cx2.CX2Network` from merged elements
+
+    :rtype: :py:class:`~ndex2.cx2.CX2Network`
+    """
+    net = CX2Network()
+    declarations = {constants.NODES_ASPECT: {}, constants.EDGES_ASPECT: {}}
+    for attr_name, datatype in node_types.items():
+        declarations[constants.NODES_ASPECT][attr_name] = {constants.ATTR_DATATYPE: datatype}
+    for attr_name, datatype in edge_types.items():
+        declarations[constants.EDGES_ASPECT][attr_name] = {constants.ATTR_DATATYPE: datatype}
+    net_attr_declarations = first_net.get_attribute_declarations().get(constants.NETWORK_ATTRIBUTES_ASPECT)
+    if net_attr_declarations:
+        declarations[constants.NETWORK_ATTRIBUTES_ASPECT] = copy.deepcopy(net_attr_declarations)
+    net.set_attribute_declarations(declarations)
+    net.set_network_attributes(copy.deepcopy(first_net.get_network_attributes()))
+
+    for node in merged_nodes:
+        attrs = _get_merged_attributes(node, node_types, attribute_policy)
+        net.add_node(node_id=node.element_id,
+                     attributes={attr_name: value for attr_name, value, datatype in attrs})
+    for edge in merged_edges:
+        attrs = _get_merged_attributes(edge, edge_types, attribute_policy)
+        net.add_edge(edge_id=edge.element_id, source=edge.source, target=edge.target,
+                     attributes={attr_name: value for attr_name, value, datatype in attrs})
+    return net
@@ -1,6 +1,7 @@
 __author__ = 'aarongary'
 
 import sys
+import copy
 import pandas as pd
 import networkx as nx
 import io
@@ -11,6 +12,7 @@ import ijson
 import requests
 import base64
 import logging
+from itertools import compress
 
 from ndex2.client import Ndex2
 from ndex2.exceptions import NDExError
@@ -19,7 +21,8 @@ from ndex2.exceptions import NDExUnauthorizedError
 from ndex2.exceptions import NDExInvalidParameterError
 
 from ndex2 import constants
-from ndex2.util import PandasDataConverter
+from ndex2 import query
+from ndex2.util import DataConverter, PandasDataConverter
 
 if sys.version_info.major == 3:
     from urllib.request import urlopen, Request, HTTPError, URLError
@@ -34,8 +37,14 @@ class NiceCXNetwork:
     PROPERTIES_OF = 'properties_of'
     PROPS_OF_NODES = 'nodes'
     PROPS_OF_EDGES = 'edges'
+    APPLIES_TO = 'applies_to'
     META_DATA = 'metaData'
 
+    _COW_ASPECTS = ('nodes', 'edges', 'nodeAttributes', 'edgeAttributes',
+                    'citations', 'supports', 'nodeCitations',
+                    'edgeCitations', 'edgeSupports')
+    _COW_ELEMENT_ASPECTS = ('nodeAttributes', 'edgeAttributes')
+
     def __init__(self, **attr):
 
         self.metadata = {}
@@ -62,6 +71,12 @@ class NiceCXNetwork:
         self.missingNodes = {}
         self.s = None
         self.node_name_to_id_map_cache = {}
+        self._node_edge_index = None
+        self._layout_index = None
+        self._search_term_index = None
+        self._relation_index = {}
+        self._cow_shared = set()
+        self._cow_owned = {}
         self.logger = logging.getLogger(__name__)
 
     @staticmethod
@@ -105,9 +120,10 @@ class NiceCXNetwork:
         else:
             target_id = edge_target
 
-        self.edges[edge_id] = {constants.EDGE_ID: edge_id,
-                               constants.EDGE_SOURCE: src_id,
-                               constants.EDGE_TARGET: target_id}
+        self._get_writable_aspect('edges')[edge_id] = {
+            constants.EDGE_ID: edge_id,
+            constants.EDGE_SOURCE: src_id,
+            constants.EDGE_TARGET: target_id}
 
         if edge_interaction is not None:
             self.edges[edge_id][constants.EDGE_INTERACTION] = edge_interaction
@@ -144,6 +160,7 @@ class NiceCXNetwork:
                            edge_target=edge_target,
                            edge_interaction=edge_interaction)
         self.edge_int_id_generator += 1
+        self._add_edge_to_node_edge_index(self.edges[edge_id])
 
         return edge_id
 
@@ -154,6 +171,7 @@ class NiceCXNetwork:
         if node_id is None:
             node_id = self.get_next_node_id()
 
+        self._get_writable_aspect('nodes')
         if node_represents is not None:
             self.nodes[node_id] = {constants.NODE_ID: node_id,
                                    constants.NODE_NAME: node_name,
@@ -258,7 +276,7 @@ class NiceCXNetwork:
         if attributes is not None:
             add_this_citation[attributes] = attributes
 
-        self.citations[id] = add_this_citation
+        self._get_writable_aspect('citations')[id] = add_this_citation
 
         return add_this_citation
 
@@ -289,7 +307,7 @@ class NiceCXNetwork:
         if props is not None and len(props) > 0:
             add_this_supports['properties'] = props
 
-        self.supports[id] = add_this_supports
+        self._get_writable_aspect('supports')[id] = add_this_supports
 
         return add_this_supports
 
@@ -306,23 +324,151 @@ class NiceCXNetwork:
 
     def build_many_to_many_relation(self, aspect_name, element,
                                     relation_name):
-        if aspect_name == 'nodeCitations':
-            aspect = self.nodeCitations
-        elif aspect_name == 'edgeCitations':
-            aspect = self.edgeCitations
-        elif aspect_name == 'edgeSupports':
-            aspect = self.edgeSupports
-        else:
+        if aspect_name not in ('nodeCitations', 'edgeCitations',
+                               'edgeSupports'):
             raise Exception('Only nodeCitations, edgeCitations and '
                             'edgeSupports are supported. ' +
                             aspect_name + ' was supplied')
 
+        index = self._relation_index.get(aspect_name)
+        if index is not None and index[0] is not getattr(self, aspect_name):
+            index = None
+            del self._relation_index[aspect_name]
+
+        relation_ids = element.get(relation_name)
         for po in element.get('po'):
+            aspect = self._get_writable_aspect(aspect_name)
             po_id = aspect.get(po)
             if po_id is None:
-                aspect[po] = element.get(relation_name)
+                aspect[po] = relation_ids
             else:
-                aspect[po] += element.get(relation_name)
+                # new list, the loader can share one list between elements
+                aspect[po] = self._as_id_list(po_id) + \
+                    self._as_id_list(relation_ids)
+            if index is not None:
+                for relation_id in self._as_id_list(relation_ids):
+                    index[1].setdefault(relation_id, {})[po] = None
+
+        if index is not None:
+            index[0] = getattr(self, aspect_name)
+
+    def get_nodes_by_citation(self, citation):
+        """
+        Gets ids of nodes that cite **citation**. This is the reverse
+        of :py:func:`get_node_citations` and does not scan the network
+
+        .. versionadded:: 3.12.0
+
+        :param citation: citation id or citation object
+        :type citation: int or dict with ``@id`` attribute
+        :return: ids of nodes in the order they were linked to **citation**
+        :rtype: list
+        """
+        return self._get_related_element_ids('nodeCitations', self.nodes,
+                                             citation)
+
+    def get_edges_by_citation(self, citation):
+        """
+        Gets ids of edges that cite **citation**. This is the reverse
+        of :py:func:`get_edge_citations` and does not scan the network
+
+        Example:
+
+            ``get_edges_by_citation(my_citation)``
+            ``# returns: [0, 3]``
+
+        .. versionadded:: 3.12.0
+
+        :param citation: citation id or citation object
+        :type citation: int or dict with ``@id`` attribute
+        :return: ids of edges in the order they were linked to **citation**
+        :rtype: list
+        """
+        return self._get_related_element_ids('edgeCitations', self.edges,
+                                             citation)
+
+    def get_edges_by_support(self, support):
+        """
+        Gets ids of edges backed by **support**. This is the reverse
+        of :py:attr:`edgeSupports` and does not scan the network
+
+        .. versionadded:: 3.12.0
+
+        :param support: support id or support object
+        :type support: int or dict with ``@id`` attribute
+        :return: ids of edges in the order they were linked to **support**
+        :rtype: list
+        """
+        return self._get_related_element_ids('edgeSupports', self.edges,
+                                             support)
+
+    def _get_related_element_ids(self, aspect_name, elements, relation):
+        """
+        Gets ids of nodes or edges linked to **relation** in
+        **aspect_name**, leaving out any no longer in **elements**
+
+        :param aspect_name: ``nodeCitations``, ``edgeCitations`` or
+                            ``edgeSupports``
+        :type aspect_name: str
+        :param elements: :py:attr:`nodes` or :py:attr:`edges`
+        :type elements: dict
+        :param relation: citation or support id or object
+        :type relation: int or dict with ``@id`` attribute
+        :return: ids of nodes or edges
+        :rtype: list
+        """
+        if isinstance(relation, dict):
+            relation = relation.get('@id')
+        element_ids = self._get_relation_index(aspect_name).get(relation, {})
+        return [e_id for e_id in element_ids if e_id in elements]
+
+    def _get_relation_index(self, aspect_name):
+        """
+        Gets map of citation or support id to ids of the nodes or edges
+        linked to it in **aspect_name**. The map is built on first use,
+        which covers networks just loaded, and then kept current by
+        :py:func:`build_many_to_many_relation`, :py:func:`remove_node`
+        and :py:func:`remove_edge`. If the aspect is replaced the map is
+        rebuilt
+
+        :param aspect_name: ``nodeCitations``, ``edgeCitations`` or
+                            ``edgeSupports``
+        :type aspect_name: str
+        :return: citation or support id => dict with node or edge ids as
+                 keys (used as an ordered set)
+        :rtype: dict
+        """
+        aspect = getattr(self, aspect_name)
+        index = self._relation_index.get(aspect_name)
+        if index is None or index[0] is not aspect:
+            reverse = {}
+            for po, relation_ids in aspect.items():
+                for relation_id in self._as_id_list(relation_ids):
+                    reverse.setdefault(relation_id, {})[po] = None
+            index = [aspect, reverse]
+            self._relation_index[aspect_name] = index
+        return index[1]
+
+    def _remove_from_relation_index(self, aspect_name, element_id):
+        """
+        Removes node or edge **element_id** from the map returned by
+        :py:func:`_get_relation_index` if the map has been built
+
+        :param aspect_name: ``nodeCitations``, ``edgeCitations`` or
+                            ``edgeSupports``
+        :type aspect_name: str
+        :param element_id: id of node or edge just removed
+        :type element_id: int
+        """
+        index = self._relation_index.get(aspect_name)
+        if index is None:
+            return
+        aspect = getattr(self, aspect_name)
+        if index[0] is not aspect:
+            del self._relation_index[aspect_name]
+            return
+        for relation_id in self._as_id_list(aspect.get(element_id, [])):
+            index[1].get(relation_id, {}).pop(element_id, None)
     # TODO
     # make opaque aspect into a one shot method to set the whole aspect.
     # i.e. not one element at a time
@@ -467,6 +613,7 @@ class NiceCXNetwork:
         if name is None or values is None:
             raise NDExError('Node attribute requires the name and values property')
 
+        self._get_writable_element('nodeAttributes', node_id)
         if self.nodeAttributes.get(node_id) is None:
             self.nodeAttributes[node_id] = []
 
@@ -499,6 +646,7 @@ class NiceCXNetwork:
         if isinstance(property_of, dict):
             property_of = property_of.get('@id')
 
+        self._get_writable_element('edgeAttributes', property_of)
         if self.edgeAttributes.get(property_of) is None:
             self.edgeAttributes[property_of] = []
 
@@ -793,9 +941,14 @@ class NiceCXNetwork:
         return self.nodeAttributes.items()
 
     def remove_node(self, node):
-        return self.nodes.pop(node, None)
+        self._search_term_index = None
+        self._remove_from_relation_index('nodeCitations', node)
+        return self._get_writable_aspect('nodes').pop(node, None)
 
     def remove_node_attribute(self, node, attribute_name):
+        self._get_writable_element('nodeAttributes',
+                                   node.get('@id') if isinstance(node, dict)
+                                   else node)
         node_attrs = self.get_node_attributes(node)
 
         if node_attrs:
@@ -805,9 +958,17 @@ class NiceCXNetwork:
                     break
 
     def remove_edge(self, edge):
-        return self.edges.pop(edge, None)
+        removed_edge = self._get_writable_aspect('edges').pop(edge, None)
+        if removed_edge is not None:
+            self._remove_edge_from_node_edge_index(removed_edge)
+            self._remove_from_relation_index('edgeCitations', edge)
+            self._remove_from_relation_index('edgeSupports', edge)
+        return removed_edge
 
     def remove_edge_attribute(self, edge, attribute_name):
+        self._get_writable_element('edgeAttributes',
+                                   edge.get('@id') if isinstance(edge, dict)
+                                   else edge)
         edge_attrs = self.get_edge_attributes(edge)
 
         if edge_attrs:
@@ -816,6 +977,506 @@ class NiceCXNetwork:
                     edge_attrs.remove(e_a)
                     break
 
+    # ========================
+    # COPY OPERATIONS
+    # ========================
+
+    def copy(self):
+        """
+        Creates a copy of this network that can be changed without
+        changing this network and vice versa.
+
+        Unlike :py:func:`copy.deepcopy`, the nodes, edges, attributes,
+        citations and supports are not copied up front. The copy shares
+        them with this network and an aspect or, for attributes, the
+        list for a single node or edge, is copied the first time either
+        network changes it through methods such as
+        :py:func:`add_node_attribute` or :py:func:`remove_edge`.
+        Copying is fast no matter the size of the network and memory
+        only grows with the changes made afterwards.
+
+        .. code-block:: python
+
+            variant = net.copy()
+            variant.set_node_attribute(node_id, 'condition', 'treated')
+
+        .. warning::
+
+            The node, edge and attribute objects returned by methods
+            such as :py:func:`get_node` are shared until changed
+            through this class. Altering them directly will change
+            both networks, use :py:func:`copy.deepcopy` on the network
+            if that is needed.
+
+        .. versionadded:: 3.12.0
+
+        :return: copy of this network
+        :rtype: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        """
+        clone = copy.copy(self)
+        for aspect_name in NiceCXNetwork._COW_ASPECTS:
+            self._cow_shared.add(aspect_name)
+        clone._cow_shared = set(self._cow_shared)
+        self._cow_owned = {}
+        clone._cow_owned = {}
+
+        clone.metadata = copy.deepcopy(self.metadata)
+        clone.networkAttributes = [dict(n_a) for n_a in
+                                   self.networkAttributes]
+        clone.opaqueAspects = dict(self.opaqueAspects)
+        clone.node_id_lookup = list(self.node_id_lookup)
+        clone.nodeSupports = dict(self.nodeSupports)
+        clone.edgeAttributeHeader = set(self.edgeAttributeHeader)
+        clone.nodeAttributeHeader = set(self.nodeAttributeHeader)
+        clone.nodeAssociatedAspects = dict(self.nodeAssociatedAspects)
+        clone.edgeAssociatedAspects = dict(self.edgeAssociatedAspects)
+        clone.provenance = copy.copy(self.provenance)
+        clone.missingNodes = dict(self.missingNodes)
+        clone.node_name_to_id_map_cache = {}
+        clone._node_edge_index = None
+        clone._layout_index = None
+        clone._search_term_index = None
+        clone._relation_index = {}
+        return clone
+
+    def _get_writable_aspect(self, aspect_name):
+        """
+        Gets the aspect **aspect_name**, first giving this network its
+        own copy of the aspect if it is still shared with a network
+        created by or creating this one via :py:func:`copy`
+
+        :param aspect_name: name of attribute holding aspect such as ``nodes``
+        :type aspect_name: str
+        :return: aspect that can be changed
+        :rtype: dict
+        """
+        if aspect_name in self._cow_shared:
+            self._cow_shared.discard(aspect_name)
+            setattr(self, aspect_name, copy.copy(getattr(self, aspect_name)))
+            if aspect_name in NiceCXNetwork._COW_ELEMENT_ASPECTS:
+                self._cow_owned[aspect_name] = set()
+        return getattr(self, aspect_name)
+
+    def _get_writable_element(self, aspect_name, key):
+        """
+        Like :py:func:`_get_writable_aspect`, but also gives this
+        network its own copy of the list under **key** so it can be
+        changed in place
+
+        :param aspect_name: name of attribute holding aspect such as
+                            ``nodeAttributes``
+        :type aspect_name: str
+        :param key: id of node or edge
+        :type key: int
+        :return: aspect where list under **key** can be changed
+        :rtype: dict
+        """
+        aspect = self._get_writable_aspect(aspect_name)
+        owned = self._cow_owned.get(aspect_name)
+        if owned is not None and key not in owned:
+            owned.add(key)
+            if key in aspect:
+                aspect[key] = list(aspect[key])
+        return aspect
+
+    # ========================
+    # SUBNETWORK OPERATIONS
+    # ========================
+
+    def _get_node_edge_index(self):
+        """
+        Gets map of node id to list of ids of edges that have the
+        node as source or target. The map is built on first use and
+        then kept current by :py:func:`create_edge` and
+        :py:func:`remove_edge`. If the number of edges no longer matches,
+        (edges were added to :py:attr:`edges` directly) the map is rebuilt
+
+        :return: node id => list of edge ids
+        :rtype: dict
+        """
+        if self._node_edge_index is None or \
+                self._node_edge_index[0] != len(self.edges):
+            self._node_edge_index = [len(self.edges),
+                                     query.build_node_edge_index(self.edges)]
+        return self._node_edge_index[1]
+
+    def _add_edge_to_node_edge_index(self, edge):
+        """
+        Adds **edge** to node edge index if the index has been built
+
+        :param edge: edge just added to :py:attr:`edges`
+        :type edge: dict
+        """
+        if self._node_edge_index is None:
+            return
+        index = self._node_edge_index[1]
+        index.setdefault(edge.get(constants.EDGE_SOURCE),
+                         []).append(edge.get(constants.EDGE_ID))
+        if edge.get(constants.EDGE_TARGET) != edge.get(constants.EDGE_SOURCE):
+            index.setdefault(edge.get(constants.EDGE_TARGET),
+                             []).append(edge.get(constants.EDGE_ID))
+        self._node_edge_index[0] += 1
+
+    def _remove_edge_from_node_edge_index(self, edge):
+        """
+        Removes **edge** from node edge index if the index has been built
+
+        :param edge: edge just removed from :py:attr:`edges`
+        :type edge: dict
+        """
+        if self._node_edge_index is None:
+            return
+        index = self._node_edge_index[1]
+        for node_id in set([edge.get(constants.EDGE_SOURCE),
+                            edge.get(constants.EDGE_TARGET)]):
+            edge_ids = index.get(node_id)
+            if edge_ids is not None and edge.get(constants.EDGE_ID) in edge_ids:
+                edge_ids.remove(edge.get(constants.EDGE_ID))
+        self._node_edge_index[0] -= 1
+
+    def _get_layout_index(self):
+        """
+        Gets map of node id to its entry in the
+        :py:const:`~ndex2.constants.CARTESIAN_LAYOUT_ASPECT` opaque aspect.
+        The map is rebuilt whenever that aspect is replaced or changes size
+
+        :return: node id => layout element
+        :rtype: dict
+        """
+        layout = self.get_opaque_aspect(constants.CARTESIAN_LAYOUT_ASPECT)
+        if not isinstance(layout, list):
+            return {}
+        if self._layout_index is None or \
+                self._layout_index[0] is not layout or \
+                self._layout_index[1] != len(layout):
+            index = {}
+            for coord in layout:
+                index[coord.get(constants.LAYOUT_NODE)] = coord
+            self._layout_index = [layout, len(layout), index]
+        return self._layout_index[2]
+
+    def subnetwork(self, node_ids, include_incident=False):
+        """
+        Creates a new network containing the nodes specified by **node_ids**
+        and the edges between them (the induced subnetwork).
+
+        .. versionadded:: 3.12.0
+
+        Along with the nodes and edges, the new network gets copies of
+        their node and edge attributes, node citations, edge citations,
+        edge supports (and the citations and supports they reference),
+        and :py:const:`~ndex2.constants.CARTESIAN_LAYOUT_ASPECT` entries.
+        Network attributes and the visual style are also copied, keeping
+        only the node and edge specific visual properties of elements in
+        the new network. Node and edge ids are unchanged.
+
+        Lookups are done through indexes on this network, so the cost
+        of this call is proportional to the size of the subnetwork rather than
+        the size of this network (the indexes are built on first call).
+
+        .. code-block:: python
+
+            from ndex2.nice_cx_network import NiceCXNetwork
+
+            net = NiceCXNetwork()
+            node_one = net.create_node('node1')
+            node_two = net.create_node('node2')
+            node_three = net.create_node('node3')
+            net.create_edge(edge_source=node_one, edge_target=node_two)
+            net.create_edge(edge_source=node_two, edge_target=node_three)
+
+            # contains node1, node2 and the edge between them
+            sub_net = net.subnetwork([node_one, node_two])
+
+        :param node_ids: ids of nodes to include
+        :type node_ids: list
+        :param include_incident: If ``True`` every edge with at least one
+                                 endpoint in **node_ids** is included along
+                                 with the node at its other end
+        :type include_incident: bool
+        :raises NDExNotFoundError: If a node in **node_ids** is not in this
+                                   network
+        :return: New network
+        :rtype: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        """
+        node_id_set = set()
+        for node_id in node_ids:
+            if node_id not in self.nodes:
+                raise NDExNotFoundError('Node ' + str(node_id) +
+                                        ' not found in network')
+            node_id_set.add(node_id)
+
+        node_edge_index = self._get_node_edge_index()
+        edge_ids = []
+        seen_edges = set()
+        incident_node_ids = set()
+        for node_id in node_id_set:
+            for edge_id in node_edge_index.get(node_id, []):
+                if edge_id in seen_edges:
+                    continue
+                edge = self.edges[edge_id]
+                src_id = edge.get(constants.EDGE_SOURCE)
+                target_id = edge.get(constants.EDGE_TARGET)
+                if src_id in node_id_set and target_id in node_id_set:
+                    seen_edges.add(edge_id)
+                    edge_ids.append(edge_id)
+                elif include_incident is True:
+                    seen_edges.add(edge_id)
+                    edge_ids.append(edge_id)
+                    incident_node_ids.add(src_id)
+                    incident_node_ids.add(target_id)
+
+        node_id_set.update(incident_node_ids)
+        return self._create_subnetwork(node_id_set, edge_ids)
+
+    def _create_subnetwork(self, node_ids, edge_ids):
+        """
+        Creates new network with copies of the nodes and
+        edges passed in along with everything that is attached
+        to them. See :py:func:`subnetwork`
+
+        :param node_ids: ids of nodes to copy
+        :type node_ids: set
+        :param edge_ids: ids of edges to copy, the source and target
+                         of each edge must be in **node_ids**
+        :type edge_ids: list
+        :return: New network
+        :rtype: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        """
+        sub_net = NiceCXNetwork()
+        sub_net.networkAttributes = copy.deepcopy(self.networkAttributes)
+
+        citation_ids = set()
+        support_ids = set()
+        for node_id in node_ids:
+            if node_id not in self.nodes:
+                continue
+            sub_net.nodes[node_id] = copy.deepcopy(self.nodes[node_id])
+            if node_id in self.nodeAttributes:
+                sub_net.nodeAttributes[node_id] = copy.deepcopy(self.nodeAttributes[node_id])
+            if node_id in self.nodeCitations:
+                sub_net.nodeCitations[node_id] = copy.deepcopy(self.nodeCitations[node_id])
+                citation_ids.update(self._as_id_list(self.nodeCitations[node_id]))
+
+        for edge_id in edge_ids:
+            sub_net.edges[edge_id] = copy.deepcopy(self.edges[edge_id])
+            if edge_id in self.edgeAttributes:
+                sub_net.edgeAttributes[edge_id] = copy.deepcopy(self.edgeAttributes[edge_id])
+            if edge_id in self.edgeCitations:
+                sub_net.edgeCitations[edge_id] = copy.deepcopy(self.edgeCitations[edge_id])
+                citation_ids.update(self._as_id_list(self.edgeCitations[edge_id]))
+            if edge_id in self.edgeSupports:
+                sub_net.edgeSupports[edge_id] = copy.deepcopy(self.edgeSupports[edge_id])
+                support_ids.update(self._as_id_list(self.edgeSupports[edge_id]))
+
+        for support_id in support_ids:
+            support = self.supports.get(support_id)
+            if support is None:
+                continue
+            sub_net.supports[support_id] = copy.deepcopy(support)
+            if support.get('citation') is not None:
+                citation_ids.add(support.get('citation'))
+
+        for citation_id in citation_ids:
+            if citation_id in self.citations:
+                sub_net.citations[citation_id] = copy.deepcopy(self.citations[citation_id])
+
+        layout_index = self._get_layout_index()
+        if layout_index:
+            sub_layout = [copy.deepcopy(layout_index[node_id])
+                          for node_id in node_ids if node_id in layout_index]
+            if sub_layout:
+                sub_net.set_opaque_aspect(constants.CARTESIAN_LAYOUT_ASPECT,
+                                          sub_layout)
+
+        vis_props_aspect = self._get_visual_properties_aspect()
+        if vis_props_aspect is not None:
+            sub_vis_props = []
+            for entry in vis_props_aspect:
+                props_of = entry.get(NiceCXNetwork.PROPERTIES_OF)
+                if props_of == NiceCXNetwork.PROPS_OF_NODES and \
+                        entry.get(NiceCXNetwork.APPLIES_TO) not in node_ids:
+                    continue
+                if props_of == NiceCXNetwork.PROPS_OF_EDGES and \
+                        entry.get(NiceCXNetwork.APPLIES_TO) not in sub_net.edges:
+                    continue
+                sub_vis_props.append(copy.deepcopy(entry))
+            sub_net._set_visual_properties_aspect(sub_vis_props)
+
+        sub_net.node_int_id_generator = self.node_int_id_generator
+        sub_net.edge_int_id_generator = self.edge_int_id_generator
+        return sub_net
+
+    @staticmethod
+    def _as_id_list(value):
+        """
+        Many to many relations (citations, supports) normally store
+        a list of ids, but a single id is also tolerated
+
+        :param value: id or list of ids
+        :return: list of ids
+        :rtype: list
+        """
+        if isinstance(value, list):
+            return value
+        return [value]
+
+    def _get_search_term_index(self):
+        """
+        Gets map of search term to ids of nodes matching that term.
+        See :py:func:`ndex2.query.build_search_term_index`. The map is
+        rebuilt if the number of nodes has changed since it was built
+
+        :return: search term => set of node ids
+        :rtype: dict
+        """
+        if self._search_term_index is None or \
+                self._search_term_index[0] != len(self.nodes):
+            index = query.build_search_term_index(
+                (node_id, node.get(constants.NODE_NAME),
+                 node.get(constants.NODE_REPRESENTS))
+                for node_id, node in self.nodes.items())
+            self._search_term_index = [len(self.nodes), index]
+        return self._search_term_index[1]
+
+    def get_neighborhood(self, search_string, search_depth=1, edge_limit=2500,
+                         error_when_limit=True):
+        """
+        Runs a neighborhood query on this network without contacting
+        NDEx. This is a local version of
+        :py:func:`~ndex2.client.Ndex2.get_neighborhood` that takes the
+        same parameters.
+
+        .. versionadded:: 3.12.0
+
+        Nodes matching **search_string** are found by name and represents
+        and then the network is traversed **search_depth** steps out from
+        them. The result is a new network containing every node reached
+        and every edge traversed, along with everything
+        :py:func:`subnetwork` copies. Call :py:func:`to_cx` on the result
+        to get CX like the server returns.
+
+        Unlike the server, which accepts
+        `Lucene <https://lucene.apache.org/>`__ queries, **search_string**
+        is split on whitespace into terms (double quotes keep a term
+        with spaces together) and a node matches if its name or represents
+        equals any of the terms, ignoring case. If represents has a prefix,
+        such as ``hgnc:TP53``, the value after the prefix (``TP53``) also
+        matches. ``AND``, ``OR`` and ``NOT`` are ignored.
+
+        .. code-block:: python
+
+            import ndex2
+
+            net = ndex2.create_nice_cx_from_file('mynetwork.cx')
+            neighborhood = net.get_neighborhood('TP53 MDM2', search_depth=2)
+            cx = neighborhood.to_cx()
+
+        :param search_string: Search string used to find the starting nodes
+        :type search_string: str
+        :param search_depth: Number of steps to traverse out from the
+                             starting nodes
+        :type search_depth: int
+        :param edge_limit: The maximum number of edges in the result,
+                           ``None`` means no limit
+        :type edge_limit: int
+        :param error_when_limit: If ``True`` an error is raised if the
+                                 result would have more than **edge_limit**
+                                 edges. If ``False`` the result is cut off
+                                 at **edge_limit** edges and gets network
+                                 attribute ``EdgeLimitExceeded`` set to
+                                 ``'true'``
+        :type error_when_limit: bool
+        :raises NDExError: If result has more than **edge_limit** edges and
+                           **error_when_limit** is ``True``
+        :return: New network
+        :rtype: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        """
+        seed_node_ids = query.find_node_ids(self._get_search_term_index(),
+                                            search_string)
+        node_ids, edge_ids, limit_exceeded = \
+            query.get_neighborhood_element_ids(seed_node_ids,
+                                               self._get_node_edge_index(),
+                                               self.edges,
+                                               search_depth=search_depth,
+                                               edge_limit=edge_limit,
+                                               error_when_limit=error_when_limit)
+        return self._create_query_result(node_ids, edge_ids, limit_exceeded)
+
+    def get_interconnectquery(self, search_string, search_depth=1,
+                              edge_limit=2500, error_when_limit=True):
+        """
+        Runs an interconnect query on this network without contacting
+        NDEx. This is a local version of
+        :py:func:`~ndex2.client.Ndex2.get_interconnectquery` that takes the
+        same parameters.
+
+        .. versionadded:: 3.12.0
+
+        Nodes matching **search_string** are found the same way as
+        :py:func:`get_neighborhood` finds them. The result is a new
+        network containing every edge that lies on a path of at most
+        **search_depth** steps starting at one matching node and ending at
+        a different one, along with the matching nodes, the nodes on
+        those paths and everything :py:func:`subnetwork` copies.
+        Call :py:func:`to_cx` on the result to get CX like the server
+        returns.
+
+        .. code-block:: python
+
+            import ndex2
+
+            net = ndex2.create_nice_cx_from_file('mynetwork.cx')
+            interconnect = net.get_interconnectquery('TP53 MDM2 CDKN1A',
+                                                     search_depth=2)
+
+        :param search_string: Search string used to find the nodes
+                              paths start and end at
+        :type search_string: str
+        :param search_depth: Maximum number of steps in a path
+        :type search_depth: int
+        :param edge_limit: The maximum number of edges in the result,
+                           ``None`` means no limit
+        :type edge_limit: int
+        :param error_when_limit: If ``True`` an error is raised if the
+                                 result would have more than **edge_limit**
+                                 edges. If ``False`` the result is cut off
+                                 at **edge_limit** edges and gets network
+                                 attribute ``EdgeLimitExceeded`` set to
+                                 ``'true'``
+        :type error_when_limit: bool
+        :raises NDExError: If result has more than **edge_limit** edges and
+                           **error_when_limit** is ``True``
+        :return: New network
+        :rtype: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        """
+        seed_node_ids = query.find_node_ids(self._get_search_term_index(),
+                                            search_string)
+        node_ids, edge_ids, limit_exceeded = \
+            query.get_interconnect_element_ids(seed_node_ids,
+                                               self._get_node_edge_index(),
+                                               self.edges,
+                                               search_depth=search_depth,
+                                               edge_limit=edge_limit,
+                                               error_when_limit=error_when_limit)
+        return self._create_query_result(node_ids, edge_ids, limit_exceeded)
+
+    def _create_query_result(self, node_ids, edge_ids, limit_exceeded):
+        """
+        Creates subnetwork for result of a local query, flagging
+        it with network attribute
+        :py:const:`~ndex2.query.EDGE_LIMIT_EXCEEDED` if
+        **limit_exceeded** is ``True``
+
+        :return: New network
+        :rtype: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        """
+        sub_net = self._create_subnetwork(node_ids, edge_ids)
+        if limit_exceeded is True:
+            sub_net.set_network_attribute(query.EDGE_LIMIT_EXCEEDED,
+                                          values='true')
+        return sub_net
+
     #==================
     # OTHER OPERATIONS
     #==================
@@ -1215,6 +1876,12 @@ class NiceCXNetwork:
         .. versionchanged:: 3.5.0
             Added **include_attributes** and  **dataconverter** parameters
 
+        .. versionchanged:: 3.12.0
+            Table is now built column by column, converting attributes of
+            each node once instead of once per edge. Columns for **target**
+            node attributes are now correctly named and attribute columns
+            are in the order attributes are first seen
+
         The following columns will be added to the :py:class:`pandas.DataFrame`:
 
         * **source** - Name of edge source node
@@ -1264,8 +1931,8 @@ class NiceCXNetwork:
 
         .. code-block:: python
 
-               source interaction target edgelabel  target_weight  source_weight
-            0  node1       binds  node2   an edge            0.2            0.5
+               source interaction target edgelabel  source_weight  target_weight
+            0  node1       binds  node2   an edge            0.5            0.2
 
         .. note::
 
@@ -1288,66 +1955,233 @@ class NiceCXNetwork:
         if include_attributes is not None and isinstance(include_attributes, bool) is False:
             raise NDExInvalidParameterError('include_attributes must be None or a bool')
 
-        rows = []
-        if sys.version_info.major == 3:
-            edge_items = self.edges.items()
-        else:
-            edge_items = self.edges.iteritems()
-
-        edge_attr_name_set = set()
-        node_attr_name_set = set()
-
-        omit_attrs = True
-        if include_attributes is not None and include_attributes is True:
-            omit_attrs = False
-
-        for k, v in edge_items:
-            if omit_attrs is False:
-                e_a = self.edgeAttributes.get(k)
-                # ==========================
-                # PROCESS EDGE ATTRIBUTES
-                # ==========================
-                add_this_dict = {}
-                if e_a is not None:
-                    for e_a_item in e_a:
-                        add_this_dict[e_a_item.get('n')] = dataconverter.convert_value(e_a_item.get('v'),
-                                                                                       e_a_item.get('d'))
-                        edge_attr_name_set.add(e_a_item.get('n'))
-                # ================================
-                # PROCESS SOURCE NODE ATTRIBUTES
-                # ================================
-                s_a = self.nodeAttributes.get(v.get('s'))
-                if s_a is not None:
-                    for s_a_item in s_a:
-                        add_this_dict['source_' + s_a_item.get('n')] = dataconverter.convert_value(s_a_item.get('v'),
-                                                                                                       s_a_item.get('d'))
-                        node_attr_name_set.add('source_' + s_a_item.get('n'))
-
-                # ================================
-                # PROCESS TARGET NODE ATTRIBUTES
-                # ================================
-                t_a = self.nodeAttributes.get(v.get('t'))
-                if t_a is not None:
-                    for t_a_item in t_a:
-                        add_this_dict['target_' + t_a_item.get('n')] = dataconverter.convert_value(t_a_item.get('v'),
-                                                                                                       t_a_item.get('d'))
-                        node_attr_name_set.add('target_' + s_a_item.get('n'))
-
-            if omit_attrs is False and add_this_dict:
-                rows.append(dict(add_this_dict,
-                                 source=self.nodes.get(v.get('s')).get('n'),
-                                 target=self.nodes.get(v.get('t')).get('n'),
-                                 interaction=v.get('i')))
+        edge_ids = []
+        source_ids = []
+        target_ids = []
+        interactions = []
+        for edge_id, edge in self.edges.items():
+            edge_ids.append(edge_id)
+            source_ids.append(edge.get(constants.EDGE_SOURCE))
+            target_ids.append(edge.get(constants.EDGE_TARGET))
+            interactions.append(edge.get(constants.EDGE_INTERACTION))
+
+        node_names = pd.Series([n.get(constants.NODE_NAME) for n in self.nodes.values()],
+                               index=list(self.nodes.keys()), dtype=object)
+        data = {'source': node_names.reindex(source_ids).tolist(),
+                'interaction': interactions,
+                'target': node_names.reindex(target_ids).tolist()}
+        df_columns = ['source', 'interaction', 'target']
+
+        if include_attributes is True:
+            attr_columns = []
+            edge_table = self._get_attribute_table(self.edgeAttributes,
+                                                   dataconverter)
+            edge_index = pd.Index(edge_ids)
+            for name, column in edge_table.items():
+                if not column.index.equals(edge_index):
+                    column = column.reindex(edge_index)
+                attr_columns.append((name, column))
+
+            node_table = self._get_attribute_table(self.nodeAttributes,
+                                                   dataconverter)
+            for prefix, node_ids in (('source_', pd.Index(source_ids)),
+                                     ('target_', pd.Index(target_ids))):
+                for name, column in node_table.items():
+                    # only add columns for attributes on at least one
+                    # source (or target) node
+                    if node_ids.isin(column.index).any():
+                        attr_columns.append((prefix + name,
+                                             column.reindex(node_ids)))
+
+            for name, column in attr_columns:
+                if name not in data:
+                    data[name] = self._get_dataframe_column(column)
+                    df_columns.append(name)
+
+        return pd.DataFrame(data, columns=df_columns)
+
+    def to_node_dataframe(self, attributes=None,
+                          dataconverter=PandasDataConverter(),
+                          include_layout=False):
+        """
+        Network nodes exported as a :py:class:`pandas.DataFrame` indexed
+        by node id, the counterpart of :py:func:`to_pandas_dataframe`
+        for nodes. The index is named **node_id** and the following
+        columns are added:
+
+        * **name** - Name of node
+
+        * **represents** - Represents of node
+
+        * One column per node attribute, in the order attributes are
+          first seen, or in the order given by **attributes**
+
+        * **x** and **y** - Coordinates of node from the
+          :py:const:`~ndex2.constants.CARTESIAN_LAYOUT_ASPECT` aspect, if
+          **include_layout** is ``True``
+
+        .. code-block:: python
+
+            from ndex2.nice_cx_network import NiceCXNetwork
+
+            net = NiceCXNetwork()
+            node_one = net.create_node('node1')
+            net.set_node_attribute(node_one, 'weight', 0.5, type='double')
+
+            node_df = net.to_node_dataframe()
+            edge_df = net.to_pandas_dataframe()
+
+            # add attributes of source node to edge table
+            edge_df.join(node_df.set_index('name'), on='source')
+
+        .. note::
+
+            Values are converted based on CX data types. See
+            :py:class:`~ndex2.util.PandasDataConverter` for information
+            on how conversion is performed
+
+        .. versionadded:: 3.12.0
+
+        :param attributes: Names of node attributes to add as columns,
+                           ``None`` means add all node attributes
+        :type attributes: list
+        :param dataconverter: Object that converts CX data values to native
+                              data types. Default is
+                              :py:class:`~ndex2.util.PandasDataConverter`
+        :type dataconverter: :py:class:`~ndex2.util.DataConverter`
+        :param include_layout: If ``True`` add **x** and **y** columns
+        :type include_layout: bool
+        :raises NDExInvalidParameterError: If **include_layout** is not a
+                                           :py:class:`bool` or
+                                           **attributes** is not ``None`` or
+                                           a :py:class:`list`
+        :return: Node table with attributes
+        :rtype: :py:class:`pandas.DataFrame`
+        """
+        if not isinstance(include_layout, bool):
+            raise NDExInvalidParameterError('include_layout must be a bool')
+        if attributes is not None and not isinstance(attributes, list):
+            raise NDExInvalidParameterError('attributes must be None or a list')
+
+        node_ids = list(self.nodes.keys())
+        data = {constants.NODE_NAME_EXPANDED: [],
+                constants.NODE_REPRESENTS_EXPANDED: []}
+        for node in self.nodes.values():
+            data[constants.NODE_NAME_EXPANDED].append(node.get(constants.NODE_NAME))
+            data[constants.NODE_REPRESENTS_EXPANDED].append(node.get(constants.NODE_REPRESENTS))
+        df_columns = [constants.NODE_NAME_EXPANDED,
+                      constants.NODE_REPRESENTS_EXPANDED]
+
+        node_table = self._get_attribute_table(self.nodeAttributes,
+                                               dataconverter,
+                                               names=attributes)
+        if attributes is None:
+            attributes = list(node_table.keys())
+        for name in attributes:
+            if name in data:
+                continue
+            column = node_table.get(name)
+            if column is None:
+                data[name] = [None] * len(node_ids)
             else:
-                rows.append(dict(source=self.nodes.get(v.get('s')).get('n'),
-                                 target=self.nodes.get(v.get('t')).get('n'),
-                                 interaction=v.get('i')))
-        if omit_attrs is False:
-            df_columns = ['source', 'interaction', 'target'] + list(edge_attr_name_set) + list(node_attr_name_set)
-        else:
-            df_columns = ['source', 'interaction', 'target']
+                data[name] = self._get_dataframe_column(column.reindex(node_ids))
+            df_columns.append(name)
+
+        if include_layout is True:
+            layout = self._get_layout_index()
+            for coord_name in (constants.LAYOUT_X, constants.LAYOUT_Y):
+                data[coord_name] = [layout.get(node_id, {}).get(coord_name)
+                                    for node_id in node_ids]
+                df_columns.append(coord_name)
+
+        return pd.DataFrame(data, columns=df_columns,
+                            index=pd.Index(node_ids, name='node_id'))
 
-        return pd.DataFrame(rows, columns=df_columns)
+    @staticmethod
+    def _get_attribute_table(element_attributes, dataconverter, names=None):
+        """
+        Builds one column per attribute name in **element_attributes**,
+        each holding the values converted by **dataconverter** and
+        indexed by node or edge id. If a node or edge has more then one
+        attribute with the same name, the last one is used. Values are
+        converted a column, or a data type within a column, at a time
+        by :py:meth:`~ndex2.util.DataConverter.convert_column`, so
+        columns of numbers or booleans are typed :py:mod:`numpy` arrays
+
+        :param element_attributes: :py:attr:`nodeAttributes` or
+                                   :py:attr:`edgeAttributes`
+        :type element_attributes: dict
+        :param dataconverter: Object that converts CX data values to
+                              native data types
+        :type dataconverter: :py:class:`~ndex2.util.DataConverter`
+        :param names: Only build columns for these attribute names,
+                      ``None`` means all
+        :type names: list
+        :return: attribute name => :py:class:`pandas.Series`
+                 in order attribute names were first seen
+        :rtype: dict
+        """
+        if names is not None:
+            names = set(names)
+        # attribute name => (node or edge ids, attributes)
+        raw_columns = {}
+        get_raw_column = raw_columns.get
+        for element_id, attrs in element_attributes.items():
+            for attr in attrs:
+                name = attr.get('n')
+                raw_column = get_raw_column(name)
+                if raw_column is None:
+                    if names is not None and name not in names:
+                        continue
+                    raw_column = raw_columns[name] = ([], [])
+                raw_column[0].append(element_id)
+                raw_column[1].append(attr)
+
+        convert_column = getattr(dataconverter, 'convert_column', None)
+        if convert_column is None:
+            # converter that only implements convert_value()
+            def convert_column(values, datatype):
+                return DataConverter._to_object_array([dataconverter.convert_value(value, datatype)
+                                                       for value in values])
+
+        table = {}
+        for name, (element_ids, attrs) in raw_columns.items():
+            index = pd.Index(element_ids)
+            if not index.is_unique:
+                kept = ~index.duplicated(keep='last')
+                index = index[kept]
+                attrs = list(compress(attrs, kept))
+            values = [attr.get('v') for attr in attrs]
+            datatypes = set(attr.get('d') for attr in attrs)
+            if len(datatypes) == 1:
+                column = convert_column(values, datatypes.pop())
+            else:
+                # an attribute can have a different data type on some elements
+                positions_by_type = {}
+                for position, attr in enumerate(attrs):
+                    positions_by_type.setdefault(attr.get('d'), []).append(position)
+                column = np.empty(len(attrs), dtype=object)
+                for datatype, positions in positions_by_type.items():
+                    converted = convert_column([values[p] for p in positions], datatype)
+                    for position, value in zip(positions, converted.tolist()):
+                        column[position] = value
+            table[name] = pd.Series(column, index=index, dtype=column.dtype)
+        return table
+
+    @staticmethod
+    def _get_dataframe_column(column):
+        """
+        Gets values of **column** to put in a :py:class:`pandas.DataFrame`.
+        Columns of numbers or booleans are passed as arrays, other columns
+        as lists so :py:mod:`pandas` infers their type from the values
+
+        :param column: Column from :py:func:`_get_attribute_table`, reindexed
+        :type column: :py:class:`pandas.Series`
+        :rtype: :py:class:`numpy.ndarray` or list
+        """
+        if column.dtype == object:
+            return column.tolist()
+        return column.to_numpy()
 
     def add_metadata_stub(self, aspect_name):
         md = self.metadata.get(aspect_name)
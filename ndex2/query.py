@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+"""
+Local versions of the queries NDEx runs server side, such as
+:py:func:`~ndex2.client.Ndex2.get_neighborhood` and
+:py:func:`~ndex2.client.Ndex2.get_interconnectquery`. These functions
+work on the indexes kept by
+:py:class:`~ndex2.nice_cx_network.NiceCXNetwork` and
+:py:class:`~ndex2.cx2.CX2Network` and are used by their
+``get_neighborhood()`` and ``get_interconnectquery()`` methods.
+
+.. versionadded:: 3.12.0
+"""
+
+import re
+from collections import deque
+
+from ndex2 import constants
+from ndex2.exceptions import NDExError
+
+EDGE_LIMIT_EXCEEDED = 'EdgeLimitExceeded'
+"""
+Name of network attribute set to ``'true'`` on a query result
+that was cut off at the edge limit. Also used as the error message,
+this matches what the NDEx server does
+"""
+
+SEARCH_OPERATORS = ['AND', 'OR', 'NOT']
+"""
+Words in a search string that are dropped instead of being treated
+as search terms
+"""
+
+_SEARCH_TERM_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def get_search_terms(search_string):
+    """
+    Splits **search_string** into lower case search terms. Terms
+    are separated by whitespace unless surrounded by double quotes
+    and the operators in :py:const:`SEARCH_OPERATORS` are dropped
+
+    :param search_string: search string such as ``'TP53 MDM2'``
+    :type search_string: str
+    :return: search terms
+    :rtype: list
+    """
+    if search_string is None:
+        return []
+    terms = []
+    for quoted, word in _SEARCH_TERM_RE.findall(search_string):
+        if word in SEARCH_OPERATORS:
+            continue
+        term = quoted if quoted else word
+        term = term.strip().lower()
+        if term:
+            terms.append(term)
+    return terms
+
+
+def build_search_term_index(nodes):
+    """
+    Builds map of lower case search term to ids of nodes matching
+    that term. A node matches its name and its represents. If
+    represents has a prefix, such as ``hgnc:TP53``, the value
+    after the prefix is also matched
+
+    :param nodes: tuples of (node id, name, represents)
+    :type nodes: iterable
+    :return: term => set of node ids
+    :rtype: dict
+    """
+    index = {}
+    for node_id, name, represents in nodes:
+        for value in (name, represents):
+            if value is None:
+                continue
+            term = str(value).lower()
+            index.setdefault(term, set()).add(node_id)
+            if value is represents and ':' in term:
+                index.setdefault(term[term.index(':') + 1:],
+                                 set()).add(node_id)
+    return index
+
+
+def find_node_ids(search_term_index, search_string):
+    """
+    Finds nodes matching any of the terms in **search_string**
+
+    :param search_term_index: index from :py:func:`build_search_term_index`
+    :type search_term_index: dict
+    :param search_string: search string
+    :type search_string: str
+    :return: ids of matching nodes
+    :rtype: set
+    """
+    node_ids = set()
+    for term in get_search_terms(search_string):
+        node_ids.update(search_term_index.get(term, ()))
+    return node_ids
+
+
+def build_node_edge_index(edges):
+    """
+    Builds map of node id to ids of edges that have that
+    node as source or target
+
+    :param edges: edge id => edge with source and target set under
+                  :py:const:`~ndex2.constants.EDGE_SOURCE` and
+                  :py:const:`~ndex2.constants.EDGE_TARGET`
+    :type edges: dict
+    :return: node id => list of edge ids
+    :rtype: dict
+    """
+    index = {}
+    for edge_id, edge in edges.items():
+        index.setdefault(edge.get(constants.EDGE_SOURCE), []).append(edge_id)
+        if edge.get(constants.EDGE_TARGET) != edge.get(constants.EDGE_SOURCE):
+            index.setdefault(edge.get(constants.EDGE_TARGET),
+                             []).append(edge_id)
+    return index
+
+
+def _check_edge_limit(edge_ids, edge_limit, error_when_limit):
+    """
+    Checks if another edge can be added to **edge_ids**
+
+    :raises NDExError: If limit is reached and **error_when_limit** is ``True``
+    :return: ``True`` if limit is reached
+    :rtype: bool
+    """
+    if edge_limit is None or len(edge_ids) < edge_limit:
+        return False
+    if error_when_limit is True:
+        raise NDExError(EDGE_LIMIT_EXCEEDED + ': query result has more than ' +
+                        str(edge_limit) + ' edges')
+    return True
+
+
+def get_neighborhood_element_ids(seed_node_ids, node_edge_index, edges,
+                                 search_depth=1, edge_limit=2500,
+                                 error_when_limit=True):
+    """
+    Breadth first traversal of **search_depth** steps out from
+    **seed_node_ids**, collecting every edge followed along the way
+
+    :param seed_node_ids: ids of nodes to start from
+    :type seed_node_ids: iterable
+    :param node_edge_index: index from :py:func:`build_node_edge_index`
+    :type node_edge_index: dict
+    :param edges: edge id => edge
+    :type edges: dict
+    :param search_depth: number of steps to take
+    :type search_depth: int
+    :param edge_limit: maximum number of edges to collect, ``None`` means
+                       no limit
+    :type edge_limit: int
+    :param error_when_limit: If ``True`` raise an error if there are more
+                             than **edge_limit** edges, otherwise stop
+                             collecting edges at the limit
+    :type error_when_limit: bool
+    :raises NDExError: If there are more than **edge_limit** edges and
+                       **error_when_limit** is ``True``
+    :return: (list of node ids, list of edge ids, ``True`` if edges were
+             left out due to **edge_limit**)
+    :rtype: tuple
+    """
+    node_ids = sorted(seed_node_ids)
+    visited = set(node_ids)
+    edge_ids = []
+    seen_edges = set()
+    frontier = list(node_ids)
+    depth = 0
+    while frontier and depth < search_depth:
+        next_frontier = []
+        for node_id in frontier:
+            for edge_id in node_edge_index.get(node_id, ()):
+                if edge_id in seen_edges:
+                    continue
+                if _check_edge_limit(edge_ids, edge_limit, error_when_limit):
+                    return node_ids, edge_ids, True
+                seen_edges.add(edge_id)
+                edge_ids.append(edge_id)
+                edge = edges[edge_id]
+                for other_id in (edge.get(constants.EDGE_SOURCE),
+                                 edge.get(constants.EDGE_TARGET)):
+                    if other_id not in visited:
+                        visited.add(other_id)
+                        node_ids.append(other_id)
+                        next_frontier.append(other_id)
+        frontier = next_frontier
+        depth += 1
+    return node_ids, edge_ids, False
+
+
+def _get_other_node_id(edge, node_id):
+    """
+    Gets id of node at the other end of **edge** from **node_id**
+    """
+    if edge.get(constants.EDGE_SOURCE) == node_id:
+        return edge.get(constants.EDGE_TARGET)
+    return edge.get(constants.EDGE_SOURCE)
+
+
+def _is_on_interconnect_path(labels, other_labels, search_depth):
+    """
+    Checks if an edge between nodes with **labels** and **other_labels**
+    lies on a path of at most **search_depth** steps between two
+    different starting nodes
+    """
+    for source_id, dist in labels:
+        for other_source_id, other_dist in other_labels:
+            if source_id != other_source_id and \
+                    dist + other_dist + 1 <= search_depth:
+                return True
+    return False
+
+
+def get_interconnect_element_ids(seed_node_ids, node_edge_index, edges,
+                                 search_depth=1, edge_limit=2500,
+                                 error_when_limit=True):
+    """
+    Finds the edges on paths of at most **search_depth** steps that start
+    at one node in **seed_node_ids** and end at a different one
+
+    A single breadth first search is run from all of **seed_node_ids** at
+    once, going at most **search_depth** - 1 steps. Each node reached is
+    labeled with its distance to the two nearest starting nodes, so a
+    node is visited at most twice no matter how many starting nodes can
+    reach it. An edge between two labeled nodes is on such a path if the
+    distance from one starting node to one end of the edge, plus the
+    edge, plus the distance from the other end to a different starting
+    node is at most **search_depth**.
+
+    :param seed_node_ids: ids of nodes paths must start and end at
+    :type seed_node_ids: iterable
+    :param node_edge_index: index from :py:func:`build_node_edge_index`
+    :type node_edge_index: dict
+    :param edges: edge id => edge
+    :type edges: dict
+    :param search_depth: maximum length of path
+    :type search_depth: int
+    :param edge_limit: maximum number of edges to collect, ``None`` means
+                       no limit
+    :type edge_limit: int
+    :param error_when_limit: If ``True`` raise an error if there are more
+                             than **edge_limit** edges, otherwise stop
+                             collecting edges at the limit
+    :type error_when_limit: bool
+    :raises NDExError: If there are more than **edge_limit** edges and
+                       **error_when_limit** is ``True``
+    :return: (list of node ids, list of edge ids, ``True`` if edges were
+             left out due to **edge_limit**)
+    :rtype: tuple
+    """
+    node_ids = sorted(seed_node_ids)
+    labels = {}
+    labeled_node_ids = []
+    queue = deque()
+    for node_id in node_ids:
+        labels[node_id] = [(node_id, 0)]
+        labeled_node_ids.append(node_id)
+        queue.append((node_id, node_id, 0))
+
+    while queue:
+        node_id, source_id, dist = queue.popleft()
+        if dist + 1 >= search_depth:
+            continue
+        for edge_id in node_edge_index.get(node_id, ()):
+            other_id = _get_other_node_id(edges[edge_id], node_id)
+            other_labels = labels.get(other_id)
+            if other_labels is None:
+                labels[other_id] = [(source_id, dist + 1)]
+                labeled_node_ids.append(other_id)
+            elif len(other_labels) < 2 and other_labels[0][0] != source_id:
+                other_labels.append((source_id, dist + 1))
+            else:
+                continue
+            queue.append((other_id, source_id, dist + 1))
+
+    visited = set(node_ids)
+    edge_ids = []
+    seen_edges = set()
+    for node_id in labeled_node_ids:
+        for edge_id in node_edge_index.get(node_id, ()):
+            if edge_id in seen_edges:
+                continue
+            edge = edges[edge_id]
+            other_id = _get_other_node_id(edge, node_id)
+            if other_id == node_id:
+                # self loops are never on a path between two nodes
+                continue
+            other_labels = labels.get(other_id)
+            if other_labels is None or \
+                    not _is_on_interconnect_path(labels[node_id],
+                                                 other_labels, search_depth):
+                continue
+            if _check_edge_limit(edge_ids, edge_limit, error_when_limit):
+                return node_ids, edge_ids, True
+            seen_edges.add(edge_id)
+            edge_ids.append(edge_id)
+            for end_id in (edge.get(constants.EDGE_SOURCE),
+                           edge.get(constants.EDGE_TARGET)):
+                if end_id not in visited:
+                    visited.add(end_id)
+                    node_ids.append(end_id)
+    return node_ids, edge_ids, False
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
 import logging
+import numpy as np
+import pandas as pd
 from ndex2 import constants
 from ndex2.exceptions import NDExError
 
@@ -31,6 +33,64 @@ class DataConverter(object):
         """
         raise NotImplementedError('Must be implemented by subclass')
 
+    def convert_series(self, values=None, datatype=None):
+        """
+        Converts every value in *values*, which all have the same
+        CX *datatype*, to native data type. This implementation calls
+        :py:meth:`convert_value` on each value, subclasses can override
+        it to convert a whole column at once
+
+        .. versionadded:: 3.12.0
+
+        :param values: Values to convert
+        :type values: list or :py:class:`pandas.Series`
+        :param datatype: CX data type which is one of the following:
+                         :py:const:`ndex2.constants.VALID_ATTRIBUTE_DATATYPES`
+        :type datatype: str
+        :return: Converted values, in the same order as *values*
+        :rtype: list
+        """
+        if values is None:
+            return []
+        return [self.convert_value(value=value, datatype=datatype)
+                for value in values]
+
+    def convert_column(self, values=None, datatype=None):
+        """
+        Converts every value in *values* like :py:meth:`convert_series`,
+        but returns the converted values as a :py:class:`numpy.ndarray`.
+        This implementation puts the result of :py:meth:`convert_series`
+        in an array of objects, subclasses can override it to return
+        arrays of numbers or booleans
+
+        .. versionadded:: 3.12.0
+
+        :param values: Values to convert
+        :type values: list or :py:class:`pandas.Series`
+        :param datatype: CX data type which is one of the following:
+                         :py:const:`ndex2.constants.VALID_ATTRIBUTE_DATATYPES`
+        :type datatype: str
+        :return: Converted values, in the same order as *values*
+        :rtype: :py:class:`numpy.ndarray`
+        """
+        return DataConverter._to_object_array(self.convert_series(values=values,
+                                                                  datatype=datatype))
+
+    @staticmethod
+    def _to_object_array(values):
+        """
+        Puts *values* in a :py:class:`numpy.ndarray` of objects, without
+        :py:mod:`numpy` turning values that are lists into a dimension
+
+        :param values: Values
+        :type values: list
+        :rtype: :py:class:`numpy.ndarray`
+        """
+        column = np.empty(len(values), dtype=object)
+        for position, value in enumerate(values):
+            column[position] = value
+        return column
+
 
 class PandasDataConverter(DataConverter):
     """
@@ -45,6 +105,11 @@ class PandasDataConverter(DataConverter):
                    constants.LIST_OF_INTEGER, constants.LIST_OF_LONG,
                    constants.LIST_OF_STRING]
 
+    _BOOLEAN_STRINGS = {'true': True, '1': True, 'false': False, '0': False}
+
+    # kinds of values from pandas.api.types.infer_dtype() numpy can convert
+    _NUMBER_KINDS = ('integer', 'floating', 'mixed-integer-float')
+
     def __init__(self):
         super(DataConverter, self).__init__()
 
@@ -157,3 +222,155 @@ class PandasDataConverter(DataConverter):
 
         raise NDExError(datatype + ' unknown data type, cannot convert: ' + str(value))
 
+    def convert_series(self, values=None, datatype=None):
+        """
+        Converts every value in *values*, which all have the same
+        CX *datatype*, following the same rules as
+        :py:meth:`convert_value`, but converting the whole column at
+        once with :py:meth:`convert_column`. Values are only converted
+        one at a time to report the value that could not be converted
+
+        .. versionadded:: 3.12.0
+
+        Example usage:
+
+        .. code-block:: python
+
+            from ndex2.util import PandasDataConverter
+
+            converter = PandasDataConverter()
+
+            # would output [1.0, 2.5]
+            print(converter.convert_series(['1', 2.5], 'double'))
+
+        :param values: Values to convert
+        :type values: list or :py:class:`pandas.Series`
+        :param datatype: CX data type which is one of the following:
+                         :py:const:`ndex2.constants.VALID_ATTRIBUTE_DATATYPES`
+        :type datatype: str
+        :raises NDExError: If there is an error with conversion
+        :return: Converted values, in the same order as *values*
+        :rtype: list
+        """
+        if values is None:
+            return []
+        return self.convert_column(values=values, datatype=datatype).tolist()
+
+    def convert_column(self, values=None, datatype=None):
+        """
+        Converts every value in *values* like :py:meth:`convert_series`,
+        but returns a :py:class:`numpy.ndarray`. Columns of
+        :py:const:`~ndex2.constants.DOUBLE_DATATYPE`,
+        :py:const:`~ndex2.constants.INTEGER_DATATYPE`,
+        :py:const:`~ndex2.constants.LONG_DATATYPE` and
+        :py:const:`~ndex2.constants.BOOLEAN_DATATYPE` values are converted
+        by :py:mod:`numpy` into arrays of ``float64``, ``int64`` or
+        ``bool``, other columns into arrays of objects. This is used by
+        :py:meth:`~ndex2.nice_cx_network.NiceCXNetwork.to_pandas_dataframe`
+        and :py:meth:`~ndex2.nice_cx_network.NiceCXNetwork.to_node_dataframe`
+
+        .. versionadded:: 3.12.0
+
+        :param values: Values to convert
+        :type values: list or :py:class:`pandas.Series`
+        :param datatype: CX data type which is one of the following:
+                         :py:const:`ndex2.constants.VALID_ATTRIBUTE_DATATYPES`
+        :type datatype: str
+        :raises NDExError: If there is an error with conversion
+        :return: Converted values, in the same order as *values*
+        :rtype: :py:class:`numpy.ndarray`
+        """
+        if values is None:
+            return np.empty(0, dtype=object)
+        column = None
+        # a subclass may have changed how single values are converted
+        if type(self).convert_value is PandasDataConverter.convert_value:
+            lc_datatype = datatype.lower() if isinstance(datatype, str) else datatype
+            try:
+                column = self._convert_column(values, lc_datatype)
+            except (ValueError, TypeError, OverflowError):
+                # convert value by value to raise the error for the value that failed
+                pass
+        if column is None:
+            return self._to_object_array(super(PandasDataConverter, self).convert_series(values=values,
+                                                                                         datatype=datatype))
+        return column
+
+    @staticmethod
+    def _convert_column(values, lc_datatype):
+        """
+        Converts *values* for :py:meth:`convert_column`, with
+        :py:mod:`numpy` where the kind of values allows it
+
+        :param lc_datatype: CX data type in lower case
+        :type lc_datatype: str
+        :raises ValueError: If a value cannot be converted
+        :return: Converted values or ``None`` if *lc_datatype* is unknown
+        :rtype: :py:class:`numpy.ndarray`
+        """
+        if lc_datatype in PandasDataConverter.LIST_DTYPES:
+            return DataConverter._to_object_array([','.join(map(str, value)) if isinstance(value, list)
+                                                   else str(value) for value in values])
+
+        # kind of values, such as 'string', 'integer', 'floating' or 'mixed'
+        kind = pd.api.types.infer_dtype(values, skipna=False)
+        if kind in PandasDataConverter._NUMBER_KINDS or kind == 'boolean':
+            if lc_datatype == constants.DOUBLE_DATATYPE:
+                return np.asarray(values, dtype=np.float64)
+            if lc_datatype == constants.BOOLEAN_DATATYPE:
+                if kind == 'boolean':
+                    return np.asarray(values, dtype=bool)
+                return np.asarray(values) != 0
+            if kind == 'integer' or kind == 'boolean':
+                if lc_datatype == constants.INTEGER_DATATYPE or \
+                        lc_datatype == constants.LONG_DATATYPE:
+                    return np.asarray(values, dtype=np.int64)
+
+        column = np.asarray(values, dtype=object)
+        if column.ndim != 1:
+            raise ValueError('values must not be lists')
+
+        if lc_datatype is None or lc_datatype == constants.STRING_DATATYPE:
+            if kind == 'string':
+                return column
+            return DataConverter._to_object_array(list(map(str, values)))
+
+        if lc_datatype == constants.BOOLEAN_DATATYPE:
+            if kind != 'string':
+                return np.fromiter(map(PandasDataConverter._to_boolean, values),
+                                   dtype=bool, count=len(values))
+            is_true = (column == 'true') | (column == '1')
+            known = is_true | (column == 'false') | (column == '0') | (column == '')
+            if not known.all():
+                # other spellings, such as 'TRUE'
+                unknown = np.flatnonzero(~known)
+                is_true[unknown] = [PandasDataConverter._to_boolean(value)
+                                    for value in column[unknown]]
+            return is_true
+
+        if lc_datatype == constants.DOUBLE_DATATYPE or \
+                lc_datatype == constants.INTEGER_DATATYPE or \
+                lc_datatype == constants.LONG_DATATYPE:
+            if kind != 'string' and any(value is None for value in values):
+                # numpy would turn None into NaN instead of failing
+                raise TypeError('None is not a number')
+            # casting objects calls float() or int() on each value
+            if lc_datatype == constants.DOUBLE_DATATYPE:
+                return column.astype(np.float64)
+            return column.astype(np.int64)
+        return None
+
+    @staticmethod
+    def _to_boolean(value):
+        """
+        Converts *value* to :py:class:`bool` as :py:meth:`convert_value`
+        does for :py:const:`~ndex2.constants.BOOLEAN_DATATYPE`
+
+        :rtype: bool
+        """
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            return PandasDataConverter._BOOLEAN_STRINGS.get(value.lower(),
+                                                            bool(value))
+        return bool(value)
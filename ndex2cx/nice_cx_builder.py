@@ -177,6 +177,69 @@ class NiceCXBuilder(object):
 
         return edge_id
 
+    def add_nodes(self, names, represents=None):
+        """
+        Adds a node for each name, like :py:func:`add_node` does for one
+        name. Names that already have a node keep that node and its represents
+
+        .. versionadded:: 3.12.0
+
+        :param names: Names of the nodes
+        :type names: list
+        :param represents: Representation of each node, in the same order as **names**
+        :type represents: list
+        :return: Node ID for each name
+        :rtype: list
+        """
+        if represents is None:
+            represents = [None] * len(names)
+
+        node_ids = []
+        for name, node_represents in zip(names, represents):
+            node = self.node_inventory.get(name)
+            if node is None:
+                node = {'@id': self.node_id_counter, 'n': name}
+                if node_represents:
+                    node['r'] = node_represents
+                self.node_inventory[name] = node
+                self.node_id_counter += 1
+            node_ids.append(node['@id'])
+
+        if self.node_id_counter - 1 > self.max_node_id:
+            self.max_node_id = self.node_id_counter - 1
+        return node_ids
+
+    def add_edges(self, ids, sources, targets, interactions):
+        """
+        Adds an edge for each id, like :py:func:`add_edge` does for one
+        edge. An edge replaces any edge added before with the same id
+
+        .. versionadded:: 3.12.0
+
+        :param ids: Edge id of each edge
+        :type ids: list
+        :param sources: Source node id of each edge
+        :type sources: list
+        :param targets: Target node id of each edge
+        :type targets: list
+        :param interactions: Interaction of each edge, ``interacts-with``
+                             is used where it is empty
+        :type interactions: list
+        :return: IDs of the edges that replaced an edge with the same id
+        :rtype: list
+        """
+        replaced = []
+        for edge_id, source, target, interaction in zip(ids, sources, targets,
+                                                        interactions):
+            if edge_id in self.edge_inventory:
+                replaced.append(edge_id)
+            self.edge_inventory[edge_id] = {
+                '@id': edge_id, 's': source, 't': target,
+                'i': interaction if interaction else 'interacts-with'}
+            if edge_id > self.max_edge_id:
+                self.max_edge_id = edge_id
+        return replaced
+
     def add_node_attribute(self, property_of, name, values, type=None):
         """
         Set an attribute of a node, where the node may be specified by its id or passed in as a node dict.
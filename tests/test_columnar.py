@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for `columnar` module."""
+
+import os
+import unittest
+
+import numpy as np
+
+from ndex2.cx2 import CX2Network
+from ndex2.columnar import ColumnarCX2Network, from_cx2network
+from ndex2.exceptions import NDExAlreadyExists, NDExError, NDExNotFoundError, \
+    NDExInvalidParameterError, NDExInvalidCX2Error
+
+SKIP_REASON = 'NDEX2_TEST_SERVER environment variable detected, ' \
+              'skipping for integration tests'
+
+
+@unittest.skipIf(os.getenv('NDEX2_TEST_SERVER') is not None, SKIP_REASON)
+class TestColumnar(unittest.TestCase):
+
+    TEST_DIR = os.path.dirname(__file__)
+    DEMO_CX2_FILE = os.path.join(TEST_DIR, 'data', 'demo.cx2')
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        pass
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        pass
+
+    def test_from_cx2network_none(self):
+        try:
+            from_cx2network(None)
+            self.fail('Expected NDExError')
+        except NDExError as ne:
+            self.assertEqual('network is None', str(ne))
+
+    def test_round_trip_demo_network(self):
+        net = CX2Network()
+        net.create_from_raw_cx2(self.DEMO_CX2_FILE)
+        columnar = from_cx2network(net)
+        self.assertEqual(len(net.get_nodes()), len(columnar.get_nodes()))
+        self.assertEqual(len(net.get_edges()), len(columnar.get_edges()))
+        for node_id, node in net.get_nodes().items():
+            self.assertEqual(node, columnar.get_node(node_id))
+        for edge_id, edge in net.get_edges().items():
+            self.assertEqual(edge, columnar.get_edge(edge_id))
+        self.assertEqual(net.to_cx2(), columnar.to_cx2network().to_cx2())
+
+    def test_add_and_get(self):
+        net = ColumnarCX2Network()
+        self.assertEqual(0, net.add_node(attributes={'name': 'A', 'score': 1.5,
+                                                     'tags': ['x', 'y']}, x=1, y=2))
+        self.assertEqual(5, net.add_node(node_id=5, attributes={'name': 'B'}))
+        self.assertEqual(2, net.add_node(node_id='2'))
+        self.assertEqual(7, net.add_node())
+        self.assertEqual({'id': 0, 'v': {'name': 'A', 'score': 1.5, 'tags': ['x', 'y']},
+                          'x': 1.0, 'y': 2.0, 'z': None}, net.get_node(0))
+        self.assertEqual({'id': 2, 'v': {}, 'x': None, 'y': None, 'z': None}, net.get_node(2))
+        self.assertIsNone(net.get_node(3))
+        self.assertEqual([0, 5, 2, 7], list(net.get_nodes()))
+        self.assertTrue(5 in net.get_nodes())
+        self.assertEqual({'name': {'d': 'string'}, 'score': {'d': 'double'},
+                          'tags': {'d': 'list_of_string'}},
+                         net.get_attribute_declarations()['nodes'])
+        try:
+            net.add_node(node_id=5)
+            self.fail('Expected NDExAlreadyExists')
+        except NDExAlreadyExists as ne:
+            self.assertEqual('Node with ID 5 already exists.', str(ne))
+
+        self.assertEqual(0, net.add_edge(source=0, target='5',
+                                         attributes={'interaction': 'binds'}))
+        self.assertEqual({'id': 0, 's': 0, 't': 5, 'v': {'interaction': 'binds'}},
+                         net.get_edge(0))
+        try:
+            net.add_edge(source=0)
+            self.fail('Expected NDExError')
+        except NDExError as ne:
+            self.assertEqual('Edge must have source and target', str(ne))
+        sources, targets = net.get_edge_endpoints()
+        self.assertEqual([0], sources.tolist())
+        self.assertEqual([5], targets.tolist())
+
+        cx2_net = net.to_cx2network()
+        self.assertEqual(net.get_node(0), cx2_net.get_node(0))
+        self.assertEqual(8, cx2_net.add_node())
+
+    def test_attribute_values(self):
+        net = ColumnarCX2Network()
+        net.add_node(attributes={'name': 'A', 'score': 1.0})
+        net.add_node(attributes={'name': 'B'})
+        net.add_node(attributes={'name': 'A', 'score': 3.0})
+
+        scores = net.get_attribute_values('nodes', 'score')
+        self.assertEqual(np.float64, scores.dtype)
+        self.assertEqual([1.0, None, 3.0], scores.tolist())
+        self.assertEqual(['A', 'B', 'A'],
+                         net.get_attribute_values('nodes', 'name').tolist())
+        self.assertEqual([0, 1, 2], net.get_ids('nodes').tolist())
+
+        net.set_attribute_values('nodes', 'score', scores * 2)
+        self.assertEqual({'name': 'A', 'score': 2.0}, net.get_node(0)['v'])
+        self.assertEqual({'name': 'B'}, net.get_node(1)['v'])
+
+        net.set_attribute_values('nodes', 'score', [1, 2, None])
+        self.assertEqual(2.0, net.get_node(1)['v']['score'])
+        self.assertEqual({'name': 'A'}, net.get_node(2)['v'])
+
+        net.set_attribute_values('nodes', 'rank', np.array([3, 2, 1]))
+        self.assertEqual({'d': 'integer'},
+                         net.get_attribute_declarations()['nodes']['rank'])
+        self.assertEqual(1, net.get_node(2)['v']['rank'])
+
+        try:
+            net.get_attribute_values('nodes', 'foo')
+            self.fail('Expected NDExNotFoundError')
+        except NDExNotFoundError as ne:
+            self.assertEqual('No nodes have attribute foo', str(ne))
+        try:
+            net.set_attribute_values('nodes', 'score', [1.0])
+            self.fail('Expected NDExInvalidParameterError')
+        except NDExInvalidParameterError as ne:
+            self.assertEqual('Expected 3 values, got 1', str(ne))
+        try:
+            net.set_attribute_values('nodes', 'score', ['x', 'y', 'z'])
+            self.fail('Expected NDExInvalidCX2Error')
+        except NDExInvalidCX2Error:
+            pass
+        try:
+            net.get_ids('foo')
+            self.fail('Expected NDExInvalidParameterError')
+        except NDExInvalidParameterError as ne:
+            self.assertTrue('aspect_name must be' in str(ne))
+
+    def test_uses_less_memory(self):
+        net = CX2Network()
+        for i in range(1000):
+            net.add_node(attributes={'name': 'node' + str(i % 10), 'score': float(i)})
+        columnar = from_cx2network(net)
+        # 8 bytes id, 8 bytes score, 4 bytes name code, 3 doubles and 5 masks
+        self.assertEqual(1000 * (8 + 8 + 4 + 24 + 5), columnar.get_nbytes())
+        self.assertEqual(net.to_cx2(), columnar.to_cx2network().to_cx2())
@@ -169,3 +169,130 @@ class TestCreateNiceCXNetworkFromNetworkX(unittest.TestCase):
                                   'i': 'hurts'}, edge)
             else:
                 self.fail('Unexpected edge: ' + str(edge))
+
+    def test_create_nice_cx_from_pandas_with_attributes(self):
+        df = pd.DataFrame({'source': ['A', 'B', 'A'],
+                           'target': ['B', 'C', 'C'],
+                           'interaction': ['helps', '', 'hurts'],
+                           'weight': [0.5, float('nan'), float('inf')],
+                           'count': [1, 2, 3],
+                           'srep': ['uniprot:A', 'uniprot:B', 'uniprot:X'],
+                           'stype': ['protein', 'gene', 'complex'],
+                           'ttype': ['gene', 'rna', 'rna']},
+                          index=[10, 11, 12])
+
+        net = ndex2.create_nice_cx_from_pandas(df, source_field='source',
+                                               target_field='target',
+                                               source_node_attr=['stype'],
+                                               target_node_attr=['ttype'],
+                                               edge_attr=['weight', 'count'],
+                                               edge_interaction='interaction',
+                                               source_represents='srep')
+        self.assertEqual({0: {'@id': 0, 'n': 'A', 'r': 'uniprot:A'},
+                          1: {'@id': 1, 'n': 'B', 'r': 'B'},
+                          2: {'@id': 2, 'n': 'C', 'r': 'C'}},
+                         dict(net.get_nodes()))
+        self.assertEqual({10: {'@id': 10, 's': 0, 't': 1, 'i': 'helps'},
+                          11: {'@id': 11, 's': 1, 't': 2,
+                               'i': 'interaction'},
+                          12: {'@id': 12, 's': 0, 't': 2, 'i': 'hurts'}},
+                         dict(net.get_edges()))
+
+        # first row a node appears in sets its attributes
+        self.assertEqual('protein', net.get_node_attribute_value(0, 'stype'))
+        self.assertEqual('gene', net.get_node_attribute_value(1, 'ttype'))
+        self.assertEqual('gene', net.get_node_attribute_value(1, 'stype'))
+        self.assertEqual('rna', net.get_node_attribute_value(2, 'ttype'))
+        self.assertEqual('string',
+                         net.get_node_attribute(0, 'stype')['d'])
+
+        self.assertEqual({'po': 10, 'n': 'weight', 'v': 0.5, 'd': 'double'},
+                         net.get_edge_attribute(10, 'weight'))
+        self.assertEqual((None, None),
+                         net.get_edge_attribute(11, 'weight'))
+        self.assertEqual('INFINITY',
+                         net.get_edge_attribute_value(12, 'weight'))
+        self.assertEqual({'po': 11, 'n': 'count', 'v': 2, 'd': 'integer'},
+                         net.get_edge_attribute(11, 'count'))
+
+    def test_create_nice_cx_from_pandas_with_nullable_column(self):
+        df = pd.DataFrame({'source': ['A', 'B'],
+                           'target': ['B', 'C'],
+                           'count': pd.Series([1, None], dtype='Int64')})
+        net = ndex2.create_nice_cx_from_pandas(df, source_field='source',
+                                               target_field='target',
+                                               source_node_attr=['count'],
+                                               edge_attr=['count'])
+        # missing values are NaN as in rows from DataFrame.iterrows()
+        self.assertEqual({'po': 0, 'n': 'count', 'v': 1, 'd': 'integer'},
+                         net.get_edge_attribute(0, 'count'))
+        self.assertEqual((None, None), net.get_edge_attribute(1, 'count'))
+        self.assertEqual('nan', net.get_node_attribute_value(1, 'count'))
+
+    def test_create_nice_cx_from_pandas_with_citation(self):
+        df = pd.DataFrame({'source': ['A', 'B'],
+                           'target': ['B', 'C'],
+                           'citation': ['pmid:1', 'pmid:2']})
+        net = ndex2.create_nice_cx_from_pandas(df, source_field='source',
+                                               target_field='target',
+                                               source_node_attr=['citation'],
+                                               edge_attr=['citation'])
+        self.assertEqual({'po': 0, 'n': 'citation', 'v': "['pmid:1']",
+                          'd': 'list_of_string'},
+                         net.get_node_attribute(0, 'citation'))
+        self.assertEqual({'po': 1, 'n': 'citation', 'v': ['pmid:2'],
+                          'd': 'list_of_string'},
+                         net.get_edge_attribute(1, 'citation'))
+
+    def test_create_nice_cx_from_pandas_with_chunks(self):
+        df = pd.DataFrame({'source': ['A', 'B', 'A', 'D'],
+                           'target': ['B', 'C', 'C', 'A'],
+                           'stype': ['protein', 'gene', 'complex', 'rna'],
+                           'ttype': ['gene', 'rna', 'rna', 'dna'],
+                           'weight': [0.5, 0.6, 0.7, 0.8]})
+        args = {'source_field': 'source', 'target_field': 'target',
+                'source_node_attr': ['stype'], 'target_node_attr': ['ttype'],
+                'edge_attr': ['weight']}
+        net = ndex2.create_nice_cx_from_pandas(df, **args)
+        chunked_net = ndex2.create_nice_cx_from_pandas((df.iloc[i:i + 2] for i
+                                                        in range(0, 4, 2)),
+                                                       **args)
+        self.assertEqual({0: {'@id': 0, 'n': 'A', 'r': 'A'},
+                          1: {'@id': 1, 'n': 'B', 'r': 'B'},
+                          2: {'@id': 2, 'n': 'C', 'r': 'C'},
+                          3: {'@id': 3, 'n': 'D', 'r': 'D'}},
+                         dict(chunked_net.get_nodes()))
+
+        # the first chunk a node appears in sets its attributes
+        self.assertEqual('protein',
+                         chunked_net.get_node_attribute_value(0, 'stype'))
+        self.assertEqual('rna',
+                         chunked_net.get_node_attribute_value(2, 'ttype'))
+        self.assertEqual(net.to_cx(), chunked_net.to_cx())
+
+    def test_create_nice_cx_from_pandas_with_chunks_of_different_row_types(self):
+        # all numbers in the first chunk, so rows there are cast to float
+        first = pd.DataFrame({'s': [1, 2], 't': [2, 3],
+                              'note': [float('nan'), float('nan')]})
+        second = pd.DataFrame({'s': [1], 't': [3], 'note': ['x']},
+                              index=[2])
+        args = {'source_field': 's', 'target_field': 't',
+                'edge_attr': ['note']}
+        chunked_net = ndex2.create_nice_cx_from_pandas([first, second],
+                                                       **args)
+        net = ndex2.create_nice_cx_from_pandas(pd.concat([first, second]),
+                                               **args)
+        self.assertEqual(['1', '2', '3'],
+                         [node['n'] for node_id, node in
+                          chunked_net.get_nodes()])
+        self.assertEqual({'@id': 2, 's': 0, 't': 2, 'i': 'interacts-with'},
+                         chunked_net.get_edge(2))
+        self.assertEqual(net.to_cx(), chunked_net.to_cx())
+
+    def test_create_nice_cx_from_pandas_with_numeric_sif(self):
+        df = pd.DataFrame({'a': [1, 2], 'b': [2, 3]})
+        net = ndex2.create_nice_cx_from_pandas(df)
+        self.assertEqual(['1', '2', '3'],
+                         [node['n'] for node_id, node in net.get_nodes()])
+        for edge_id, edge in net.get_edges():
+            self.assertEqual('interacts-with', edge['i'])
@@ -1,11 +1,17 @@
 import unittest
 import os
+import io
+import copy
+import gzip
 import json
 import tempfile
 import shutil
 
 import networkx as nx
+import numpy as np
 import pandas as pd
+import requests
+import requests_mock
 
 from ndex2 import constants
 
@@ -13,7 +19,7 @@ from ndex2.cx2 import CX2Network, convert_value, NoStyleCXToCX2NetworkFactory, P
 from ndex2.cx2 import NetworkXToCX2NetworkFactory
 from ndex2.cx2 import CX2NetworkPandasDataFrameFactory
 from ndex2.exceptions import NDExAlreadyExists, NDExError
-from ndex2.exceptions import NDExInvalidCX2Error, NDExNotFoundError
+from ndex2.exceptions import NDExInvalidCX2Error, NDExNotFoundError, NDExInvalidParameterError
 
 
 class TestCX2Network(unittest.TestCase):
@@ -55,6 +61,53 @@ class TestCX2Network(unittest.TestCase):
         self.assertIsNotNone(self.cx2_obj.get_attribute_declarations())
         self.assertGreater(len(self.cx2_obj.get_nodes()), 0)
 
+    def test_create_from_raw_cx2_from_file_object(self):
+        expected = CX2Network()
+        expected.create_from_raw_cx2(self.sample_file)
+        with open(self.sample_file, 'rb') as f:
+            self.cx2_obj.create_from_raw_cx2(f)
+        self.assertEqual(expected.to_cx2(), self.cx2_obj.to_cx2())
+
+        with open(self.sample_file, 'r') as f:
+            text_network = CX2Network()
+            text_network.create_from_raw_cx2(io.StringIO(f.read()))
+        self.assertEqual(expected.to_cx2(), text_network.to_cx2())
+
+    def test_create_from_raw_cx2_from_http_response(self):
+        cx2 = [{"CXVersion": "2.0", "hasFragments": False},
+               {"nodes": [{"id": 3, "v": {"name": "A"}, "x": 1.5}]}]
+        with requests_mock.mock() as m:
+            m.get('http://foo/network', text=json.dumps(cx2))
+            self.cx2_obj.create_from_raw_cx2(requests.get('http://foo/network', stream=True))
+        self.assertEqual({"id": 3, "v": {"name": "A"}, "x": 1.5, "y": None, "z": None},
+                         self.cx2_obj.get_node(3))
+
+    def test_create_from_raw_cx2_declarations_after_nodes(self):
+        cx2 = [{"CXVersion": "2.0", "hasFragments": True},
+               {"nodes": [{"id": 1, "v": {"n": "A", "size": "2"}}]},
+               {"networkAttributes": [{"name": "net"}]},
+               {"attributeDeclarations": [{"nodes": {"name": {"d": "string", "a": "n"},
+                                                     "size": {"d": "integer"}}}]},
+               {"attributeDeclarations": [{"edges": {"interaction": {"d": "string", "v": "pp"}}}]},
+               {"nodes": [{"id": 2, "v": {"n": "B", "size": 3}}]},
+               {"edges": [{"id": 0, "s": 1, "t": 2}]},
+               {"networkAttributes": [{"description": "fragment"}]}]
+        for cx2_data in (cx2, io.BytesIO(json.dumps(cx2).encode('utf-8'))):
+            net = CX2Network()
+            net.create_from_raw_cx2(cx2_data)
+            self.assertEqual({"name": "A", "size": 2}, net.get_node(1)["v"])
+            self.assertEqual({"interaction": "pp"}, net.get_edge(0)["v"])
+            self.assertEqual({"name": "net", "description": "fragment"}, net.get_network_attributes())
+            self.assertEqual({"name": {"d": "string", "a": "n"}, "size": {"d": "integer"}},
+                             net.get_attribute_declarations()["nodes"])
+
+    def test_create_from_raw_cx2_invalid_json(self):
+        for invalid in (b'{"nodes": []}', b'[1]', b'[{"nodes": [{"id": 1}'):
+            with self.assertRaises(NDExInvalidCX2Error):
+                CX2Network().create_from_raw_cx2(io.BytesIO(invalid))
+        with self.assertRaises(NDExError):
+            self.cx2_obj.create_from_raw_cx2(None)
+
     def test_invalid_input_create_from_raw_cx2(self):
         with self.assertRaises(NDExInvalidCX2Error):
             self.cx2_obj.create_from_raw_cx2(12345)
@@ -75,6 +128,157 @@ class TestCX2Network(unittest.TestCase):
         finally:
             shutil.rmtree(temp_dir)
 
+    def test_write_cx2(self):
+        self.cx2_obj.create_from_raw_cx2(self.sample_file)
+        self.cx2_obj.set_attribute_declarations({"nodes": {"name": {"d": "string", "a": "n"}},
+                                                 "edges": {}})
+        self.cx2_obj.add_node(attributes={"name": "extra", "tags": ["a", "b"]}, x=1.0)
+        expected = json.dumps(self.cx2_obj.copy().to_cx2(), indent=4)
+
+        output = io.StringIO()
+        self.cx2_obj.copy().write_cx2(output, indent=4)
+        self.assertEqual(expected, output.getvalue())
+        self.assertIn('"n": "extra"', output.getvalue())
+
+        output = io.BytesIO()
+        self.cx2_obj.copy().write_cx2(output)
+        self.assertEqual(json.dumps(self.cx2_obj.copy().to_cx2()).encode('utf-8'), output.getvalue())
+
+        output = io.BytesIO()
+        self.cx2_obj.copy().write_cx2(output, compress='gzip')
+        self.assertEqual(self.cx2_obj.copy().to_cx2(), json.loads(gzip.decompress(output.getvalue())))
+
+        chunks = list(self.cx2_obj.copy().iter_cx2(indent=4, chunk_size=1024))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(expected.encode('utf-8'), b''.join(chunks))
+
+        with self.assertRaises(NDExInvalidParameterError):
+            self.cx2_obj.write_cx2(io.BytesIO(), compress='zip')
+
+    def test_write_cx2_empty_network(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            test_out = os.path.join(temp_dir, 'test_output.cx2')
+            self.cx2_obj.write_cx2(test_out, indent=2)
+            with open(test_out, 'r') as f:
+                self.assertEqual(json.dumps(self.cx2_obj.to_cx2(), indent=2), f.read())
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_to_cx2_does_not_share_attributes(self):
+        self.cx2_obj.add_node(0, attributes={"tags": ["a"]})
+        node = self.cx2_obj.to_cx2()[3]["nodes"][0]
+        node["v"]["tags"].append("b")
+        node["v"]["name"] = "changed"
+        self.assertEqual({"tags": ["a"]}, self.cx2_obj.get_node(0)["v"])
+
+    def test_to_cx2_leaves_out_default_values_when_optimized(self):
+        self.cx2_obj.set_attribute_declarations({"nodes": {"type": {"d": "string", "v": "protein"},
+                                                           "size": {"d": "double", "v": 2}}})
+        self.cx2_obj.add_node(0, attributes={"name": "A"})
+        self.cx2_obj.add_node(1, attributes={"name": "B", "type": "gene", "size": 3})
+        nodes = self.cx2_obj.to_cx2()[3]["nodes"]
+        self.assertEqual({"name": "A", "type": "protein", "size": 2.0}, nodes[0]["v"])
+        self.assertEqual({"name": "B", "type": "gene", "size": 3.0}, nodes[1]["v"])
+        output = io.StringIO()
+        self.cx2_obj.write_cx2(output)
+        self.assertEqual(nodes, json.loads(output.getvalue())[3]["nodes"])
+
+        nodes = self.cx2_obj.to_cx2(optimize=True)[3]["nodes"]
+        self.assertEqual({"name": "A"}, nodes[0]["v"])
+        self.assertEqual({"name": "B", "type": "gene", "size": 3.0}, nodes[1]["v"])
+
+    def test_optimize_declarations(self):
+        for node_id in range(4):
+            self.cx2_obj.add_node(node_id, attributes={"name": "node" + str(node_id),
+                                                       "represents": "uniprot:P0" + str(node_id),
+                                                       "type": "protein" if node_id < 3 else "gene",
+                                                       "active": False})
+        self.cx2_obj.add_node(4, attributes={"name": "node4", "represents": "uniprot:P04", "type": "protein",
+                                             "active": False, "source": "curated"})
+        self.cx2_obj.add_edge(0, 0, 1, attributes={"interaction": "interacts-with"})
+        self.cx2_obj.add_edge(1, 1, 2, attributes={"interaction": "interacts-with"})
+        self.cx2_obj.add_edge(2, 2, 3)
+        expected_nodes = copy.deepcopy(self.cx2_obj.get_nodes())
+        expected_edges = copy.deepcopy(self.cx2_obj.get_edges())
+        before = json.dumps(self.cx2_obj.to_cx2())
+
+        declarations = copy.deepcopy(self.cx2_obj.get_attribute_declarations())
+        optimized = self.cx2_obj.optimize_declarations()
+        # type is left on one node only, too few for an alias to pay off
+        self.assertEqual({"nodes": {"name": {"d": "string", "a": "c"},
+                                    "represents": {"d": "string", "a": "a"},
+                                    "type": {"d": "string", "v": "protein"},
+                                    "active": {"d": "boolean", "a": "b"},
+                                    "source": {"d": "string"}},
+                          "edges": {"interaction": {"d": "string", "a": "a"}}}, optimized)
+        # the network is not changed
+        self.assertEqual(declarations, self.cx2_obj.get_attribute_declarations())
+        self.assertEqual(expected_nodes, self.cx2_obj.get_nodes())
+        self.assertEqual(before, json.dumps(self.cx2_obj.to_cx2()))
+
+        after = self.cx2_obj.to_cx2(optimize=True)
+        self.assertLess(len(json.dumps(after)), len(before))
+        self.assertEqual({"nodes": optimized["nodes"], "edges": optimized["edges"]},
+                         after[2]["attributeDeclarations"][0])
+        self.assertEqual({"a": "uniprot:P00", "b": False, "c": "node0"}, after[3]["nodes"][0]["v"])
+
+        net = CX2Network()
+        net.create_from_raw_cx2(after)
+        self.assertEqual(expected_nodes, net.get_nodes())
+        self.assertEqual(expected_edges, net.get_edges())
+
+        # write_cx2 and iter_cx2 write the same
+        output = io.StringIO()
+        self.cx2_obj.write_cx2(output, optimize=True)
+        self.assertEqual(after, json.loads(output.getvalue()))
+        self.assertEqual(after, json.loads(b''.join(self.cx2_obj.iter_cx2(optimize=True))))
+
+    def test_optimize_declarations_after_edits(self):
+        for node_id in range(4):
+            self.cx2_obj.add_node(node_id, attributes={"name": "node" + str(node_id), "type": "protein"})
+        self.cx2_obj.to_cx2(optimize=True)
+        self.cx2_obj.optimize_declarations()
+
+        # type was on every node, it must not be set on nodes without it
+        self.cx2_obj.remove_node_attribute(0, "type")
+        self.cx2_obj.add_node(4, attributes={"name": "node4"})
+        self.cx2_obj.add_node(5, attributes={"c": "protein"})
+        self.assertEqual({"name": "node4"}, self.cx2_obj.get_node(4)["v"])
+        self.assertEqual({"c": "protein"}, self.cx2_obj.get_node(5)["v"])
+        expected_nodes = copy.deepcopy(self.cx2_obj.get_nodes())
+
+        for optimize in (False, True):
+            net = CX2Network()
+            net.create_from_raw_cx2(self.cx2_obj.to_cx2(optimize=optimize))
+            self.assertEqual(expected_nodes, net.get_nodes())
+
+    def test_optimize_declarations_keeps_declared(self):
+        for node_id in range(3):
+            self.cx2_obj.add_node(node_id, attributes={"name": "node" + str(node_id), "type": "protein"})
+        self.cx2_obj.set_attribute_declarations({"nodes": {"name": {"d": "string", "a": "n"},
+                                                           "type": {"d": "string"}}})
+        optimized = self.cx2_obj.optimize_declarations()
+        self.assertEqual({"nodes": {"name": {"d": "string", "a": "n"},
+                                    "type": {"d": "string", "v": "protein"}}}, optimized)
+        self.assertEqual(optimized, self.cx2_obj.optimize_declarations())
+        self.assertEqual({"name": {"d": "string", "a": "n"}, "type": {"d": "string"}},
+                         self.cx2_obj.get_attribute_declarations()["nodes"])
+
+    def test_optimize_declarations_leaves_unused_declarations_in_network(self):
+        self.cx2_obj.set_attribute_declarations({"nodes": {"unused": {"d": "integer"}}})
+        self.cx2_obj.add_node(0, attributes={"name": "A"})
+        self.cx2_obj.add_node(1, attributes={"name": "B"})
+        self.assertEqual({"nodes": {"name": {"d": "string"}}}, self.cx2_obj.optimize_declarations())
+        self.assertEqual({"unused": {"d": "integer"}, "name": {"d": "string"}},
+                         self.cx2_obj.get_attribute_declarations()["nodes"])
+        self.cx2_obj.add_node(2, attributes={"unused": "5"})
+        self.assertEqual(5, self.cx2_obj.get_node(2)["v"]["unused"])
+
+    def test_optimize_declarations_empty_network(self):
+        self.assertEqual({}, self.cx2_obj.optimize_declarations())
+        self.assertEqual(self.cx2_obj.to_cx2(), self.cx2_obj.to_cx2(optimize=True))
+
     def test_to_cx2(self):
         self.cx2_obj.create_from_raw_cx2(self.sample_file)
         cx2_data = self.cx2_obj.to_cx2()
@@ -120,6 +324,45 @@ class TestCX2Network(unittest.TestCase):
         processed = self.cx2_obj._process_attributes("nodes", attributes["v"])
         self.assertEqual(processed.get("annot"), "example")
 
+    def test_process_attributes_after_declarations_change(self):
+        self.cx2_obj.set_attribute_declarations({"nodes": {"annot": {"d": "string", "v": "example"}}})
+        self.assertEqual({"annot": "example"}, self.cx2_obj._process_attributes("nodes", {}))
+
+        self.cx2_obj.set_attribute_declarations({"nodes": {"annot": {"d": "integer", "a": "a1", "v": "5"}}})
+        self.assertEqual({"annot": 7}, self.cx2_obj._process_attributes("nodes", {"a1": "7"}))
+        self.assertEqual({"annot": 5}, self.cx2_obj._process_attributes("nodes", {}))
+
+        # new attributes are declared and converted as declared afterwards
+        self.assertEqual({"annot": 5, "score": 1.5},
+                         self.cx2_obj._process_attributes("nodes", {"score": 1.5}))
+        self.assertEqual({"d": "double"}, self.cx2_obj.get_attribute_declarations()["nodes"]["score"])
+        self.assertEqual({"annot": 5, "score": 2.0},
+                         self.cx2_obj._process_attributes("nodes", {"score": "2"}))
+
+        self.cx2_obj.rename_attribute("nodes", "score", "weight")
+        self.assertEqual({"annot": 5, "weight": 3.0},
+                         self.cx2_obj._process_attributes("nodes", {"weight": "3"}))
+        self.assertNotIn("score", self.cx2_obj.get_attribute_declarations()["nodes"])
+
+        # declarations removed directly are noticed too
+        del self.cx2_obj.get_attribute_declarations()["nodes"]["weight"]
+        self.assertEqual({"annot": 5, "weight": "3"},
+                         self.cx2_obj._process_attributes("nodes", {"weight": "3"}))
+        self.assertEqual({"d": "string"}, self.cx2_obj.get_attribute_declarations()["nodes"]["weight"])
+
+        # as are declarations changed in place, even through a dict held on to
+        declarations = self.cx2_obj.get_attribute_declarations()["nodes"]
+        self.assertEqual({"annot": 5, "weight": "3"},
+                         self.cx2_obj._process_attributes("nodes", {"weight": "3"}))
+        declarations["weight"]["d"] = "double"
+        self.assertEqual({"annot": 5, "weight": 3.0},
+                         self.cx2_obj._process_attributes("nodes", {"weight": "3"}))
+        declarations["annot"]["a"] = "a2"
+        declarations["annot"]["v"] = "6"
+        self.assertEqual({"annot": 8},
+                         self.cx2_obj._process_attributes("nodes", {"a2": "8"}))
+        self.assertEqual({"annot": 6}, self.cx2_obj._process_attributes("nodes", {}))
+
     def test_translate_network_attributes_to_cx2(self):
         factory = NoStyleCXToCX2NetworkFactory()
         network_attributes = [{"n": "name1", "v": "value1"}, {"n": "name2", "v": "value2"}]
@@ -249,6 +492,51 @@ class TestCX2Network(unittest.TestCase):
         self.assertIsNone(self.cx2_obj.get_node(1))
         self.assertIsNone(self.cx2_obj.get_edge(1))
 
+    def test_remove_node_with_several_edges(self):
+        net = CX2Network()
+        for node_id in range(4):
+            net.add_node(node_id)
+        net.add_edge(source=0, target=1)
+        net.add_edge(source=2, target=0)
+        net.add_edge(source=0, target=0)
+        kept_edge = net.add_edge(source=1, target=2)
+        self.assertEqual(3, net.get_degree(1, direction='in') + net.get_degree(2))
+        net.remove_node(0)
+        self.assertEqual([kept_edge], list(net.get_edges().keys()))
+        self.assertEqual([kept_edge], net.get_out_edges(1))
+        self.assertEqual([], net.get_in_edges(1))
+
+    def test_get_neighbors_and_degree(self):
+        net = CX2Network()
+        for node_id in range(4):
+            net.add_node(node_id)
+        edge_one = net.add_edge(source=0, target=1)
+        edge_two = net.add_edge(source=2, target=0)
+        edge_three = net.add_edge(source=0, target=0)
+        edge_four = net.add_edge(source=0, target=1)
+
+        self.assertEqual([edge_one, edge_three, edge_four], net.get_out_edges(0))
+        self.assertEqual([edge_two, edge_three], net.get_in_edges(0))
+        self.assertEqual([1, 0, 2], net.get_neighbors(0))
+        self.assertEqual([0], net.get_neighbors(1))
+        self.assertEqual([], net.get_neighbors(3))
+        self.assertEqual(5, net.get_degree(0))
+        self.assertEqual(3, net.get_degree(0, direction='out'))
+        self.assertEqual(2, net.get_degree(0, direction='in'))
+        self.assertEqual(0, net.get_degree(3))
+
+        # indexes follow edges added and removed after they are built
+        net.remove_edge(edge_one)
+        edge_five = net.add_edge(source=3, target=0)
+        self.assertEqual([edge_three, edge_four], net.get_out_edges(0))
+        self.assertEqual([edge_two, edge_three, edge_five], net.get_in_edges(0))
+        self.assertEqual([0], net.get_neighbors(3))
+
+        with self.assertRaises(NDExNotFoundError):
+            net.get_neighbors(10)
+        with self.assertRaises(NDExInvalidParameterError):
+            net.get_degree(0, direction='both')
+
     def test_update_node(self):
         self.cx2_obj.add_node(1, attributes={"name": "Node1"}, x=10, y=20, z=30)
         self.cx2_obj.update_node(1, attributes={"name": "UpdatedNode"}, x=11, y=21)
@@ -259,6 +547,82 @@ class TestCX2Network(unittest.TestCase):
         self.cx2_obj.add_edge(1, 1, 2, attributes={"i": "link"})
         self.assertEqual(self.cx2_obj.get_edge(1), {"id": 1, "s": 1, "t": 2, "v": {"interaction": "link"}})
 
+    def test_add_nodes(self):
+        self.cx2_obj.set_attribute_declarations({"nodes": {"name": {"a": "n", "d": "string"},
+                                                           "type": {"d": "string", "v": "protein"}}})
+        self.cx2_obj.add_node(attributes={"n": "first"})
+        node_ids = self.cx2_obj.add_nodes(attributes={"n": ["A", "B", "C"],
+                                                      "weight": [None, 2, "3"],
+                                                      "flag": [True, None, False]},
+                                          x=[1.0, 2.0, 3.0], y=[4.0, 5.0, 6.0])
+        self.assertEqual([1, 2, 3], node_ids)
+        self.assertEqual({"id": 1, "v": {"type": "protein", "name": "A", "flag": True},
+                          "x": 1.0, "y": 4.0, "z": None}, self.cx2_obj.get_node(1))
+        self.assertEqual({"type": "protein", "name": "C", "weight": 3, "flag": False},
+                         self.cx2_obj.get_node(3)["v"])
+        self.assertEqual({"d": "integer"}, self.cx2_obj.get_attribute_declarations()["nodes"]["weight"])
+        self.assertEqual({"d": "boolean"}, self.cx2_obj.get_attribute_declarations()["nodes"]["flag"])
+        self.assertEqual(2, self.cx2_obj.lookup_node_id_by_name("B"))
+
+        # ids passed in move the id counter past them, missing values in DataFrames are left out
+        node_ids = self.cx2_obj.add_nodes(ids=[10, "7"],
+                                          attributes=pd.DataFrame({"name": ["D", "E"],
+                                                                   "score": [0.5, float("nan")]}))
+        self.assertEqual([10, 7], node_ids)
+        self.assertEqual({"type": "protein", "name": "E"}, self.cx2_obj.get_node(7)["v"])
+        self.assertEqual(0.5, self.cx2_obj.get_node(10)["v"]["score"])
+        self.assertEqual(12, self.cx2_obj.add_node())
+
+    def test_add_nodes_with_nullable_columns(self):
+        attributes = pd.DataFrame({"count": pd.Series([1, None, 3], dtype="Int64"),
+                                   "flag": pd.Series([True, None, False], dtype="boolean")})
+        self.cx2_obj.add_nodes(attributes=attributes)
+        other = CX2Network()
+        for count, flag in ((1, True), (None, None), (3, False)):
+            other.add_node(attributes={"count": count, "flag": flag})
+
+        # typed as add_node() types the values, not as floats
+        self.assertEqual({"count": {"d": "integer"}, "flag": {"d": "boolean"}},
+                         self.cx2_obj.get_attribute_declarations()["nodes"])
+        self.assertEqual(other.to_cx2(), self.cx2_obj.to_cx2())
+        self.assertIs(int, type(self.cx2_obj.get_node(2)["v"]["count"]))
+
+    def test_add_nodes_invalid(self):
+        self.cx2_obj.add_node(1, attributes={"age": 5})
+        before = self.cx2_obj.copy().to_cx2()
+        with self.assertRaises(NDExAlreadyExists):
+            self.cx2_obj.add_nodes(ids=[2, 1])
+        with self.assertRaises(NDExAlreadyExists):
+            self.cx2_obj.add_nodes(ids=[3, 3])
+        with self.assertRaises(NDExInvalidParameterError):
+            self.cx2_obj.add_nodes(ids=[2, 3], attributes={"name": ["A"]})
+        with self.assertRaises(NDExInvalidCX2Error):
+            self.cx2_obj.add_nodes(attributes={"name": ["A", "B"], "age": [1, "old"]})
+        self.assertEqual(before, self.cx2_obj.to_cx2())
+        self.assertEqual(2, self.cx2_obj.add_node())
+        self.assertEqual([], self.cx2_obj.add_nodes())
+
+    def test_add_edges(self):
+        node_ids = self.cx2_obj.add_nodes(attributes={"name": ["A", "B", "C"]})
+        self.assertEqual([], self.cx2_obj.get_out_edges(0))
+        edge_ids = self.cx2_obj.add_edges(sources=node_ids[:2], targets=["1", 2],
+                                          attributes={"interaction": ["binds", None],
+                                                      "weight": pd.Series([1, 2])})
+        self.assertEqual([0, 1], edge_ids)
+        self.assertEqual({"id": 1, "s": 1, "t": 2, "v": {"weight": 2}}, self.cx2_obj.get_edge(1))
+        self.assertEqual({"d": "integer"}, self.cx2_obj.get_attribute_declarations()["edges"]["weight"])
+        self.assertEqual([1], self.cx2_obj.get_out_edges(1))
+        self.assertEqual([0], self.cx2_obj.get_in_edges(1))
+
+        self.assertEqual([5], self.cx2_obj.add_edges([2], [0], ids=[5]))
+        self.assertEqual(6, self.cx2_obj.add_edge(source=0, target=2))
+        with self.assertRaises(NDExError):
+            self.cx2_obj.add_edges(None, [1])
+        with self.assertRaises(NDExInvalidCX2Error):
+            self.cx2_obj.add_edges(["a"], [1])
+        with self.assertRaises(NDExInvalidParameterError):
+            self.cx2_obj.add_edges([0, 1], [1])
+
     def test_add_edge_without_attributes(self):
         self.cx2_obj.add_edge(1, 1, 2)
         self.assertEqual(self.cx2_obj.get_edge(1), {"id": 1, "s": 1, "t": 2, "v": {}})
@@ -461,6 +825,20 @@ class TestCX2Network(unittest.TestCase):
         self.assertEqual(convert_value('boolean', 'true'), True)
         self.assertEqual(convert_value('list_of_integer', [1, 2, 3]), [1, 2, 3])
 
+    def test_convert_value_with_values_of_right_type(self):
+        value = 'hello'
+        self.assertIs(value, convert_value('string', value))
+        value = [1, 2]
+        res = convert_value('list_of_long', value)
+        self.assertEqual(value, res)
+        self.assertIsNot(value, res)
+        res = convert_value('double', np.float64(1.5))
+        self.assertIs(float, type(res))
+        self.assertEqual([1.0, 2.5], convert_value('list_of_double', [1, np.float64(2.5)]))
+        self.assertIs(float, type(convert_value('list_of_double', [1])[0]))
+        self.assertEqual('integer', self.cx2_obj._get_cx2_type(np.int64(5)))
+        self.assertEqual('long', self.cx2_obj._get_cx2_type(2 ** 40))
+
     def test_get_cx2network_with_graph(self):
         factory = NetworkXToCX2NetworkFactory()
         g = nx.Graph()
@@ -504,6 +882,49 @@ class TestCX2Network(unittest.TestCase):
         self.assertTrue((df['target_id'] == 2).any())
         self.assertTrue((df['edge_attr'] == 'a').any())
 
+    def test_conversion_to_dataframe_typed_columns(self):
+        network = CX2Network()
+        node_one = network.add_node(attributes={'name': 'A', 'size': 3, 'ok': True}, x=1.0, y=2.0)
+        node_two = network.add_node(attributes={'name': 'B'}, x=3.0, y=4.0)
+        network.add_node(attributes={'name': 'C', 'isolated': 'yes'})
+        network.add_edge(source=node_one, target=node_two, attributes={'weight': 0.5, 'count': 2})
+        network.add_edge(source=node_two, target=node_one, attributes={'source_name': 'renamed'})
+        factory = CX2NetworkPandasDataFrameFactory()
+        df = factory.get_dataframe(network)
+
+        self.assertEqual(['source_id', 'target_id', 'source_name', 'source_size', 'source_ok',
+                          'target_name', 'target_size', 'target_ok', 'source_x', 'source_y', 'source_z',
+                          'target_x', 'target_y', 'target_z', 'weight', 'count'], list(df.columns))
+        self.assertEqual(['A', 'renamed'], df['source_name'].tolist())
+        self.assertEqual('Int64', str(df['source_size'].dtype))
+        self.assertEqual([None, 3], [None if pd.isna(v) else v for v in df['target_size'].tolist()])
+        self.assertEqual('boolean', str(df['source_ok'].dtype))
+        self.assertEqual('float64', str(df['weight'].dtype))
+        self.assertEqual('Int64', str(df['count'].dtype))
+        self.assertEqual([3.0, 1.0], df['target_x'].tolist())
+
+    def test_conversion_to_dataframe_with_projection(self):
+        network = CX2Network()
+        node_one = network.add_node(attributes={'name': 'A', 'size': 3}, x=1.0, y=2.0)
+        node_two = network.add_node(attributes={'name': 'B', 'size': 4}, x=3.0, y=4.0)
+        network.add_edge(source=node_one, target=node_two, attributes={'weight': 0.5, 'count': 2})
+        factory = CX2NetworkPandasDataFrameFactory()
+
+        df = factory.get_dataframe(network, node_attributes=['name', 'x'], edge_attributes=['count'])
+        self.assertEqual(['source_id', 'target_id', 'source_name', 'target_name',
+                          'source_x', 'target_x', 'count'], list(df.columns))
+
+        df = factory.get_dataframe(network, node_attributes=[], edge_attributes=[])
+        self.assertEqual(['source_id', 'target_id'], list(df.columns))
+
+        try:
+            factory.get_dataframe(network, node_attributes='name')
+            self.fail('Expected exception')
+        except NDExInvalidParameterError as e:
+            self.assertEqual('node_attributes must be None or a list', str(e))
+
+        self.assertEqual(0, len(factory.get_dataframe(CX2Network())))
+
     def test_get_nodelist_table(self):
         network = CX2Network()
         network.add_node(node_id=1, attributes={'attr1': 'value1', 'attr2': 10}, x=0.1, y=0.2, z=0.3)
@@ -733,6 +1154,49 @@ class TestCX2Network(unittest.TestCase):
         self.assertNotIn('weight', self.cx2_obj.get_attribute_declarations().get(constants.EDGES_ASPECT, {}))
         self.assertIn('type', self.cx2_obj.get_attribute_declarations().get(constants.EDGES_ASPECT, {}))
 
+    def test_cleanup_attribute_declarations_uses_counts(self):
+        self.cx2_obj.add_nodes(ids=[1, 2], attributes={'color': ['red', None], 'shape': ['circle', 'square']})
+        self.cx2_obj.add_edge(1, 1, 2, attributes={'weight': 1.5})
+        self.cx2_obj.update_node(2, attributes={'color': 'blue'})
+        self.cx2_obj.rename_attribute(constants.NODES_ASPECT, 'shape', 'form')
+        self.cx2_obj.remove_node(2)
+        self.assertEqual({constants.NODES_ASPECT: {'color': 1, 'form': 1},
+                          constants.EDGES_ASPECT: {}},
+                         self.cx2_obj._attribute_counts)
+
+        self.cx2_obj._cleanup_attribute_declarations()
+        self.assertEqual({'color', 'form'},
+                         set(self.cx2_obj.get_attribute_declarations()[constants.NODES_ASPECT]))
+        self.assertEqual({}, self.cx2_obj.get_attribute_declarations()[constants.EDGES_ASPECT])
+
+        # attributes set directly on a node are found when a declaration looks unused
+        self.cx2_obj.set_attribute_declarations({constants.NODES_ASPECT: {'color': {'d': 'string'},
+                                                                          'form': {'d': 'string'},
+                                                                          'size': {'d': 'double'}}})
+        self.cx2_obj.get_node(1)[constants.ASPECT_VALUES]['size'] = 2.0
+        self.cx2_obj._cleanup_attribute_declarations()
+        self.assertIn('size', self.cx2_obj.get_attribute_declarations()[constants.NODES_ASPECT])
+        self.assertEqual(1, self.cx2_obj._attribute_counts[constants.NODES_ASPECT]['size'])
+
+    def test_to_cx2_declarations_after_attribute_deleted_from_node(self):
+        self.cx2_obj.add_node(0, attributes={'a': 'x', 'b': 'y'})
+        self.cx2_obj.add_node(1, attributes={'a': 'z', 'b': 'w'})
+        self.cx2_obj.to_cx2()
+
+        # deleting directly from the node is not tracked, the declaration is kept
+        del self.cx2_obj.get_node(0)[constants.ASPECT_VALUES]['b']
+        del self.cx2_obj.get_node(1)[constants.ASPECT_VALUES]['b']
+        declarations = self.cx2_obj.to_cx2()[2]['attributeDeclarations'][0]
+        self.assertEqual({'a': {'d': 'string'}, 'b': {'d': 'string'}}, declarations[constants.NODES_ASPECT])
+
+        # removed with remove_node_attribute, the declaration is dropped
+        net = CX2Network()
+        net.add_node(0, attributes={'a': 'x', 'b': 'y'})
+        net.to_cx2()
+        net.remove_node_attribute(0, 'b')
+        declarations = net.to_cx2()[2]['attributeDeclarations'][0]
+        self.assertEqual({'a': {'d': 'string'}}, declarations[constants.NODES_ASPECT])
+
     def test_opaque_aspect_operations(self):
         self.cx2_obj.set_opaque_aspect('aspect1', 'value1')
         self.assertIn({'aspect1': 'value1'}, self.cx2_obj.get_opaque_aspects())
@@ -772,6 +1236,313 @@ class TestCX2Network(unittest.TestCase):
         self.assertEqual(cx2_df_3_column.get_edge(0)[constants.ASPECT_VALUES]['interaction'], 'interacts-with')
         self.assertEqual(cx2_df_3_column.get_edge(1)[constants.ASPECT_VALUES]['interaction'], 'neighbor-of')
 
+    def test_get_neighborhood(self):
+        net = CX2Network()
+        net.add_network_attribute('name', 'mynet')
+        node_one = net.add_node(attributes={'name': 'TP53', 'represents': 'hgnc:TP53'})
+        node_two = net.add_node(attributes={'name': 'MDM2'})
+        node_three = net.add_node(attributes={'name': 'CDKN1A'})
+        edge_one = net.add_edge(source=node_one, target=node_two, attributes={'weight': 0.5})
+        edge_two = net.add_edge(source=node_three, target=node_two)
+        net.add_node_bypass(node_one, {'NODE_FILL_COLOR': '#FF0000'})
+        net.add_node_bypass(node_three, {'NODE_FILL_COLOR': '#00FF00'})
+        net.add_edge_bypass(edge_two, {'EDGE_WIDTH': 2})
+
+        res = net.get_neighborhood('foo')
+        self.assertEqual({}, res.get_nodes())
+        self.assertEqual({}, res.get_edges())
+        self.assertEqual('mynet', res.get_name())
+
+        res = net.get_neighborhood('tp53')
+        self.assertEqual({node_one, node_two}, set(res.get_nodes()))
+        self.assertEqual([edge_one], list(res.get_edges()))
+        self.assertEqual(0.5, res.get_edge(edge_one)['v']['weight'])
+        self.assertEqual({node_one: {'NODE_FILL_COLOR': '#FF0000'}}, res.get_node_bypasses())
+        self.assertEqual({}, res.get_edge_bypasses())
+        self.assertFalse('EdgeLimitExceeded' in res.get_network_attributes())
+
+        res = net.get_neighborhood('TP53', search_depth=2)
+        self.assertEqual({node_one, node_two, node_three}, set(res.get_nodes()))
+        self.assertEqual({edge_one, edge_two}, set(res.get_edges()))
+        self.assertEqual({edge_two: {'EDGE_WIDTH': 2}}, res.get_edge_bypasses())
+
+        # result is a copy
+        res.add_node_attribute(node_one, 'name', 'foo')
+        self.assertEqual('TP53', net.get_node(node_one)['v']['name'])
+
+        # renamed node is found after update
+        net.update_node(node_three, attributes={'name': 'p21'})
+        res = net.get_neighborhood('P21')
+        self.assertEqual({node_two, node_three}, set(res.get_nodes()))
+
+        # removed edge is no longer traversed
+        net.remove_edge(edge_two)
+        res = net.get_neighborhood('p21')
+        self.assertEqual({node_three}, set(res.get_nodes()))
+        self.assertEqual({}, res.get_edges())
+        self.assertTrue(len(res.to_cx2()) > 0)
+
+    def test_get_neighborhood_edge_limit(self):
+        net = CX2Network()
+        hub = net.add_node(attributes={'name': 'hub'})
+        for i in range(5):
+            net.add_edge(source=hub, target=net.add_node(attributes={'name': 'n' + str(i)}))
+
+        with self.assertRaises(NDExError) as ne:
+            net.get_neighborhood('hub', edge_limit=4)
+        self.assertTrue(str(ne.exception).startswith('EdgeLimitExceeded'))
+
+        res = net.get_neighborhood('hub', edge_limit=4, error_when_limit=False)
+        self.assertEqual(4, len(res.get_edges()))
+        self.assertEqual(5, len(res.get_nodes()))
+        self.assertEqual('true', res.get_network_attributes()['EdgeLimitExceeded'])
+
+    def test_get_neighborhood_demo_network(self):
+        self.cx2_obj.create_from_raw_cx2(self.sample_file)
+        node_id = self.cx2_obj.lookup_node_id_by_name('721')
+        expected_edges = set(e_id for e_id, e in self.cx2_obj.get_edges().items()
+                             if node_id in (e['s'], e['t']))
+        res = self.cx2_obj.get_neighborhood('721')
+        self.assertEqual(expected_edges, set(res.get_edges()))
+
+    def test_get_interconnectquery(self):
+        net = CX2Network()
+        node_one = net.add_node(attributes={'name': 'TP53'})
+        node_two = net.add_node(attributes={'name': 'MDM2'})
+        node_three = net.add_node(attributes={'name': 'CDKN1A', 'represents': 'hgnc:CDKN1A'})
+        node_four = net.add_node(attributes={'name': 'EP300'})
+        edge_one = net.add_edge(source=node_one, target=node_two)
+        edge_two = net.add_edge(source=node_three, target=node_two)
+        net.add_edge(source=node_four, target=node_one)
+
+        res = net.get_interconnectquery('TP53 CDKN1A')
+        self.assertEqual({node_one, node_three}, set(res.get_nodes()))
+        self.assertEqual({}, res.get_edges())
+
+        res = net.get_interconnectquery('tp53 "hgnc:cdkn1a"', search_depth=2)
+        self.assertEqual({node_one, node_two, node_three}, set(res.get_nodes()))
+        self.assertEqual({edge_one, edge_two}, set(res.get_edges()))
+
+        res = net.get_interconnectquery('TP53 CDKN1A', search_depth=2, edge_limit=1, error_when_limit=False)
+        self.assertEqual(1, len(res.get_edges()))
+        self.assertEqual('true', res.get_network_attributes()['EdgeLimitExceeded'])
+
+    def test_copy(self):
+        net = CX2Network()
+        net.add_network_attribute('name', 'base')
+        node_one = net.add_node(attributes={'name': 'a', 'score': 1.0}, x=1.0, y=2.0)
+        node_two = net.add_node(attributes={'name': 'b'})
+        edge_id = net.add_edge(source=node_one, target=node_two, attributes={'weight': 0.5})
+        net.add_node_bypass(node_one, {'NODE_FILL_COLOR': '#000000'})
+        net.add_opaque_aspect({'foo': [{'x': 1}]})
+
+        clone = net.copy()
+        self.assertIs(net.get_nodes(), clone.get_nodes())
+
+        clone.add_node_attribute(node_one, 'score', 2.0)
+        clone.update_node(node_two, x=5.0)
+        clone.remove_edge_attribute(edge_id, 'weight')
+        clone.add_node(attributes={'name': 'c'})
+        clone.add_node_bypass(node_two, {'NODE_FILL_COLOR': '#FFFFFF'})
+        clone.add_network_attribute('name', 'variant')
+        clone.rename_attribute('nodes', 'score', 'value')
+        clone.set_opaque_aspect('foo', [{'x': 2}])
+
+        self.assertEqual({node_one, node_two}, set(net.get_nodes()))
+        self.assertEqual({'name': 'a', 'score': 1.0}, net.get_node(node_one)['v'])
+        self.assertIsNone(net.get_node(node_two)['x'])
+        self.assertEqual({'weight': 0.5}, net.get_edge(edge_id)['v'])
+        self.assertEqual([node_one], list(net.get_node_bypasses()))
+        self.assertEqual('base', net.get_name())
+        self.assertIn('score', net.get_attribute_declarations()['nodes'])
+        self.assertEqual([{'x': 1}], net.get_opaque_aspect('foo'))
+
+        self.assertEqual(3, len(clone.get_nodes()))
+        self.assertEqual({'name': 'a', 'value': 2.0}, clone.get_node(node_one)['v'])
+        self.assertEqual(5.0, clone.get_node(node_two)['x'])
+        self.assertEqual({}, clone.get_edge(edge_id)['v'])
+        self.assertEqual({node_one, node_two}, set(clone.get_node_bypasses()))
+        self.assertEqual('variant', clone.get_name())
+        self.assertIn('value', clone.get_attribute_declarations()['nodes'])
+        self.assertEqual([{'x': 2}], clone.get_opaque_aspect('foo'))
+
+        # changing the original must not change the copy
+        net.remove_edge(edge_id)
+        net.update_node(node_one, attributes={'score': 3.0})
+        self.assertEqual({}, net.get_edges())
+        self.assertEqual({edge_id}, set(clone.get_edges()))
+        self.assertEqual(2.0, clone.get_node(node_one)['v']['value'])
+        self.assertEqual(1, len(clone.get_neighborhood('b').get_edges()))
+        self.assertEqual(0, len(net.get_neighborhood('b').get_edges()))
+
+    def test_copy_demo_network(self):
+        self.cx2_obj.create_from_raw_cx2(self.sample_file)
+        expected_cx2 = self.cx2_obj.to_cx2()
+        clone = self.cx2_obj.copy()
+        self.assertEqual(expected_cx2, clone.to_cx2())
+        for node_id in list(clone.get_nodes()):
+            clone.update_node(node_id, attributes={'condition': 'treated'})
+        self.assertEqual(expected_cx2, self.cx2_obj.to_cx2())
+
+    def test_lookup_node_id_by_name(self):
+        net = CX2Network()
+        self.assertIsNone(net.lookup_node_id_by_name('A'))
+        node_a = net.add_node(attributes={'name': 'A'})
+        node_b = net.add_node(attributes={'name': 'B'})
+        self.assertEqual(node_a, net.lookup_node_id_by_name('A'))
+
+        # index is kept current as nodes change
+        node_c = net.add_node(attributes={'name': 'C'})
+        self.assertEqual(node_c, net.lookup_node_id_by_name('C'))
+        net.update_node(node_b, attributes={'name': 'B2'})
+        self.assertIsNone(net.lookup_node_id_by_name('B'))
+        self.assertEqual(node_b, net.lookup_node_id_by_name('B2'))
+        net.add_node_attribute(node_c, 'name', 'C2')
+        self.assertEqual(node_c, net.lookup_node_id_by_name('C2'))
+        net.remove_node(node_a)
+        self.assertIsNone(net.lookup_node_id_by_name('A'))
+        net.remove_node_attribute(node_b, 'name')
+        self.assertIsNone(net.lookup_node_id_by_name('B2'))
+
+        # first node in the network wins if several have the name
+        net.update_node(node_c, attributes={'name': 'B'})
+        net.update_node(node_b, attributes={'name': 'B'})
+        self.assertEqual(node_b, net.lookup_node_id_by_name('B'))
+
+    def test_lookup_node_ids_by_attribute(self):
+        net = CX2Network()
+        net.set_attribute_declarations({'nodes': {'type': {'d': 'string', 'a': 't'},
+                                                  'aliases': {'d': 'list_of_string'}}})
+        node_one = net.add_node(attributes={'name': 'TP53', 't': 'protein', 'aliases': ['P53']})
+        node_two = net.add_node(attributes={'name': 'MDM2', 'type': 'protein'})
+        node_three = net.add_node(attributes={'name': 'MIR21', 'type': 'rna'})
+
+        self.assertEqual([node_one, node_two], net.lookup_node_ids_by_attribute('type', 'protein'))
+        self.assertEqual([node_one, node_two], net.lookup_node_ids_by_attribute('t', 'protein'))
+        self.assertEqual([node_one], net.lookup_node_ids_by_attribute('aliases', ['P53']))
+        self.assertEqual([], net.lookup_node_ids_by_attribute('type', 'gene'))
+        self.assertEqual([], net.lookup_node_ids_by_attribute('type', {'not': 'hashable'}))
+
+        net.add_node_attribute(node_three, 'type', 'protein')
+        self.assertEqual([node_one, node_two, node_three], net.lookup_node_ids_by_attribute('type', 'protein'))
+
+        net.rename_attribute('nodes', 'type', 'kind')
+        self.assertEqual([], net.lookup_node_ids_by_attribute('type', 'protein'))
+        self.assertEqual([node_one, node_two, node_three], net.lookup_node_ids_by_attribute('kind', 'protein'))
+
+        # changes to a copy do not show up in the original
+        clone = net.copy()
+        clone.remove_node(node_two)
+        self.assertEqual([node_one, node_three], clone.lookup_node_ids_by_attribute('kind', 'protein'))
+        self.assertEqual([node_one, node_two, node_three], net.lookup_node_ids_by_attribute('kind', 'protein'))
+
+    def test_lookup_node_ids_by_attribute_after_updates(self):
+        net = CX2Network()
+        for node_id in (5, 1, 3, 0):
+            net.add_node(node_id, attributes={'type': 'protein' if node_id % 2 else 'gene'})
+        self.assertEqual([1, 3, 5], net.lookup_node_ids_by_attribute('type', 'protein'))
+        index = net._attribute_indexes['nodes']['type']
+
+        # existing nodes taking a value others have keep the index current
+        net.add_node_attribute(0, 'type', 'protein')
+        self.assertEqual([0, 1, 3, 5], net.lookup_node_ids_by_attribute('type', 'protein'))
+        net.update_node(3, attributes={'type': 'gene'})
+        self.assertEqual([0, 1, 5], net.lookup_node_ids_by_attribute('type', 'protein'))
+        self.assertEqual([3], net.lookup_node_ids_by_attribute('type', 'gene'))
+        net.remove_node(1)
+        self.assertEqual([0, 5], net.lookup_node_ids_by_attribute('type', 'protein'))
+        self.assertIs(index, net._attribute_indexes['nodes']['type'])
+
+    def test_find_nodes(self):
+        net = CX2Network()
+        net.add_node(0, attributes={'type': 'protein', 'score': 0.95, 'GO:term': 'GO:1'})
+        net.add_node(1, attributes={'type': 'protein', 'score': 0.5})
+        net.add_node(2, attributes={'type': 'gene', 'score': 0.99})
+        net.add_node(3, attributes={'type': 'rna'})
+
+        def check_queries():
+            self.assertEqual([0, 1], net.find_nodes(type='protein'))
+            self.assertEqual([0], net.find_nodes(type='protein', score__gt=0.9))
+            self.assertEqual([1], net.find_nodes(score__lte=0.5))
+            self.assertEqual([0, 2], net.find_nodes(score__gte=0.95))
+            self.assertEqual([1], net.find_nodes(score__lt=0.95))
+            self.assertEqual([2, 3], net.find_nodes(type__ne='protein'))
+            # nodes without the attribute never match
+            self.assertEqual([0, 1], net.find_nodes(score__ne=0.99))
+            self.assertEqual([0, 1, 3], net.find_nodes(type__in=['protein', 'rna']))
+            self.assertEqual([0], net.find_nodes(type__in=('protein', 'rna'), score__ne=0.5))
+            self.assertEqual([0], net.find_nodes({'GO:term': 'GO:1'}))
+            # numbers are not compared with strings
+            self.assertEqual([], net.find_nodes(type__gt=1))
+            self.assertEqual([], net.find_nodes(score__gt='a'))
+            self.assertEqual([0, 1, 2, 3], net.find_nodes())
+
+        check_queries()
+        net.create_index('nodes', 'type')
+        net.create_index('nodes', 'score', kind='sorted')
+        check_queries()
+
+        # indexes are kept current
+        net.update_node(1, attributes={'score': 0.97})
+        net.add_node_attribute(3, 'score', 1.0)
+        net.remove_node(2)
+        net.add_node(4, attributes={'type': 'protein', 'score': 0.2})
+        self.assertEqual([0, 1, 3], net.find_nodes(score__gt=0.9))
+        self.assertEqual([0, 1, 4], net.find_nodes(type='protein'))
+        net.remove_node_attribute(0, 'score')
+        self.assertEqual([1, 4], net.find_nodes(type='protein', score__gte=0))
+
+        net.rename_attribute('nodes', 'score', 'weight')
+        self.assertEqual([1, 3], net.find_nodes(weight__gt=0.9))
+        self.assertEqual([], net.find_nodes(score__gt=0.9))
+
+        clone = net.copy()
+        clone.update_node(4, attributes={'weight': 0.99})
+        self.assertEqual([1, 3, 4], clone.find_nodes(weight__gt=0.9))
+        self.assertEqual([1, 3], net.find_nodes(weight__gt=0.9))
+
+    def test_find_edges(self):
+        net = CX2Network()
+        for node_id in range(3):
+            net.add_node(node_id)
+        net.add_edge(0, 0, 1, attributes={'interaction': 'binds', 'weight': 0.3})
+        net.add_edge(1, 1, 2, attributes={'interaction': 'binds', 'weight': 0.8})
+        net.add_edge(2, 2, 0, attributes={'interaction': 'inhibits', 'weight': 0.9})
+        net.create_index('edges', 'interaction')
+        net.create_index('edges', 'weight', kind='sorted')
+        indexes = [net._attribute_indexes['edges']['interaction'], net._sorted_attribute_indexes['edges']['weight']]
+
+        self.assertEqual([1], net.find_edges(interaction='binds', weight__gte=0.5))
+        net.update_edge(0, attributes={'weight': 0.6})
+        net.add_edge_attribute(2, 'interaction', 'binds')
+        self.assertEqual([0, 1, 2], net.find_edges(interaction='binds', weight__gte=0.5))
+        net.remove_edge_attribute(1, 'weight')
+        net.remove_node(2)
+        self.assertEqual([0], net.find_edges(interaction='binds', weight__gte=0.5))
+        net.add_edges([1], [0], attributes={'interaction': ['binds'], 'weight': [0.7]})
+        self.assertEqual([0, 3], net.find_edges(weight__gte=0.5))
+        # indexes are kept current, not built again
+        self.assertEqual(indexes,
+                         [net._attribute_indexes['edges']['interaction'], net._sorted_attribute_indexes['edges']['weight']])
+
+    def test_create_index_and_find_invalid(self):
+        net = CX2Network()
+        try:
+            net.create_index('foo', 'type')
+            self.fail('Expected NDExInvalidParameterError')
+        except NDExInvalidParameterError as ne:
+            self.assertEqual("aspect_name must be 'nodes' or 'edges', got foo", str(ne))
+        try:
+            net.create_index('nodes', 'type', kind='btree')
+            self.fail('Expected NDExInvalidParameterError')
+        except NDExInvalidParameterError as ne:
+            self.assertEqual("kind must be 'hash' or 'sorted', got btree", str(ne))
+        try:
+            net.find_nodes(type__in='protein')
+            self.fail('Expected NDExInvalidParameterError')
+        except NDExInvalidParameterError as ne:
+            self.assertEqual('Value for type__in must be a list, tuple or set', str(ne))
+
 
 if __name__ == '__main__':
     unittest.main()
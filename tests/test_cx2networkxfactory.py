@@ -91,6 +91,30 @@ class TestCX2NetworkXFactory(unittest.TestCase):
             self.assertEqual(len(graph.nodes), 6)
             self.assertEqual(len(graph.edges), 6)
 
+    def test_graph_creation_does_not_change_network(self):
+        expected_cx2 = self.cx2network.to_cx2()
+        graph = self.factory.get_graph(self.cx2network)
+        for node_id, node_data in graph.nodes(data=True):
+            self.assertIn('x', node_data)
+            self.assertNotIn('x', self.cx2network.get_node(node_id)['v'])
+        self.assertEqual(expected_cx2, self.cx2network.to_cx2())
+
+    def test_graph_list_attributes_not_shared_with_network(self):
+        net = CX2Network()
+        net.add_network_attribute('tags', ['a'], datatype='list_of_string')
+        node_one = net.add_node(attributes={'name': 'A', 'L': ['x']})
+        node_two = net.add_node(attributes={'name': 'B', 'L': ['y']})
+        net.add_edge(source=node_one, target=node_two, attributes={'L': ['e']})
+        expected_cx2 = net.to_cx2()
+
+        graph = self.factory.get_graph(net)
+        graph.nodes[node_one]['L'].append('z')
+        for _, _, edge_data in graph.edges(data=True):
+            edge_data['L'].append('z')
+        graph.graph['tags'].append('z')
+        self.assertEqual(['x', 'z'], graph.nodes[node_one]['L'])
+        self.assertEqual(expected_cx2, net.to_cx2())
+
     def test_node_attributes(self):
         graph = self.factory.get_graph(self.cx2network)
         for node_id, node_data in graph.nodes(data=True):
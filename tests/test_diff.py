@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for `diff` module."""
+
+import os
+import json
+import unittest
+
+import ndex2
+from ndex2.nice_cx_network import NiceCXNetwork
+from ndex2.cx2 import CX2Network
+from ndex2.exceptions import NDExInvalidParameterError
+from ndex2.diff import diff
+
+SKIP_REASON = 'NDEX2_TEST_SERVER environment variable detected, ' \
+              'skipping for integration tests'
+
+
+@unittest.skipIf(os.getenv('NDEX2_TEST_SERVER') is not None, SKIP_REASON)
+class TestDiff(unittest.TestCase):
+
+    TEST_DIR = os.path.dirname(__file__)
+    WNT_SIGNAL_FILE = os.path.join(TEST_DIR, 'data', 'wntsignaling.cx')
+    DEMO_CX2_FILE = os.path.join(TEST_DIR, 'data', 'demo.cx2')
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        pass
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        pass
+
+    def get_nice_cx_network(self):
+        net = NiceCXNetwork()
+        net.set_name('mynet')
+        a = net.create_node('A')
+        b = net.create_node('B')
+        net.set_node_attribute(a, 'score', 1.5, type='double')
+        edge = net.create_edge(edge_source=a, edge_target=b,
+                               edge_interaction='binds')
+        net.set_edge_attribute(edge, 'weight', 0.5, type='double')
+        return net
+
+    def test_diff_invalid_networks(self):
+        for net_a, net_b in [(None, None), (NiceCXNetwork(), CX2Network()),
+                             (CX2Network(), 'foo')]:
+            try:
+                diff(net_a, net_b)
+                self.fail('Expected NDExInvalidParameterError')
+            except NDExInvalidParameterError:
+                pass
+
+    def test_diff_same_networks(self):
+        self.assertTrue(diff(self.get_nice_cx_network(),
+                             self.get_nice_cx_network()).is_empty())
+        wnt_a = ndex2.create_nice_cx_from_file(TestDiff.WNT_SIGNAL_FILE)
+        wnt_b = ndex2.create_nice_cx_from_file(TestDiff.WNT_SIGNAL_FILE)
+        self.assertTrue(diff(wnt_a, wnt_b).is_empty())
+        self.assertTrue(diff(wnt_a, wnt_b, key='name').is_empty())
+
+        cx2_a = CX2Network()
+        cx2_a.create_from_raw_cx2(TestDiff.DEMO_CX2_FILE)
+        cx2_b = CX2Network()
+        cx2_b.create_from_raw_cx2(TestDiff.DEMO_CX2_FILE)
+        res = diff(cx2_a, cx2_b)
+        self.assertTrue(res.is_empty())
+        self.assertEqual({'networkAttributes': {'set': {}, 'remove': []},
+                          'nodes': {'add': [], 'remove': [], 'update': []},
+                          'edges': {'add': [], 'remove': [], 'update': []}},
+                         res.get_patch())
+
+    def test_diff_nice_cx_by_id(self):
+        net_a = self.get_nice_cx_network()
+        net_b = self.get_nice_cx_network()
+        net_b.set_network_attribute('version', '2.0')
+        net_b.set_node_attribute(0, 'score', 2.5, type='double',
+                                 overwrite=True)
+        net_b.set_node_attribute(1, 'color', 'red')
+        c = net_b.create_node('C')
+        net_b.remove_edge(0)
+        edge = net_b.create_edge(edge_source=0, edge_target=c)
+
+        res = diff(net_a, net_b)
+        self.assertFalse(res.is_empty())
+        self.assertEqual({'version': '2.0'}, res.added_network_attributes)
+        self.assertEqual({}, res.removed_network_attributes)
+        self.assertEqual({}, res.changed_network_attributes)
+        self.assertEqual({c: c}, res.added_nodes)
+        self.assertEqual({}, res.removed_nodes)
+        self.assertEqual({0: {'a': 0, 'b': 0,
+                              'attributes': {'score': (1.5, 2.5)}},
+                          1: {'a': 1, 'b': 1,
+                              'attributes': {'color': (None, 'red')}}},
+                         res.changed_nodes)
+        self.assertEqual({edge: edge}, res.added_edges)
+        self.assertEqual({0: 0}, res.removed_edges)
+        self.assertEqual({}, res.changed_edges)
+
+        patch = res.get_patch()
+        self.assertEqual({'set': {'version': '2.0'}, 'remove': []},
+                         patch['networkAttributes'])
+        self.assertEqual({'add': [c], 'remove': [],
+                          'update': [{'a': 0, 'b': 0,
+                                      'set': {'score': 2.5}, 'remove': []},
+                                     {'a': 1, 'b': 1,
+                                      'set': {'color': 'red'},
+                                      'remove': []}]},
+                         patch['nodes'])
+        self.assertEqual({'add': [edge], 'remove': [0], 'update': []},
+                         patch['edges'])
+        # patch should be serializable
+        self.assertTrue(len(json.dumps(patch)) > 0)
+
+    def test_diff_nice_cx_rewired_edge(self):
+        net_a = self.get_nice_cx_network()
+        net_b = self.get_nice_cx_network()
+        net_b.edges[0]['t'] = 0
+        net_b.edgeAttributes[0] = []
+        res = diff(net_a, net_b)
+        self.assertEqual({0: {'a': 0, 'b': 0, 'target': (1, 0),
+                              'attributes': {'weight': (0.5, None)}}},
+                         res.changed_edges)
+        self.assertEqual([{'a': 0, 'b': 0, 't': 0, 'set': {},
+                           'remove': ['weight']}],
+                         res.get_patch()['edges']['update'])
+
+    def test_diff_nice_cx_by_name(self):
+        net_a = self.get_nice_cx_network()
+        net_b = NiceCXNetwork()
+        net_b.set_name('mynet')
+        b = net_b.create_node('B')
+        a = net_b.create_node('A')
+        net_b.set_node_attribute(a, 'score', 1.5, type='double')
+        edge = net_b.create_edge(edge_source=a, edge_target=b,
+                                 edge_interaction='binds')
+        net_b.set_edge_attribute(edge, 'weight', 0.5, type='double')
+
+        self.assertFalse(diff(net_a, net_b).is_empty())
+        self.assertTrue(diff(net_a, net_b, key='name').is_empty())
+
+        net_b.create_edge(edge_source=a, edge_target=b,
+                          edge_interaction='binds')
+        res = diff(net_a, net_b, key='name')
+        self.assertEqual({(('A', 'B', 'binds'), 1): 1}, res.added_edges)
+
+    def test_diff_cx2(self):
+        net_a = CX2Network()
+        net_a.add_network_attribute('name', 'mynet')
+        net_a.add_network_attribute('version', '1.0')
+        a = net_a.add_node(attributes={'name': 'A', 'tags': ['x']}, x=1.0, y=2.0)
+        b = net_a.add_node(attributes={'name': 'B'})
+        net_a.add_edge(source=a, target=b, attributes={'interaction': 'binds'})
+
+        net_b = CX2Network()
+        net_b.add_network_attribute('name', 'mynet2')
+        a = net_b.add_node(attributes={'name': 'A', 'tags': ['x', 'y']}, x=1.0, y=3.0)
+        b = net_b.add_node(attributes={'name': 'B'})
+        net_b.add_edge(source=a, target=b, attributes={'interaction': 'binds'})
+
+        res = diff(net_a, net_b, key='name')
+        self.assertEqual({'name': ('mynet', 'mynet2')}, res.changed_network_attributes)
+        self.assertEqual({'version': '1.0'}, res.removed_network_attributes)
+        self.assertEqual({'A': {'a': 0, 'b': 0,
+                                'attributes': {'tags': (['x'], ['x', 'y']),
+                                               'y': (2.0, 3.0)}}},
+                         res.changed_nodes)
+        self.assertEqual({}, res.changed_edges)
+        self.assertEqual({}, res.added_edges)
+        self.assertEqual([], res.changed_aspects)
+
+    def test_diff_nice_cx_other_aspects(self):
+        net_a = self.get_nice_cx_network()
+        self.assertEqual([], diff(net_a, self.get_nice_cx_network()).changed_aspects)
+
+        changes = {'cyVisualProperties': lambda net: net.set_opaque_aspect(
+                       'cyVisualProperties',
+                       [{'properties_of': 'network',
+                         'properties': {'NETWORK_BACKGROUND_PAINT': '#FFFFFF'}}]),
+                   'cartesianLayout': lambda net: net.set_opaque_aspect(
+                       'cartesianLayout', [{'node': 0, 'x': 1.0, 'y': 2.0}]),
+                   'edgeCitations': lambda net: net.add_edge_citations(0, 5),
+                   'edgeSupports': lambda net: net.add_edge_supports(0, 6),
+                   'myAspect': lambda net: net.set_opaque_aspect('myAspect', [{'a': 1}])}
+        for name, change in changes.items():
+            net_b = self.get_nice_cx_network()
+            change(net_b)
+            res = diff(net_a, net_b)
+            self.assertFalse(res.is_empty(), name)
+            self.assertEqual([name], res.changed_aspects)
+            self.assertEqual({}, res.changed_nodes)
+            self.assertEqual({}, res.changed_edges)
+
+    def test_diff_cx2_other_aspects(self):
+        def get_network():
+            net = CX2Network()
+            a = net.add_node(attributes={'name': 'A'})
+            b = net.add_node(attributes={'name': 'B'})
+            net.add_edge(source=a, target=b)
+            return net
+
+        net_a = get_network()
+        self.assertTrue(diff(net_a, get_network()).is_empty())
+        changes = {'visualProperties': lambda net: net.set_visual_properties(
+                       {'default': {'network': {'NETWORK_BACKGROUND_COLOR': '#FFFFFF'}}}),
+                   'nodeBypasses': lambda net: net.add_node_bypass(0, {'NODE_SHAPE': 'ellipse'}),
+                   'edgeBypasses': lambda net: net.add_edge_bypass(0, {'EDGE_WIDTH': 2}),
+                   'myAspect': lambda net: net.set_opaque_aspect('myAspect', [{'a': 1}])}
+        for name, change in changes.items():
+            net_b = get_network()
+            change(net_b)
+            res = diff(net_a, net_b)
+            self.assertFalse(res.is_empty(), name)
+            self.assertEqual([name], res.changed_aspects)
+
+    def test_diff_nan_values(self):
+        nan = float('nan')
+        net_a = self.get_nice_cx_network()
+        net_a.set_node_attribute(0, 'score', nan, type='double', overwrite=True)
+        net_a.set_network_attribute('scores', [1.0, nan], type='list_of_double')
+        net_b = self.get_nice_cx_network()
+        net_b.set_node_attribute(0, 'score', nan, type='double', overwrite=True)
+        net_b.set_network_attribute('scores', [1.0, nan], type='list_of_double')
+        self.assertTrue(diff(net_a, net_b).is_empty())
+
+        cx2_a = CX2Network()
+        cx2_a.add_node(0, attributes={'name': 'A', 'score': nan})
+        cx2_b = CX2Network()
+        cx2_b.add_node(0, attributes={'name': 'A', 'score': nan})
+        self.assertTrue(diff(cx2_a, cx2_b).is_empty())
+        cx2_b.set_node_attribute(0, 'score', 1.0)
+        self.assertEqual([0], list(diff(cx2_a, cx2_b).changed_nodes))
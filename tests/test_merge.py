@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for `merge` module."""
+
+import os
+import unittest
+
+from ndex2.nice_cx_network import NiceCXNetwork
+from ndex2.cx2 import CX2Network
+from ndex2.exceptions import NDExInvalidParameterError
+from ndex2.merge import merge_networks
+
+SKIP_REASON = 'NDEX2_TEST_SERVER environment variable detected, ' \
+              'skipping for integration tests'
+
+
+@unittest.skipIf(os.getenv('NDEX2_TEST_SERVER') is not None, SKIP_REASON)
+class TestMerge(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        pass
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        pass
+
+    def get_nice_cx_networks(self):
+        net_one = NiceCXNetwork()
+        net_one.set_name('one')
+        a = net_one.create_node('A', node_represents='hgnc:A')
+        b = net_one.create_node('B')
+        net_one.set_node_attribute(a, 'score', 1, type='integer')
+        net_one.set_node_attribute(a, 'source', 'one')
+        edge = net_one.create_edge(edge_source=a, edge_target=b,
+                                   edge_interaction='binds')
+        net_one.set_edge_attribute(edge, 'weight', 0.5, type='double')
+
+        net_two = NiceCXNetwork()
+        net_two.set_name('two')
+        c = net_two.create_node('C')
+        a = net_two.create_node('A', node_represents='uniprot:A')
+        net_two.set_node_attribute(a, 'score', 2.5, type='double')
+        net_two.set_node_attribute(a, 'source', 'one')
+        net_two.set_node_attribute(c, 'source', 'two')
+        net_two.create_edge(edge_source=c, edge_target=a)
+        b = net_two.create_node('B')
+        edge = net_two.create_edge(edge_source=a, edge_target=b,
+                                   edge_interaction='binds')
+        net_two.set_edge_attribute(edge, 'weight', 0.7, type='double')
+        return net_one, net_two
+
+    def test_merge_networks_invalid_args(self):
+        for networks in [None, [], [NiceCXNetwork(), CX2Network()], ['foo']]:
+            try:
+                merge_networks(networks)
+                self.fail('Expected NDExInvalidParameterError')
+            except NDExInvalidParameterError:
+                pass
+        try:
+            merge_networks([NiceCXNetwork()], attribute_policy='foo')
+            self.fail('Expected NDExInvalidParameterError')
+        except NDExInvalidParameterError as ne:
+            self.assertTrue('attribute_policy' in str(ne))
+
+    def test_merge_nice_cx_networks_by_name_first(self):
+        net_one, net_two = self.get_nice_cx_networks()
+        res = merge_networks([net_one, net_two])
+        self.assertEqual('one', res.get_name())
+        self.assertEqual({0: {'@id': 0, 'n': 'A', 'r': 'hgnc:A'},
+                          1: {'@id': 1, 'n': 'B', 'r': 'B'},
+                          2: {'@id': 2, 'n': 'C', 'r': 'C'}}, res.nodes)
+        self.assertEqual({0: {'@id': 0, 's': 0, 't': 1, 'i': 'binds'},
+                          1: {'@id': 1, 's': 2, 't': 0},
+                          2: {'@id': 2, 's': 0, 't': 1, 'i': 'binds'}},
+                         res.edges)
+        # score is double in second network so first value is widened
+        self.assertEqual({'po': 0, 'n': 'score', 'v': 1.0, 'd': 'double'},
+                         res.get_node_attribute(0, 'score'))
+        self.assertEqual('one', res.get_node_attribute_value(0, 'source'))
+        self.assertEqual('two', res.get_node_attribute_value(2, 'source'))
+        self.assertEqual(0.5, res.get_edge_attribute_value(0, 'weight'))
+        self.assertEqual(0.7, res.get_edge_attribute_value(2, 'weight'))
+
+    def test_merge_nice_cx_networks_union_dedup_edges(self):
+        net_one, net_two = self.get_nice_cx_networks()
+        res = merge_networks([net_one, net_two], attribute_policy='union',
+                             deduplicate_edges=True)
+        self.assertEqual(3, len(res.nodes))
+        self.assertEqual(2, len(res.edges))
+        self.assertEqual({'po': 0, 'n': 'score', 'v': [1.0, 2.5],
+                          'd': 'list_of_double'},
+                         res.get_node_attribute(0, 'score'))
+        # source never differs so it stays a string
+        self.assertEqual({'po': 0, 'n': 'source', 'v': 'one', 'd': 'string'},
+                         res.get_node_attribute(0, 'source'))
+        self.assertEqual([0.5, 0.7], res.get_edge_attribute_value(0, 'weight'))
+        self.assertEqual(None, res.get_edge_attributes(1))
+
+    def test_merge_nice_cx_networks_concat(self):
+        net_one, net_two = self.get_nice_cx_networks()
+        net_three = NiceCXNetwork()
+        a = net_three.create_node('A')
+        net_three.set_node_attribute(a, 'score', 1, type='integer')
+        res = merge_networks([net_one, net_two, net_three],
+                             attribute_policy='concat')
+        self.assertEqual([1.0, 2.5, 1.0],
+                         res.get_node_attribute_value(0, 'score'))
+        res = merge_networks([net_one, net_two, net_three],
+                             attribute_policy='union')
+        self.assertEqual([1.0, 2.5],
+                         res.get_node_attribute_value(0, 'score'))
+        # node C has no conflict but score is now a list type
+        self.assertEqual('list_of_double',
+                         res.get_node_attribute(0, 'score')['d'])
+
+    def test_merge_nice_cx_networks_by_represents_and_attribute(self):
+        net_one, net_two = self.get_nice_cx_networks()
+        res = merge_networks([net_one, net_two], node_key='represents')
+        self.assertEqual(['A', 'B', 'C', 'A'],
+                         [n['n'] for n in res.nodes.values()])
+
+        res = merge_networks([net_one, net_two], node_key='source')
+        # A nodes share source, B nodes have none so are never unified
+        self.assertEqual(['A', 'B', 'C', 'B'],
+                         [n['n'] for n in res.nodes.values()])
+
+    def test_merge_cx2_networks(self):
+        net_one = CX2Network()
+        net_one.add_network_attribute('name', 'one')
+        a = net_one.add_node(attributes={'name': 'A', 'score': 1, 'tags': ['x']})
+        b = net_one.add_node(attributes={'name': 'B', 'flag': True})
+        net_one.add_edge(source=a, target=b, attributes={'interaction': 'binds', 'weight': 0.5})
+
+        net_two = CX2Network()
+        b = net_two.add_node(attributes={'name': 'B', 'flag': 'maybe'})
+        a = net_two.add_node(attributes={'name': 'A', 'score': 2, 'tags': ['x', 'y']})
+        net_two.add_edge(source=a, target=b, attributes={'interaction': 'binds', 'weight': 0.9})
+        net_two.add_edge(source=b, target=a, attributes={'interaction': 'binds'})
+
+        res = merge_networks([net_one, net_two])
+        self.assertEqual('one', res.get_name())
+        self.assertEqual({'name': 'A', 'score': 1, 'tags': ['x']}, res.get_node(0)['v'])
+        self.assertEqual({'name': 'B', 'flag': 'True'}, res.get_node(1)['v'])
+        self.assertEqual('string', res.get_declared_type('nodes', 'flag'))
+        self.assertEqual(3, len(res.get_edges()))
+
+        res = merge_networks([net_one, net_two], attribute_policy='union', deduplicate_edges=True)
+        self.assertEqual({'name': 'A', 'score': [1, 2], 'tags': ['x', 'y']}, res.get_node(0)['v'])
+        self.assertEqual('list_of_integer', res.get_declared_type('nodes', 'score'))
+        self.assertEqual({'name': 'B', 'flag': ['True', 'maybe']}, res.get_node(1)['v'])
+        self.assertEqual({'id': 0, 's': 0, 't': 1, 'v': {'interaction': 'binds', 'weight': [0.5, 0.9]}},
+                         res.get_edge(0))
+        self.assertEqual({'id': 1, 's': 1, 't': 0, 'v': {'interaction': 'binds'}},
+                         res.get_edge(1))
+        self.assertTrue(len(res.to_cx2()) > 0)
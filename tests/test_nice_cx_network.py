@@ -10,6 +10,7 @@ import warnings
 
 from unittest.mock import MagicMock, ANY
 import requests_mock
+import pandas as pd
 from ndex2 import client
 from ndex2.nice_cx_network import NiceCXNetwork
 from ndex2.exceptions import NDExError
@@ -946,7 +947,7 @@ class TestNiceCXNetwork(unittest.TestCase):
         glypy = ndex2.create_nice_cx_from_file(TestNiceCXNetwork.GLYPICAN_FILE)
         df = glypy.to_pandas_dataframe(include_attributes=True)
         self.assertEqual(1, len(df))
-        self.assertEqual(7, df.shape[1])
+        self.assertEqual(8, df.shape[1])
         self.assertEqual('GPC2', df.iloc[0]['source'])
         self.assertEqual('in-complex-with',
                          df.iloc[0]['interaction'])
@@ -981,6 +982,93 @@ class TestNiceCXNetwork(unittest.TestCase):
             self.assertEqual('include_attributes must be None or a bool',
                              str(ne))
 
+    def test_to_pandas_dataframe_node_attributes(self):
+        net = NiceCXNetwork()
+        node_one = net.create_node('node1')
+        node_two = net.create_node('node2')
+        node_three = net.create_node('node3')
+        net.set_node_attribute(node_one, 'weight', 0.5, type='double')
+        net.set_node_attribute(node_two, 'size', '3', type='integer')
+        net.set_node_attribute(node_three, 'size', 4, type='integer')
+        net.set_node_attribute(node_three, 'alias', ['a', 'b'],
+                               type='list_of_string')
+        edge_one = net.create_edge(edge_source=node_one,
+                                   edge_target=node_two,
+                                   edge_interaction='binds')
+        net.create_edge(edge_source=node_one, edge_target=node_three)
+        net.set_edge_attribute(edge_one, 'flag', 'true', type='boolean')
+
+        df = net.to_pandas_dataframe(include_attributes=True)
+        self.assertEqual(['source', 'interaction', 'target', 'flag',
+                          'source_weight', 'target_size', 'target_alias'],
+                         list(df.columns))
+        self.assertEqual(['node1', 'node1'], df['source'].tolist())
+        self.assertEqual(['node2', 'node3'], df['target'].tolist())
+        self.assertEqual('binds', df.iloc[0]['interaction'])
+        self.assertTrue(pd.isna(df.iloc[1]['interaction']))
+        self.assertEqual(True, df.iloc[0]['flag'])
+        self.assertTrue(pd.isna(df.iloc[1]['flag']))
+        self.assertEqual([0.5, 0.5], df['source_weight'].tolist())
+        self.assertEqual([3, 4], df['target_size'].tolist())
+        self.assertEqual('int64', str(df['target_size'].dtype))
+        self.assertTrue(pd.isna(df.iloc[0]['target_alias']))
+        self.assertEqual('a,b', df.iloc[1]['target_alias'])
+
+    def test_to_node_dataframe(self):
+        net = NiceCXNetwork()
+        node_one = net.create_node('node1', node_represents='hgnc:1')
+        node_two = net.create_node('node2')
+        net.set_node_attribute(node_one, 'weight', 0.5, type='double')
+        net.set_node_attribute(node_two, 'size', '3', type='integer')
+        net.set_node_attribute(node_two, 'weight', 1, type='double')
+        net.set_node_attribute(node_two, 'alias', ['a', 'b'],
+                               type='list_of_string')
+
+        df = net.to_node_dataframe()
+        self.assertEqual('node_id', df.index.name)
+        self.assertEqual([node_one, node_two], df.index.tolist())
+        self.assertEqual(['name', 'represents', 'weight', 'size', 'alias'],
+                         list(df.columns))
+        self.assertEqual(['node1', 'node2'], df['name'].tolist())
+        self.assertEqual(['hgnc:1', 'node2'], df['represents'].tolist())
+        self.assertEqual([0.5, 1.0], df['weight'].tolist())
+        self.assertEqual('float64', str(df['weight'].dtype))
+        self.assertTrue(pd.isna(df.loc[node_one, 'size']))
+        self.assertEqual(3, df.loc[node_two, 'size'])
+        self.assertEqual('a,b', df.loc[node_two, 'alias'])
+
+        df = net.to_node_dataframe(attributes=['size', 'missing', 'name'])
+        self.assertEqual(['name', 'represents', 'size', 'missing'],
+                         list(df.columns))
+        self.assertTrue(df['missing'].isna().all())
+
+        try:
+            net.to_node_dataframe(include_layout='foo')
+            self.fail('Expected NDExInvalidParameterError')
+        except NDExInvalidParameterError as ne:
+            self.assertEqual('include_layout must be a bool', str(ne))
+
+        try:
+            net.to_node_dataframe(attributes='size')
+            self.fail('Expected NDExInvalidParameterError')
+        except NDExInvalidParameterError as ne:
+            self.assertEqual('attributes must be None or a list', str(ne))
+
+    def test_to_node_dataframe_wnt_signaling(self):
+        wnt = ndex2.create_nice_cx_from_file(TestNiceCXNetwork.WNT_SIGNAL_FILE)
+        df = wnt.to_node_dataframe(include_layout=True)
+        self.assertEqual(len(wnt.nodes), len(df))
+        self.assertEqual(['name', 'represents', 'TYPE', 'x', 'y'],
+                         list(df.columns))
+        layout = wnt.get_opaque_aspect(constants.CARTESIAN_LAYOUT_ASPECT)
+        self.assertEqual(layout[0]['x'], df.loc[layout[0]['node'], 'x'])
+        self.assertEqual(layout[0]['y'], df.loc[layout[0]['node'], 'y'])
+
+        # join with edge table
+        edge_df = wnt.to_pandas_dataframe()
+        joined = edge_df.join(df.set_index('name')[['TYPE']], on='source')
+        self.assertEqual(len(edge_df), len(joined))
+        self.assertEqual('protein', joined.iloc[0]['TYPE'])
 
     def test_to_pandas_dataframe_wnt_signaling(self):
         wnt = ndex2.create_nice_cx_from_file(TestNiceCXNetwork.WNT_SIGNAL_FILE)
@@ -1004,4 +1092,417 @@ class TestNiceCXNetwork(unittest.TestCase):
 
         self.assertEqual('BTO:0004896,BTO:0004300', df.iloc[73]['CELL_DATA'])
 
+    def test_subnetwork_node_not_found(self):
+        net = NiceCXNetwork()
+        node_one = net.create_node('node1')
+        try:
+            net.subnetwork([node_one, 5])
+            self.fail('Expected NDExNotFoundError')
+        except NDExNotFoundError as ne:
+            self.assertEqual('Node 5 not found in network', str(ne))
+
+    def test_subnetwork_induced(self):
+        net = NiceCXNetwork()
+        net.set_name('mynet')
+        node_one = net.create_node('node1', node_represents='rep1')
+        node_two = net.create_node('node2')
+        node_three = net.create_node('node3')
+        net.set_node_attribute(node_one, 'color', 'red')
+        net.set_node_attribute(node_three, 'color', 'blue')
+        edge_one = net.create_edge(edge_source=node_one,
+                                   edge_target=node_two,
+                                   edge_interaction='binds')
+        edge_two = net.create_edge(edge_source=node_two,
+                                   edge_target=node_three)
+        net.set_edge_attribute(edge_one, 'weight', 0.5, type='double')
+        net.set_edge_attribute(edge_two, 'weight', 0.8, type='double')
+
+        sub_net = net.subnetwork([node_one, node_two])
+        self.assertEqual('mynet', sub_net.get_name())
+        self.assertEqual({node_one, node_two}, set(sub_net.nodes))
+        self.assertEqual('rep1', sub_net.get_node(node_one)['r'])
+        self.assertEqual([edge_one], list(sub_net.edges))
+        self.assertEqual('binds', sub_net.get_edge(edge_one)['i'])
+        self.assertEqual('red', sub_net.get_node_attribute_value(node_one,
+                                                                 'color'))
+        self.assertEqual(0.5, sub_net.get_edge_attribute_value(edge_one,
+                                                               'weight'))
+        self.assertEqual({}, sub_net.get_edge_attributes(edge_two) or {})
+
+        # verify the subnetwork is a copy
+        sub_net.set_node_attribute(node_one, 'color', 'green',
+                                   overwrite=True)
+        self.assertEqual('red', net.get_node_attribute_value(node_one,
+                                                             'color'))
+
+        # new ids do not collide with ids from original network
+        new_node = sub_net.create_node('node4')
+        self.assertTrue(new_node not in net.nodes)
+
+    def test_subnetwork_include_incident(self):
+        net = NiceCXNetwork()
+        node_one = net.create_node('node1')
+        node_two = net.create_node('node2')
+        node_three = net.create_node('node3')
+        node_four = net.create_node('node4')
+        edge_one = net.create_edge(edge_source=node_one,
+                                   edge_target=node_two)
+        edge_two = net.create_edge(edge_source=node_three,
+                                   edge_target=node_one)
+        net.create_edge(edge_source=node_three, edge_target=node_four)
+        edge_four = net.create_edge(edge_source=node_one,
+                                    edge_target=node_one)
+
+        sub_net = net.subnetwork([node_one])
+        self.assertEqual([node_one], list(sub_net.nodes))
+        self.assertEqual([edge_four], list(sub_net.edges))
+
+        sub_net = net.subnetwork([node_one], include_incident=True)
+        self.assertEqual({node_one, node_two, node_three},
+                         set(sub_net.nodes))
+        self.assertEqual({edge_one, edge_two, edge_four},
+                         set(sub_net.edges))
+
+    def test_subnetwork_index_tracks_edge_changes(self):
+        net = NiceCXNetwork()
+        node_one = net.create_node('node1')
+        node_two = net.create_node('node2')
+        edge_one = net.create_edge(edge_source=node_one,
+                                   edge_target=node_two)
+        self.assertEqual([edge_one],
+                         list(net.subnetwork([node_one, node_two]).edges))
+
+        net.remove_edge(edge_one)
+        self.assertEqual({}, net.subnetwork([node_one, node_two]).edges)
+
+        edge_two = net.create_edge(edge_source=node_two,
+                                   edge_target=node_one)
+        self.assertEqual([edge_two],
+                         list(net.subnetwork([node_one, node_two]).edges))
+
+        # edge added directly to edges dict
+        net.edges[10] = {'@id': 10, 's': node_one, 't': node_two}
+        self.assertEqual({edge_two, 10},
+                         set(net.subnetwork([node_one, node_two]).edges))
+
+    def test_subnetwork_citations_supports_layout_and_style(self):
+        net = NiceCXNetwork()
+        node_one = net.create_node('node1')
+        node_two = net.create_node('node2')
+        node_three = net.create_node('node3')
+        edge_one = net.create_edge(edge_source=node_one,
+                                   edge_target=node_two)
+        edge_two = net.create_edge(edge_source=node_two,
+                                   edge_target=node_three)
+        net.citations[0] = {'@id': 0, 'dc:title': 'cite0'}
+        net.citations[1] = {'@id': 1, 'dc:title': 'cite1'}
+        net.citations[2] = {'@id': 2, 'dc:title': 'cite2'}
+        net.supports[0] = {'@id': 0, 'text': 'support0', 'citation': 2}
+        net.nodeCitations[node_one] = [0]
+        net.edgeCitations[edge_two] = [1]
+        net.edgeSupports[edge_one] = [0]
+        net.set_opaque_aspect(constants.CARTESIAN_LAYOUT_ASPECT,
+                              [{'node': node_one, 'x': 1.0, 'y': 2.0},
+                               {'node': node_three, 'x': 3.0, 'y': 4.0}])
+        net.set_opaque_aspect(NiceCXNetwork.CY_VISUAL_PROPERTIES,
+                              [{'properties_of': 'network'},
+                               {'properties_of': 'nodes:default'},
+                               {'properties_of': 'nodes',
+                                'applies_to': node_one},
+                               {'properties_of': 'nodes',
+                                'applies_to': node_three},
+                               {'properties_of': 'edges',
+                                'applies_to': edge_one},
+                               {'properties_of': 'edges',
+                                'applies_to': edge_two}])
+
+        sub_net = net.subnetwork([node_one, node_two])
+        self.assertEqual({0, 2}, set(sub_net.citations))
+        self.assertEqual({0}, set(sub_net.supports))
+        self.assertEqual({node_one: [0]}, sub_net.nodeCitations)
+        self.assertEqual({}, sub_net.edgeCitations)
+        self.assertEqual({edge_one: [0]}, sub_net.edgeSupports)
+        self.assertEqual([{'node': node_one, 'x': 1.0, 'y': 2.0}],
+                         sub_net.get_opaque_aspect(
+                             constants.CARTESIAN_LAYOUT_ASPECT))
+        self.assertEqual([{'properties_of': 'network'},
+                          {'properties_of': 'nodes:default'},
+                          {'properties_of': 'nodes',
+                           'applies_to': node_one},
+                          {'properties_of': 'edges',
+                           'applies_to': edge_one}],
+                         sub_net.get_opaque_aspect(
+                             NiceCXNetwork.CY_VISUAL_PROPERTIES))
+
+    def test_subnetwork_wnt_signaling(self):
+        wnt = ndex2.create_nice_cx_from_file(TestNiceCXNetwork.WNT_SIGNAL_FILE)
+        node_ids = list(wnt.nodes)[:10]
+        sub_net = wnt.subnetwork(node_ids)
+        self.assertEqual(set(node_ids), set(sub_net.nodes))
+        expected_edges = set(e_id for e_id, e in wnt.get_edges()
+                             if e['s'] in node_ids and e['t'] in node_ids)
+        self.assertEqual(expected_edges, set(sub_net.edges))
+        # should be convertible to cx
+        self.assertTrue(len(sub_net.to_cx()) > 0)
+
+    def test_get_edges_by_citation_and_support(self):
+        net = NiceCXNetwork()
+        node_one = net.create_node('a')
+        node_two = net.create_node('b')
+        edge_one = net.create_edge(node_one, node_two)
+        edge_two = net.create_edge(node_two, node_one)
+        citation = net.add_citation(5, title='paper')
+        net.add_edge_citations(edge_one, citation)
+        self.assertEqual([edge_one], net.get_edges_by_citation(5))
+        self.assertEqual([], net.get_edges_by_citation(6))
+        self.assertEqual([], net.get_edges_by_support(1))
+
+        # index is kept current after first use
+        net.add_edge_citations(edge_two, 5)
+        net.add_edge_citations(edge_two, 6)
+        net.add_edge_citations(edge_two, 6)
+        net.add_edge_supports(edge_two, {'@id': 1})
+        self.assertEqual([edge_one, edge_two],
+                         net.get_edges_by_citation(citation))
+        self.assertEqual([edge_two], net.get_edges_by_citation(6))
+        self.assertEqual([5, 6, 6], net.edgeCitations[edge_two])
+        self.assertEqual([edge_two], net.get_edges_by_support(1))
+
+        net.remove_edge(edge_one)
+        self.assertEqual([edge_two], net.get_edges_by_citation(5))
+        net.remove_edge(edge_two)
+        self.assertEqual([], net.get_edges_by_support(1))
+
+        # replacing the aspect rebuilds the index
+        net.edgeCitations = {edge_two: [7]}
+        self.assertEqual([], net.get_edges_by_citation(7))
+        edge_three = net.create_edge(node_one, node_one)
+        net.edgeCitations = {edge_three: [7]}
+        self.assertEqual([edge_three], net.get_edges_by_citation(7))
+
+        # copies have their own index
+        clone = net.copy()
+        clone.add_edge_citations(edge_three, 8)
+        self.assertEqual([edge_three], clone.get_edges_by_citation(8))
+        self.assertEqual([], net.get_edges_by_citation(8))
+        self.assertEqual([7], net.edgeCitations[edge_three])
+
+    def test_get_nodes_by_citation_loaded_network(self):
+        aspects = ['nodes', 'edges', 'citations', 'supports',
+                   'nodeCitations', 'edgeCitations', 'edgeSupports']
+        net = ndex2.create_nice_cx_from_raw_cx([
+            {'metaData': [{'name': a} for a in aspects]},
+            {'nodes': [{'@id': 0, 'n': 'a'}, {'@id': 1, 'n': 'b'}]},
+            {'edges': [{'@id': 0, 's': 0, 't': 1},
+                       {'@id': 1, 's': 1, 't': 0}]},
+            {'citations': [{'@id': 2, 'dc:title': 'paper'}]},
+            {'supports': [{'@id': 3, 'text': 'evidence', 'citation': 2}]},
+            {'nodeCitations': [{'po': [0, 1], 'citations': [2]}]},
+            {'edgeCitations': [{'po': [0, 1], 'citations': [2]}]},
+            {'edgeSupports': [{'po': [1], 'supports': [3]}]}])
+        self.assertEqual([0, 1], net.get_nodes_by_citation(2))
+        self.assertEqual([0, 1], net.get_edges_by_citation(2))
+        self.assertEqual([1], net.get_edges_by_support(3))
+
+        # loader shares one list between edges, adding must not change both
+        net.add_edge_citations(0, 4)
+        self.assertEqual([0], net.get_edges_by_citation(4))
+        self.assertEqual([2], net.edgeCitations[1])
+
+        net.remove_node(1)
+        self.assertEqual([0], net.get_nodes_by_citation(2))
+
+    def test_copy(self):
+        net = NiceCXNetwork()
+        node_one = net.create_node('a')
+        node_two = net.create_node('b')
+        edge_id = net.create_edge(node_one, node_two, 'binds')
+        net.set_node_attribute(node_one, 'score', 1.0)
+        net.set_edge_attribute(edge_id, 'weight', 0.5)
+        net.add_citation(0, title='paper')
+        net.add_edge_citations(edge_id, 0)
+        net.set_network_attribute('name', 'base')
+        net.set_opaque_aspect('foo', [{'x': 1}])
+
+        clone = net.copy()
+        self.assertIs(net.nodes, clone.nodes)
+        self.assertIs(net.edgeAttributes, clone.edgeAttributes)
+
+        clone.set_node_attribute(node_one, 'score', 2.0, overwrite=True)
+        clone.set_edge_attribute(edge_id, 'extra', 'yes')
+        clone.remove_edge_attribute(edge_id, 'weight')
+        clone.add_edge_citations(edge_id, 1)
+        clone.create_node('c')
+        clone.remove_edge(edge_id)
+        clone.set_network_attribute('name', 'variant')
+        clone.set_opaque_aspect('foo', None)
+
+        self.assertEqual(2, len(net.nodes))
+        self.assertEqual({edge_id}, set(net.edges))
+        self.assertEqual(1.0, net.get_node_attribute_value(node_one, 'score'))
+        self.assertEqual([{'po': edge_id, 'n': 'weight', 'v': 0.5}],
+                         net.get_edge_attributes(edge_id))
+        self.assertEqual([0], net.edgeCitations[edge_id])
+        self.assertEqual('base', net.get_network_attribute('name')['v'])
+        self.assertEqual([{'x': 1}], net.get_opaque_aspect('foo'))
+
+        self.assertEqual(3, len(clone.nodes))
+        self.assertEqual({}, clone.edges)
+        self.assertEqual(2.0, clone.get_node_attribute_value(node_one, 'score'))
+        self.assertEqual([{'po': edge_id, 'n': 'extra', 'v': 'yes'}],
+                         clone.get_edge_attributes(edge_id))
+        self.assertEqual([0, 1], clone.edgeCitations[edge_id])
+        self.assertEqual('variant', clone.get_network_attribute('name')['v'])
+        self.assertIsNone(clone.get_opaque_aspect('foo'))
+
+        # changing the original must not change the copy
+        net.set_node_attribute(node_two, 'score', 3.0)
+        net.remove_node_attribute(node_one, 'score')
+        self.assertEqual(3.0, net.get_node_attribute_value(node_two, 'score'))
+        self.assertIsNone(clone.get_node_attribute_value(node_two, 'score'))
+        self.assertEqual(2.0, clone.get_node_attribute_value(node_one, 'score'))
+
+    def test_copy_of_copy_and_queries(self):
+        wnt = ndex2.create_nice_cx_from_file(TestNiceCXNetwork.WNT_SIGNAL_FILE)
+        expected_cx = wnt.to_cx()
+        clone = wnt.copy()
+        self.assertEqual(expected_cx, clone.to_cx())
+
+        node_id = list(clone.nodes)[0]
+        edge_ids = [e_id for e_id, e in clone.get_edges()
+                    if node_id in (e['s'], e['t'])]
+        for e_id in edge_ids:
+            clone.remove_edge(e_id)
+        clone.remove_node(node_id)
+        self.assertEqual(len(wnt.nodes) - 1, len(clone.nodes))
+        self.assertIn(node_id, wnt.nodes)
+        self.assertEqual(len(edge_ids),
+                         len(wnt.subnetwork([node_id],
+                                            include_incident=True).edges))
+
+        second = clone.copy()
+        second.create_edge(list(second.nodes)[0], list(second.nodes)[1])
+        self.assertEqual(len(clone.edges) + 1, len(second.edges))
+        self.assertEqual(len(wnt.edges) - len(edge_ids), len(clone.edges))
+        self.assertEqual(expected_cx, wnt.to_cx())
+
+    def test_get_neighborhood(self):
+        net = NiceCXNetwork()
+        net.set_name('mynet')
+        node_one = net.create_node('TP53', node_represents='hgnc:TP53')
+        node_two = net.create_node('MDM2')
+        node_three = net.create_node('CDKN1A')
+        node_four = net.create_node('EP300')
+        edge_one = net.create_edge(edge_source=node_one,
+                                   edge_target=node_two)
+        edge_two = net.create_edge(edge_source=node_three,
+                                   edge_target=node_two)
+        edge_three = net.create_edge(edge_source=node_four,
+                                     edge_target=node_three)
+
+        res = net.get_neighborhood('foo')
+        self.assertEqual({}, res.nodes)
+        self.assertEqual({}, res.edges)
+        self.assertEqual('mynet', res.get_name())
+
+        res = net.get_neighborhood('tp53')
+        self.assertEqual({node_one, node_two}, set(res.nodes))
+        self.assertEqual([edge_one], list(res.edges))
+        self.assertEqual(None, res.get_network_attribute('EdgeLimitExceeded'))
+
+        res = net.get_neighborhood('TP53', search_depth=2)
+        self.assertEqual({node_one, node_two, node_three}, set(res.nodes))
+        self.assertEqual({edge_one, edge_two}, set(res.edges))
+
+        res = net.get_neighborhood('"hgnc:tp53" EP300')
+        self.assertEqual({node_one, node_two, node_three, node_four},
+                         set(res.nodes))
+        self.assertEqual({edge_one, edge_three}, set(res.edges))
+
+        # nodes added after first query are found
+        node_five = net.create_node('BRCA1')
+        edge_four = net.create_edge(edge_source=node_five,
+                                    edge_target=node_one)
+        res = net.get_neighborhood('BRCA1')
+        self.assertEqual({node_one, node_five}, set(res.nodes))
+        self.assertEqual([edge_four], list(res.edges))
+
+        # verify result can be converted to CX
+        self.assertTrue(len(res.to_cx()) > 0)
+
+    def test_get_neighborhood_edge_limit(self):
+        net = NiceCXNetwork()
+        hub = net.create_node('hub')
+        for i in range(5):
+            net.create_edge(edge_source=hub,
+                            edge_target=net.create_node('n' + str(i)))
+
+        try:
+            net.get_neighborhood('hub', edge_limit=4)
+            self.fail('Expected NDExError')
+        except NDExError as ne:
+            self.assertTrue(str(ne).startswith('EdgeLimitExceeded'))
+
+        res = net.get_neighborhood('hub', edge_limit=4,
+                                   error_when_limit=False)
+        self.assertEqual(4, len(res.edges))
+        self.assertEqual(5, len(res.nodes))
+        self.assertEqual('true',
+                         res.get_network_attribute('EdgeLimitExceeded')['v'])
+
+        res = net.get_neighborhood('hub', edge_limit=5)
+        self.assertEqual(5, len(res.edges))
+        self.assertEqual(None, res.get_network_attribute('EdgeLimitExceeded'))
+
+    def test_get_neighborhood_wnt_signaling(self):
+        wnt = ndex2.create_nice_cx_from_file(TestNiceCXNetwork.WNT_SIGNAL_FILE)
+        lrp6_id = wnt.get_node_by_name('LRP6')['@id']
+        expected_edges = set(e_id for e_id, e in wnt.edges.items()
+                             if lrp6_id in (e['s'], e['t']))
+        expected_nodes = set([lrp6_id])
+        for e_id in expected_edges:
+            expected_nodes.add(wnt.edges[e_id]['s'])
+            expected_nodes.add(wnt.edges[e_id]['t'])
+
+        res = wnt.get_neighborhood('LRP6')
+        self.assertEqual(expected_edges, set(res.edges))
+        self.assertEqual(expected_nodes, set(res.nodes))
+
+    def test_get_interconnectquery(self):
+        net = NiceCXNetwork()
+        net.set_name('mynet')
+        node_one = net.create_node('TP53')
+        node_two = net.create_node('MDM2')
+        node_three = net.create_node('CDKN1A')
+        node_four = net.create_node('EP300')
+        edge_one = net.create_edge(edge_source=node_one,
+                                   edge_target=node_two)
+        edge_two = net.create_edge(edge_source=node_three,
+                                   edge_target=node_two)
+        net.create_edge(edge_source=node_four, edge_target=node_one)
+
+        res = net.get_interconnectquery('TP53')
+        self.assertEqual([node_one], list(res.nodes))
+        self.assertEqual({}, res.edges)
+        self.assertEqual('mynet', res.get_name())
+
+        res = net.get_interconnectquery('TP53 CDKN1A')
+        self.assertEqual({node_one, node_three}, set(res.nodes))
+        self.assertEqual({}, res.edges)
+
+        res = net.get_interconnectquery('TP53 CDKN1A', search_depth=2)
+        self.assertEqual({node_one, node_two, node_three}, set(res.nodes))
+        self.assertEqual({edge_one, edge_two}, set(res.edges))
+
+        try:
+            net.get_interconnectquery('TP53 CDKN1A', search_depth=2,
+                                      edge_limit=1)
+            self.fail('Expected NDExError')
+        except NDExError as ne:
+            self.assertTrue(str(ne).startswith('EdgeLimitExceeded'))
 
+        res = net.get_interconnectquery('TP53 CDKN1A', search_depth=2,
+                                        edge_limit=1, error_when_limit=False)
+        self.assertEqual(1, len(res.edges))
+        self.assertEqual('true',
+                         res.get_network_attribute('EdgeLimitExceeded')['v'])
@@ -5,6 +5,9 @@
 import os
 import unittest
 
+import numpy as np
+import pandas as pd
+
 from ndex2 import constants
 from ndex2.exceptions import NDExError
 from ndex2.util import DataConverter
@@ -169,3 +172,83 @@ class TestDefaultNetworkXFactory(unittest.TestCase):
                                           datatype=dtype)
             self.assertEqual('', res)
 
+    def test_convert_series(self):
+        converter = PandasDataConverter()
+        self.assertEqual([], converter.convert_series())
+        self.assertEqual(['1', 'None', 'a'],
+                         converter.convert_series([1, None, 'a']))
+        self.assertEqual([True, False, True, False, True],
+                         converter.convert_series([True, 'fAlse', 'rando text', 0, 7],
+                                                  constants.BOOLEAN_DATATYPE))
+        self.assertEqual([1.0, 5.5, 7.0],
+                         converter.convert_series([True, '5.5', 7],
+                                                  constants.DOUBLE_DATATYPE))
+        self.assertEqual([1, 3, -5],
+                         converter.convert_series([1.1, '3', -5],
+                                                  constants.LONG_DATATYPE))
+        self.assertEqual(['ha', '', '1,2,TrUE,None'],
+                         converter.convert_series(['ha', [], [1, '2', 'TrUE', None]],
+                                                  constants.LIST_OF_STRING))
+
+        # numpy arrays and pandas Series of numbers are cast at once
+        res = converter.convert_series(np.array([1, 2]),
+                                       constants.DOUBLE_DATATYPE)
+        self.assertEqual([1.0, 2.0], res)
+        self.assertTrue(isinstance(res[0], float))
+        res = converter.convert_series(pd.Series([3, 4]),
+                                       constants.INTEGER_DATATYPE)
+        self.assertEqual([3, 4], res)
+        self.assertTrue(isinstance(res[0], int))
+
+    def test_convert_column(self):
+        converter = PandasDataConverter()
+        for values, datatype, expected, dtype in [
+                ([1.5, '2', 3], constants.DOUBLE_DATATYPE, [1.5, 2.0, 3.0], np.float64),
+                (['1', ' 2 ', '1_0'], constants.DOUBLE_DATATYPE, [1.0, 2.0, 10.0], np.float64),
+                ([1, True, 3.7], constants.INTEGER_DATATYPE, [1, 1, 3], np.int64),
+                (['4', '-5'], constants.LONG_DATATYPE, [4, -5], np.int64),
+                ([2 ** 70], constants.LONG_DATATYPE, [2 ** 70], object),
+                ([True, False], constants.BOOLEAN_DATATYPE, [True, False], bool),
+                (['true', 'FALSE', '0', '', 'x', 'TrUe'], constants.BOOLEAN_DATATYPE,
+                 [True, False, False, False, True, True], bool),
+                ([0, 2.5, float('nan')], constants.BOOLEAN_DATATYPE, [False, True, True], bool),
+                (['a', 1], constants.STRING_DATATYPE, ['a', '1'], object),
+                ([], constants.DOUBLE_DATATYPE, [], np.float64)]:
+            res = converter.convert_column(values, datatype)
+            self.assertEqual(np.dtype(dtype), res.dtype)
+            self.assertEqual(expected, res.tolist())
+
+        # numpy turns None into NaN, convert_value() fails on it
+        for datatype in (constants.DOUBLE_DATATYPE, constants.INTEGER_DATATYPE):
+            try:
+                converter.convert_column([1.5, None], datatype)
+                self.fail('Expected NDExError')
+            except NDExError as ne:
+                self.assertTrue('Unable to convert None' in str(ne))
+
+    def test_convert_series_errors(self):
+        converter = PandasDataConverter()
+        try:
+            converter.convert_series([1, 'TruE'], constants.DOUBLE_DATATYPE)
+            self.fail('Expected exception')
+        except NDExError as ne:
+            self.assertTrue('Unable to convert TruE to type '
+                            'compatible with double CX data type :' in str(ne))
+        try:
+            converter.convert_series(['asdf'], 'FOO')
+            self.fail('Expected NDExError')
+        except NDExError as ne:
+            self.assertEqual('FOO unknown data type, cannot convert: asdf', str(ne))
+
+    def test_convert_series_uses_subclass_convert_value(self):
+        class UpperConverter(PandasDataConverter):
+            def convert_value(self, value=None, datatype=None):
+                return str(value).upper()
+
+        self.assertEqual(['A', 'B'],
+                         UpperConverter().convert_series(['a', 'b']))
+        try:
+            DataConverter().convert_series(['a'])
+            self.fail('Expected NotImplementedError')
+        except NotImplementedError as ne:
+            self.assertEqual('Must be implemented by subclass', str(ne))
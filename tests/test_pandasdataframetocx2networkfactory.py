@@ -177,80 +177,135 @@ class TestPandasDataFrameToCX2NetworkFactory(unittest.TestCase):
         self.assertEqual(orig_edge['v'], rt_cx2net.get_edges()[0]['v'])
 
     def test_attribute_extraction(self):
-        row = pd.Series({
-            's_attribute': 'value1',
-            't_attribute': 'value2',
-            'some_edge_attribute': 'value3',
-            'source_prefix_attr': 'sourceValue',
-            'target_prefix_attr': 'targetValue'
+        df = pd.DataFrame({
+            'source_name': ['A'],
+            'target_name': ['B'],
+            's_attribute': ['value1'],
+            't_attribute': ['value2'],
+            'some_edge_attribute': ['value3'],
+            'source_prefix_attr': ['sourceValue'],
+            'target_prefix_attr': ['targetValue']
         })
-        source_node_attr = ['s_attribute']
-        source_node_attr_prefix = 'source_'
-        target_node_attr = ['t_attribute']
-        target_node_attr_prefix = 'target_'
-        edge_attr = ['some_edge_attribute']
-
-        source_attrs, target_attrs, edge_attrs = self.factory._process_row_for_attributes(
-            row,
-            source_node_attr,
-            source_node_attr_prefix,
-            target_node_attr,
-            target_node_attr_prefix,
-            edge_attr
-        )
-
-        self.assertEqual(source_attrs, {'s_attribute': 'value1'})
-        self.assertEqual(target_attrs, {'t_attribute': 'value2'})
-        self.assertEqual(edge_attrs, {'some_edge_attribute': 'value3'})
+        network = self.factory.get_cx2network(df,
+                                              source_node_attr=['s_attribute'],
+                                              source_node_attr_prefix='source_',
+                                              target_node_attr=['t_attribute'],
+                                              target_node_attr_prefix='target_',
+                                              edge_attr=['some_edge_attribute'])
+
+        self.assertEqual({'name': 'A', 's_attribute': 'value1'}, network.get_node(0)['v'])
+        self.assertEqual({'name': 'B', 't_attribute': 'value2'}, network.get_node(1)['v'])
+        self.assertEqual({'some_edge_attribute': 'value3', 'interaction': 'interacts-with'},
+                         network.get_edge(0)['v'])
 
     def test_missing_attributes(self):
-        row = pd.Series({
-            'unrelated_column': 'some_value'
+        df = pd.DataFrame({
+            'source_name': ['A'],
+            'target_name': ['B'],
+            'unrelated_column': ['some_value']
         })
-        source_node_attr = ['nonexistent_source_attr']
-        source_node_attr_prefix = 'source_'
-        target_node_attr = ['nonexistent_target_attr']
-        target_node_attr_prefix = 'target_'
-        edge_attr = ['nonexistent_edge_attr']
-
-        source_attrs, target_attrs, edge_attrs = self.factory._process_row_for_attributes(
-            row,
-            source_node_attr,
-            source_node_attr_prefix,
-            target_node_attr,
-            target_node_attr_prefix,
-            edge_attr
-        )
-
-        self.assertEqual(source_attrs, {})
-        self.assertEqual(target_attrs, {})
-        self.assertEqual(edge_attrs, {})
-
-    def test_edge_case_empty_row(self):
-        row = pd.Series({})
-        source_attrs, target_attrs, edge_attrs = self.factory._process_row_for_attributes(
-            row,
-            [],
-            'source_',
-            [],
-            'target_',
-            []
-        )
-
-        self.assertEqual(source_attrs, {})
-        self.assertEqual(target_attrs, {})
-        self.assertEqual(edge_attrs, {})
+        network = self.factory.get_cx2network(df,
+                                              source_node_attr=['nonexistent_source_attr'],
+                                              source_node_attr_prefix='source_',
+                                              target_node_attr=['nonexistent_target_attr'],
+                                              target_node_attr_prefix='target_',
+                                              edge_attr=['nonexistent_edge_attr'])
+
+        self.assertEqual({'name': 'A'}, network.get_node(0)['v'])
+        self.assertEqual({'name': 'B'}, network.get_node(1)['v'])
+        self.assertEqual({'interaction': 'interacts-with'}, network.get_edge(0)['v'])
+
+    def test_edge_case_no_attribute_columns(self):
+        df = pd.DataFrame({'source_name': ['A'], 'target_name': ['B']})
+        network = self.factory.get_cx2network(df, source_node_attr=[], target_node_attr=[], edge_attr=[])
+
+        self.assertEqual({'name': 'A'}, network.get_node(0)['v'])
+        self.assertEqual({'name': 'B'}, network.get_node(1)['v'])
+        self.assertEqual({'interaction': 'interacts-with'}, network.get_edge(0)['v'])
 
     def test_empty_attributes(self):
-        row = pd.Series({'a_column': 'some_value'})
+        df = pd.DataFrame({'source_name': ['A'], 'target_name': ['B'], 'a_column': ['some_value']})
 
         with self.assertRaises(NDExError):
-            self.factory._process_row_for_attributes(
-                row,
-                None, '',
-                None, '',
-                None
-            )
+            self.factory.get_cx2network(df, source_node_attr=None, source_node_attr_prefix='',
+                                        target_node_attr=None, target_node_attr_prefix='',
+                                        edge_attr=None)
+
+    def test_node_attributes_from_several_rows(self):
+        data = {'source_name': ['A', 'B', 'A'], 'target_name': ['B', 'C', 'C'],
+                'source_size': [1.0, float('nan'), 3.0], 'target_size': [2.0, 4.0, float('nan')],
+                'source_x': [10.0, 20.0, float('nan')], 'weight': [0.5, float('nan'), 0.7]}
+        df = pd.DataFrame(data)
+        network = self.factory.get_cx2network(df)
+
+        self.assertEqual({0: 'A', 1: 'B', 2: 'C'},
+                         {node_id: node['v']['name'] for node_id, node in network.get_nodes().items()})
+        # last value found for a node wins, missing values are skipped
+        self.assertEqual({'name': 'A', 'size': 3.0}, network.get_node(0)['v'])
+        self.assertEqual({'name': 'B', 'size': 2.0}, network.get_node(1)['v'])
+        self.assertEqual({'name': 'C', 'size': 4.0}, network.get_node(2)['v'])
+        self.assertEqual(10.0, network.get_node(0)['x'])
+        self.assertEqual(20.0, network.get_node(1)['x'])
+        self.assertIsNone(network.get_node(2)['x'])
+
+        self.assertEqual({'id': 1, 's': 1, 't': 2, 'v': {'interaction': 'interacts-with'}},
+                         network.get_edge(1))
+        self.assertEqual({'weight': 0.7, 'interaction': 'interacts-with'}, network.get_edge(2)['v'])
+        self.assertEqual({'nodes': {'size': {'d': 'double'}, 'name': {'d': 'string'}},
+                          'edges': {'weight': {'d': 'double'}, 'interaction': {'d': 'string'}}},
+                         network.get_attribute_declarations())
+
+        self.assertEqual(3, network.add_node(attributes={'name': 'D'}))
+        self.assertEqual(3, network.add_edge(source=3, target=0))
+
+    def test_with_ids_and_names(self):
+        data = {'source_id': [5, 2, 5], 'target_name': ['B', 'A', 'B'],
+                'source_name': ['A', 'Z', 'Y'], 'interaction': ['binds', None, 'inhibits']}
+        df = pd.DataFrame(data)
+        network = self.factory.get_cx2network(df)
+
+        # targets have no id so are matched by name, including to the node with id 5
+        self.assertEqual([5, 6, 2], list(network.get_nodes().keys()))
+        self.assertEqual('A', network.get_node(5)['v']['name'])
+        self.assertEqual('B', network.get_node(6)['v']['name'])
+        self.assertEqual([(5, 6, 'binds'), (2, 5, 'interacts-with'), (5, 6, 'inhibits')],
+                         [(edge['s'], edge['t'], edge['v']['interaction'])
+                          for edge in network.get_edges().values()])
+
+    def test_with_chunks(self):
+        data = {'source_name': ['A', 'B', 'A', 'D'], 'target_name': ['B', 'C', 'C', 'A'],
+                'source_size': [1.0, float('nan'), 3.0, 5], 'target_size': [2.0, 4.0, float('nan'), 6],
+                'weight': [0.5, float('nan'), 0.7, 0.9]}
+        df = pd.DataFrame(data)
+        network = self.factory.get_cx2network(df)
+        chunked_network = self.factory.get_cx2network(df.iloc[i:i + 2] for i in range(0, len(df), 2))
+
+        # node ids carry over from one chunk to the next
+        self.assertEqual({0: 'A', 1: 'B', 2: 'C', 3: 'D'},
+                         {node_id: node['v']['name'] for node_id, node in chunked_network.get_nodes().items()})
+        self.assertEqual({'name': 'A', 'size': 6.0}, chunked_network.get_node(0)['v'])
+        self.assertEqual([(0, 1), (1, 2), (0, 2), (3, 0)],
+                         [(edge['s'], edge['t']) for edge in chunked_network.get_edges().values()])
+        self.assertEqual(network.to_cx2(), chunked_network.to_cx2())
+        self.assertEqual(4, chunked_network.add_node(attributes={'name': 'E'}))
+        self.assertEqual(4, chunked_network.add_edge(source=4, target=0))
+
+    def test_with_chunks_of_different_row_types(self):
+        # all numbers in the first chunk, so rows there are cast to float
+        first = pd.DataFrame({'source_name': [1, 2], 'target_name': [2, 3], 'note': [float('nan')] * 2})
+        second = pd.DataFrame({'source_name': [1], 'target_name': [3], 'note': ['x']})
+        chunked_network = self.factory.get_cx2network([first, second])
+        network = self.factory.get_cx2network(pd.concat([first, second], ignore_index=True))
+
+        self.assertEqual({0: 1, 1: 2, 2: 3},
+                         {node_id: node['v']['name'] for node_id, node in chunked_network.get_nodes().items()})
+        self.assertEqual('integer', chunked_network.get_attribute_declarations()['nodes']['name']['d'])
+        self.assertEqual(network.to_cx2(), chunked_network.to_cx2())
+
+    def test_with_chunks_not_dataframes(self):
+        with self.assertRaises(NDExError):
+            self.factory.get_cx2network([pd.DataFrame({'source': ['A'], 'target': ['B']}), 'not a DataFrame'])
+        self.assertEqual({}, self.factory.get_cx2network([]).get_nodes())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for `query` module."""
+
+import os
+import random
+import unittest
+
+import networkx as nx
+
+from ndex2 import query
+from ndex2.exceptions import NDExError
+
+SKIP_REASON = 'NDEX2_TEST_SERVER environment variable detected, ' \
+              'skipping for integration tests'
+
+
+@unittest.skipIf(os.getenv('NDEX2_TEST_SERVER') is not None, SKIP_REASON)
+class TestQuery(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        # 0 - 1 - 2 - 3 with self loop on 3
+        self.edges = {0: {'@id': 0, 's': 0, 't': 1},
+                      1: {'@id': 1, 's': 2, 't': 1},
+                      2: {'@id': 2, 's': 2, 't': 3},
+                      3: {'@id': 3, 's': 3, 't': 3}}
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        pass
+
+    def test_get_search_terms(self):
+        self.assertEqual([], query.get_search_terms(None))
+        self.assertEqual([], query.get_search_terms(''))
+        self.assertEqual(['tp53', 'mdm2'],
+                         query.get_search_terms('TP53 OR MDM2'))
+        self.assertEqual(['tp53', 'cell cycle', 'x'],
+                         query.get_search_terms('  TP53 AND "Cell Cycle" x '))
+
+    def test_build_search_term_index_and_find_node_ids(self):
+        index = query.build_search_term_index([(0, 'TP53', 'hgnc:TP53'),
+                                               (1, 'MDM2', None),
+                                               (2, None, 'ncbigene:4193'),
+                                               (3, 5, 'uniprot')])
+        self.assertEqual({0}, index['tp53'])
+        self.assertEqual({0}, index['hgnc:tp53'])
+        self.assertEqual({2}, index['4193'])
+        self.assertEqual({3}, index['5'])
+        self.assertEqual(set(), query.find_node_ids(index, 'foo'))
+        self.assertEqual({0, 1}, query.find_node_ids(index, 'mdm2 OR tp53'))
+        self.assertEqual({2}, query.find_node_ids(index, 'NCBIGENE:4193'))
+
+    def test_build_node_edge_index(self):
+        self.assertEqual({0: [0], 1: [0, 1], 2: [1, 2], 3: [2, 3]},
+                         query.build_node_edge_index(self.edges))
+
+    def test_get_neighborhood_element_ids(self):
+        index = query.build_node_edge_index(self.edges)
+        self.assertEqual(([], [], False),
+                         query.get_neighborhood_element_ids(set(), index,
+                                                            self.edges))
+        self.assertEqual(([0, 1], [0], False),
+                         query.get_neighborhood_element_ids({0}, index,
+                                                            self.edges))
+        self.assertEqual(([0, 1, 2], [0, 1], False),
+                         query.get_neighborhood_element_ids({0}, index,
+                                                            self.edges,
+                                                            search_depth=2))
+        self.assertEqual(([0, 1, 2, 3], [0, 1, 2, 3], False),
+                         query.get_neighborhood_element_ids({0}, index,
+                                                            self.edges,
+                                                            search_depth=5))
+        self.assertEqual(([0], [], False),
+                         query.get_neighborhood_element_ids({0}, index,
+                                                            self.edges,
+                                                            search_depth=0))
+
+    def test_get_neighborhood_element_ids_edge_limit(self):
+        index = query.build_node_edge_index(self.edges)
+        self.assertEqual(([0, 1, 2], [0, 1], True),
+                         query.get_neighborhood_element_ids(
+                             {0}, index, self.edges, search_depth=3,
+                             edge_limit=2, error_when_limit=False))
+        # limit is not exceeded if exactly edge_limit edges are found
+        self.assertEqual(([0, 1, 2], [0, 1], False),
+                         query.get_neighborhood_element_ids(
+                             {0}, index, self.edges, search_depth=2,
+                             edge_limit=2, error_when_limit=True))
+        try:
+            query.get_neighborhood_element_ids({0}, index, self.edges,
+                                               search_depth=3, edge_limit=2)
+            self.fail('Expected NDExError')
+        except NDExError as ne:
+            self.assertEqual('EdgeLimitExceeded: query result has more '
+                             'than 2 edges', str(ne))
+
+    def test_get_interconnect_element_ids(self):
+        index = query.build_node_edge_index(self.edges)
+        self.assertEqual(([0], [], False),
+                         query.get_interconnect_element_ids({0}, index,
+                                                            self.edges,
+                                                            search_depth=3))
+        self.assertEqual(([0, 2], [], False),
+                         query.get_interconnect_element_ids({0, 2}, index,
+                                                            self.edges))
+        self.assertEqual(([0, 2, 1], [0, 1], False),
+                         query.get_interconnect_element_ids({0, 2}, index,
+                                                            self.edges,
+                                                            search_depth=2))
+        # self loop on 3 is not on any path
+        self.assertEqual(([0, 3, 1, 2], [0, 2, 1], False),
+                         query.get_interconnect_element_ids({0, 3}, index,
+                                                            self.edges,
+                                                            search_depth=5))
+        self.assertEqual(([0, 3], [], False),
+                         query.get_interconnect_element_ids({0, 3}, index,
+                                                            self.edges,
+                                                            search_depth=2))
+
+    def test_get_interconnect_element_ids_edge_limit(self):
+        index = query.build_node_edge_index(self.edges)
+        self.assertEqual(([0, 3, 1], [0], True),
+                         query.get_interconnect_element_ids(
+                             {0, 3}, index, self.edges, search_depth=3,
+                             edge_limit=1, error_when_limit=False))
+        try:
+            query.get_interconnect_element_ids({0, 3}, index, self.edges,
+                                               search_depth=3, edge_limit=2)
+            self.fail('Expected NDExError')
+        except NDExError as ne:
+            self.assertTrue(str(ne).startswith('EdgeLimitExceeded'))
+
+    def test_get_interconnect_element_ids_matches_brute_force(self):
+        rand = random.Random(1)
+        for trial in range(20):
+            graph = nx.gnm_random_graph(40, 70, seed=trial)
+            edges = {}
+            for edge_id, (src, tgt) in enumerate(graph.edges()):
+                if rand.random() < 0.5:
+                    src, tgt = tgt, src
+                edges[edge_id] = {'@id': edge_id, 's': src, 't': tgt}
+            index = query.build_node_edge_index(edges)
+            seeds = set(rand.sample(range(40), rand.randint(2, 5)))
+            dists = {seed: nx.single_source_shortest_path_length(graph, seed)
+                     for seed in seeds}
+            for depth in range(1, 5):
+                expected = set()
+                for edge_id, edge in edges.items():
+                    for u, v in ((edge['s'], edge['t']),
+                                 (edge['t'], edge['s'])):
+                        for a in seeds:
+                            for b in seeds:
+                                if a != b and u in dists[a] and \
+                                        v in dists[b] and \
+                                        dists[a][u] + 1 + dists[b][v] <= depth:
+                                    expected.add(edge_id)
+                res = query.get_interconnect_element_ids(seeds, index, edges,
+                                                         search_depth=depth,
+                                                         edge_limit=None)
+                self.assertEqual(expected, set(res[1]))